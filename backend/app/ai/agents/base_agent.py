@@ -5,14 +5,17 @@ LangGraph-based base agent class providing conversation state management,
 memory persistence, and common agent functionality.
 """
 
-import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, TypedDict, Annotated
+from typing import Dict, Any, List, Optional, TypedDict, Annotated, AsyncGenerator
 from datetime import datetime, timezone
 import uuid
+from contextlib import aclosing
 
+from langchain_core.messages import AIMessageChunk
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
@@ -22,7 +25,7 @@ import redis.asyncio as redis
 from redis.asyncio import Redis
 
 from ..config import AIConfig, AgentType
-from ..llm.router import LLMRouter
+from ..llm.router import LLMRouter, ResponseContentCleaner, clean_response_content
 from ..llm.prompt_templates import PromptTemplateManager, PromptType
 from ..models import ModelConfigurationManager, ToolCompatibilityChecker
 from ...core.exceptions import AIProcessingError
@@ -54,6 +57,9 @@ class BaseAgent(ABC):
     - Common agent utilities
     """
     
+    # Graph nodes whose LLM tokens are forwarded to the client by stream_chat
+    STREAMING_NODES = ("llm_with_tools", "generate_response")
+    
     def __init__(
         self,
         agent_type: AgentType,
@@ -112,6 +118,7 @@ class BaseAgent(ABC):
             # Debug wrapper for tool node
             async def debug_tool_node(state: AgentState):
                 logger.info("🔧 DEBUG: Entering ToolNode execution")
+                writer = get_stream_writer()
                 logger.info(f"🔧 DEBUG: Tool node has {len(self._tools)} tools available")
                 logger.info(f"🔧 DEBUG: Tool names: {[tool.name for tool in self._tools]}")
                 
@@ -121,6 +128,12 @@ class BaseAgent(ABC):
                     logger.info(f"🔧 DEBUG: Executing {len(latest_message.tool_calls)} tool calls")
                     for i, tool_call in enumerate(latest_message.tool_calls):
                         logger.info(f"🔧 DEBUG: Tool call {i+1}: {tool_call}")
+                    
+                    # Tool progress event for streaming clients (no-op outside astream)
+                    writer({
+                        "type": "tool_start",
+                        "tools": [tool_call.get("name", "unknown_tool") for tool_call in latest_message.tool_calls]
+                    })
                 else:
                     logger.info("🔧 DEBUG: No tool calls found in latest message!")
                 
@@ -148,10 +161,17 @@ class BaseAgent(ABC):
                         else:
                             logger.warning("🔧 DEBUG: No tool results found in ToolNode messages")
                     
+                    writer({
+                        "type": "tool_end",
+                        "tools": list(result.get("tool_results", {}).keys()) if isinstance(result, dict) else [],
+                        "success": True
+                    })
+                    
                     return result
                 except Exception as e:
                     logger.error(f"🔧 DEBUG: ToolNode execution failed: {e}")
                     logger.error(f"🔧 DEBUG: Exception type: {type(e)}")
+                    writer({"type": "tool_end", "tools": [], "success": False, "error": str(e)})
                     raise
             
             workflow.add_node("tools", debug_tool_node)
@@ -266,13 +286,17 @@ class BaseAgent(ABC):
         """Analyze query for agent-specific context (to be implemented by subclasses)"""
         pass
 
-    async def _llm_with_tools_node(self, state: AgentState) -> AgentState:
+    async def _llm_with_tools_node(
+        self,
+        state: AgentState,
+        config: Optional[RunnableConfig] = None
+    ) -> AgentState:
         """LLM node with tool binding for intelligent tool selection"""
         
         if not self._llm_with_tools:
             # If no tools bound, fallback to regular generation
             logger.warning(f"🚫 No tools bound for {self.agent_type.value}, falling back to regular generation")
-            return await self._generate_response_fallback(state)
+            return await self._generate_response_fallback(state, config)
         
         # Get the latest message content
         latest_message = state["messages"][-1]
@@ -326,7 +350,11 @@ class BaseAgent(ABC):
         
         return state
     
-    async def _generate_response_fallback(self, state: AgentState) -> AgentState:
+    async def _generate_response_fallback(
+        self,
+        state: AgentState,
+        config: Optional[RunnableConfig] = None
+    ) -> AgentState:
         """Fallback response generation without tools (original method)"""
         
         # Get prompt type for this agent
@@ -355,11 +383,14 @@ class BaseAgent(ABC):
         
         try:
             # Generate response with model preference
-            response = await self.llm_router.route_query(
-                messages=formatted_messages,
-                agent_type=self.agent_type.value,
-                preferred_provider=self._get_preferred_provider()
-            )
+            if self._is_streaming(config):
+                response = await self._stream_fallback_response(formatted_messages)
+            else:
+                response = await self.llm_router.route_query(
+                    messages=formatted_messages,
+                    agent_type=self.agent_type.value,
+                    preferred_provider=self._get_preferred_provider()
+                )
             
             # Add assistant response to messages
             state["messages"].append({
@@ -385,6 +416,46 @@ class BaseAgent(ABC):
         
         return state
     
+    def _is_streaming(self, config: Optional[RunnableConfig]) -> bool:
+        """Check whether the current graph run was started by stream_chat"""
+        if not config:
+            return False
+        return bool(config.get("configurable", {}).get("stream_tokens"))
+    
+    async def _stream_fallback_response(self, formatted_messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Generate the fallback response through the router's streaming completion,
+        forwarding each token to the LangGraph custom stream as it arrives.
+        
+        Returns the assembled response in the same shape as a non-streaming
+        route_query result.
+        """
+        writer = get_stream_writer()
+        
+        stream = await self.llm_router.route_query(
+            messages=formatted_messages,
+            agent_type=self.agent_type.value,
+            preferred_provider=self._get_preferred_provider(),
+            stream=True
+        )
+        
+        content_parts = []
+        stream_metadata = {}
+        async for chunk in stream:
+            if chunk.get("type") == "content":
+                content_parts.append(chunk["content"])
+                writer({"type": "content", "content": chunk["content"]})
+            elif chunk.get("type") == "metadata":
+                stream_metadata = chunk
+        
+        return {
+            "content": clean_response_content("".join(content_parts)),
+            "provider": stream_metadata.get("provider"),
+            "model": stream_metadata.get("model"),
+            "usage": {},
+            "response_time": stream_metadata.get("response_time", 0)
+        }
+    
     async def _generate_response(self, state: AgentState) -> AgentState:
         """Generate final response, potentially incorporating tool results"""
         
@@ -674,15 +745,7 @@ Please provide a comprehensive and helpful response to the user's question using
         """
         
         # Create initial state
-        initial_state = AgentState(
-            messages=[{"role": "user", "content": message}],
-            user_context=user_context,
-            conversation_id=conversation_id or str(uuid.uuid4()),
-            agent_type=self.agent_type.value,
-            memory={},
-            task_context=None,
-            last_updated=datetime.now(timezone.utc).isoformat()
-        )
+        initial_state = self._create_initial_state(message, user_context, conversation_id)
         
         # Configure for conversation continuity
         config = {"thread_id": initial_state["conversation_id"]}
@@ -691,68 +754,204 @@ Please provide a comprehensive and helpful response to the user's question using
             # Run the workflow
             result = await self.app.ainvoke(initial_state, config)
             
-            # Extract response (handle both dict and LangGraph message formats)
-            assistant_messages = []
-            for msg in result["messages"]:
-                if hasattr(msg, 'type') and msg.type == "ai":  # LangGraph AIMessage
-                    assistant_messages.append(msg)
-                elif isinstance(msg, dict) and msg.get("role") == "assistant":  # Dict format
-                    assistant_messages.append(msg)
-            
-            if not assistant_messages:
-                raise AIProcessingError("No response generated")
-            
-            # Get content from the latest response
-            latest_message = assistant_messages[-1]
-            if hasattr(latest_message, 'content'):  # LangGraph message object
-                latest_response = latest_message.content
-            else:  # Dict format
-                latest_response = latest_message["content"]
-            
-            return {
-                "content": latest_response,
-                "conversation_id": result["conversation_id"],
-                "agent_type": self.agent_type.value,
-                "metadata": result["memory"].get("last_response_metadata", {}),
-                "timestamp": result["last_updated"]
-            }
+            return self._build_chat_response(result)
             
         except Exception as e:
             logger.error(f"Chat processing failed: {e}")
             raise AIProcessingError(f"Chat processing failed: {e}")
+    
+    def _create_initial_state(
+        self,
+        message: str,
+        user_context: Dict[str, Any],
+        conversation_id: Optional[str] = None
+    ) -> AgentState:
+        """Create the initial graph state for a user message"""
+        
+        return AgentState(
+            messages=[{"role": "user", "content": message}],
+            user_context=user_context,
+            conversation_id=conversation_id or str(uuid.uuid4()),
+            agent_type=self.agent_type.value,
+            memory={},
+            task_context=None,
+            last_updated=datetime.now(timezone.utc).isoformat()
+        )
+    
+    def _build_chat_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the final assistant response from a completed graph state"""
+        
+        # Extract response (handle both dict and LangGraph message formats)
+        assistant_messages = []
+        for msg in result["messages"]:
+            if hasattr(msg, 'type') and msg.type == "ai":  # LangGraph AIMessage
+                assistant_messages.append(msg)
+            elif isinstance(msg, dict) and msg.get("role") == "assistant":  # Dict format
+                assistant_messages.append(msg)
+        
+        if not assistant_messages:
+            raise AIProcessingError("No response generated")
+        
+        # Get content from the latest response
+        latest_message = assistant_messages[-1]
+        if hasattr(latest_message, 'content'):  # LangGraph message object
+            latest_response = latest_message.content
+        else:  # Dict format
+            latest_response = latest_message["content"]
+        
+        return {
+            "content": clean_response_content(latest_response),
+            "conversation_id": result["conversation_id"],
+            "agent_type": self.agent_type.value,
+            "metadata": result["memory"].get("last_response_metadata", {}),
+            "timestamp": result["last_updated"]
+        }
 
     async def stream_chat(
         self,
         message: str,
         user_context: Dict[str, Any],
         conversation_id: Optional[str] = None
-    ):
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         """
-        Streaming chat interface (simplified for this implementation)
+        Streaming chat interface
+        
+        Runs the LangGraph workflow with astream and forwards LLM tokens and
+        tool progress events as the graph produces them. Tokens are cleaned
+        as they arrive, so the streamed content adds up to the content of
+        the final chunk.
+        
+        Text from the tool-calling LLM is held back until its node finishes
+        without tool calls, so a preamble before a tool call ("Let me look
+        that up...") is never sent. If the streamed text still differs from
+        the final response (a synthesis that failed halfway and fell back to
+        a tool summary), one more content chunk with "replace": True carries
+        the complete response and tells the client to discard what it got.
+        
+        Args:
+            message: User message
+            user_context: User context information
+            conversation_id: Optional conversation ID for continuity
+            
+        Yields:
+            "content", "tool_start" and "tool_end" chunks, followed by a final
+            "metadata" chunk carrying the complete response. A content chunk
+            with "replace": True replaces all content streamed before it
         """
         
-        # For now, delegate to regular chat
-        # In a full implementation, this would use LangGraph streaming capabilities
-        response = await self.chat(message, user_context, conversation_id)
+        initial_state = self._create_initial_state(message, user_context, conversation_id)
+        conversation_id = initial_state["conversation_id"]
+        
+        # stream_tokens tells nodes that call the router directly to stream too
+        config = {"configurable": {"thread_id": conversation_id, "stream_tokens": True}}
+        
+        final_state = None
+        cleaner = ResponseContentCleaner()
+        sent_parts: List[str] = []
+        
+        # Raw llm_with_tools text, held until the node's state update shows it
+        # became the final answer rather than a preamble to tool calls
+        pending: List[str] = []
         
-        # Yield response in chunks to simulate streaming
-        content = response["content"]
-        chunk_size = 50
+        def send(raw: str) -> Optional[Dict[str, Any]]:
+            content = cleaner.feed(raw)
+            if not content:
+                return None
+            sent_parts.append(content)
+            return {"type": "content", "content": content, "conversation_id": conversation_id}
         
-        for i in range(0, len(content), chunk_size):
-            chunk = content[i:i + chunk_size]
-            yield {
+        try:
+            # Closing this generator (client disconnect) closes the graph run too
+            async with aclosing(self.app.astream(
+                initial_state,
+                config,
+                stream_mode=["messages", "custom", "values"]
+            )) as run:
+                async for mode, payload in run:
+                    if mode == "messages":
+                        chunk, chunk_metadata = payload
+                        node = chunk_metadata.get("langgraph_node")
+                        
+                        # Only forward token chunks from response-producing nodes
+                        if not isinstance(chunk, AIMessageChunk) or node not in self.STREAMING_NODES:
+                            continue
+                        
+                        # A tool call makes everything the model said before it a preamble
+                        if chunk.tool_call_chunks:
+                            pending.clear()
+                            continue
+                        if not isinstance(chunk.content, str) or not chunk.content:
+                            continue
+                        
+                        if node == "llm_with_tools":
+                            pending.append(chunk.content)
+                        else:
+                            content = send(chunk.content)
+                            if content:
+                                yield content
+                    
+                    elif mode == "custom":
+                        if payload.get("type") == "content":
+                            content = send(payload["content"])
+                            if content:
+                                yield content
+                        else:
+                            yield {**payload, "conversation_id": conversation_id}
+                    
+                    elif mode == "values":
+                        final_state = payload
+                        
+                        if pending:
+                            latest = payload["messages"][-1] if payload.get("messages") else None
+                            is_answer = (
+                                latest is not None and
+                                not getattr(latest, "tool_calls", None) and
+                                self._get_message_content(latest) == "".join(pending)
+                            )
+                            if is_answer:
+                                for raw in pending:
+                                    content = send(raw)
+                                    if content:
+                                        yield content
+                            pending.clear()
+            
+            # Text held back at the end of the stream (an unfinished line start)
+            content = cleaner.flush()
+            if content:
+                sent_parts.append(content)
+                yield {"type": "content", "content": content, "conversation_id": conversation_id}
+            
+            if final_state is None:
+                raise AIProcessingError("No response generated")
+            
+            response = self._build_chat_response(final_state)
+            
+        except Exception as e:
+            logger.error(f"Streaming chat processing failed: {e}")
+            raise AIProcessingError(f"Streaming chat processing failed: {e}")
+        
+        # Responses that never passed through an LLM stream (error fallbacks,
+        # tool summaries) are sent as a single chunk, replacing any streamed
+        # text that did not end up in the final message
+        sent_content = "".join(sent_parts)
+        if response["content"] and sent_content != response["content"]:
+            chunk = {
                 "type": "content",
-                "content": chunk,
+                "content": response["content"],
                 "conversation_id": response["conversation_id"]
             }
-            await asyncio.sleep(0.1)  # Small delay for streaming effect
+            if sent_content:
+                chunk["replace"] = True
+            yield chunk
         
         # Final metadata chunk
         yield {
-            "type": "metadata", 
+            "type": "metadata",
+            "content": response["content"],
+            "agent_type": response["agent_type"],
             "metadata": response["metadata"],
-            "conversation_id": response["conversation_id"]
+            "conversation_id": response["conversation_id"],
+            "timestamp": response["timestamp"]
         }
 
     async def get_conversation_history(
@@ -7,7 +7,7 @@ model settings, provider configurations, and system parameters.
 
 import os
 from typing import Dict, Any, List, Optional
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 from enum import Enum
 
@@ -24,6 +24,14 @@ class AgentType(str, Enum):
     ANALYTICS = "analytics"
     GENERAL = "general"
 
+# Output dimension of the supported embedding models; vectors are stored in
+# Neo4j vector indexes created with AIConfig.embedding_dimension dimensions
+EMBEDDING_MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
 class AIConfig(BaseSettings):
     """AI system configuration settings"""
     
@@ -41,7 +49,7 @@ class AIConfig(BaseSettings):
     # OpenAI Configuration  
     openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
     openai_default_model: str = "gpt-4o-mini"
-    openai_embedding_model: str = "text-embedding-3-small"
+    openai_embedding_model: str = Field(default="text-embedding-3-small", env="OPENAI_EMBEDDING_MODEL")
     openai_max_tokens: int = 2048
     openai_temperature: float = 0.7
     
@@ -101,6 +109,17 @@ class AIConfig(BaseSettings):
         case_sensitive = False
         extra = "ignore"  # Ignore extra environment variables not defined in the model
 
+    @model_validator(mode="after")
+    def check_embedding_dimension(self) -> "AIConfig":
+        """Fail at startup when the embedding model cannot fill the vector indexes"""
+        model_dimension = EMBEDDING_MODEL_DIMENSIONS.get(self.openai_embedding_model)
+        if model_dimension is not None and model_dimension != self.embedding_dimension:
+            raise ValueError(
+                f"Embedding model {self.openai_embedding_model} returns {model_dimension}-dimensional "
+                f"vectors but embedding_dimension is {self.embedding_dimension}"
+            )
+        return self
+
     def get_model_config(self, provider: LLMProvider) -> Dict[str, Any]:
         """Get model configuration for specific provider"""
         configs = {
@@ -7,30 +7,45 @@ with proper error handling and retry logic.
 
 import asyncio
 import logging
+import time
 from typing import Dict, List, Any, Optional, Union
 from contextlib import asynccontextmanager
 import json
 from datetime import datetime
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncDriver, AsyncSession
 from neo4j.exceptions import ServiceUnavailable, TransientError
 
+from database.driver_registry import get_driver_registry
+from database.query_registry import register_query
+from database.slow_query_log import get_slow_query_log
+
 from ..config import AIConfig
 from ...core.exceptions import DatabaseConnectionError
 
 logger = logging.getLogger(__name__)
 
+# The index name is a parameter, so every vector index shares one plan
+VECTOR_QUERY = register_query("graph.vector_query", """
+CALL db.index.vector.queryNodes($index_name, $top_k, $vector)
+YIELD node, score
+WHERE score >= $threshold
+RETURN node, score
+ORDER BY score DESC
+""", parameters={"index_name": "person_bio_vector", "top_k": 10, "vector": [0.0], "threshold": 0.0})
+
 class Neo4jClient:
     """
     Async Neo4j client with connection pooling and error handling
+    
+    The driver and its pool are shared process-wide (see database.driver_registry).
     """
     
     def __init__(self, config: AIConfig):
         self.config = config
         self.driver: Optional[AsyncDriver] = None
-        self._connection_pool_size = 50
-        self._connection_timeout = 15
         self._max_retry_attempts = 3
+        self._max_transaction_retry_time = 15.0  # seconds managed transactions retry transient errors
         
     async def connect(self) -> None:
         """Initialize Neo4j driver connection"""
@@ -39,13 +54,10 @@ class Neo4jClient:
             return
             
         try:
-            # Configure driver with connection pooling
-            self.driver = AsyncGraphDatabase.driver(
+            # Borrow the process-wide driver and its connection pool
+            self.driver = get_driver_registry().acquire(
                 self.config.neo4j_uri,
-                auth=(self.config.neo4j_username, self.config.neo4j_password),
-                max_connection_pool_size=self._connection_pool_size,
-                connection_timeout=self._connection_timeout,
-                database=self.config.neo4j_database
+                (self.config.neo4j_username, self.config.neo4j_password)
             )
             
             # Verify connectivity
@@ -54,12 +66,15 @@ class Neo4jClient:
             
         except Exception as e:
             logger.error(f"Neo4j connection failed: {e}")
+            if self.driver:
+                await get_driver_registry().release(self.driver)
+                self.driver = None
             raise DatabaseConnectionError(f"Failed to connect to Neo4j: {e}")
 
     async def _verify_connectivity(self) -> None:
         """Verify database connectivity"""
         
-        async with self.driver.session() as session:
+        async with self.driver.session(database=self.config.neo4j_database) as session:
             result = await session.run("RETURN 1 as test")
             record = await result.single()
             if not record or record["test"] != 1:
@@ -69,7 +84,7 @@ class Neo4jClient:
         """Close Neo4j driver connection"""
         
         if self.driver:
-            await self.driver.close()
+            await get_driver_registry().release(self.driver)
             self.driver = None
             logger.info("Neo4j connection closed")
 
@@ -113,6 +128,7 @@ class Neo4jClient:
         
         for attempt in range(retry_attempts):
             try:
+                started = time.perf_counter()
                 async with self.session(database) as session:
                     result = await session.run(query, parameters or {})
                     
@@ -126,6 +142,11 @@ class Neo4jClient:
                     # Get query summary
                     summary = await result.consume()
                     
+                    get_slow_query_log().observe(
+                        self.driver, database or self.config.neo4j_database, query, parameters,
+                        time.perf_counter() - started, records=len(records)
+                    )
+                    
                     logger.debug(f"Query executed successfully: {len(records)} records returned")
                     return records
                     
@@ -193,6 +214,81 @@ class Neo4jClient:
             logger.error(f"Write query execution error: {e}")
             raise DatabaseConnectionError(f"Write query execution failed: {e}")
 
+    async def execute_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a read-only query in a managed read transaction
+        
+        Routed to followers and read replicas in a cluster; transient
+        failures are retried by the driver for a bounded time.
+        
+        Returns:
+            List of result records as dictionaries
+        """
+        
+        return await self._execute_managed(READ_ACCESS, query, parameters, database)
+
+    async def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a query in a managed write transaction on the cluster leader
+        
+        Retried like execute_read, so the query must be safe to run again.
+        
+        Returns:
+            List of result records as dictionaries
+        """
+        
+        return await self._execute_managed(WRITE_ACCESS, query, parameters, database)
+
+    async def _execute_managed(
+        self,
+        access_mode: str,
+        query: str,
+        parameters: Optional[Dict[str, Any]],
+        database: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Run one query as a driver-managed transaction function"""
+        
+        if not self.driver:
+            await self.connect()
+        
+        async def work(tx):
+            result = await tx.run(query, parameters or {})
+            return [self._serialize_record(dict(record)) async for record in result]
+        
+        try:
+            started = time.perf_counter()
+            async with self.driver.session(
+                database=database or self.config.neo4j_database,
+                default_access_mode=access_mode,
+                max_transaction_retry_time=self._max_transaction_retry_time
+            ) as session:
+                if access_mode == READ_ACCESS:
+                    records = await session.execute_read(work)
+                else:
+                    records = await session.execute_write(work)
+            
+            get_slow_query_log().observe(
+                self.driver, database or self.config.neo4j_database, query, parameters,
+                time.perf_counter() - started, access_mode=access_mode, records=len(records)
+            )
+            
+            logger.debug(f"{access_mode} transaction executed: {len(records)} records returned")
+            return records
+            
+        except Exception as e:
+            logger.error(f"{access_mode} transaction failed: {e}")
+            raise DatabaseConnectionError(f"{access_mode.capitalize()} transaction failed: {e}")
+
     async def run_vector_query(
         self,
         index_name: str,
@@ -213,22 +309,15 @@ class Neo4jClient:
             List of similar nodes with scores
         """
         
-        query = f"""
-        CALL db.index.vector.queryNodes('{index_name}', $top_k, $vector)
-        YIELD node, score
-        WHERE score >= $threshold
-        RETURN node, score
-        ORDER BY score DESC
-        """
-        
         parameters = {
+            "index_name": index_name,
             "vector": vector,
             "top_k": top_k,
             "threshold": similarity_threshold or 0.0
         }
         
         try:
-            results = await self.run_query(query, parameters)
+            results = await self.execute_read(VECTOR_QUERY, parameters)
             
             # Format results
             formatted_results = []
@@ -401,6 +490,7 @@ class Neo4jClient:
                 "status": "healthy",
                 "response_time": response_time,
                 "database": self.config.neo4j_database,
+                "pool": get_driver_registry().get_pool_metrics(self.driver),
                 "timestamp": datetime.utcnow().isoformat()
             }
             
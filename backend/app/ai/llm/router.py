@@ -7,6 +7,7 @@ cost optimization, and provider-specific configuration.
 
 import asyncio
 import logging
+import re
 from typing import Dict, Any, List, Optional, AsyncGenerator, Union
 from enum import Enum
 import httpx
@@ -19,6 +20,91 @@ from ...core.exceptions import AIProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Response formatting, applied line by line so streamed responses can be
+# cleaned as they arrive: "1. Section Name:" becomes "**Section Name:**"
+# and "-" or "*" bullets become "•", keeping any indentation
+_SECTION_HEADER = re.compile(r'^([^\S\n]*)\d+\.[^\S\n]+([^:\n]+:)', re.MULTILINE)
+_BULLET = re.compile(r'^([^\S\n]*)[\*\-][^\S\n]+', re.MULTILINE)
+
+# Line starts that may still turn into a section header or a bullet
+_PARTIAL_SECTION_HEADER = re.compile(r'[^\S\n]*\d+(\.([^\S\n][^:\n]*)?)?')
+_PARTIAL_BULLET = re.compile(r'[^\S\n]*([\*\-][^\S\n]*)?')
+
+
+def _format_lines(content: str) -> str:
+    content = _SECTION_HEADER.sub(r'\1**\2**', content)
+    return _BULLET.sub(r'\1• ', content)
+
+
+def clean_response_content(content: str) -> str:
+    """Clean and format LLM response content for better display"""
+    
+    content = _format_lines(content)
+    
+    # Clean up trailing spaces, then reduce excessive newlines (max 2)
+    content = re.sub(r'[ ]+\n', '\n', content)
+    content = re.sub(r'\n{3,}', '\n\n', content)
+    
+    return content.strip()
+
+
+class ResponseContentCleaner:
+    """
+    Incremental clean_response_content() for streamed responses
+    
+    Each line start is held back until it is known whether it is a section
+    header or a bullet, and trailing whitespace until more text follows, so
+    the concatenated output of feed() and flush() equals
+    clean_response_content() of the whole response.
+    """
+    
+    def __init__(self):
+        self._line_start: Optional[str] = ""  # None once the line start is formatted
+        self._whitespace = ""  # held back until more text follows
+        self._started = False
+    
+    def feed(self, token: str) -> str:
+        """Add a streamed token; returns the cleaned text that is now final"""
+        output = []
+        for line in re.split(r'(\n)', token):
+            if line == "\n":
+                if self._line_start is not None:
+                    output.append(self._emit(_format_lines(self._line_start)))
+                self._whitespace = self._whitespace.rstrip(" ") + "\n"
+                self._line_start = ""
+            elif self._line_start is None:
+                output.append(self._emit(line))
+            else:
+                self._line_start += line
+                if not (_PARTIAL_SECTION_HEADER.fullmatch(self._line_start) or
+                        _PARTIAL_BULLET.fullmatch(self._line_start)):
+                    output.append(self._emit(_format_lines(self._line_start)))
+                    self._line_start = None
+        return "".join(output)
+    
+    def flush(self) -> str:
+        """End of the response; returns any cleaned text still held back"""
+        output = self._emit(_format_lines(self._line_start)) if self._line_start else ""
+        self._line_start = ""
+        self._whitespace = ""
+        return output
+    
+    def _emit(self, text: str) -> str:
+        output = []
+        for part in re.split(r'(\s+)', text):
+            if not part:
+                continue
+            if part.isspace():
+                self._whitespace += part
+                continue
+            if self._started:
+                output.append(re.sub(r'\n{3,}', '\n\n', self._whitespace))
+            self._started = True
+            self._whitespace = ""
+            output.append(part)
+        return "".join(output)
+
+
 class QueryComplexity(str, Enum):
     """Query complexity levels for model routing"""
     SIMPLE = "simple"      # Basic queries, factual lookups
@@ -65,6 +151,13 @@ class LLMRouter:
         #         api_key=self.config.openai_api_key
         #     )
         #     logger.info("Initialized OpenAI provider")
+        
+        # Embeddings always come from OpenAI: the Neo4j vector indexes hold
+        # embedding_dimension-sized vectors, which no Together.ai model returns
+        self.embedding_client = None
+        if self.config.openai_api_key:
+            self.embedding_client = AsyncOpenAI(api_key=self.config.openai_api_key)
+            logger.info(f"Initialized OpenAI embeddings ({self.config.openai_embedding_model})")
 
     async def route_query(
         self,
@@ -223,7 +316,7 @@ class LLMRouter:
             
             # Format response
             return {
-                "content": self._clean_response_content(response.choices[0].message.content),
+                "content": clean_response_content(response.choices[0].message.content),
                 "provider": provider,
                 "model": params["model"],
                 "usage": {
@@ -266,7 +359,8 @@ class LLMRouter:
             stream = await client.chat.completions.create(**params)
             
             async for chunk in stream:
-                if chunk.choices[0].delta.content:
+                # Usage-only and keep-alive chunks arrive without choices
+                if chunk.choices and chunk.choices[0].delta.content:
                     yield {
                         "content": chunk.choices[0].delta.content,
                         "provider": provider,
@@ -311,25 +405,6 @@ class LLMRouter:
                 (current_avg * (total_requests - 1) + response_time) / total_requests
             )
 
-    def _clean_response_content(self, content: str) -> str:
-        """Clean and format LLM response content for better display"""
-        import re
-        
-        # Convert numbered main sections to bold headers
-        # Pattern: "1. Section Name:" becomes "**Section Name:**"
-        content = re.sub(r'^(\d+)\.\s+([^:\n]+:)', r'**\2**', content, flags=re.MULTILINE)
-        
-        # Reduce excessive newlines (max 2)
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        
-        # Ensure consistent bullet formatting
-        content = re.sub(r'^[\*\-]\s+', '• ', content, flags=re.MULTILINE)
-        
-        # Clean up extra spaces
-        content = re.sub(r'[ ]+\n', '\n', content)
-        
-        return content.strip()
-
     def _estimate_cost(self, provider: LLMProvider, total_tokens: int) -> float:
         """Estimate cost for request"""
         cost_per_token = self.cost_per_token.get(provider, 0)
@@ -337,15 +412,86 @@ class LLMRouter:
 
     async def get_embedding(
         self,
-        text: str,
+        text: Union[str, List[str]],
         model: Optional[str] = None
-    ) -> List[float]:
-        """Generate text embeddings - currently disabled (no OpenAI provider)"""
+    ) -> Union[List[float], List[List[float]]]:
+        """
+        Generate text embeddings
         
-        raise AIProcessingError(
-            "Embedding generation not available - OpenAI provider not configured. "
-            "Consider using Together.ai embedding models or external embedding service."
-        )
+        Args:
+            text: Text to embed, or a list of texts to embed in one request
+            model: Embedding model (defaults to the configured OpenAI embedding model)
+            
+        Returns:
+            Embedding vector, or one vector per input text when given a list
+        """
+        
+        if isinstance(text, list):
+            return await self.get_embeddings(text, model=model)
+        
+        embeddings = await self.get_embeddings([text], model=model)
+        return embeddings[0]
+
+    async def get_embeddings(
+        self,
+        texts: List[str],
+        model: Optional[str] = None
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for several texts with a single API request
+        
+        The embeddings endpoint accepts an array of inputs, so callers should
+        batch texts rather than issue one request per text.
+        
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to the configured OpenAI embedding model)
+            
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        
+        if not texts:
+            return []
+        
+        if self.embedding_client is None:
+            raise AIProcessingError(
+                "Embedding generation not available - OpenAI API key not configured"
+            )
+        
+        provider = LLMProvider.OPENAI
+        start_time = asyncio.get_event_loop().time()
+        
+        try:
+            response = await self.embedding_client.embeddings.create(
+                model=model or self.config.openai_embedding_model,
+                input=texts
+            )
+            
+            response_time = asyncio.get_event_loop().time() - start_time
+            
+            # The API may return items out of order; index maps back to the input
+            data = sorted(response.data, key=lambda item: item.index)
+            if len(data) != len(texts):
+                raise AIProcessingError(
+                    f"Embedding count mismatch: requested {len(texts)}, received {len(data)}"
+                )
+            
+            dimension = len(data[0].embedding)
+            if dimension != self.config.embedding_dimension:
+                raise AIProcessingError(
+                    f"Embedding dimension mismatch: model returned {dimension}, "
+                    f"vector indexes expect {self.config.embedding_dimension}"
+                )
+            
+            # Only a response that passed both checks counts as a success
+            self._update_stats(provider, success=True, response_time=response_time)
+            
+            return [item.embedding for item in data]
+            
+        except Exception as e:
+            self._update_stats(provider, success=False)
+            raise AIProcessingError(f"Embedding generation failed: {e}")
 
     def get_provider_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get performance statistics for all providers"""
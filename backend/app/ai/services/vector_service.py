@@ -9,6 +9,7 @@ import asyncio
 import logging
 import hashlib
 import json
+import struct
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
@@ -16,6 +17,9 @@ from enum import Enum
 import redis.asyncio as redis
 from redis.asyncio import Redis
 import numpy as np
+from neo4j import WRITE_ACCESS
+
+from database.query_registry import register_query
 
 from ..config import AIConfig
 from ..llm.router import LLMRouter
@@ -32,6 +36,62 @@ class VectorType(str, Enum):
     COMPANY_DESCRIPTION = "company_description"
     QUERY = "query"
 
+# Binary vector cache format: magic, format version and dimension, followed
+# by the embedding as raw little-endian float32 values
+VECTOR_CACHE_MAGIC = b"OVEC"
+VECTOR_CACHE_VERSION = 1
+VECTOR_CACHE_HEADER = struct.Struct("<4sBI")
+VECTOR_CACHE_DTYPE = np.dtype("<f4")
+
+# Label and embedding property of each indexed entity type
+EMBEDDED_ENTITIES = {
+    "person": ("Person", "bio_embedding"),
+    "project": ("Project", "description_embedding"),
+    "company": ("Company", "description_embedding")
+}
+
+# Labels and property names cannot be parameters: one query per entity type
+UPDATE_ENTITY_EMBEDDING = {
+    entity_type: register_query(f"vector.update_embedding.{entity_type}", f"""
+MATCH (n:{label} {{id: $entity_id}})
+SET n.{embedding_field} = $embedding,
+    n.embedding_updated = datetime()
+""", parameters={"entity_id": "", "embedding": [0.0]}, access_mode=WRITE_ACCESS)
+    for entity_type, (label, embedding_field) in EMBEDDED_ENTITIES.items()
+}
+
+ENTITY_EMBEDDING = {
+    entity_type: register_query(f"vector.entity_embedding.{entity_type}", f"""
+MATCH (n:{label} {{id: $entity_id}})
+RETURN n.{embedding_field} as embedding
+""", parameters={"entity_id": ""})
+    for entity_type, (label, embedding_field) in EMBEDDED_ENTITIES.items()
+}
+
+PEOPLE_FOR_INDEXING = register_query("vector.people_for_indexing", """
+MATCH (p:Person)
+WHERE p.bio IS NOT NULL
+  AND (p.bio_embedding IS NULL OR p.bio_updated > p.embedding_updated)
+RETURN p.id as id, p.bio as bio
+LIMIT 1000
+""")
+
+PROJECTS_FOR_INDEXING = register_query("vector.projects_for_indexing", """
+MATCH (p:Project)
+WHERE p.description IS NOT NULL
+  AND (p.description_embedding IS NULL OR p.description_updated > p.embedding_updated)
+RETURN p.id as id, p.description as description
+LIMIT 1000
+""")
+
+COMPANIES_FOR_INDEXING = register_query("vector.companies_for_indexing", """
+MATCH (c:Company)
+WHERE c.description IS NOT NULL
+  AND (c.description_embedding IS NULL OR c.description_updated > c.embedding_updated)
+RETURN c.id as id, c.description as description
+LIMIT 1000
+""")
+
 class VectorSearchService:
     """
     Vector search service with embeddings generation and caching
@@ -97,16 +157,14 @@ class VectorSearchService:
         # Create cache key
         cache_key = None
         if use_cache:
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-            cache_key = f"{self.config.redis_key_prefix}vector:{vector_type.value}:{text_hash}"
+            cache_key = self._get_cache_key(text, vector_type)
             
             # Check cache first
             try:
                 cached_vector = await self.redis_client.get(cache_key)
                 if cached_vector:
                     self.embedding_stats["cache_hits"] += 1
-                    vector_data = json.loads(cached_vector)
-                    return vector_data["embedding"]
+                    return self._decode_cached_vector(cached_vector)
             except Exception as e:
                 logger.warning(f"Cache retrieval failed: {e}")
         
@@ -123,29 +181,16 @@ class VectorSearchService:
             generation_time = asyncio.get_event_loop().time() - start_time
             
             # Update stats
-            self.embedding_stats["total_generated"] += 1
             self.embedding_stats["cache_misses"] += 1
-            
-            # Update rolling average
-            current_avg = self.embedding_stats["avg_generation_time"]
-            total_generated = self.embedding_stats["total_generated"]
-            self.embedding_stats["avg_generation_time"] = (
-                (current_avg * (total_generated - 1) + generation_time) / total_generated
-            )
+            self._record_generation(1, generation_time)
             
             # Cache the result
             if use_cache and cache_key:
                 try:
-                    vector_data = {
-                        "embedding": embedding,
-                        "text_length": len(text),
-                        "generated_at": datetime.utcnow().isoformat(),
-                        "vector_type": vector_type.value
-                    }
                     await self.redis_client.setex(
                         cache_key,
                         self.cache_ttl,
-                        json.dumps(vector_data)
+                        self._encode_cached_vector(embedding)
                     )
                 except Exception as e:
                     logger.warning(f"Cache storage failed: {e}")
@@ -162,7 +207,15 @@ class VectorSearchService:
         vector_type: VectorType,
         use_cache: bool = True
     ) -> List[Optional[List[float]]]:
-        """Generate embeddings for multiple texts efficiently"""
+        """
+        Generate embeddings for multiple texts efficiently
+        
+        Each batch costs one MGET for cache lookups, one embeddings request
+        for the misses and one pipelined round of SETEX writes.
+        
+        Returns:
+            One embedding per input text, None where generation failed
+        """
         
         if not texts:
             return []
@@ -173,22 +226,10 @@ class VectorSearchService:
         for i in range(0, len(texts), self.batch_size):
             batch = texts[i:i + self.batch_size]
             
-            # Process batch concurrently
-            batch_tasks = [
-                self.generate_embedding(text, vector_type, use_cache)
-                for text in batch
-            ]
-            
             try:
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                
-                # Handle exceptions in batch
-                for j, result in enumerate(batch_results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Batch embedding failed for text {i+j}: {result}")
-                        results.append(None)
-                    else:
-                        results.append(result)
+                results.extend(
+                    await self._generate_embedding_batch(batch, vector_type, use_cache)
+                )
                 
                 # Rate limiting - small delay between batches
                 if i + self.batch_size < len(texts):
@@ -201,6 +242,148 @@ class VectorSearchService:
         
         return results
 
+    async def _generate_embedding_batch(
+        self,
+        texts: List[str],
+        vector_type: VectorType,
+        use_cache: bool
+    ) -> List[Optional[List[float]]]:
+        """Resolve one batch of texts from cache, embedding only the misses"""
+        
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        
+        # Empty texts cannot be embedded
+        positions = []
+        for j, text in enumerate(texts):
+            if text and text.strip():
+                positions.append(j)
+            else:
+                logger.error(f"Batch embedding failed for text {j}: empty text")
+        
+        cache_keys = {j: self._get_cache_key(texts[j], vector_type) for j in positions}
+        
+        # Pipelined cache lookup
+        if use_cache and positions:
+            try:
+                cached_values = await self.redis_client.mget([cache_keys[j] for j in positions])
+                for j, cached_vector in zip(positions, cached_values):
+                    if cached_vector:
+                        try:
+                            results[j] = self._decode_cached_vector(cached_vector)
+                        except Exception as e:
+                            logger.warning(f"Cached vector decode failed: {e}")
+            except Exception as e:
+                logger.warning(f"Batch cache retrieval failed: {e}")
+            
+            self.embedding_stats["cache_hits"] += sum(1 for j in positions if results[j] is not None)
+        
+        # Deduplicate identical texts so each is embedded once
+        misses: Dict[str, List[int]] = {}
+        for j in positions:
+            if results[j] is None:
+                misses.setdefault(texts[j], []).append(j)
+        
+        if not misses:
+            return results
+        
+        miss_texts = list(misses.keys())
+        start_time = asyncio.get_event_loop().time()
+        
+        try:
+            embeddings = await self.llm_router.get_embeddings(miss_texts)
+        except Exception as e:
+            logger.error(f"Batch embedding generation failed for {len(miss_texts)} texts: {e}")
+            return results
+        
+        generation_time = asyncio.get_event_loop().time() - start_time
+        
+        generated = {}
+        for text, embedding in zip(miss_texts, embeddings):
+            if not embedding or len(embedding) != self.embedding_dimension:
+                logger.error(f"Invalid embedding dimension: {len(embedding) if embedding else 0}")
+                continue
+            generated[text] = embedding
+            for j in misses[text]:
+                results[j] = embedding
+        
+        self.embedding_stats["cache_misses"] += len(miss_texts)
+        if generated:
+            self._record_generation(len(generated), generation_time)
+        
+        # Pipelined cache write-back
+        if use_cache and generated:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for text, embedding in generated.items():
+                    pipe.setex(
+                        cache_keys[misses[text][0]],
+                        self.cache_ttl,
+                        self._encode_cached_vector(embedding)
+                    )
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Batch cache storage failed: {e}")
+        
+        return results
+
+    def _get_cache_key(self, text: str, vector_type: VectorType) -> str:
+        """Build the Redis cache key for a text embedding"""
+        text_hash = hashlib.md5(text.encode()).hexdigest()
+        return f"{self.config.redis_key_prefix}vector:{vector_type.value}:{text_hash}"
+
+    def _encode_cached_vector(self, embedding: List[float]) -> bytes:
+        """
+        Serialize an embedding for the Redis cache
+        
+        Vectors are stored as a small header plus raw little-endian float32
+        bytes, about a quarter of the size of the JSON representation.
+        """
+        vector = np.asarray(embedding, dtype=VECTOR_CACHE_DTYPE)
+        header = VECTOR_CACHE_HEADER.pack(VECTOR_CACHE_MAGIC, VECTOR_CACHE_VERSION, vector.shape[0])
+        return header + vector.tobytes()
+
+    def _decode_cached_vector(self, cached_vector: bytes) -> List[float]:
+        """
+        Deserialize an embedding read from the Redis cache
+        
+        Binary entries are read with np.frombuffer instead of being parsed,
+        then converted to the list of floats that Neo4j parameters need.
+        JSON entries written before the binary format are still accepted
+        until they expire.
+        """
+        if cached_vector[:len(VECTOR_CACHE_MAGIC)] == VECTOR_CACHE_MAGIC:
+            _, version, dimension = VECTOR_CACHE_HEADER.unpack_from(cached_vector)
+            if version != VECTOR_CACHE_VERSION:
+                raise AIProcessingError(f"Unsupported vector cache version: {version}")
+            
+            payload_size = len(cached_vector) - VECTOR_CACHE_HEADER.size
+            if payload_size != dimension * VECTOR_CACHE_DTYPE.itemsize:
+                raise AIProcessingError("Truncated vector cache entry")
+            
+            return np.frombuffer(
+                cached_vector,
+                dtype=VECTOR_CACHE_DTYPE,
+                count=dimension,
+                offset=VECTOR_CACHE_HEADER.size
+            ).tolist()
+        
+        # Legacy JSON document
+        vector_data = json.loads(cached_vector)
+        return vector_data["embedding"]
+
+    def _record_generation(self, count: int, generation_time: float) -> None:
+        """Update generation stats; batch time is amortized over its embeddings"""
+        
+        previous_total = self.embedding_stats["total_generated"]
+        total_generated = previous_total + count
+        self.embedding_stats["total_generated"] = total_generated
+        
+        # Update rolling average (per embedding)
+        current_avg = self.embedding_stats["avg_generation_time"]
+        self.embedding_stats["avg_generation_time"] = (
+            (current_avg * previous_total + generation_time) / total_generated
+        )
+
     async def semantic_search(
         self,
         query: str,
@@ -398,9 +581,16 @@ class VectorSearchService:
     async def index_entities(
         self,
         entity_type: str,
-        batch_size: int = 50
+        batch_size: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Index entities with vector embeddings"""
+        """
+        Index entities with vector embeddings
+        
+        Each batch is embedded with a single batched request, so batch_size
+        defaults to the service's embedding batch size.
+        """
+        
+        batch_size = batch_size or self.batch_size
         
         indexing_results = {
             "total_processed": 0,
@@ -474,43 +664,19 @@ class VectorSearchService:
     async def _get_people_for_indexing(self) -> List[Dict[str, Any]]:
         """Get people that need bio embedding indexing"""
         
-        query = """
-        MATCH (p:Person)
-        WHERE p.bio IS NOT NULL 
-          AND (p.bio_embedding IS NULL OR p.bio_updated > p.embedding_updated)
-        RETURN p.id as id, p.bio as bio
-        LIMIT 1000
-        """
-        
-        results = await self.neo4j.run_query(query)
+        results = await self.neo4j.run_query(PEOPLE_FOR_INDEXING)
         return [{"id": r["id"], "bio": r["bio"]} for r in results]
 
     async def _get_projects_for_indexing(self) -> List[Dict[str, Any]]:
         """Get projects that need description embedding indexing"""
         
-        query = """
-        MATCH (p:Project)
-        WHERE p.description IS NOT NULL
-          AND (p.description_embedding IS NULL OR p.description_updated > p.embedding_updated)
-        RETURN p.id as id, p.description as description
-        LIMIT 1000
-        """
-        
-        results = await self.neo4j.run_query(query)
+        results = await self.neo4j.run_query(PROJECTS_FOR_INDEXING)
         return [{"id": r["id"], "description": r["description"]} for r in results]
 
     async def _get_companies_for_indexing(self) -> List[Dict[str, Any]]:
         """Get companies that need description embedding indexing"""
         
-        query = """
-        MATCH (c:Company)
-        WHERE c.description IS NOT NULL
-          AND (c.description_embedding IS NULL OR c.description_updated > c.embedding_updated)
-        RETURN c.id as id, c.description as description
-        LIMIT 1000
-        """
-        
-        results = await self.neo4j.run_query(query)
+        results = await self.neo4j.run_query(COMPANIES_FOR_INDEXING)
         return [{"id": r["id"], "description": r["description"]} for r in results]
 
     async def _update_entity_embedding(
@@ -522,23 +688,13 @@ class VectorSearchService:
     ) -> None:
         """Update entity with generated embedding"""
         
-        label_map = {
-            "person": "Person",
-            "project": "Project",
-            "company": "Company"
-        }
-        
-        label = label_map.get(entity_type)
-        if not label:
+        if entity_type not in EMBEDDED_ENTITIES:
             raise AIProcessingError(f"Unknown entity type: {entity_type}")
         
-        query = f"""
-        MATCH (n:{label} {{id: $entity_id}})
-        SET n.{embedding_field} = $embedding,
-            n.embedding_updated = datetime()
-        """
+        if EMBEDDED_ENTITIES[entity_type][1] != embedding_field:
+            raise AIProcessingError(f"Unknown embedding field for {entity_type}: {embedding_field}")
         
-        await self.neo4j.run_write_query(query, {
+        await self.neo4j.run_write_query(UPDATE_ENTITY_EMBEDDING[entity_type], {
             "entity_id": entity_id,
             "embedding": embedding
         })
@@ -551,32 +707,11 @@ class VectorSearchService:
     ) -> List[Dict[str, Any]]:
         """Find entities similar to given entity"""
         
-        # Get entity's embedding
-        embedding_field_map = {
-            "person": "bio_embedding",
-            "project": "description_embedding",
-            "company": "description_embedding"
-        }
-        
-        label_map = {
-            "person": "Person",
-            "project": "Project", 
-            "company": "Company"
-        }
-        
-        embedding_field = embedding_field_map.get(entity_type)
-        label = label_map.get(entity_type)
-        
-        if not embedding_field or not label:
+        if entity_type not in EMBEDDED_ENTITIES:
             raise AIProcessingError(f"Unsupported entity type: {entity_type}")
         
         # Get source entity's embedding
-        query = f"""
-        MATCH (n:{label} {{id: $entity_id}})
-        RETURN n.{embedding_field} as embedding
-        """
-        
-        result = await self.neo4j.run_query(query, {"entity_id": entity_id})
+        result = await self.neo4j.run_query(ENTITY_EMBEDDING[entity_type], {"entity_id": entity_id})
         
         if not result or not result[0]["embedding"]:
             raise AIProcessingError(f"No embedding found for entity {entity_id}")
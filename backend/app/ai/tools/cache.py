@@ -1,24 +1,144 @@
 """
 Tool Caching System
 
-Redis-based caching for LangGraph tools with deterministic key generation,
-TTL management, and cache invalidation patterns.
+Two-tier caching for LangGraph tools: an in-process LRU (L1) in front of
+Redis (L2), with deterministic key generation, TTL management, and cache
+invalidation patterns.
+
+Entries stay readable for a stale window after their TTL. Tools wrapped with
+`cached_tool` serve stale entries immediately and refresh them in the
+background, and refresh hot entries probabilistically before they expire
+(XFetch early expiration) so refreshes are spread out instead of clustering
+at the TTL boundary.
+
+Every entry is registered in Redis tag sets (its tool plus the people,
+organizations, projects and Folk IDs it touches) so invalidation deletes
+exactly the affected keys in pipelined batches instead of walking the
+keyspace with KEYS. Tag sets are sorted sets scored by each entry's expiry,
+so members whose entries have expired are pruned on every write.
 """
 
+import os
 import json
+import math
+import time
+import random
+import asyncio
 import hashlib
 import logging
-from typing import Any, Dict, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union
 from datetime import timedelta
+from fnmatch import fnmatchcase
 from functools import wraps
 
 from .dependencies import get_redis_context
+from .local_cache import LocalCache, apply_invalidation, publish_invalidation
 
 logger = logging.getLogger(__name__)
 
 
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+    
+    The first caller starts the work as a task; callers arriving while it
+    is in flight await the same task and receive its result or exception.
+    Cancelling one caller does not cancel the shared work.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = {"executions": 0, "coalesced": 0}
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func once for all concurrent callers with the same key"""
+        task = self._inflight.get(key)
+        
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            self.stats["executions"] += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.stats["coalesced"] += 1
+            logger.debug(f"Coalesced concurrent call: {key}")
+        
+        return await asyncio.shield(task)
+    
+    def in_flight(self) -> int:
+        """Number of keys currently executing"""
+        return len(self._inflight)
+    
+    def is_in_flight(self, key: str) -> bool:
+        """Whether an execution for key is running"""
+        return key in self._inflight
+    
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+# Shared by every cached/coalesced tool in this process
+tool_flights = SingleFlight()
+
+
+@dataclass
+class CachedEntry:
+    """Cached tool result with its freshness metadata"""
+    value: Dict[str, Any]
+    fresh_until: float      # Unix time the entry stops being fresh
+    compute_time: float     # Seconds the tool took to produce the value
+    
+    @property
+    def is_stale(self) -> bool:
+        return time.time() >= self.fresh_until
+    
+    def should_refresh(self, beta: float = 1.0) -> bool:
+        """
+        Decide whether to refresh this entry now.
+        
+        Stale entries always refresh. Fresh entries refresh early with a
+        probability that grows as expiry approaches, scaled by how expensive
+        the value is to recompute (XFetch).
+        """
+        now = time.time()
+        if now >= self.fresh_until:
+            return True
+        if self.compute_time <= 0 or beta <= 0:
+            return False
+        
+        # 1 - random() is in (0, 1], so log() is always defined
+        return now - self.compute_time * beta * math.log(1.0 - random.random()) >= self.fresh_until
+    
+    def to_json(self) -> str:
+        return json.dumps({
+            "__swr__": {"fresh_until": self.fresh_until, "compute_time": self.compute_time},
+            "value": self.value
+        }, ensure_ascii=True)
+    
+    @classmethod
+    def from_json(cls, data: Union[str, bytes], remaining_ttl: Optional[int]) -> "CachedEntry":
+        payload = json.loads(data)
+        
+        if isinstance(payload, dict) and "__swr__" in payload:
+            meta = payload["__swr__"]
+            return cls(
+                value=payload["value"],
+                fresh_until=meta["fresh_until"],
+                compute_time=meta.get("compute_time", 0.0)
+            )
+        
+        # Entry written before stale-while-revalidate: fresh until Redis expires it
+        ttl = remaining_ttl if remaining_ttl and remaining_ttl > 0 else 0
+        return cls(value=payload, fresh_until=time.time() + ttl, compute_time=0.0)
+
+
 class ToolCache:
-    """Redis-based caching system for LangGraph tools"""
+    """Two-tier (in-process L1 + Redis L2) caching system for LangGraph tools"""
     
     # Default TTL values for different tool types (in seconds)
     DEFAULT_TTLS = {
@@ -32,6 +152,39 @@ class ToolCache:
         "default": 1800       # 30 minutes - safe default
     }
     
+    # Entries stay servable for this fraction of their TTL after going stale
+    STALE_TTL_RATIO = float(os.getenv("TOOL_CACHE_STALE_RATIO", "0.5"))
+    
+    # XFetch beta: >1 favours earlier refreshes, 0 disables early refresh
+    EARLY_REFRESH_BETA = float(os.getenv("TOOL_CACHE_EARLY_REFRESH_BETA", "1.0"))
+    
+    # Redis key prefix for tag sets (sorted sets of cache keys), and the set
+    # listing every tool tag under the same prefix (tags always contain ":")
+    TAG_PREFIX = "tooltag:"
+    TOOL_INDEX_KEY = TAG_PREFIX + "_tools"
+    
+    # Tool parameters that name an entity (bare "name" uses the tool's type)
+    ENTITY_PARAMS = {
+        "org_name": "organization",
+        "organization_name": "organization",
+        "company_name": "organization",
+        "person_name": "person",
+        "project_name": "project",
+        "project_title": "project",
+    }
+    
+    # Cap on tags per entry so large profiles don't fan out into huge writes
+    MAX_TAGS_PER_ENTRY = 64
+    
+    # Keys deleted per DEL command during invalidation
+    INVALIDATION_BATCH_SIZE = 500
+    
+    # In-process L1 cache shared by all tools in this worker
+    _local_cache = LocalCache("tool_cache")
+    _l2_stats = {"hits": 0, "misses": 0, "errors": 0}
+    _swr_stats = {"stale_hits": 0, "early_refreshes": 0, "refreshes": 0, "refresh_errors": 0}
+    _refresh_tasks: Set[asyncio.Task] = set()
+    
     @classmethod
     def generate_cache_key(cls, tool_name: str, **kwargs) -> str:
         """
@@ -62,7 +215,11 @@ class ToolCache:
     @classmethod
     def get_ttl_for_tool(cls, tool_name: str) -> int:
         """Get appropriate TTL for a tool type"""
-        # Extract tool type from tool name
+        return cls.DEFAULT_TTLS.get(cls.get_tool_type(tool_name), cls.DEFAULT_TTLS["default"])
+    
+    @classmethod
+    def get_tool_type(cls, tool_name: str) -> str:
+        """Extract tool type from tool name"""
         tool_type = "default"
         
         if "person" in tool_name.lower() or "people" in tool_name.lower():
@@ -80,7 +237,74 @@ class ToolCache:
         elif "analytic" in tool_name.lower() or "insight" in tool_name.lower():
             tool_type = "analytics"
             
-        return cls.DEFAULT_TTLS.get(tool_type, cls.DEFAULT_TTLS["default"])
+        return tool_type
+    
+    @classmethod
+    def get_tag_set_ttl(cls) -> int:
+        """Tag sets outlive the longest default entry retention"""
+        longest = max(cls.DEFAULT_TTLS.values())
+        return longest + cls.get_stale_ttl(longest)
+    
+    @staticmethod
+    def entity_tag(entity_type: str, value: Any) -> str:
+        """Tag for an entity, e.g. organization:nike or folk:abc123"""
+        return f"{entity_type}:{str(value).strip().lower()}"
+    
+    @classmethod
+    def extract_tags(
+        cls,
+        tool_name: str,
+        params: Dict[str, Any],
+        result: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Derive the tags an entry belongs to from its parameters and result.
+        
+        Args:
+            tool_name: Name of the tool
+            params: Tool parameters
+            result: Tool result (optional)
+            
+        Returns:
+            Ordered, de-duplicated tag list starting with the tool tag
+        """
+        tags = {f"tool:{tool_name}": None}
+        tool_type = cls.get_tool_type(tool_name)
+        
+        def add(entity_type: str, value: Any) -> None:
+            if isinstance(value, str) and value.strip():
+                tags.setdefault(cls.entity_tag(entity_type, value), None)
+        
+        def add_entity(entity_type: str, data: Any) -> None:
+            if isinstance(data, str):
+                add(entity_type, data)
+            elif isinstance(data, dict):
+                for field in ("name", "fullName", "display_name", "title", "project"):
+                    add(entity_type, data.get(field))
+                for field in ("folkId", "folk_id"):
+                    add("folk", data.get(field))
+        
+        for param, value in params.items():
+            if param in cls.ENTITY_PARAMS:
+                add(cls.ENTITY_PARAMS[param], value)
+            elif param == "name" and tool_type in ("person", "organization", "project"):
+                add(tool_type, value)
+        
+        if isinstance(result, dict):
+            for field, entity_type in (("organization", "organization"), ("person", "person"), ("project", "project")):
+                add_entity(entity_type, result.get(field))
+            for field, entity_type in (("people", "person"), ("organizations", "organization"), ("projects", "project")):
+                items = result.get(field)
+                if isinstance(items, list):
+                    for item in items:
+                        add_entity(entity_type, item)
+        
+        return list(tags)[:cls.MAX_TAGS_PER_ENTRY]
+    
+    @classmethod
+    def get_stale_ttl(cls, ttl: int) -> int:
+        """Seconds an entry remains servable after its TTL"""
+        return max(0, int(ttl * cls.STALE_TTL_RATIO))
     
     @classmethod
     async def get(cls, tool_name: str, **kwargs) -> Optional[Dict[str, Any]]:
@@ -94,21 +318,55 @@ class ToolCache:
         Returns:
             Cached result or None if not found/expired
         """
+        entry = await cls.get_entry(tool_name, **kwargs)
+        if entry is None or entry.is_stale:
+            return None
+        return entry.value
+    
+    @classmethod
+    async def get_entry(cls, tool_name: str, **kwargs) -> Optional[CachedEntry]:
+        """
+        Get cached entry, including stale entries still inside the stale window.
+        
+        Args:
+            tool_name: Name of the tool
+            **kwargs: Tool parameters
+            
+        Returns:
+            CachedEntry or None if not cached
+        """
         cache_key = cls.generate_cache_key(tool_name, **kwargs)
         
+        # L1: in-process, no network round trip or decode
+        local_entry = cls._local_cache.get(cache_key)
+        if local_entry is not None:
+            logger.debug(f"L1 cache hit for {tool_name}: {cache_key}")
+            return local_entry
+        
         try:
             async with get_redis_context() as redis:
-                cached_data = await redis.get(cache_key)
+                # Fetch the remaining TTL with the value so L1 never outlives L2
+                pipe = redis.pipeline(transaction=False)
+                pipe.get(cache_key)
+                pipe.ttl(cache_key)
+                cached_data, remaining_ttl = await pipe.execute()
                 
                 if cached_data:
-                    result = json.loads(cached_data)
+                    entry = CachedEntry.from_json(cached_data, remaining_ttl)
+                    cls._l2_stats["hits"] += 1
+                    
+                    ttl = remaining_ttl if remaining_ttl and remaining_ttl > 0 else cls.get_ttl_for_tool(tool_name)
+                    cls._local_cache.set(cache_key, entry, ttl, size=len(cached_data))
+                    
                     logger.debug(f"Cache hit for {tool_name}: {cache_key}")
-                    return result
+                    return entry
                 else:
+                    cls._l2_stats["misses"] += 1
                     logger.debug(f"Cache miss for {tool_name}: {cache_key}")
                     return None
                     
         except Exception as e:
+            cls._l2_stats["errors"] += 1
             logger.error(f"Cache get error for {tool_name}: {e}")
             return None
     
@@ -118,15 +376,22 @@ class ToolCache:
         tool_name: str, 
         result: Dict[str, Any], 
         ttl: Optional[int] = None,
+        compute_time: float = 0.0,
+        tags: Optional[Iterable[str]] = None,
         **kwargs
     ) -> bool:
         """
         Cache result for tool with given parameters.
         
+        The entry is fresh for ttl seconds and kept for a further stale
+        window so it can be served while a refresh runs.
+        
         Args:
             tool_name: Name of the tool
             result: Tool result to cache
             ttl: Time to live in seconds (optional)
+            compute_time: Seconds the tool took, used for early refresh
+            tags: Extra tags to register the entry under
             **kwargs: Tool parameters
             
         Returns:
@@ -143,11 +408,23 @@ class ToolCache:
                 logger.debug(f"Not caching error result for {tool_name}")
                 return False
                 
-            cached_data = json.dumps(result, ensure_ascii=True)
+            entry = CachedEntry(value=result, fresh_until=time.time() + ttl, compute_time=compute_time)
+            cached_data = entry.to_json()
+            retention = ttl + cls.get_stale_ttl(ttl)
+            
+            cls._local_cache.set(cache_key, entry, retention, size=len(cached_data))
+            
+            entry_tags = cls.extract_tags(tool_name, kwargs, result)
+            entry_tags.extend(tag for tag in (tags or []) if tag not in entry_tags)
             
             async with get_redis_context() as redis:
-                await redis.setex(cache_key, ttl, cached_data)
-                logger.debug(f"Cached result for {tool_name} (TTL: {ttl}s): {cache_key}")
+                pipe = redis.pipeline(transaction=False)
+                pipe.setex(cache_key, retention, cached_data)
+                cls.register_tags(pipe, cache_key, entry_tags, retention)
+                pipe.sadd(cls.TOOL_INDEX_KEY, f"tool:{tool_name}")
+                await pipe.execute()
+                
+                logger.debug(f"Cached result for {tool_name} (TTL: {ttl}s, tags: {len(entry_tags)}): {cache_key}")
                 return True
                 
         except Exception as e:
@@ -168,45 +445,231 @@ class ToolCache:
         """
         cache_key = cls.generate_cache_key(tool_name, **kwargs)
         
+        local_removed = cls._local_cache.delete(cache_key)
+        
         try:
             async with get_redis_context() as redis:
                 result = await redis.delete(cache_key)
+                await publish_invalidation(redis, keys=[cache_key])
                 logger.debug(f"Invalidated cache for {tool_name}: {cache_key}")
-                return bool(result)
+                return bool(result) or local_removed
                 
         except Exception as e:
             logger.error(f"Cache invalidation error for {tool_name}: {e}")
             return False
     
+    @classmethod
+    def register_tags(cls, pipe, cache_key: str, tags: Iterable[str], retention: int) -> None:
+        """
+        Queue tag-set registration for a cache key on a Redis pipeline.
+        
+        Members are scored by the time their entry expires, and members
+        already past it are removed, so a tag set that keeps being written
+        (and so never expires) only holds live keys.
+        """
+        now = time.time()
+        tag_ttl = max(retention, cls.get_tag_set_ttl())
+        for tag in tags:
+            tag_key = cls.TAG_PREFIX + tag
+            pipe.zadd(tag_key, {cache_key: now + retention})
+            pipe.zremrangebyscore(tag_key, "-inf", now)
+            pipe.expire(tag_key, tag_ttl)
+    
+    @classmethod
+    def _queue_live_members(cls, pipe, tag_keys: Iterable[str]) -> None:
+        """Queue reads of the unexpired members of each tag set"""
+        now = time.time()
+        for tag_key in tag_keys:
+            pipe.zrangebyscore(tag_key, now, "+inf")
+    
+    @classmethod
+    async def invalidate_tags(
+        cls,
+        tags: Iterable[str],
+        publish: bool = True,
+        redis_client=None
+    ) -> int:
+        """
+        Invalidate every cached result registered under any of the tags.
+        
+        Args:
+            tags: Tags such as "organization:nike" or "folk:abc123"
+            publish: Broadcast L1 evictions to other workers
+            redis_client: Redis client to use instead of the tool
+                dependencies' one (for processes outside the API)
+            
+        Returns:
+            Number of keys invalidated
+        """
+        tag_keys = [cls.TAG_PREFIX + tag for tag in dict.fromkeys(tags)]
+        if not tag_keys:
+            return 0
+        
+        try:
+            if redis_client is not None:
+                return await cls._invalidate_tag_keys(redis_client, tag_keys, publish)
+            
+            async with get_redis_context() as redis:
+                return await cls._invalidate_tag_keys(redis, tag_keys, publish)
+                
+        except Exception as e:
+            logger.error(f"Tag invalidation error for {tag_keys[:5]}: {e}")
+            return 0
+    
+    @classmethod
+    async def _invalidate_tag_keys(cls, redis, tag_keys: List[str], publish: bool) -> int:
+        """Delete the live members of the tag sets, then the tag sets themselves"""
+        pipe = redis.pipeline(transaction=False)
+        cls._queue_live_members(pipe, tag_keys)
+        members = await pipe.execute()
+        
+        keys = _decode_members(members)
+        count = await cls._delete_keys(redis, keys, extra_keys=tag_keys, publish=publish)
+        
+        logger.info(f"Invalidated {count} cached results for {len(tag_keys)} tags")
+        return count
+    
+    @classmethod
+    async def invalidate_entity(cls, entity_type: str, value: Any) -> int:
+        """Invalidate every cached result touching one entity"""
+        return await cls.invalidate_tags([cls.entity_tag(entity_type, value)])
+    
     @classmethod
     async def invalidate_pattern(cls, pattern: str) -> int:
         """
         Invalidate all cached results matching a pattern.
         
+        Candidate keys come from the per-tool tag sets, never from a keyspace
+        scan, and are filtered against the pattern locally.
+        
         Args:
             pattern: Redis key pattern (e.g., "tool:*person*")
             
         Returns:
             Number of keys invalidated
         """
+        cls._local_cache.delete_matching(pattern)
+        
         try:
             async with get_redis_context() as redis:
-                keys = await redis.keys(pattern)
-                if keys:
-                    count = await redis.delete(*keys)
+                await publish_invalidation(redis, pattern=pattern)
+                
+                tool_tags = _decode_members([await redis.smembers(cls.TOOL_INDEX_KEY)])
+                if not tool_tags:
+                    return 0
+                
+                pipe = redis.pipeline(transaction=False)
+                cls._queue_live_members(pipe, [cls.TAG_PREFIX + tool_tag for tool_tag in tool_tags])
+                members = await pipe.execute()
+                
+                keys = []
+                emptied_tags = []
+                for tool_tag, tag_members in zip(tool_tags, members):
+                    tag_members = _decode_members([tag_members])
+                    matched = [key for key in tag_members if fnmatchcase(key, pattern)]
+                    keys.extend(matched)
+                    if len(matched) == len(tag_members):
+                        emptied_tags.append(cls.TAG_PREFIX + tool_tag)
+                
+                count = await cls._delete_keys(redis, keys, extra_keys=emptied_tags, publish=False)
+                
+                if count:
                     logger.info(f"Invalidated {count} cached results matching pattern: {pattern}")
-                    return count
-                return 0
+                return count
                 
         except Exception as e:
             logger.error(f"Pattern invalidation error for {pattern}: {e}")
             return 0
+    
+    @classmethod
+    async def _delete_keys(
+        cls,
+        redis,
+        keys: List[str],
+        extra_keys: Optional[List[str]] = None,
+        publish: bool = True
+    ) -> int:
+        """Delete cache keys in pipelined batches and drop them from every L1"""
+        apply_invalidation(keys=keys)
+        
+        pipe = redis.pipeline(transaction=False)
+        for start in range(0, len(keys), cls.INVALIDATION_BATCH_SIZE):
+            pipe.delete(*keys[start:start + cls.INVALIDATION_BATCH_SIZE])
+        if extra_keys:
+            pipe.delete(*extra_keys)
+        results = await pipe.execute()
+        
+        if publish and keys:
+            await publish_invalidation(redis, keys=keys)
+        
+        deleted = results[:-1] if extra_keys else results
+        return sum(int(result or 0) for result in deleted)
+    
+    @classmethod
+    def schedule_refresh(
+        cls,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Any]],
+        stale: bool = True
+    ) -> bool:
+        """
+        Refresh an entry in the background.
+        
+        The refresh shares the single-flight slot for cache_key, so it never
+        runs alongside a cache-miss execution or another refresh.
+        
+        Returns:
+            True if a refresh was started
+        """
+        if tool_flights.is_in_flight(cache_key):
+            return False
+        
+        cls._swr_stats["refreshes" if stale else "early_refreshes"] += 1
+        
+        task = asyncio.create_task(tool_flights.do(cache_key, loader))
+        cls._refresh_tasks.add(task)
+        task.add_done_callback(cls._refresh_done)
+        return True
+    
+    @classmethod
+    def _refresh_done(cls, task: asyncio.Task) -> None:
+        cls._refresh_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            cls._swr_stats["refresh_errors"] += 1
+            logger.warning(f"Background cache refresh failed: {error}")
+    
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """Get L1 and L2 cache hit/miss statistics"""
+        l2_lookups = cls._l2_stats["hits"] + cls._l2_stats["misses"]
+        return {
+            "l1": cls._local_cache.get_stats(),
+            "l2": {
+                **cls._l2_stats,
+                "hit_rate": cls._l2_stats["hits"] / l2_lookups if l2_lookups else 0
+            },
+            "stale_while_revalidate": {
+                **cls._swr_stats,
+                "pending_refreshes": len(cls._refresh_tasks)
+            },
+            "single_flight": {
+                **tool_flights.stats,
+                "in_flight": tool_flights.in_flight()
+            }
+        }
 
 
 def cached_tool(ttl: Optional[int] = None):
     """
     Decorator for LangGraph tools to add automatic caching.
     
+    Cache misses are coalesced: concurrent calls with the same cache key
+    share a single execution instead of each querying the database. Stale
+    entries are returned immediately while a background refresh runs.
+    
     Args:
         ttl: Optional custom TTL in seconds
         
@@ -221,19 +684,62 @@ def cached_tool(ttl: Optional[int] = None):
         
         @wraps(tool_func)
         async def wrapper(*args, **kwargs):
-            # Try to get from cache first
-            cached_result = await ToolCache.get(tool_name, **kwargs)
-            if cached_result is not None:
-                return cached_result
+            async def execute_and_cache():
+                # Execute tool function
+                started = time.monotonic()
+                result = await tool_func(*args, **kwargs)
+                
+                # Cache the result
+                if isinstance(result, dict):
+                    await ToolCache.set(
+                        tool_name, result, ttl=ttl,
+                        compute_time=time.monotonic() - started, **kwargs
+                    )
+                
+                return result
+            
+            # Positional arguments are not part of the cache key
+            if args:
+                cached_result = await ToolCache.get(tool_name, **kwargs)
+                if cached_result is not None:
+                    return cached_result
+                return await execute_and_cache()
             
-            # Execute tool function
-            result = await tool_func(*args, **kwargs)
+            cache_key = ToolCache.generate_cache_key(tool_name, **kwargs)
             
-            # Cache the result
-            if isinstance(result, dict):
-                await ToolCache.set(tool_name, result, ttl=ttl, **kwargs)
+            # Try to get from cache first, serving stale entries while refreshing
+            entry = await ToolCache.get_entry(tool_name, **kwargs)
+            if entry is not None:
+                stale = entry.is_stale
+                if stale:
+                    ToolCache._swr_stats["stale_hits"] += 1
+                if entry.should_refresh(ToolCache.EARLY_REFRESH_BETA):
+                    ToolCache.schedule_refresh(cache_key, execute_and_cache, stale=stale)
+                return entry.value
             
-            return result
+            return await tool_flights.do(cache_key, execute_and_cache)
+            
+        return wrapper
+    return decorator
+
+
+def coalesced_tool(tool_name: Optional[str] = None):
+    """
+    Decorator that deduplicates identical concurrent tool calls without caching.
+    
+    Args:
+        tool_name: Name used in the coalescing key (defaults to the function name)
+    """
+    def decorator(tool_func):
+        name = tool_name or getattr(tool_func, 'name', tool_func.__name__)
+        
+        @wraps(tool_func)
+        async def wrapper(*args, **kwargs):
+            if args:
+                return await tool_func(*args, **kwargs)
+            
+            cache_key = ToolCache.generate_cache_key(name, **kwargs)
+            return await tool_flights.do(cache_key, lambda: tool_func(**kwargs))
             
         return wrapper
     return decorator
@@ -260,6 +766,17 @@ async def warm_cache_for_common_queries():
     pass
 
 
+def _decode_members(member_sets: Iterable[Any]) -> List[str]:
+    """Flatten SMEMBERS/ZRANGEBYSCORE replies into unique string keys"""
+    keys = {}
+    for members in member_sets:
+        for member in members or ():
+            if isinstance(member, bytes):
+                member = member.decode()
+            keys[member] = None
+    return list(keys)
+
+
 async def clear_all_tool_cache():
     """Clear all tool cache entries (use with caution)"""
     try:
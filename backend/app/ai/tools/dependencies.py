@@ -15,6 +15,8 @@ from contextlib import asynccontextmanager
 from database.neo4j_client import Neo4jClient
 from ...core.redis import get_redis
 from ..llm.router import LLMRouter
+from .local_cache import start_invalidation_listener, stop_invalidation_listener
+from .entity_resolver import start_entity_resolver_refresh, stop_entity_resolver_refresh
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +68,12 @@ class DependencyManager:
                 redis_client = await get_redis()
                 logger.info("Redis client initialized for tools")
                 
+                # Evict L1 tool cache entries invalidated by other workers
+                start_invalidation_listener(redis_client)
+                
+                # Keep entity names in memory for the search tools
+                start_entity_resolver_refresh(neo4j_client)
+                
                 # Initialize Folk client (if available)
                 folk_client = None  # Will be implemented based on existing patterns
                 
@@ -97,6 +105,10 @@ class DependencyManager:
         async with self._lock:
             logger.info("Cleaning up tool dependencies...")
             
+            await stop_invalidation_listener(self._dependencies.redis_client)
+            
+            await stop_entity_resolver_refresh(self._dependencies.neo4j_client)
+            
             # Close Neo4j connection
             if self._dependencies.neo4j_client:
                 try:
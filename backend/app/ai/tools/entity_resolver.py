@@ -0,0 +1,393 @@
+"""
+Entity Name Resolver
+
+Keeps the names and aliases of every Person, Organization, Project and Deal
+in memory and finds the ones a user query mentions, so agents and search
+tools can fetch entities by element id instead of scanning the graph for
+each word of the query.
+
+Names are matched as whole word sequences by an Aho-Corasick automaton over
+word terms: one pass over the query finds every known name in it, however
+many names are indexed. Query words missing from the name vocabulary are
+first corrected to a vocabulary word within one edit, looked up through
+single-deletion neighbourhoods (as in SymSpell), so "netflx" still resolves.
+
+A background task rebuilds the index from Neo4j every
+ENTITY_RESOLVER_REFRESH_SECONDS and swaps it in whole; lookups never wait
+for a refresh.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .graph_queries import ENTITY_NAMES, MIN_FUZZY_TERM_LENGTH, STOPWORDS, name_terms
+
+logger = logging.getLogger(__name__)
+
+# Names shorter than this (in characters) are not indexed
+MIN_NAME_LENGTH = 3
+
+# Score lost per corrected word, relative to the length of the name
+FUZZY_PENALTY = 0.2
+
+
+@dataclass
+class EntityMatch:
+    """An entity named in a query"""
+    entity_type: str  # node label
+    element_id: str
+    name: str  # the entity's first indexed name
+    matched_text: str  # the query words that matched, after correction
+    start: int  # word positions in the query
+    end: int
+    score: float  # 1.0 for an exact match
+    fuzzy: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _deletions(term: str) -> List[str]:
+    return [term[:i] + term[i + 1:] for i in range(len(term))]
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Levenshtein distance of at most one, counting an adjacent swap as one edit"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diff = [i for i in range(len(a)) if a[i] != b[i]]
+        return len(diff) == 1 or (
+            len(diff) == 2 and diff[1] == diff[0] + 1
+            and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+        )
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    return any(longer[:i] + longer[i + 1:] == shorter for i in range(len(longer)))
+
+
+class EntityNameIndex:
+    """
+    Immutable word-level Aho-Corasick automaton over entity names
+
+    Build with EntityNameIndex.build(); the resolver replaces the whole index
+    on refresh rather than updating it.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: List[int] = [-1]  # pattern ending at each state
+        self._output_link: List[int] = [0]  # nearest state on the fail chain ending a pattern
+        self._patterns: List[Tuple[int, List[Tuple[str, str, str]]]] = []  # length, entities
+        self._vocabulary: Counter = Counter()
+        self._deletes: Dict[str, List[str]] = {}
+        self.entity_count = 0
+
+    @classmethod
+    def build(cls, entities: Iterable[Tuple[str, str, Sequence[Any]]]) -> "EntityNameIndex":
+        """
+        Args:
+            entities: (label, element id, names) per entity; the first name
+                is the one reported in matches
+        """
+        index = cls()
+        pattern_ids: Dict[Tuple[str, ...], int] = {}
+
+        for entity_type, element_id, names in entities:
+            names = [str(name) for name in names if name is not None and str(name).strip()]
+            if not names:
+                continue
+            index.entity_count += 1
+            display_name = names[0]
+
+            seen = set()
+            for name in names:
+                terms = tuple(name_terms(name))
+                if not terms or terms in seen or sum(map(len, terms)) < MIN_NAME_LENGTH:
+                    continue
+                if len(terms) == 1 and terms[0] in STOPWORDS:
+                    continue
+                seen.add(terms)
+
+                pattern_id = pattern_ids.get(terms)
+                if pattern_id is None:
+                    pattern_id = pattern_ids[terms] = index._add_pattern(terms)
+                index._patterns[pattern_id][1].append((entity_type, element_id, display_name))
+                index._vocabulary.update(terms)
+
+        index._link()
+        index._index_deletions()
+        return index
+
+    def _add_pattern(self, terms: Tuple[str, ...]) -> int:
+        state = 0
+        for term in terms:
+            next_state = self._goto[state].get(term)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][term] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append(-1)
+                self._output_link.append(0)
+            state = next_state
+
+        self._terminal[state] = len(self._patterns)
+        self._patterns.append((len(terms), []))
+        return self._terminal[state]
+
+    def _link(self) -> None:
+        """Breadth-first fail and output links"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for term, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and term not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(term, 0)
+                self._fail[next_state] = target
+                self._output_link[next_state] = target if self._terminal[target] >= 0 else self._output_link[target]
+
+    def _index_deletions(self) -> None:
+        deletes: Dict[str, List[str]] = {}
+        for term in self._vocabulary:
+            if len(term) >= MIN_FUZZY_TERM_LENGTH and term not in STOPWORDS:
+                for key in [term] + _deletions(term):
+                    deletes.setdefault(key, []).append(term)
+        self._deletes = deletes
+
+    def correct(self, term: str) -> Optional[str]:
+        """The most common vocabulary word within one edit of a word, if any"""
+        if term in self._vocabulary:
+            return term
+        if term.endswith("'s") and term[:-2] in self._vocabulary:
+            return term[:-2]
+        if len(term) < MIN_FUZZY_TERM_LENGTH or term in STOPWORDS:
+            return None
+
+        candidates = set()
+        for key in [term] + _deletions(term):
+            candidates.update(self._deletes.get(key, ()))
+        candidates = [c for c in candidates if _within_one_edit(term, c)]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: (-self._vocabulary[c], c))
+
+    def search(self, terms: Sequence[str]) -> List[Tuple[int, int, int]]:
+        """(start, end, pattern id) of every indexed name in a word sequence"""
+        found = []
+        state = 0
+        for position, term in enumerate(terms):
+            while state and term not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(term, 0)
+
+            output = state if self._terminal[state] >= 0 else self._output_link[state]
+            while output:
+                length = self._patterns[self._terminal[output]][0]
+                found.append((position + 1 - length, position + 1, self._terminal[output]))
+                output = self._output_link[output]
+        return found
+
+    def match(self, text: str) -> List[EntityMatch]:
+        """Entities named in a text; longer names win over names they contain"""
+        terms = name_terms(text)
+        corrected = [self.correct(term) or term for term in terms]
+        is_fuzzy = [c != t and not (t.endswith("'s") and c == t[:-2]) for t, c in zip(terms, corrected)]
+
+        spans = sorted(self.search(corrected), key=lambda s: (-(s[1] - s[0]), s[0]))
+        taken = [False] * len(terms)
+        matches = []
+        for start, end, pattern_id in spans:
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = [True] * (end - start)
+
+            fuzzy_terms = sum(is_fuzzy[start:end])
+            score = round(1.0 - FUZZY_PENALTY * fuzzy_terms / (end - start), 3)
+            for entity_type, element_id, name in self._patterns[pattern_id][1]:
+                matches.append(EntityMatch(
+                    entity_type=entity_type,
+                    element_id=element_id,
+                    name=name,
+                    matched_text=" ".join(corrected[start:end]),
+                    start=start,
+                    end=end,
+                    score=score,
+                    fuzzy=fuzzy_terms > 0
+                ))
+
+        return sorted(matches, key=lambda m: m.start)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entities": self.entity_count,
+            "names": len(self._patterns),
+            "states": len(self._goto),
+            "vocabulary": len(self._vocabulary)
+        }
+
+
+class EntityResolver:
+    """Process-wide entity name resolver, refreshed from Neo4j"""
+
+    def __init__(self, refresh_seconds: Optional[float] = None):
+        self.refresh_seconds = refresh_seconds or float(os.getenv("ENTITY_RESOLVER_REFRESH_SECONDS", "300"))
+        self._index = EntityNameIndex.build([])
+        self._loaded_at: Optional[str] = None
+        self._build_seconds: Optional[float] = None
+        self._last_error: Optional[str] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once an index has been loaded from Neo4j"""
+        return self._loaded_at is not None
+
+    def resolve(
+        self,
+        text: str,
+        entity_types: Optional[Iterable[str]] = None,
+        min_score: float = 0.0
+    ) -> List[EntityMatch]:
+        """
+        Entities named in a text, in the order they appear
+
+        An entity named twice is reported once, with its best match.
+
+        Args:
+            text: User query or tool argument
+            entity_types: Only report these labels
+            min_score: Drop fuzzy matches scoring below this
+        """
+        types = set(entity_types) if entity_types else None
+        best: Dict[str, EntityMatch] = {}
+        for match in self._index.match(text):
+            if (types and match.entity_type not in types) or match.score < min_score:
+                continue
+            current = best.get(match.element_id)
+            if current is None or match.score > current.score:
+                best[match.element_id] = match
+        return sorted(best.values(), key=lambda m: (m.start, -m.score))
+
+    def load(self, entities: Iterable[Tuple[str, str, Sequence[Any]]]) -> None:
+        """Replace the index (refresh() and tests)"""
+        start = time.perf_counter()
+        self._index = EntityNameIndex.build(entities)
+        self._build_seconds = round(time.perf_counter() - start, 3)
+        self._loaded_at = datetime.now(timezone.utc).isoformat()
+
+    async def refresh(self, neo4j_client) -> bool:
+        """
+        Rebuild the index from Neo4j
+
+        The current index is kept if any label fails to load.
+
+        Returns:
+            True if the index was replaced
+        """
+        entities = []
+        for label, query in ENTITY_NAMES.items():
+            result = await neo4j_client.execute_read(query)
+            if not result or not result.success:
+                self._last_error = f"{label}: {getattr(result, 'error', None) or 'no result'}"
+                logger.warning(f"Entity resolver refresh failed, keeping the current index ({self._last_error})")
+                return False
+            entities.extend((label, record["element_id"], record["names"]) for record in result.records)
+
+        # Building is CPU bound: keep it off the event loop
+        await asyncio.to_thread(self.load, entities)
+        self._last_error = None
+        logger.info(f"Entity resolver loaded {self._index.entity_count} entities in {self._build_seconds}s")
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "loaded_at": self._loaded_at,
+            "build_seconds": self._build_seconds,
+            "refresh_seconds": self.refresh_seconds,
+            "last_error": self._last_error,
+            **self._index.get_stats()
+        }
+
+
+# Process-wide resolver and its refresh task
+_entity_resolver: Optional[EntityResolver] = None
+_refresh_task: Optional[asyncio.Task] = None
+# Neo4j client of every owner that started the refresh and has not stopped it
+_refresh_clients: List[Any] = []
+
+
+def get_entity_resolver() -> EntityResolver:
+    """Get the process-wide entity resolver (empty until the refresh task loads it)"""
+    global _entity_resolver
+
+    if _entity_resolver is None:
+        _entity_resolver = EntityResolver()
+
+    return _entity_resolver
+
+
+async def _refresh_periodically() -> None:
+    resolver = get_entity_resolver()
+    while _refresh_clients:
+        try:
+            # The newest owner's client: earlier owners may close theirs first
+            await resolver.refresh(_refresh_clients[-1])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Entity resolver refresh failed: {e}")
+        await asyncio.sleep(resolver.refresh_seconds)
+
+
+def start_entity_resolver_refresh(neo4j_client) -> Optional[asyncio.Task]:
+    """
+    Start the process-wide resolver refresh task, or join it if running.
+
+    The orchestrator and the tool dependencies both use the resolver, so
+    the task is reference counted: it runs until every caller has called
+    stop_entity_resolver_refresh() with the same client. Must be called
+    from a running event loop.
+    """
+    global _refresh_task
+
+    if neo4j_client is None:
+        return None
+
+    _refresh_clients.append(neo4j_client)
+
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_refresh_periodically())
+
+    return _refresh_task
+
+
+async def stop_entity_resolver_refresh(neo4j_client) -> None:
+    """Leave the resolver refresh task; the last caller to leave stops it"""
+    global _refresh_task
+
+    if neo4j_client in _refresh_clients:
+        _refresh_clients.remove(neo4j_client)
+
+    if _refresh_clients:
+        return
+
+    if _refresh_task and not _refresh_task.done():
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+
+    _refresh_task = None
@@ -17,7 +17,7 @@ from langgraph.prebuilt import ToolNode
 
 # Local imports
 from .dependencies import get_tool_dependencies, get_neo4j_context, get_redis_context
-from .cache import ToolCache, cached_tool
+from .cache import ToolCache, cached_tool, coalesced_tool
 from .error_handling import (
     resilient_tool, 
     safe_tool_execution,
@@ -51,7 +51,8 @@ class ToolFactory:
         enable_resilience: bool = True,
         circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
         retry_config: Optional[RetryConfig] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        enable_coalescing: bool = True
     ) -> Callable:
         """
         Create a database tool with dependency injection and resilience patterns.
@@ -66,6 +67,7 @@ class ToolFactory:
             circuit_breaker_config: Custom circuit breaker config
             retry_config: Custom retry config
             timeout: Tool execution timeout
+            enable_coalescing: Share one execution between identical concurrent calls
             
         Returns:
             Decorated tool function ready for LangGraph binding
@@ -154,9 +156,11 @@ class ToolFactory:
                 tool_name=name
             )(decorated_func)
         
-        # 3. Apply caching
+        # 3. Apply caching (cache misses are coalesced by cached_tool)
         if enable_cache:
             decorated_func = cached_tool(ttl=cache_ttl)(decorated_func)
+        elif enable_coalescing:
+            decorated_func = coalesced_tool(name)(decorated_func)
         
         # 4. Add debug wrapper before @tool decorator
         @wraps(decorated_func)
@@ -174,6 +178,7 @@ class ToolFactory:
         self.tool_metadata[name] = {
             "description": description,
             "cache_enabled": enable_cache,
+            "coalescing_enabled": enable_cache or enable_coalescing,
             "resilience_enabled": enable_resilience,
             "timeout": timeout,
             "created_at": datetime.utcnow().isoformat(),
@@ -0,0 +1,56 @@
+"""
+Folk Change Invalidation
+
+Evicts the tool cache entries (ToolCache and GraphQueryTools) tagged with the
+entities a Folk ingestion run modified, so caches can hold long TTLs without
+serving stale profiles after a sync.
+
+The ingestion process deletes the tagged Redis (L2) keys and tag sets itself.
+Only the L1 evictions travel over pub/sub, where the API workers' invalidation
+listener picks them up; a worker that misses them has its L1 suspended until
+it resubscribes, so no Redis state depends on a worker being subscribed.
+"""
+
+import logging
+from typing import Iterable, List
+
+from tools.folk_ingestion.change_events import FolkChange
+from .cache import ToolCache
+
+logger = logging.getLogger(__name__)
+
+
+def tags_for_changes(changes: Iterable[FolkChange]) -> List[str]:
+    """Cache tags for modified entities and the entities that embed them"""
+    tags = {}
+    for change in changes:
+        tags[ToolCache.entity_tag("folk", change.folk_id)] = None
+        if change.name:
+            tags[ToolCache.entity_tag(change.entity_type, change.name)] = None
+        for related_id in change.related_folk_ids:
+            tags[ToolCache.entity_tag("folk", related_id)] = None
+    return list(tags)
+
+
+async def apply_folk_changes(changes: List[FolkChange], redis_client=None) -> int:
+    """
+    Invalidate every cached tool result touching the changed entities.
+
+    Deletes the tagged keys and tag sets in Redis and broadcasts the L1
+    evictions to the API workers.
+
+    Args:
+        changes: Modified Folk entities
+        redis_client: Redis client of the calling process (defaults to the
+            tool dependencies' client)
+
+    Returns:
+        Number of cache keys invalidated
+    """
+    tags = tags_for_changes(changes)
+    if not tags:
+        return 0
+
+    count = await ToolCache.invalidate_tags(tags, redis_client=redis_client)
+    logger.info(f"Folk changes for {len(changes)} entities invalidated {count} cached tool results")
+    return count
@@ -0,0 +1,901 @@
+"""
+Graph Tool Queries
+
+Every Cypher query the agent tools run (GraphQueryTools, the LangGraph tool
+definitions and the vector search tools), registered by name with the
+process-wide query registry so each one is planned at startup and keeps one
+shape whatever the arguments. Optional filters take a null parameter when
+they are not used.
+
+Entities are looked up by name through the full-text indexes created in
+database/create_indexes.py rather than CONTAINS scans: the tools pass the
+Lucene query built by fulltext_search() and each query keeps the best
+scoring node, so a lookup costs an index seek whatever the graph size.
+Free-text searches seek the same indexes with keyword_search().
+
+Nodes and owner relationships the Folk sync tombstoned (folkDeleted) stay in
+the graph until they are purged, so every query skips them.
+"""
+
+import re
+from typing import Any, Dict, List, Sequence
+
+from database.query_registry import register_query
+
+
+# ==========================================================================
+# Full-text entity resolution
+# ==========================================================================
+
+# Index properties an entity name is matched against
+PERSON_NAME_FIELDS = ("name", "fullName", "id")
+ORGANIZATION_NAME_FIELDS = ("name", "id")
+PROJECT_NAME_FIELDS = ("name", "title", "id")
+DEAL_NAME_FIELDS = ("name",)
+CONCEPT_NAME_FIELDS = ("name",)
+
+# Terms shorter than this are not matched fuzzily
+MIN_FUZZY_TERM_LENGTH = 4
+
+_NAME_TERM = re.compile(r"\w+(?:'\w+)*")
+
+# Common words: never a name on their own and not worth searching for
+STOPWORDS = frozenset({
+    "about", "after", "all", "and", "any", "are", "can", "did", "does", "for",
+    "from", "had", "has", "have", "how", "new", "not", "our", "the", "their",
+    "them", "they", "this", "that", "was", "were", "what", "when", "where",
+    "which", "who", "whom", "why", "will", "with", "work", "you", "your"
+})
+
+
+def name_terms(text: str) -> List[str]:
+    """Lowercase word terms of a name or query, as the full-text analyzer splits them"""
+    return _NAME_TERM.findall(text.lower())
+
+
+def fulltext_search(text: str, fields: Sequence[str]) -> str:
+    """
+    Lucene query for an entity name, for db.index.fulltext.queryNodes
+
+    The name is reduced to lowercase word terms, which also drops any Lucene
+    syntax in user input. The exact phrase scores highest, then every term
+    as a prefix ("boost mob"). There is no fuzzy clause: the queries keep the
+    best match, and an edit-distance match would turn a name that is not in
+    the graph into the nearest other entity. Misspellings are corrected
+    against known names by the entity resolver instead.
+
+    Raises:
+        ValueError: if the name has no word characters
+    """
+    terms = name_terms(text)
+    if not terms:
+        raise ValueError(f"Nothing to search for in {text!r}")
+
+    prefixes = " AND ".join(f"{term}*" for term in terms)
+    clauses = f'"{" ".join(terms)}"^4 OR ({prefixes})^2'
+    return " OR ".join(f"{field}:({clauses})" for field in fields)
+
+
+def keyword_search(text: str) -> str:
+    """
+    Lucene query for free text, matching any of its words in any indexed property
+
+    Common and single-letter words are dropped. Entities containing the
+    whole text score highest, then the more of its words they contain;
+    longer words also match within one edit.
+
+    Raises:
+        ValueError: if only common words are left
+    """
+    terms = list(dict.fromkeys(
+        term for term in name_terms(text) if len(term) > 1 and term not in STOPWORDS
+    ))
+    if not terms:
+        raise ValueError(f"Nothing to search for in {text!r}")
+
+    words = " OR ".join(
+        f"{term}~1" if len(term) >= MIN_FUZZY_TERM_LENGTH else term for term in terms
+    )
+    return f'"{" ".join(terms)}"^4 OR {words}' if len(terms) > 1 else words
+
+
+def person_search(name: str) -> str:
+    return fulltext_search(name, PERSON_NAME_FIELDS)
+
+
+def organization_search(name: str) -> str:
+    return fulltext_search(name, ORGANIZATION_NAME_FIELDS)
+
+
+def project_search(title: str) -> str:
+    return fulltext_search(title, PROJECT_NAME_FIELDS)
+
+
+def deal_search(name: str) -> str:
+    return fulltext_search(name, DEAL_NAME_FIELDS)
+
+
+def concept_search(name: str) -> str:
+    return fulltext_search(name, CONCEPT_NAME_FIELDS)
+
+
+# ==========================================================================
+# Entity details (GraphQueryTools)
+# ==========================================================================
+
+PERSON_DETAILS = register_query("tools.person_details", """
+CALL db.index.fulltext.queryNodes('person_fulltext_index', $name) YIELD node AS p, score
+WHERE coalesce(p.folkDeleted, false) = false
+WITH p, score
+ORDER BY score DESC
+LIMIT 1
+OPTIONAL MATCH (p)-[r:CONTRIBUTED_TO]->(proj:Project)
+OPTIONAL MATCH (p)-[:WORKS_FOR]->(org:Organization)
+WHERE coalesce(org.folkDeleted, false) = false
+OPTIONAL MATCH (p)-[:BELONGS_TO]->(g:Group)
+WHERE coalesce(g.folkDeleted, false) = false
+OPTIONAL MATCH (internal:Person {isInternal: true})-[owns:OWNS_CONTACT]->(p)
+WHERE coalesce(owns.folkDeleted, false) = false
+RETURN p {
+    .name, .fullName, .email, .folkId, .isInternal,
+    .bio, .role, .phone, .location, .linkedinUrl, .website, .tags
+} AS person,
+org.name AS organization,
+collect(DISTINCT {
+    project: proj.name,
+    role: r.role,
+    startDate: r.startDate,
+    projectId: proj.id
+}) AS projects,
+collect(DISTINCT g.name) AS groups,
+internal.name AS contact_owner
+""", parameters={"name": ""})
+
+PEOPLE_AT_ORGANIZATION = register_query("tools.people_at_organization", """
+CALL db.index.fulltext.queryNodes('organization_fulltext_index', $org_name) YIELD node AS o, score
+WHERE coalesce(o.folkDeleted, false) = false
+WITH o, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (p:Person)-[:WORKS_FOR]->(o)
+WHERE coalesce(p.folkDeleted, false) = false
+RETURN p {
+    .name, .role, .email, .folkId, .isInternal
+} AS person,
+coalesce(o.name, o.id) AS organization
+ORDER BY p.name
+""", parameters={"org_name": ""})
+
+DEAL_SOURCER = register_query("tools.deal_sourcer", """
+CALL db.index.fulltext.queryNodes('deal_fulltext_index', $deal_name) YIELD node AS d, score
+WHERE coalesce(d.folkDeleted, false) = false
+MATCH (p:Person {isInternal: true})-[sourced:SOURCED]->(d)
+WHERE coalesce(sourced.folkDeleted, false) = false
+WITH p, d, score
+ORDER BY score DESC
+LIMIT 1
+
+// Get sourcing history for context
+OPTIONAL MATCH (p)-[other_sourced:SOURCED]->(other_deals:Deal)
+WHERE other_deals <> d
+  AND coalesce(other_sourced.folkDeleted, false) = false
+  AND coalesce(other_deals.folkDeleted, false) = false
+
+// Get their department/role
+OPTIONAL MATCH (p)-[:WORKS_FOR]->(dept:Department)
+
+RETURN p {
+    .name, .fullName, .email, .folkUserId, .role
+} AS sourcer,
+d {
+    .name, .status, .value, .currency, .folkId
+} AS deal,
+dept.name AS department,
+count(other_deals) AS total_deals_sourced,
+collect(other_deals.name)[..3] AS recent_other_deals
+""", parameters={"deal_name": ""})
+
+DEAL_DETAILS = register_query("tools.deal_details", """
+CALL db.index.fulltext.queryNodes('deal_fulltext_index', $deal_name) YIELD node AS d, score
+WHERE coalesce(d.folkDeleted, false) = false
+MATCH (sourcer:Person)-[sourced:SOURCED]->(d)
+WHERE coalesce(sourced.folkDeleted, false) = false
+WITH sourcer, d, score
+ORDER BY score DESC
+LIMIT 1
+OPTIONAL MATCH (d)-[:WITH_CONTACT]->(contact:Person)
+WHERE coalesce(contact.folkDeleted, false) = false
+OPTIONAL MATCH (d)-[:FOR_ORGANIZATION]->(org:Organization)
+WHERE coalesce(org.folkDeleted, false) = false
+RETURN d {
+    .name, .status, .value, .currency, .folkId,
+    .probability, .expectedCloseDate, .description
+} AS deal,
+sourcer.name AS sourced_by,
+collect(contact.name) AS contacts,
+org.name AS organization
+""", parameters={"deal_name": ""})
+
+PROJECT_DETAILS = register_query("tools.project_details", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+OPTIONAL MATCH (proj)-[:FEATURES_CONCEPT]->(c:CreativeConcept)
+OPTIONAL MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj)
+OPTIONAL MATCH (proj)-[:MANAGED_BY]->(dept:Department)
+RETURN proj {
+    .name, .id, .logline, .status, .year, .description
+} AS project,
+client.name AS client,
+dept.name AS department,
+collect(DISTINCT c.name) AS concepts,
+collect(DISTINCT {
+    person: p.name,
+    role: r.role,
+    startDate: r.startDate
+}) AS crew
+""", parameters={"title": ""})
+
+PROJECTS_BY_CONCEPT = register_query("tools.projects_by_concept", """
+CALL db.index.fulltext.queryNodes('concept_fulltext_index', $concept_name) YIELD node AS c, score
+WHERE coalesce(c.folkDeleted, false) = false
+WITH c, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (proj:Project)-[:FEATURES_CONCEPT]->(c)
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+OPTIONAL MATCH (director:Person)-[r:CONTRIBUTED_TO {role: 'Director'}]->(proj)
+RETURN proj {
+    .name, .id, .logline, .status, .year
+} AS project,
+collect(c.name) AS concepts,
+client.name AS client,
+director.name AS director,
+'direct_match' AS match_type
+""", parameters={"concept_name": ""})
+
+PROJECTS_BY_RELATED_CONCEPT = register_query("tools.projects_by_related_concept", """
+CALL db.index.fulltext.queryNodes('concept_fulltext_index', $concept_name) YIELD node AS c1, score
+WHERE coalesce(c1.folkDeleted, false) = false
+WITH c1, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (c1)-[:RELATED_TO*1..2]->(c2:CreativeConcept)
+MATCH (proj:Project)-[:FEATURES_CONCEPT]->(c2)
+WHERE NOT proj.name IN $existing_titles
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+RETURN proj {
+    .name, .id, .logline, .status, .year
+} AS project,
+collect(c2.name) AS concepts,
+client.name AS client,
+'related_concept' AS match_type
+""", parameters={"concept_name": "", "existing_titles": [""]})
+
+CONTRIBUTORS_ON_CLIENT_PROJECTS = register_query("tools.contributors_on_client_projects", """
+CALL db.index.fulltext.queryNodes('organization_fulltext_index', $client_name) YIELD node AS o, score
+WHERE coalesce(o.folkDeleted, false) = false
+WITH o, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj:Project)-[:FOR_CLIENT]->(o)
+WHERE r.role CONTAINS $role
+RETURN DISTINCT p {
+    .name, .role, .email, .bio
+} AS person,
+collect(DISTINCT proj.name) AS projects,
+count(DISTINCT proj) AS project_count
+ORDER BY project_count DESC
+""", parameters={"role": "", "client_name": ""})
+
+PROJECT_VENDORS = register_query("tools.project_vendors", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS p, score
+WHERE coalesce(p.folkDeleted, false) = false
+WITH p, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (o:Organization)-[r:PROVIDED_SERVICE]->(p)
+RETURN o {
+    .name, .organizationId, .folkId
+} AS vendor,
+r.service AS service,
+r.cost AS cost,
+r.startDate AS start_date
+ORDER BY o.name
+""", parameters={"title": ""})
+
+PROJECT_DOCUMENTS = register_query("tools.project_documents", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS p, score
+WHERE coalesce(p.folkDeleted, false) = false
+WITH p, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (d:Document)-[]->(p)
+RETURN d {
+    .title, .type, .id, .created_at
+} AS document
+ORDER BY d.created_at DESC
+""", parameters={"title": ""})
+
+DOCUMENT_PROFILE = register_query("tools.document_profile", """
+MATCH (d:Document {id: $doc_id})
+RETURN d.profile AS profile, d.title AS title, d.type AS type
+""", parameters={"doc_id": ""})
+
+DOCUMENT_FULL_TEXT_SEARCH = register_query("tools.document_full_text_search", """
+CALL db.index.fulltext.queryNodes('documentTextIndex', $search_query)
+YIELD node, score
+MATCH (node:Document)
+RETURN node.title AS title,
+       node.type AS type,
+       node.id AS id,
+       score,
+       node.fullTextContent AS content
+ORDER BY score DESC
+LIMIT $limit
+""", parameters={"search_query": "", "limit": 10})
+
+
+# ==========================================================================
+# Network and project discovery (GraphQueryTools)
+# ==========================================================================
+
+COLLABORATORS = register_query("tools.collaborators", """
+CALL db.index.fulltext.queryNodes('person_fulltext_index', $person_name) YIELD node AS p1, score
+WHERE coalesce(p1.folkDeleted, false) = false
+WITH p1, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (p1)-[:CONTRIBUTED_TO]->(proj:Project)<-[:CONTRIBUTED_TO]-(p2:Person)
+WHERE p1 <> p2 AND coalesce(p2.folkDeleted, false) = false
+  AND ($project_type IS NULL OR proj.type CONTAINS $project_type)
+WITH p2, collect(DISTINCT proj.name) AS shared_projects, count(DISTINCT proj) AS collaboration_count
+ORDER BY collaboration_count DESC
+LIMIT 20
+RETURN p2 {
+    .name, .role, .email, .folkId
+} AS collaborator,
+shared_projects,
+collaboration_count
+""", parameters={"person_name": "", "project_type": ""})
+
+ORGANIZATION_PROFILE = register_query("tools.organization_profile", """
+CALL db.index.fulltext.queryNodes('organization_fulltext_index', $org_name) YIELD node AS o, score
+WHERE coalesce(o.folkDeleted, false) = false
+WITH o, score
+ORDER BY score DESC
+LIMIT 1
+OPTIONAL MATCH (o)<-[:WORKS_FOR]-(p:Person)
+WHERE coalesce(p.folkDeleted, false) = false
+OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj:Project)
+OPTIONAL MATCH (o)<-[:FOR_ORGANIZATION]-(d:Deal)
+WHERE coalesce(d.folkDeleted, false) = false
+RETURN o {
+    .id, .name, .type, .description, .folkId
+} AS organization,
+collect(DISTINCT p.name) AS people,
+collect(DISTINCT proj.name) AS projects,
+collect(DISTINCT d.name) AS deals,
+count(DISTINCT p) AS people_count,
+count(DISTINCT proj) AS project_count
+""", parameters={"org_name": ""})
+
+# A variable-length bound cannot be a parameter: one query per depth
+MAX_NETWORK_DEGREES = 3
+
+NETWORK_CONNECTIONS = {
+    degrees: register_query(f"tools.network_connections.{degrees}", f"""
+CALL db.index.fulltext.queryNodes('person_fulltext_index', $person_name) YIELD node AS start, score
+WHERE coalesce(start.folkDeleted, false) = false
+WITH start, score
+ORDER BY score DESC
+LIMIT 1
+MATCH path = (start)-[:WORKS_FOR|CONTRIBUTED_TO|BELONGS_TO*1..{degrees}]-(connected:Person)
+WHERE start <> connected AND coalesce(connected.folkDeleted, false) = false
+WITH connected, length(path) AS distance, path
+ORDER BY distance, connected.name
+RETURN DISTINCT connected {{
+    .name, .role, .email, .folkId, .isInternal
+}} AS person,
+min(distance) AS degrees_of_separation
+LIMIT 50
+""", parameters={"person_name": ""})
+    for degrees in range(1, MAX_NETWORK_DEGREES + 1)
+}
+
+PROJECTS_BY_CRITERIA = register_query("tools.projects_by_criteria", """
+MATCH (proj:Project)
+WHERE ($project_type IS NULL OR proj.type CONTAINS $project_type)
+  AND ($year IS NULL OR proj.year = $year)
+  AND ($status IS NULL OR proj.status CONTAINS $status)
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+WITH proj, client
+WHERE $client_name IS NULL OR client.name CONTAINS $client_name
+OPTIONAL MATCH (director:Person)-[:CONTRIBUTED_TO {role: 'Director'}]->(proj)
+RETURN proj {
+    .name, .type, .status, .year, .description, .budget
+} AS project,
+client.name AS client,
+director.name AS director
+ORDER BY proj.year DESC, proj.name
+LIMIT 25
+""", parameters={"project_type": "", "year": 2024, "status": "", "client_name": ""})
+
+
+def project_criteria_parameters(criteria: Dict[str, Any]) -> Dict[str, Any]:
+    """PROJECTS_BY_CRITERIA parameters; criteria left out are null and do not filter"""
+    return {
+        "project_type": criteria.get("type") or None,
+        "year": criteria.get("year") or None,
+        "status": criteria.get("status") or None,
+        "client_name": criteria.get("client") or None
+    }
+
+SIMILAR_PROJECT_TARGET = register_query("tools.similar_project_target", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+RETURN proj.concept_embedding AS embedding, proj.name AS exact_title
+""", parameters={"title": ""})
+
+SIMILAR_PROJECTS = register_query("tools.similar_projects", """
+MATCH (proj:Project)
+WHERE proj.concept_embedding IS NOT NULL
+AND proj.name <> $exact_title
+WITH proj, gds.similarity.cosine(proj.concept_embedding, $target_embedding) AS similarity
+WHERE similarity >= $threshold
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+RETURN proj {
+    .name, .type, .year, .status
+} AS project,
+client.name AS client,
+similarity
+ORDER BY similarity DESC
+LIMIT 10
+""", parameters={"exact_title": "", "target_embedding": [0.0], "threshold": 0.8})
+
+PROJECT_TEAM = register_query("tools.project_team", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj)
+OPTIONAL MATCH (p)-[:WORKS_FOR]->(org:Organization)
+RETURN proj {
+    .name, .type, .status, .year
+} AS project,
+collect({
+    person: p {.name, .role, .email, .folkId},
+    role: r.role,
+    startDate: r.startDate,
+    endDate: r.endDate,
+    organization: org.name
+}) AS crew
+""", parameters={"title": ""})
+
+PROJECT_CONCEPTS = register_query("tools.project_concepts", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (proj)-[:FEATURES_CONCEPT]->(c:CreativeConcept)
+OPTIONAL MATCH (c)-[:RELATED_TO]->(related:CreativeConcept)
+RETURN proj {
+    .name, .type, .year
+} AS project,
+collect(DISTINCT c {
+    .name, .category, .description, .tags
+}) AS concepts,
+collect(DISTINCT related.name) AS related_concepts
+""", parameters={"title": ""})
+
+CREATIVE_REFERENCES = register_query("tools.creative_references", """
+CALL db.index.fulltext.queryNodes('concept_fulltext_index', $concept_name) YIELD node AS c, score
+WHERE coalesce(c.folkDeleted, false) = false
+WITH c, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (c)-[:INSPIRED_BY]->(ref:Reference)
+WHERE $medium IS NULL OR ref.medium CONTAINS $medium
+RETURN c {
+    .name, .category, .description
+} AS concept,
+collect(ref {
+    .title, .creator, .medium, .year, .url, .description
+}) AS references
+""", parameters={"concept_name": "", "medium": ""})
+
+DOCUMENTS_BY_CONTENT = register_query("tools.documents_by_content", """
+CALL db.index.fulltext.queryNodes('document_fulltext_index', $search_query)
+YIELD node, score
+MATCH (node:Document)
+WHERE $doc_type IS NULL OR node.type CONTAINS $doc_type
+RETURN node {
+    .title, .type, .id, .created_at
+} AS document,
+score,
+node.content AS content
+ORDER BY score DESC
+LIMIT 15
+""", parameters={"search_query": "", "doc_type": ""})
+
+DOCUMENT_BY_ID = register_query("tools.document_by_id", """
+MATCH (d:Document {id: $doc_id})
+OPTIONAL MATCH (d)-[:RELATED_TO]->(proj:Project)
+OPTIONAL MATCH (d)-[:CREATED_BY]->(author:Person)
+RETURN d {
+    .title, .type, .id, .content, .summary,
+    .created_at, .sensitivityLevel
+} AS document,
+proj.name AS project,
+author.name AS author
+""", parameters={"doc_id": ""})
+
+PROJECT_PERFORMANCE_INSIGHTS = register_query("tools.project_insights.performance", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+OPTIONAL MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj)
+WITH proj, client, count(p) AS crew_size
+RETURN proj {
+    .name, .status, .year, .budget, .actualCost, .duration
+} AS project,
+client.name AS client,
+crew_size,
+{
+    budget_efficiency: CASE
+        WHEN proj.budget IS NOT NULL AND proj.actualCost IS NOT NULL
+        THEN round((proj.budget - proj.actualCost) * 100.0 / proj.budget)
+        ELSE null
+    END,
+    crew_efficiency: CASE
+        WHEN crew_size > 15 THEN 'large_team'
+        WHEN crew_size > 8 THEN 'medium_team'
+        ELSE 'small_team'
+    END
+} AS performance_metrics
+""", parameters={"title": ""})
+
+PROJECT_TEAM_INSIGHTS = register_query("tools.project_insights.team", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj)
+WITH proj, collect({
+    name: p.name,
+    role: r.role,
+    experience_level: CASE
+        WHEN COUNT { (p)-[:CONTRIBUTED_TO]->(:Project) } > 10 THEN 'senior'
+        WHEN COUNT { (p)-[:CONTRIBUTED_TO]->(:Project) } > 3 THEN 'mid'
+        ELSE 'junior'
+    END
+}) AS team_analysis
+RETURN proj.name AS project_title,
+size(team_analysis) AS total_crew,
+size([m IN team_analysis WHERE m.experience_level = 'senior']) AS senior_count,
+size([m IN team_analysis WHERE m.experience_level = 'mid']) AS mid_count,
+size([m IN team_analysis WHERE m.experience_level = 'junior']) AS junior_count,
+team_analysis
+""", parameters={"title": ""})
+
+PROJECT_GENERAL_INSIGHTS = register_query("tools.project_insights.general", """
+CALL db.index.fulltext.queryNodes('project_fulltext_index', $title) YIELD node AS proj, score
+WHERE coalesce(proj.folkDeleted, false) = false
+WITH proj, score
+ORDER BY score DESC
+LIMIT 1
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+OPTIONAL MATCH (proj)-[:FEATURES_CONCEPT]->(concept:CreativeConcept)
+OPTIONAL MATCH (p:Person)-[:CONTRIBUTED_TO]->(proj)
+RETURN proj {
+    .name, .type, .status, .year, .budget, .description
+} AS project,
+client.name AS client,
+collect(DISTINCT concept.name) AS concepts,
+count(DISTINCT p) AS crew_size
+""", parameters={"title": ""})
+
+
+# ==========================================================================
+# LangGraph tool definitions
+# ==========================================================================
+
+NODE_LABEL_COUNTS = register_query(
+    "tools.node_label_counts",
+    "MATCH (n) RETURN labels(n) as labels, count(n) as count ORDER BY count DESC LIMIT 10"
+)
+
+ORGANIZATION_PROFILE_WITH_TREATMENTS = register_query("tools.organization_profile_with_treatments", """
+CALL db.index.fulltext.queryNodes('organization_fulltext_index', $org_name) YIELD node AS o, score
+WHERE coalesce(o.folkDeleted, false) = false
+WITH o, score
+ORDER BY score DESC
+LIMIT 1
+
+// CRITICAL: Find treatment writers using WROTE_TREATMENT_FOR relationship we discovered
+OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(treatment_proj:Project)<-[:WROTE_TREATMENT_FOR]-(writer:Person)
+
+// Also find DESIGNED_TREATMENT_FOR relationships
+OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(design_proj:Project)<-[:DESIGNED_TREATMENT_FOR]-(designer:Person)
+
+// Find any documents/chunks with treatment content
+OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj3:Project)-[:HAS_DOCUMENT|HAS_CHUNK]-(doc)
+WHERE (doc.text IS NOT NULL AND toLower(doc.text) CONTAINS 'treatment') OR
+      (doc.content IS NOT NULL AND toLower(doc.content) CONTAINS 'treatment')
+
+// Find all projects and people connected to this organization - USING ID PROPERTIES
+OPTIONAL MATCH (o)<-[:WORKS_FOR]-(p:Person)
+WHERE coalesce(p.folkDeleted, false) = false
+OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj:Project)
+OPTIONAL MATCH (proj)<-[:CONTRIBUTED_TO]-(contributor:Person)
+WHERE coalesce(contributor.folkDeleted, false) = false
+OPTIONAL MATCH (o)<-[:FOR_ORGANIZATION]-(d:Deal)
+WHERE coalesce(d.folkDeleted, false) = false
+
+RETURN o {
+    .id, .name, .type, .description, .folkId
+} AS organization,
+collect(DISTINCT p.id) AS people,
+collect(DISTINCT proj.id) AS projects,
+collect(DISTINCT d.name) AS deals,
+collect(DISTINCT contributor.id) AS contributors,
+collect(DISTINCT writer.id) AS treatment_writers_direct,
+collect(DISTINCT designer.id) AS treatment_designers,
+collect(DISTINCT {
+    id: writer.id,
+    role: writer.role,
+    bio: writer.bio,
+    project: treatment_proj.id,
+    relationship: 'WROTE_TREATMENT_FOR'
+}) AS writer_details_direct,
+collect(DISTINCT {
+    id: designer.id,
+    role: designer.role,
+    bio: designer.bio,
+    project: design_proj.id,
+    relationship: 'DESIGNED_TREATMENT_FOR'
+}) AS designer_details,
+collect(DISTINCT {
+    text: substring(coalesce(doc.text, doc.content, ''), 0, 200),
+    id: doc.id
+}) AS treatment_documents,
+count(DISTINCT p) AS people_count,
+count(DISTINCT proj) AS project_count,
+count(DISTINCT writer) AS treatment_writer_count
+""", parameters={"org_name": ""})
+
+TREATMENT_WRITER_CANDIDATES = register_query("tools.treatment_writer_candidates", """
+// The client, if the name resolves to an organization
+CALL db.index.fulltext.queryNodes('organization_fulltext_index', $org_name) YIELD node, score
+WHERE coalesce(node.folkDeleted, false) = false
+WITH node, score
+ORDER BY score DESC
+LIMIT 1
+WITH collect(node) AS clients
+
+CALL db.index.fulltext.queryNodes('person_fulltext_index',
+    'bio:(treatment* OR writer* OR screenwriter* OR screenplay* OR script*) OR role:(writer* OR screenwriter*)')
+YIELD node AS person
+WHERE coalesce(person.folkDeleted, false) = false
+
+OPTIONAL MATCH (person)-[rel:CONTRIBUTED_TO|WROTE_TREATMENT_FOR|DESIGNED_TREATMENT_FOR]->(project:Project)-[:FOR_CLIENT]->(org:Organization)
+WHERE org IN clients
+
+RETURN person {
+    .id, .role, .bio, .company
+} AS vector_person,
+type(rel) AS relationship_type,
+project.id AS related_project,
+org.id AS org_match,
+// Calculate similarity score based on keyword matches
+CASE
+    WHEN toLower(person.bio) CONTAINS 'treatment' THEN 1.0
+    WHEN toLower(person.bio) CONTAINS 'writer' THEN 0.8
+    WHEN toLower(person.bio) CONTAINS 'screenplay' THEN 0.7
+    ELSE 0.5
+END AS similarity_score
+ORDER BY similarity_score DESC
+LIMIT 10
+""", parameters={"org_name": ""})
+
+ORGANIZATION_RELATIONSHIPS = register_query("tools.organization_relationships", """
+CALL db.index.fulltext.queryNodes('organization_fulltext_index', $org_name) YIELD node AS o, score
+WHERE coalesce(o.folkDeleted, false) = false
+WITH o, score
+ORDER BY score DESC
+LIMIT 1
+
+// Look for specific writers or treatment creators
+CALL {
+    CALL db.index.fulltext.queryNodes('person_fulltext_index',
+        'name:(courtney* OR phillips*) OR bio:treatment* OR role:writer*')
+    YIELD node
+    WHERE coalesce(node.folkDeleted, false) = false
+    WITH node
+    LIMIT 25
+    RETURN collect(node) AS writers
+}
+
+// Debug: Find ALL relationships from organization
+OPTIONAL MATCH (o)-[r1]->(connected1)
+OPTIONAL MATCH (o)<-[r2]-(connected2)
+
+// Find all projects using different relationship patterns
+OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj1:Project)
+OPTIONAL MATCH (o)-[:CLIENT_OF]->(proj2:Project)
+OPTIONAL MATCH (o)-[:HAS_PROJECT]->(proj3:Project)
+OPTIONAL MATCH (proj4:Project)-[:INVOLVES]->(o)
+OPTIONAL MATCH (proj5:Project {client: o.name})
+OPTIONAL MATCH (proj6:Project {client: o.id})
+
+// Find people with broader relationship patterns
+OPTIONAL MATCH (person1:Person)-[:CONTRIBUTED_TO]->(proj1)
+OPTIONAL MATCH (person2:Person)-[:WORKED_ON]->(proj1)
+OPTIONAL MATCH (person3:Person)-[:WORKS_FOR]->(o)
+OPTIONAL MATCH (person4:Person {company: o.name})
+
+RETURN o {
+    .id, .name, .type, .description, .folkId
+} AS organization,
+// Debug relationship info
+collect(DISTINCT type(r1)) AS outgoing_rels,
+collect(DISTINCT type(r2)) AS incoming_rels,
+collect(DISTINCT labels(connected1)) AS outgoing_connected,
+collect(DISTINCT labels(connected2)) AS incoming_connected,
+// Project collections
+collect(DISTINCT proj1.name) AS for_client_projects,
+collect(DISTINCT proj2.name) AS client_of_projects,
+collect(DISTINCT proj3.name) AS has_projects,
+collect(DISTINCT proj4.name) AS involves_projects,
+collect(DISTINCT proj5.name) AS named_client_projects,
+collect(DISTINCT proj6.name) AS id_client_projects,
+// People collections
+collect(DISTINCT person1.name) AS contributed_people,
+collect(DISTINCT person2.name) AS worked_on_people,
+collect(DISTINCT person3.name) AS works_for_people,
+collect(DISTINCT person4.name) AS company_people,
+[writer IN writers | writer.name] AS potential_writers,
+// Detailed writer info
+[writer IN writers | {
+    name: writer.name,
+    role: writer.role,
+    bio: writer.bio,
+    company: writer.company
+}] AS writer_details
+""", parameters={"org_name": ""})
+
+SIMILAR_PROJECTS_WITH_DIRECTOR = register_query("tools.similar_projects_with_director", """
+MATCH (proj:Project)
+WHERE proj.concept_embedding IS NOT NULL
+AND proj.name <> $exact_title
+WITH proj, gds.similarity.cosine(proj.concept_embedding, $target_embedding) AS similarity
+WHERE similarity >= $threshold
+OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
+OPTIONAL MATCH (director:Person)-[:CONTRIBUTED_TO {role: 'Director'}]->(proj)
+RETURN proj {
+    .name, .type, .year, .description
+} AS project,
+client.name AS client,
+director.name AS director,
+round(similarity, 3) AS similarity_score
+ORDER BY similarity DESC
+LIMIT 10
+""", parameters={"exact_title": "", "target_embedding": [0.0], "threshold": 0.8})
+
+
+# ==========================================================================
+# Entity name resolver (entity_resolver.py)
+# ==========================================================================
+
+# Labels the resolver indexes, with the properties holding their names;
+# an `aliases` list property is indexed as well when a node has one
+RESOLVABLE_ENTITY_FIELDS = {
+    "Person": PERSON_NAME_FIELDS,
+    "Organization": ORGANIZATION_NAME_FIELDS,
+    "Project": PROJECT_NAME_FIELDS,
+    "Deal": DEAL_NAME_FIELDS
+}
+
+# Labels cannot be parameters: one query per label
+ENTITY_NAMES = {
+    label: register_query(f"tools.entity_names.{label}", f"""
+MATCH (n:{label})
+WHERE coalesce(n.folkDeleted, false) = false
+RETURN elementId(n) AS element_id,
+       [name IN [{", ".join(f"n.{field}" for field in fields)}] + coalesce(n.aliases, []) WHERE name IS NOT NULL] AS names
+""")
+    for label, fields in RESOLVABLE_ENTITY_FIELDS.items()
+}
+
+# Properties of an entity returned by the search tools
+ENTITY_SUMMARY = "entity {.id, .role, .bio, .company, .name, .title, .description, .type}"
+
+ENTITIES_BY_ID = register_query("tools.entities_by_id", f"""
+MATCH (entity)
+WHERE elementId(entity) IN $element_ids AND coalesce(entity.folkDeleted, false) = false
+RETURN elementId(entity) AS element_id,
+       {ENTITY_SUMMARY} AS entity,
+       labels(entity) AS labels
+""", parameters={"element_ids": [""]})
+
+
+# ==========================================================================
+# Hybrid search (universal_vector_search.py)
+# ==========================================================================
+
+# Index names are procedure arguments, so one query serves every index
+
+VECTOR_CANDIDATES = register_query("tools.vector_candidates", f"""
+CALL db.index.vector.queryNodes($index_name, $top_k, $vector) YIELD node AS entity, score
+WHERE score >= $threshold AND coalesce(entity.folkDeleted, false) = false
+RETURN elementId(entity) AS element_id,
+       {ENTITY_SUMMARY} AS entity,
+       labels(entity) AS labels,
+       score
+ORDER BY score DESC
+""", parameters={"index_name": "person_bio_vector", "top_k": 10, "vector": [0.0], "threshold": 0.0})
+
+FULLTEXT_CANDIDATES = register_query("tools.fulltext_candidates", f"""
+CALL db.index.fulltext.queryNodes($index_name, $search, {{limit: $limit}}) YIELD node AS entity, score
+WHERE coalesce(entity.folkDeleted, false) = false
+RETURN elementId(entity) AS element_id,
+       {ENTITY_SUMMARY} AS entity,
+       labels(entity) AS labels,
+       score
+ORDER BY score DESC
+""", parameters={"index_name": "person_fulltext_index", "search": "", "limit": 10})
+
+
+# ==========================================================================
+# Vector search tools
+# ==========================================================================
+
+TREATMENT_WRITERS_FOR_TERM = register_query("tools.treatment_writers_for_term", """
+MATCH (writer:Person)-[r:AUTHORED_BY|WROTE_TREATMENT_FOR|DIRECTED|CREATED]-(item)
+WHERE (
+    toLower(item.id) CONTAINS toLower($search_term) OR
+    toLower(item.name) CONTAINS toLower($search_term) OR
+    toLower(item.client) CONTAINS toLower($search_term) OR
+    ANY(word IN $query_words WHERE toLower(item.id) CONTAINS word)
+)
+AND (
+    toLower(writer.role) CONTAINS 'writer' OR
+    toLower(writer.role) CONTAINS 'director' OR
+    toLower(writer.role) CONTAINS 'author'
+)
+RETURN writer.id AS writer_id, writer.name AS writer_name, writer.role AS writer_role,
+       writer.bio AS writer_bio,
+       item.id AS item_id, item.name AS item_name, item.type AS item_type,
+       type(r) AS relationship_type,
+       item.description AS item_description
+ORDER BY writer.id
+LIMIT 10
+""", parameters={"search_term": "", "query_words": [""]})
+
+TREATMENT_WRITERS_FOR_ENTITIES = register_query("tools.treatment_writers_for_entities", """
+MATCH (item)
+WHERE elementId(item) IN $element_ids AND coalesce(item.folkDeleted, false) = false
+MATCH (writer:Person)-[r:AUTHORED_BY|WROTE_TREATMENT_FOR|DIRECTED|CREATED]-(item)
+WHERE toLower(writer.role) CONTAINS 'writer' OR
+      toLower(writer.role) CONTAINS 'director' OR
+      toLower(writer.role) CONTAINS 'author'
+RETURN writer.id AS writer_id, writer.name AS writer_name, writer.role AS writer_role,
+       writer.bio AS writer_bio,
+       item.id AS item_id, item.name AS item_name, item.type AS item_type,
+       type(r) AS relationship_type,
+       item.description AS item_description
+ORDER BY writer.id
+LIMIT 10
+""", parameters={"element_ids": [""]})
@@ -15,6 +15,43 @@ from datetime import datetime, timedelta
 from database.neo4j_client import Neo4jClient
 from tools.folk_ingestion.folk_client import FolkClient
 from app.core.exceptions import AIProcessingError
+from .local_cache import LocalCache
+from .cache import ToolCache
+from .graph_queries import (
+    COLLABORATORS,
+    CONTRIBUTORS_ON_CLIENT_PROJECTS,
+    CREATIVE_REFERENCES,
+    DEAL_DETAILS,
+    DEAL_SOURCER,
+    DOCUMENT_BY_ID,
+    DOCUMENT_FULL_TEXT_SEARCH,
+    DOCUMENT_PROFILE,
+    DOCUMENTS_BY_CONTENT,
+    MAX_NETWORK_DEGREES,
+    NETWORK_CONNECTIONS,
+    ORGANIZATION_PROFILE,
+    PEOPLE_AT_ORGANIZATION,
+    PERSON_DETAILS,
+    PROJECT_CONCEPTS,
+    PROJECT_DETAILS,
+    PROJECT_DOCUMENTS,
+    PROJECT_GENERAL_INSIGHTS,
+    PROJECT_PERFORMANCE_INSIGHTS,
+    PROJECT_TEAM,
+    PROJECT_TEAM_INSIGHTS,
+    PROJECT_VENDORS,
+    PROJECTS_BY_CONCEPT,
+    PROJECTS_BY_CRITERIA,
+    PROJECTS_BY_RELATED_CONCEPT,
+    SIMILAR_PROJECT_TARGET,
+    SIMILAR_PROJECTS,
+    concept_search,
+    deal_search,
+    organization_search,
+    person_search,
+    project_criteria_parameters,
+    project_search
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +66,7 @@ class GraphQueryTools:
     - Document/Content tools
     
     Features:
-    - Redis caching for performance
+    - Two-tier caching (in-process L1 + Redis L2) for performance
     - Folk API hybrid queries for live data
     - Graceful error handling and fallback
     - Structured responses for agent consumption
@@ -59,35 +96,75 @@ class GraphQueryTools:
             "document": 1800,   # 30 minutes for document data
             "organization": 600 # 10 minutes for org data
         }
+        
+        # In-process L1 cache in front of Redis; entries use the TTLs above
+        self.local_cache = LocalCache("graph_tools")
+        self.l2_stats = {"hits": 0, "misses": 0, "errors": 0}
     
     async def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get result from Redis cache if available"""
+        """Get result from the L1 cache, falling back to Redis"""
+        local = self.local_cache.get(cache_key)
+        if local is not None:
+            return local
+        
         if not self.redis_client:
             return None
         
         try:
-            cached = await self.redis_client.get(cache_key)
+            # Fetch the remaining TTL with the value so L1 never outlives Redis
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(cache_key)
+            pipe.ttl(cache_key)
+            cached, remaining_ttl = await pipe.execute()
+            
             if cached:
-                return json.loads(cached)
+                self.l2_stats["hits"] += 1
+                result = json.loads(cached)
+                if remaining_ttl and remaining_ttl > 0:
+                    self.local_cache.set(cache_key, result, remaining_ttl, size=len(cached))
+                return result
+            
+            self.l2_stats["misses"] += 1
         except Exception as e:
+            self.l2_stats["errors"] += 1
             logger.warning(f"Cache retrieval failed for {cache_key}: {e}")
         
         return None
     
     async def _set_cached_result(self, cache_key: str, result: Dict[str, Any], ttl: int):
-        """Store result in Redis cache"""
-        if not self.redis_client or not result:
+        """Store result in the L1 cache and Redis"""
+        if not result:
+            return
+        
+        cached = json.dumps(result, default=str)
+        # Store the JSON round-tripped value so L1 and Redis hits look identical
+        self.local_cache.set(cache_key, json.loads(cached), ttl, size=len(cached))
+        
+        if not self.redis_client:
             return
         
         try:
-            await self.redis_client.setex(
-                cache_key, 
-                ttl, 
-                json.dumps(result, default=str)
-            )
+            # Register under entity tags so Folk change events can evict it
+            tags = ToolCache.extract_tags(cache_key.split(":", 1)[0], {}, result)[1:]
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(cache_key, ttl, cached)
+            ToolCache.register_tags(pipe, cache_key, tags, ttl)
+            await pipe.execute()
         except Exception as e:
             logger.warning(f"Cache storage failed for {cache_key}: {e}")
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get L1 and Redis cache hit/miss statistics"""
+        l2_lookups = self.l2_stats["hits"] + self.l2_stats["misses"]
+        return {
+            "l1": self.local_cache.get_stats(),
+            "l2": {
+                **self.l2_stats,
+                "hit_rate": self.l2_stats["hits"] / l2_lookups if l2_lookups else 0
+            }
+        }
+    
     # ==========================================================================
     # Category 1: People, Companies & Relationships (CRM & HR Focus)
     # ==========================================================================
@@ -105,30 +182,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (p:Person)
-        WHERE p.name CONTAINS $name OR p.fullName CONTAINS $name
-        OPTIONAL MATCH (p)-[r:CONTRIBUTED_TO]->(proj:Project)
-        OPTIONAL MATCH (p)-[:WORKS_FOR]->(org:Organization)
-        OPTIONAL MATCH (p)-[:BELONGS_TO]->(g:Group)
-        OPTIONAL MATCH (internal:Person {isInternal: true})-[:OWNS_CONTACT]->(p)
-        RETURN p {
-            .name, .fullName, .email, .folkId, .isInternal,
-            .bio, .role, .phone, .location, .linkedinUrl, .website, .tags
-        } AS person,
-        org.name AS organization,
-        collect(DISTINCT {
-            project: proj.name, 
-            role: r.role, 
-            startDate: r.startDate,
-            projectId: proj.id
-        }) AS projects,
-        collect(DISTINCT g.name) AS groups,
-        internal.name AS contact_owner
-        """
+        query = PERSON_DETAILS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"name": name})
+            result = await self.neo4j_client.execute_read(query, {"name": person_search(name)})
             
             if result and result.records:
                 # Take the first matching person
@@ -180,18 +237,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (p:Person)-[:WORKS_FOR]->(o:Organization)
-        WHERE o.name CONTAINS $org_name
-        RETURN p {
-            .name, .role, .email, .folkId, .isInternal
-        } AS person,
-        o.name AS organization
-        ORDER BY p.name
-        """
+        query = PEOPLE_AT_ORGANIZATION
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"org_name": organization_name})
+            result = await self.neo4j_client.execute_read(query, {"org_name": organization_search(organization_name)})
             
             if result and result.records:
                 people = []
@@ -238,30 +287,10 @@ class GraphQueryTools:
         
         Used by: Sales Agent (deal attribution), Analytics Agent (sourcing analysis)
         """
-        query = """
-        MATCH (p:Person {isInternal: true})-[:SOURCED]->(d:Deal)
-        WHERE d.name CONTAINS $deal_name
-        
-        // Get sourcing history for context
-        OPTIONAL MATCH (p)-[:SOURCED]->(other_deals:Deal)
-        WHERE other_deals <> d
-        
-        // Get their department/role
-        OPTIONAL MATCH (p)-[:WORKS_FOR]->(dept:Department)
-        
-        RETURN p {
-            .name, .fullName, .email, .folkUserId, .role
-        } AS sourcer,
-        d {
-            .name, .status, .value, .currency, .folkId
-        } AS deal,
-        dept.name AS department,
-        count(other_deals) AS total_deals_sourced,
-        collect(other_deals.name)[..3] AS recent_other_deals
-        """
+        query = DEAL_SOURCER
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"deal_name": deal_name})
+            result = await self.neo4j_client.execute_read(query, {"deal_name": deal_search(deal_name)})
             
             if result and result.records:
                 record = result.records[0]
@@ -298,22 +327,10 @@ class GraphQueryTools:
         Used by: Sales Agent (deal management), Analytics Agent (pipeline analysis)
         """
         # Step 1: Get rich context from graph
-        query = """
-        MATCH (sourcer:Person)-[:SOURCED]->(d:Deal)
-        WHERE d.name CONTAINS $deal_name
-        OPTIONAL MATCH (d)-[:WITH_CONTACT]->(contact:Person)
-        OPTIONAL MATCH (d)-[:FOR_ORGANIZATION]->(org:Organization)
-        RETURN d {
-            .name, .status, .value, .currency, .folkId,
-            .probability, .expectedCloseDate, .description
-        } AS deal,
-        sourcer.name AS sourced_by,
-        collect(contact.name) AS contacts,
-        org.name AS organization
-        """
+        query = DEAL_DETAILS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"deal_name": deal_name})
+            result = await self.neo4j_client.execute_read(query, {"deal_name": deal_search(deal_name)})
             
             if result and result.records:
                 graph_data = result.records[0]
@@ -370,28 +387,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (proj:Project)
-        WHERE proj.name CONTAINS $title
-        OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-        OPTIONAL MATCH (proj)-[:FEATURES_CONCEPT]->(c:CreativeConcept)
-        OPTIONAL MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj)
-        OPTIONAL MATCH (proj)-[:MANAGED_BY]->(dept:Department)
-        RETURN proj {
-            .name, .id, .logline, .status, .year, .description
-        } AS project,
-        client.name AS client,
-        dept.name AS department,
-        collect(DISTINCT c.name) AS concepts,
-        collect(DISTINCT {
-            person: p.name, 
-            role: r.role,
-            startDate: r.startDate
-        }) AS crew
-        """
+        query = PROJECT_DETAILS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"title": project_title})
+            result = await self.neo4j_client.execute_read(query, {"title": project_search(project_title)})
             
             if result and result.records:
                 record = result.records[0]
@@ -444,22 +443,10 @@ class GraphQueryTools:
             return cached
         
         # Base query for direct concept matches
-        query = """
-        MATCH (proj:Project)-[:FEATURES_CONCEPT]->(c:CreativeConcept)
-        WHERE c.name CONTAINS $concept_name
-        OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-        OPTIONAL MATCH (director:Person)-[r:CONTRIBUTED_TO {role: 'Director'}]->(proj)
-        RETURN proj {
-            .name, .id, .logline, .status, .year
-        } AS project,
-        collect(c.name) AS concepts,
-        client.name AS client,
-        director.name AS director,
-        'direct_match' AS match_type
-        """
+        query = PROJECTS_BY_CONCEPT
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"concept_name": concept_name})
+            result = await self.neo4j_client.execute_read(query, {"concept_name": concept_search(concept_name)})
             
             projects = []
             if result and result.records:
@@ -474,24 +461,12 @@ class GraphQueryTools:
             
             # If include_related and we found results, also find related concepts
             if include_related and projects:
-                related_query = """
-                MATCH (c1:CreativeConcept)-[:RELATED_TO*1..2]->(c2:CreativeConcept)
-                WHERE c1.name CONTAINS $concept_name
-                MATCH (proj:Project)-[:FEATURES_CONCEPT]->(c2)
-                WHERE NOT proj.name IN $existing_titles
-                OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-                RETURN proj {
-                    .name, .id, .logline, .status, .year
-                } AS project,
-                collect(c2.name) AS concepts,
-                client.name AS client,
-                'related_concept' AS match_type
-                """
+                related_query = PROJECTS_BY_RELATED_CONCEPT
                 
                 existing_titles = [p["project"]["name"] for p in projects if p["project"]]
-                related_result = await self.neo4j_client.execute_query(
+                related_result = await self.neo4j_client.execute_read(
                     related_query,
-                    {"concept_name": concept_name, "existing_titles": existing_titles}
+                    {"concept_name": concept_search(concept_name), "existing_titles": existing_titles}
                 )
                 
                 if related_result and related_result.records:
@@ -534,21 +509,12 @@ class GraphQueryTools:
         
         Used by: Talent Agent (find experienced crew), Sales Agent (team capabilities)
         """
-        query = """
-        MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj:Project)-[:FOR_CLIENT]->(o:Organization)
-        WHERE r.role CONTAINS $role AND o.name CONTAINS $client_name
-        RETURN DISTINCT p {
-            .name, .role, .email, .bio
-        } AS person,
-        collect(DISTINCT proj.name) AS projects,
-        count(DISTINCT proj) AS project_count
-        ORDER BY project_count DESC
-        """
+        query = CONTRIBUTORS_ON_CLIENT_PROJECTS
         
         try:
-            result = await self.neo4j_client.execute_query(
+            result = await self.neo4j_client.execute_read(
                 query, 
-                {"role": role, "client_name": client_name}
+                {"role": role, "client_name": organization_search(client_name)}
             )
             
             contributors = []
@@ -583,20 +549,10 @@ class GraphQueryTools:
         
         Used by: Analytics Agent (vendor analysis), Talent Agent (vendor relationships)
         """
-        query = """
-        MATCH (o:Organization)-[r:PROVIDED_SERVICE]->(p:Project)
-        WHERE p.name CONTAINS $title
-        RETURN o {
-            .name, .organizationId, .folkId
-        } AS vendor,
-        r.service AS service,
-        r.cost AS cost,
-        r.startDate AS start_date
-        ORDER BY o.name
-        """
+        query = PROJECT_VENDORS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"title": project_title})
+            result = await self.neo4j_client.execute_read(query, {"title": project_search(project_title)})
             
             vendors = []
             if result and result.records:
@@ -633,17 +589,10 @@ class GraphQueryTools:
         
         Used by: Analytics Agent (project documentation)
         """
-        query = """
-        MATCH (d:Document)-[]->(p:Project)
-        WHERE p.name CONTAINS $title
-        RETURN d {
-            .title, .type, .id, .created_at
-        } AS document
-        ORDER BY d.created_at DESC
-        """
+        query = PROJECT_DOCUMENTS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"title": project_title})
+            result = await self.neo4j_client.execute_read(query, {"title": project_search(project_title)})
             
             documents = []
             if result and result.records:
@@ -675,13 +624,10 @@ class GraphQueryTools:
         
         Used by: Analytics Agent (extract specific document data)
         """
-        query = """
-        MATCH (d:Document {id: $doc_id})
-        RETURN d.profile AS profile, d.title AS title, d.type AS type
-        """
+        query = DOCUMENT_PROFILE
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"doc_id": document_id})
+            result = await self.neo4j_client.execute_read(query, {"doc_id": document_id})
             
             if result and result.records:
                 record = result.records[0]
@@ -756,21 +702,10 @@ class GraphQueryTools:
         Used by: Analytics Agent (document search and analysis)
         """
         # Use Neo4j full-text search with ranking
-        query = """
-        CALL db.index.fulltext.queryNodes('documentTextIndex', $search_query)
-        YIELD node, score
-        MATCH (node:Document)
-        RETURN node.title AS title, 
-               node.type AS type,
-               node.id AS id,
-               score,
-               node.fullTextContent AS content
-        ORDER BY score DESC
-        LIMIT $limit
-        """
+        query = DOCUMENT_FULL_TEXT_SEARCH
         
         try:
-            result = await self.neo4j_client.execute_query(
+            result = await self.neo4j_client.execute_read(
                 query, 
                 {"search_query": search_query, "limit": limit}
             )
@@ -857,32 +792,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (p1:Person)-[:CONTRIBUTED_TO]->(proj:Project)<-[:CONTRIBUTED_TO]-(p2:Person)
-        WHERE p1.name CONTAINS $person_name AND p1 <> p2
-        """
-        
-        # Add project type filter if specified
-        if project_type:
-            query += " AND proj.type CONTAINS $project_type"
-        
-        query += """
-        WITH p2, collect(DISTINCT proj.name) AS shared_projects, count(DISTINCT proj) AS collaboration_count
-        ORDER BY collaboration_count DESC
-        LIMIT 20
-        RETURN p2 {
-            .name, .role, .email, .folkId
-        } AS collaborator,
-        shared_projects,
-        collaboration_count
-        """
-        
         try:
-            params = {"person_name": person_name}
-            if project_type:
-                params["project_type"] = project_type
-                
-            result = await self.neo4j_client.execute_query(query, params)
+            # A null project type disables the filter, keeping one query shape
+            params = {"person_name": person_search(person_name), "project_type": project_type or None}
+            result = await self.neo4j_client.execute_read(COLLABORATORS, params)
             
             collaborators = []
             if result and result.records:
@@ -924,22 +837,7 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (o:Organization)
-        WHERE o.id CONTAINS $org_name OR o.name CONTAINS $org_name OR 
-              toLower(o.id) CONTAINS toLower($org_name) OR toLower(o.name) CONTAINS toLower($org_name)
-        OPTIONAL MATCH (o)<-[:WORKS_FOR]-(p:Person)
-        OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj:Project)
-        OPTIONAL MATCH (o)<-[:FOR_ORGANIZATION]-(d:Deal)
-        RETURN o {
-            .id, .name, .type, .description, .folkId
-        } AS organization,
-        collect(DISTINCT p.name) AS people,
-        collect(DISTINCT proj.name) AS projects,
-        collect(DISTINCT d.name) AS deals,
-        count(DISTINCT p) AS people_count,
-        count(DISTINCT proj) AS project_count
-        """
+        query = ORGANIZATION_PROFILE
         
         try:
             # Ensure Neo4j client is properly connected
@@ -954,7 +852,7 @@ class GraphQueryTools:
                     await self.neo4j_client.connect()
             
             logger.debug(f"Executing organization query for: {org_name}")
-            result = await self.neo4j_client.execute_query(query, {"org_name": org_name})
+            result = await self.neo4j_client.execute_read(query, {"org_name": organization_search(org_name)})
             
             if result and result.records:
                 record = result.records[0]
@@ -1005,31 +903,21 @@ class GraphQueryTools:
         """
         Get network connections within specified degrees of separation
         
+        Degrees are clamped to 1..MAX_NETWORK_DEGREES (one registered query per depth).
+        
         Used by: Sales Agent (influence mapping), Analytics Agent (network analysis)
         """
+        degrees = max(1, min(degrees, MAX_NETWORK_DEGREES))
         cache_key = f"network:{person_name.lower().replace(' ', '_')}:deg_{degrees}"
         
         cached = await self._get_cached_result(cache_key)
         if cached:
             return cached
         
-        # Build variable-length relationship query
-        degrees_pattern = f"*1..{degrees}"
-        
-        query = f"""
-        MATCH path = (start:Person)-[:WORKS_FOR|:CONTRIBUTED_TO|:BELONGS_TO{degrees_pattern}]-(connected:Person)
-        WHERE start.name CONTAINS $person_name AND start <> connected
-        WITH connected, length(path) AS distance, path
-        ORDER BY distance, connected.name
-        RETURN DISTINCT connected {{
-            .name, .role, .email, .folkId, .isInternal
-        }} AS person,
-        min(distance) AS degrees_of_separation
-        LIMIT 50
-        """
-        
         try:
-            result = await self.neo4j_client.execute_query(query, {"person_name": person_name})
+            result = await self.neo4j_client.execute_read(
+                NETWORK_CONNECTIONS[degrees], {"person_name": person_search(person_name)}
+            )
             
             connections = []
             if result and result.records:
@@ -1070,44 +958,8 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        # Build dynamic query based on criteria
-        where_clauses = []
-        params = {}
-        
-        if criteria.get("type"):
-            where_clauses.append("proj.type CONTAINS $project_type")
-            params["project_type"] = criteria["type"]
-            
-        if criteria.get("year"):
-            where_clauses.append("proj.year = $year")
-            params["year"] = criteria["year"]
-            
-        if criteria.get("status"):
-            where_clauses.append("proj.status CONTAINS $status")
-            params["status"] = criteria["status"]
-            
-        if criteria.get("client"):
-            where_clauses.append("client.name CONTAINS $client_name")
-            params["client_name"] = criteria["client"]
-        
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f"""
-        MATCH (proj:Project)
-        OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-        OPTIONAL MATCH (director:Person)-[:CONTRIBUTED_TO {{role: 'Director'}}]->(proj)
-        WHERE {where_clause}
-        RETURN proj {{
-            .name, .type, .status, .year, .description, .budget
-        }} AS project,
-        client.name AS client,
-        director.name AS director
-        ORDER BY proj.year DESC, proj.name
-        LIMIT 25
-        """
-        
         try:
-            result = await self.neo4j_client.execute_query(query, params)
+            result = await self.neo4j_client.execute_read(PROJECTS_BY_CRITERIA, project_criteria_parameters(criteria))
             
             projects = []
             if result and result.records:
@@ -1149,15 +1001,10 @@ class GraphQueryTools:
             return cached
         
         # First get the target project's embedding
-        target_query = """
-        MATCH (proj:Project)
-        WHERE proj.name CONTAINS $title
-        RETURN proj.concept_embedding AS embedding, proj.name AS exact_title
-        LIMIT 1
-        """
+        target_query = SIMILAR_PROJECT_TARGET
         
         try:
-            target_result = await self.neo4j_client.execute_query(target_query, {"title": project_title})
+            target_result = await self.neo4j_client.execute_read(target_query, {"title": project_search(project_title)})
             
             if not target_result or not target_result.records:
                 return {
@@ -1179,23 +1026,9 @@ class GraphQueryTools:
                 }
             
             # Find similar projects using vector similarity
-            similarity_query = """
-            MATCH (proj:Project)
-            WHERE proj.concept_embedding IS NOT NULL 
-            AND proj.name <> $exact_title
-            WITH proj, gds.similarity.cosine(proj.concept_embedding, $target_embedding) AS similarity
-            WHERE similarity >= $threshold
-            OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-            RETURN proj {
-                .name, .type, .year, .status
-            } AS project,
-            client.name AS client,
-            similarity
-            ORDER BY similarity DESC
-            LIMIT 10
-            """
+            similarity_query = SIMILAR_PROJECTS
             
-            result = await self.neo4j_client.execute_query(
+            result = await self.neo4j_client.execute_read(
                 similarity_query, 
                 {
                     "exact_title": exact_title,
@@ -1244,24 +1077,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj:Project)
-        WHERE proj.name CONTAINS $title
-        OPTIONAL MATCH (p)-[:WORKS_FOR]->(org:Organization)
-        RETURN proj {
-            .name, .type, .status, .year
-        } AS project,
-        collect({
-            person: p {.name, .role, .email, .folkId},
-            role: r.role,
-            startDate: r.startDate,
-            endDate: r.endDate,
-            organization: org.name
-        }) AS crew
-        """
+        query = PROJECT_TEAM
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"title": project_title})
+            result = await self.neo4j_client.execute_read(query, {"title": project_search(project_title)})
             
             if result and result.records:
                 record = result.records[0]
@@ -1318,21 +1137,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (proj:Project)-[:FEATURES_CONCEPT]->(c:CreativeConcept)
-        WHERE proj.name CONTAINS $title
-        OPTIONAL MATCH (c)-[:RELATED_TO]->(related:CreativeConcept)
-        RETURN proj {
-            .name, .type, .year
-        } AS project,
-        collect(DISTINCT c {
-            .name, .category, .description, .tags
-        }) AS concepts,
-        collect(DISTINCT related.name) AS related_concepts
-        """
+        query = PROJECT_CONCEPTS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"title": project_title})
+            result = await self.neo4j_client.execute_read(query, {"title": project_search(project_title)})
             
             if result and result.records:
                 record = result.records[0]
@@ -1378,29 +1186,9 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (c:CreativeConcept)-[:INSPIRED_BY]->(ref:Reference)
-        WHERE c.name CONTAINS $concept_name
-        """
-        
-        if medium:
-            query += " AND ref.medium CONTAINS $medium"
-        
-        query += """
-        RETURN c {
-            .name, .category, .description
-        } AS concept,
-        collect(ref {
-            .title, .creator, .medium, .year, .url, .description
-        }) AS references
-        """
-        
         try:
-            params = {"concept_name": concept_name}
-            if medium:
-                params["medium"] = medium
-                
-            result = await self.neo4j_client.execute_query(query, params)
+            params = {"concept_name": concept_search(concept_name), "medium": medium or None}
+            result = await self.neo4j_client.execute_read(CREATIVE_REFERENCES, params)
             
             references = []
             if result and result.records:
@@ -1438,41 +1226,9 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        # Use full-text search with optional type filter
-        if doc_type:
-            search_query = """
-            CALL db.index.fulltext.queryNodes('document_fulltext_index', $search_query)
-            YIELD node, score
-            MATCH (node:Document)
-            WHERE node.type CONTAINS $doc_type
-            RETURN node {
-                .title, .type, .id, .created_at
-            } AS document,
-            score,
-            node.content AS content
-            ORDER BY score DESC
-            LIMIT 15
-            """
-        else:
-            search_query = """
-            CALL db.index.fulltext.queryNodes('document_fulltext_index', $search_query)
-            YIELD node, score
-            MATCH (node:Document)
-            RETURN node {
-                .title, .type, .id, .created_at
-            } AS document,
-            score,
-            node.content AS content
-            ORDER BY score DESC
-            LIMIT 15
-            """
-        
         try:
-            params = {"search_query": query}
-            if doc_type:
-                params["doc_type"] = doc_type
-                
-            result = await self.neo4j_client.execute_query(search_query, params)
+            params = {"search_query": query, "doc_type": doc_type or None}
+            result = await self.neo4j_client.execute_read(DOCUMENTS_BY_CONTENT, params)
             
             documents = []
             if result and result.records:
@@ -1517,20 +1273,10 @@ class GraphQueryTools:
         if cached:
             return cached
         
-        query = """
-        MATCH (d:Document {id: $doc_id})
-        OPTIONAL MATCH (d)-[:RELATED_TO]->(proj:Project)
-        OPTIONAL MATCH (d)-[:CREATED_BY]->(author:Person)
-        RETURN d {
-            .title, .type, .id, .content, .summary,
-            .created_at, .sensitivityLevel
-        } AS document,
-        proj.name AS project,
-        author.name AS author
-        """
+        query = DOCUMENT_BY_ID
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"doc_id": document_id})
+            result = await self.neo4j_client.execute_read(query, {"doc_id": document_id})
             
             if result and result.records:
                 record = result.records[0]
@@ -1576,69 +1322,16 @@ class GraphQueryTools:
         
         # Different queries based on insight type
         if insight_type == "performance":
-            query = """
-            MATCH (proj:Project)
-            WHERE proj.name CONTAINS $title
-            OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-            OPTIONAL MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj)
-            WITH proj, client, count(p) AS crew_size
-            RETURN proj {
-                .name, .status, .year, .budget, .actualCost, .duration
-            } AS project,
-            client.name AS client,
-            crew_size,
-            {
-                budget_efficiency: CASE 
-                    WHEN proj.budget IS NOT NULL AND proj.actualCost IS NOT NULL 
-                    THEN round((proj.budget - proj.actualCost) * 100.0 / proj.budget)
-                    ELSE null 
-                END,
-                crew_efficiency: CASE 
-                    WHEN crew_size > 15 THEN 'large_team'
-                    WHEN crew_size > 8 THEN 'medium_team'
-                    ELSE 'small_team'
-                END
-            } AS performance_metrics
-            """
+            query = PROJECT_PERFORMANCE_INSIGHTS
         
         elif insight_type == "team":
-            query = """
-            MATCH (p:Person)-[r:CONTRIBUTED_TO]->(proj:Project)
-            WHERE proj.name CONTAINS $title
-            WITH proj, collect({
-                name: p.name, 
-                role: r.role, 
-                experience_level: CASE 
-                    WHEN size((p)-[:CONTRIBUTED_TO]->(:Project)) > 10 THEN 'senior'
-                    WHEN size((p)-[:CONTRIBUTED_TO]->(:Project)) > 3 THEN 'mid'
-                    ELSE 'junior'
-                END
-            }) AS team_analysis
-            RETURN proj.name AS project_title,
-            size(team_analysis) AS total_crew,
-            size([m IN team_analysis WHERE m.experience_level = 'senior']) AS senior_count,
-            size([m IN team_analysis WHERE m.experience_level = 'mid']) AS mid_count,
-            size([m IN team_analysis WHERE m.experience_level = 'junior']) AS junior_count,
-            team_analysis
-            """
+            query = PROJECT_TEAM_INSIGHTS
         
         else:  # Default general insights
-            query = """
-            MATCH (proj:Project)
-            WHERE proj.name CONTAINS $title
-            OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-            OPTIONAL MATCH (proj)-[:FEATURES_CONCEPT]->(concept:CreativeConcept)
-            OPTIONAL MATCH (p:Person)-[:CONTRIBUTED_TO]->(proj)
-            RETURN proj {
-                .name, .type, .status, .year, .budget, .description
-            } AS project,
-            client.name AS client,
-            collect(DISTINCT concept.name) AS concepts,
-            count(DISTINCT p) AS crew_size
-            """
+            query = PROJECT_GENERAL_INSIGHTS
         
         try:
-            result = await self.neo4j_client.execute_query(query, {"title": project_title})
+            result = await self.neo4j_client.execute_read(query, {"title": project_search(project_title)})
             
             if result and result.records:
                 record = result.records[0]
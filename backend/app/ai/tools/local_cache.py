@@ -0,0 +1,407 @@
+"""
+In-Process Tool Cache
+
+Bounded, TTL-aware LRU cache that sits in front of Redis (L1 in front of the
+L2 Redis cache) so hot tool results are served without a network round trip
+or JSON decode. Redis pub/sub invalidation messages keep the L1 caches of
+every worker process coherent.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub channel used to broadcast cache invalidations between workers
+INVALIDATION_CHANNEL = "onevice:tool_cache:invalidate"
+
+# Identifies this process so it can ignore its own invalidation messages
+PROCESS_ID = uuid.uuid4().hex
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("TOOL_L1_CACHE_MAX_ENTRIES", "2048"))
+DEFAULT_MAX_BYTES = int(os.getenv("TOOL_L1_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Resubscribe backoff (seconds) for pub/sub listeners after a Redis error
+LISTENER_MIN_BACKOFF = 1.0
+LISTENER_MAX_BACKOFF = 30.0
+
+# L1 stores nothing until the invalidation listener has subscribed, and
+# again whenever it is disconnected or stopped
+_suspended = True
+
+
+@dataclass
+class _CacheEntry:
+    """Single L1 cache entry"""
+    value: Any
+    expires_at: float
+    size: int
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL.
+
+    Entries are capped both by count and by approximate size (the length of
+    the entry's JSON encoding). Cached values are shared between callers and
+    must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0
+        }
+
+        _register_local_cache(self)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live entry, refreshing its LRU position"""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: float, size: Optional[int] = None) -> bool:
+        """
+        Store a value for ttl seconds.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+            size: Approximate size in bytes (computed from JSON if omitted)
+
+        Returns:
+            True if stored, False if the entry is too large, ttl is not
+            positive or L1 caching is suspended
+        """
+        if ttl <= 0 or _suspended:
+            return False
+
+        if size is None:
+            try:
+                size = len(json.dumps(value, default=str))
+            except (TypeError, ValueError):
+                return False
+
+        if size > self.max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _CacheEntry(value=value, expires_at=time.monotonic() + ttl, size=size)
+        self._total_bytes += size
+        self.stats["sets"] += 1
+
+        self._evict()
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove a single key"""
+        if key in self._entries:
+            self._remove(key)
+            self.stats["invalidations"] += 1
+            return True
+        return False
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Remove several keys"""
+        return sum(1 for key in keys if self.delete(key))
+
+    def delete_matching(self, pattern: str) -> int:
+        """Remove all keys matching a Redis-style glob pattern"""
+        matching = [key for key in self._entries if fnmatchcase(key, pattern)]
+        return self.delete_many(matching)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self.stats["invalidations"] += len(self._entries)
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics and memory usage"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "name": self.name,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within both limits"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats["evictions"] += 1
+
+
+# =============================================================================
+# Cross-worker invalidation
+# =============================================================================
+
+_local_caches: "weakref.WeakSet[LocalCache]" = weakref.WeakSet()
+
+
+def _register_local_cache(cache: LocalCache) -> None:
+    _local_caches.add(cache)
+
+
+def apply_invalidation(
+    keys: Optional[Iterable[str]] = None,
+    pattern: Optional[str] = None
+) -> int:
+    """Evict keys and/or a key pattern from every L1 cache in this process"""
+    removed = 0
+    keys = list(keys or [])
+    for cache in list(_local_caches):
+        if keys:
+            removed += cache.delete_many(keys)
+        if pattern:
+            removed += cache.delete_matching(pattern)
+    return removed
+
+
+async def publish_invalidation(
+    redis_client,
+    keys: Optional[Iterable[str]] = None,
+    pattern: Optional[str] = None
+) -> None:
+    """
+    Broadcast an invalidation to the other workers' L1 caches.
+
+    Local caches are expected to have been updated by the caller already.
+    """
+    keys = list(keys or [])
+    if not keys and not pattern:
+        return
+
+    message = json.dumps({"origin": PROCESS_ID, "keys": keys, "pattern": pattern})
+
+    try:
+        await redis_client.publish(INVALIDATION_CHANNEL, message)
+    except Exception as e:
+        logger.warning(f"Cache invalidation publish failed: {e}")
+
+
+async def listen_with_reconnect(
+    get_client: Callable[[], Any],
+    channel: str,
+    handle: Callable[[Any], Awaitable[None]],
+    on_connect: Optional[Callable[[], None]] = None,
+    on_disconnect: Optional[Callable[[], None]] = None,
+    min_backoff: float = LISTENER_MIN_BACKOFF,
+    max_backoff: float = LISTENER_MAX_BACKOFF
+) -> None:
+    """
+    Pass every message published on a Redis channel to `handle`, forever.
+
+    Redis errors (connection resets, failovers) do not end the listener: it
+    resubscribes with exponential backoff, through the client `get_client`
+    returns at that time. `on_connect` runs after every successful
+    subscribe and `on_disconnect` whenever the subscription drops, a
+    subscribe attempt fails or the listener is cancelled, so callers can
+    account for messages missed in between. Errors raised by `handle` only
+    skip that message.
+    """
+    backoff = min_backoff
+
+    while True:
+        pubsub = get_client().pubsub()
+
+        try:
+            await pubsub.subscribe(channel)
+            backoff = min_backoff
+            logger.info(f"Listening on {channel}")
+
+            if on_connect:
+                on_connect()
+
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+
+                try:
+                    await handle(message["data"])
+                except Exception as e:
+                    logger.warning(f"Failed to handle message on {channel}: {e}")
+
+            logger.warning(f"Subscription to {channel} ended, resubscribing in {backoff:.1f}s")
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Listener on {channel} failed, resubscribing in {backoff:.1f}s: {e}")
+        finally:
+            try:
+                await pubsub.unsubscribe(channel)
+                await pubsub.close()
+            except Exception:
+                pass
+
+            if on_disconnect:
+                on_disconnect()
+
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, max_backoff)
+
+
+class SharedListener:
+    """
+    Process-wide pub/sub listener shared by several owners.
+
+    The orchestrator and the tool dependencies both start the listeners, so
+    they are reference counted like the entity resolver refresh: the task
+    runs until every owner has called stop() with the client it started
+    with, and each (re)subscribe uses the newest client still registered.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        handle: Callable[[Any], Awaitable[None]],
+        on_connect: Optional[Callable[[], None]] = None,
+        on_disconnect: Optional[Callable[[], None]] = None
+    ):
+        self.channel = channel
+        self.handle = handle
+        self.on_connect = on_connect
+        self.on_disconnect = on_disconnect
+        self._clients: List[Any] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, redis_client) -> Optional[asyncio.Task]:
+        """
+        Start the listener, or join it if running.
+
+        Must be called from a running event loop.
+        """
+        if redis_client is None:
+            return None
+
+        self._clients.append(redis_client)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(listen_with_reconnect(
+                lambda: self._clients[-1],
+                self.channel,
+                self.handle,
+                on_connect=self.on_connect,
+                on_disconnect=self.on_disconnect
+            ))
+
+        return self._task
+
+    async def stop(self, redis_client) -> None:
+        """Leave the listener; the last owner to leave stops it"""
+        if redis_client in self._clients:
+            self._clients.remove(redis_client)
+
+        if self._clients:
+            return
+
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        self._task = None
+
+
+def suspend_local_caches() -> None:
+    """Clear every L1 cache and store nothing until resume_local_caches()"""
+    global _suspended
+
+    _suspended = True
+    for cache in list(_local_caches):
+        cache.clear()
+
+
+def resume_local_caches() -> None:
+    """Clear every L1 cache, which may have missed invalidations; cache again"""
+    global _suspended
+
+    for cache in list(_local_caches):
+        cache.clear()
+    _suspended = False
+
+
+async def _apply_invalidation_message(data: Any) -> None:
+    """Apply one invalidation message published by another worker"""
+    payload = json.loads(data)
+    if payload.get("origin") == PROCESS_ID:
+        return
+    apply_invalidation(payload.get("keys"), payload.get("pattern"))
+
+
+# Invalidations published while the listener is disconnected are missed, so
+# L1 caching is suspended (and emptied) until it has subscribed; reads fall
+# through to Redis in the meantime
+_invalidation_listener = SharedListener(
+    INVALIDATION_CHANNEL,
+    _apply_invalidation_message,
+    on_connect=resume_local_caches,
+    on_disconnect=suspend_local_caches
+)
+
+
+def start_invalidation_listener(redis_client) -> Optional[asyncio.Task]:
+    """
+    Start the process-wide invalidation listener, or join it if running.
+
+    Must be called from a running event loop.
+    """
+    return _invalidation_listener.start(redis_client)
+
+
+async def stop_invalidation_listener(redis_client) -> None:
+    """Leave the invalidation listener; the last owner to leave stops it"""
+    await _invalidation_listener.stop(redis_client)
@@ -17,6 +17,21 @@ from .factory import (
     create_project_tool,
     tool_factory
 )
+from .graph_queries import (
+    NODE_LABEL_COUNTS,
+    ORGANIZATION_PROFILE_WITH_TREATMENTS,
+    ORGANIZATION_RELATIONSHIPS,
+    PEOPLE_AT_ORGANIZATION,
+    PERSON_DETAILS,
+    PROJECTS_BY_CRITERIA,
+    SIMILAR_PROJECT_TARGET,
+    SIMILAR_PROJECTS_WITH_DIRECTOR,
+    TREATMENT_WRITER_CANDIDATES,
+    organization_search,
+    person_search,
+    project_criteria_parameters,
+    project_search
+)
 from .universal_vector_search import enhance_tool_result_with_vector_search
 from .vector_search_tool import broad_vector_search
 
@@ -69,59 +84,7 @@ async def get_organization_profile(org_name: str, neo4j_client) -> Dict[str, Any
     logger.info(f"🚀 TOOL EXECUTED: get_organization_profile called with org_name='{org_name}'")
     logger.info(f"🚀 Neo4j client type: {type(neo4j_client)}")
     # FIXED QUERY - Uses correct property names discovered during debugging
-    query = """
-    MATCH (o:Organization)
-    WHERE o.id CONTAINS $org_name OR (o.name IS NOT NULL AND o.name CONTAINS $org_name) OR
-          toLower(o.id) CONTAINS toLower($org_name) OR (o.name IS NOT NULL AND toLower(o.name) CONTAINS toLower($org_name))
-
-    // CRITICAL: Find treatment writers using WROTE_TREATMENT_FOR relationship we discovered
-    OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(treatment_proj:Project)<-[:WROTE_TREATMENT_FOR]-(writer:Person)
-
-    // Also find DESIGNED_TREATMENT_FOR relationships
-    OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(design_proj:Project)<-[:DESIGNED_TREATMENT_FOR]-(designer:Person)
-
-    // Find any documents/chunks with treatment content
-    OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj3:Project)-[:HAS_DOCUMENT|HAS_CHUNK]-(doc)
-    WHERE (doc.text IS NOT NULL AND toLower(doc.text) CONTAINS 'treatment') OR
-          (doc.content IS NOT NULL AND toLower(doc.content) CONTAINS 'treatment')
-
-    // Find all projects and people connected to this organization - USING ID PROPERTIES
-    OPTIONAL MATCH (o)<-[:WORKS_FOR]-(p:Person)
-    OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj:Project)
-    OPTIONAL MATCH (proj)<-[:CONTRIBUTED_TO]-(contributor:Person)
-    OPTIONAL MATCH (o)<-[:FOR_ORGANIZATION]-(d:Deal)
-    
-    RETURN o {
-        .id, .name, .type, .description, .folkId
-    } AS organization,
-    collect(DISTINCT p.id) AS people,
-    collect(DISTINCT proj.id) AS projects,
-    collect(DISTINCT d.name) AS deals,
-    collect(DISTINCT contributor.id) AS contributors,
-    collect(DISTINCT writer.id) AS treatment_writers_direct,
-    collect(DISTINCT designer.id) AS treatment_designers,
-    collect(DISTINCT {
-        id: writer.id, 
-        role: writer.role, 
-        bio: writer.bio,
-        project: treatment_proj.id,
-        relationship: 'WROTE_TREATMENT_FOR'
-    }) AS writer_details_direct,
-    collect(DISTINCT {
-        id: designer.id, 
-        role: designer.role, 
-        bio: designer.bio,
-        project: design_proj.id,
-        relationship: 'DESIGNED_TREATMENT_FOR'
-    }) AS designer_details,
-    collect(DISTINCT {
-        text: substring(coalesce(doc.text, doc.content, ''), 0, 200),
-        id: doc.id
-    }) AS treatment_documents,
-    count(DISTINCT p) AS people_count,
-    count(DISTINCT proj) AS project_count,
-    count(DISTINCT writer) AS treatment_writer_count
-    """
+    query = ORGANIZATION_PROFILE_WITH_TREATMENTS
     
     try:
         # Check connection state if available
@@ -135,8 +98,7 @@ async def get_organization_profile(org_name: str, neo4j_client) -> Dict[str, Any
         logger.info(f"🔍 DEBUGGING: Executing organization query for: {org_name}")
         
         # First, check what actually exists in the database
-        debug_query = "MATCH (n) RETURN labels(n) as labels, count(n) as count ORDER BY count DESC LIMIT 10"
-        debug_result = await neo4j_client.execute_query(debug_query)
+        debug_result = await neo4j_client.execute_read(NODE_LABEL_COUNTS)
         logger.info(f"🔍 DEBUG: Database node summary:")
         if debug_result and debug_result.records:
             for record in debug_result.records:
@@ -154,46 +116,18 @@ async def get_organization_profile(org_name: str, neo4j_client) -> Dict[str, Any
         logger.info(f"🔍 DEBUG: Starting organization queries...")
         
         logger.info(f"🔍 DEBUG: Now executing original Organization query...")
-        result = await neo4j_client.execute_query(query, {"org_name": org_name})
+        org_search = organization_search(org_name)
+        result = await neo4j_client.execute_read(query, {"org_name": org_search})
         logger.info(f"🔍 DEBUG: Organization query returned {len(result.records) if result and result.records else 0} records")
         
         # CRITICAL Vector Search - Based on user insight that Graph Builder uses vector search
         logger.info(f"🔍 VECTOR SEARCH: Starting vector search for treatment writers...")
         try:
             # Text-based vector search that mimics vector similarity behavior
-            text_based_vector_search = """
-            MATCH (person:Person)
-            WHERE (person.bio IS NOT NULL AND 
-                  (toLower(person.bio) CONTAINS 'treatment' OR 
-                   toLower(person.bio) CONTAINS 'writer' OR 
-                   toLower(person.bio) CONTAINS 'screenplay' OR
-                   toLower(person.bio) CONTAINS 'script')) OR
-                  (person.role IS NOT NULL AND
-                   (toLower(person.role) CONTAINS 'writer' OR
-                    toLower(person.role) CONTAINS 'screenwriter'))
-            
-            OPTIONAL MATCH (person)-[rel:CONTRIBUTED_TO|WROTE_TREATMENT_FOR|DESIGNED_TREATMENT_FOR]->(project:Project)-[:FOR_CLIENT]->(org:Organization)
-            WHERE org.id CONTAINS $org_name OR (org.name IS NOT NULL AND toLower(org.name) CONTAINS toLower($org_name))
-            
-            RETURN person {
-                .id, .role, .bio, .company
-            } AS vector_person,
-            type(rel) AS relationship_type,
-            project.id AS related_project,
-            org.id AS org_match,
-            // Calculate similarity score based on keyword matches
-            CASE 
-                WHEN toLower(person.bio) CONTAINS 'treatment' THEN 1.0
-                WHEN toLower(person.bio) CONTAINS 'writer' THEN 0.8
-                WHEN toLower(person.bio) CONTAINS 'screenplay' THEN 0.7
-                ELSE 0.5
-            END AS similarity_score
-            ORDER BY similarity_score DESC
-            LIMIT 10
-            """
+            text_based_vector_search = TREATMENT_WRITER_CANDIDATES
             
             logger.info(f"🔍 DEBUG: Executing vector-like search for treatment writers...")
-            vector_result = await neo4j_client.execute_query(text_based_vector_search, {"org_name": org_name})
+            vector_result = await neo4j_client.execute_read(text_based_vector_search, {"org_name": org_search})
             
             if vector_result and vector_result.records:
                 logger.info(f"🎯 VECTOR SEARCH: Found {len(vector_result.records)} potential treatment writers!")
@@ -219,67 +153,9 @@ async def get_organization_profile(org_name: str, neo4j_client) -> Dict[str, Any
             logger.info(f"🔍 DEBUG: Organization found, attempting enhanced vector search...")
             try:
                 # Debug and explore actual relationships in the database
-                enhanced_query = """
-                MATCH (o:Organization)
-                WHERE o.id CONTAINS $org_name OR o.name CONTAINS $org_name OR 
-                      toLower(o.id) CONTAINS toLower($org_name) OR toLower(o.name) CONTAINS toLower($org_name)
+                enhanced_query = ORGANIZATION_RELATIONSHIPS
                 
-                // Debug: Find ALL relationships from organization
-                OPTIONAL MATCH (o)-[r1]->(connected1)
-                OPTIONAL MATCH (o)<-[r2]-(connected2)
-                
-                // Find all projects using different relationship patterns
-                OPTIONAL MATCH (o)<-[:FOR_CLIENT]-(proj1:Project)
-                OPTIONAL MATCH (o)-[:CLIENT_OF]->(proj2:Project)  
-                OPTIONAL MATCH (o)-[:HAS_PROJECT]->(proj3:Project)
-                OPTIONAL MATCH (proj4:Project)-[:INVOLVES]->(o)
-                OPTIONAL MATCH (proj5:Project {client: o.name})
-                OPTIONAL MATCH (proj6:Project {client: o.id})
-                
-                // Find people with broader relationship patterns
-                OPTIONAL MATCH (person1:Person)-[:CONTRIBUTED_TO]->(proj1)
-                OPTIONAL MATCH (person2:Person)-[:WORKED_ON]->(proj1)
-                OPTIONAL MATCH (person3:Person)-[:WORKS_FOR]->(o)
-                OPTIONAL MATCH (person4:Person {company: o.name})
-                
-                // Look for specific writers or treatment creators
-                OPTIONAL MATCH (writer:Person)
-                WHERE toLower(writer.name) CONTAINS 'courtney' OR
-                      toLower(writer.name) CONTAINS 'phillips' OR
-                      toLower(writer.bio) CONTAINS 'treatment' OR
-                      toLower(writer.role) CONTAINS 'writer'
-                      
-                RETURN o {
-                    .id, .name, .type, .description, .folkId
-                } AS organization,
-                // Debug relationship info
-                collect(DISTINCT type(r1)) AS outgoing_rels,
-                collect(DISTINCT type(r2)) AS incoming_rels,
-                collect(DISTINCT labels(connected1)) AS outgoing_connected,
-                collect(DISTINCT labels(connected2)) AS incoming_connected,
-                // Project collections
-                collect(DISTINCT proj1.name) AS for_client_projects,
-                collect(DISTINCT proj2.name) AS client_of_projects, 
-                collect(DISTINCT proj3.name) AS has_projects,
-                collect(DISTINCT proj4.name) AS involves_projects,
-                collect(DISTINCT proj5.name) AS named_client_projects,
-                collect(DISTINCT proj6.name) AS id_client_projects,
-                // People collections
-                collect(DISTINCT person1.name) AS contributed_people,
-                collect(DISTINCT person2.name) AS worked_on_people,
-                collect(DISTINCT person3.name) AS works_for_people,
-                collect(DISTINCT person4.name) AS company_people,
-                collect(DISTINCT writer.name) AS potential_writers,
-                // Detailed writer info
-                collect(DISTINCT {
-                    name: writer.name,
-                    role: writer.role,
-                    bio: writer.bio,
-                    company: writer.company
-                }) AS writer_details
-                """
-                
-                enhanced_result = await neo4j_client.execute_query(enhanced_query, {"org_name": org_name})
+                enhanced_result = await neo4j_client.execute_read(enhanced_query, {"org_name": org_search})
                 logger.info(f"🔍 DEBUG: Enhanced query returned {len(enhanced_result.records) if enhanced_result and enhanced_result.records else 0} records")
                 
                 if enhanced_result and enhanced_result.records:
@@ -485,30 +361,10 @@ async def get_person_details(name: str, neo4j_client) -> Dict[str, Any]:
     - Groups they belong to
     - Internal contact owner (if external person)
     """
-    query = """
-    MATCH (p:Person)
-    WHERE p.name CONTAINS $name OR p.fullName CONTAINS $name
-    OPTIONAL MATCH (p)-[r:CONTRIBUTED_TO]->(proj:Project)
-    OPTIONAL MATCH (p)-[:WORKS_FOR]->(org:Organization)
-    OPTIONAL MATCH (p)-[:BELONGS_TO]->(g:Group)
-    OPTIONAL MATCH (internal:Person {isInternal: true})-[:OWNS_CONTACT]->(p)
-    RETURN p {
-        .name, .fullName, .email, .folkId, .isInternal,
-        .bio, .role, .phone, .location, .linkedinUrl, .website, .tags
-    } AS person,
-    org.name AS organization,
-    collect(DISTINCT {
-        project: proj.name, 
-        role: r.role, 
-        startDate: r.startDate,
-        projectId: proj.id
-    }) AS projects,
-    collect(DISTINCT g.name) AS groups,
-    internal.name AS contact_owner
-    """
+    query = PERSON_DETAILS
     
     try:
-        result = await neo4j_client.execute_query(query, {"name": name})
+        result = await neo4j_client.execute_read(query, {"name": person_search(name)})
         
         if result and result.records:
             # Take the first matching person
@@ -570,18 +426,10 @@ async def find_people_at_organization(organization_name: str, neo4j_client) -> D
     - Organization confirmation
     - Count of people found
     """
-    query = """
-    MATCH (p:Person)-[:WORKS_FOR]->(o:Organization)
-    WHERE o.name CONTAINS $org_name
-    RETURN p {
-        .name, .role, .email, .folkId, .isInternal
-    } AS person,
-    o.name AS organization
-    ORDER BY p.name
-    """
+    query = PEOPLE_AT_ORGANIZATION
     
     try:
-        result = await neo4j_client.execute_query(query, {"org_name": organization_name})
+        result = await neo4j_client.execute_read(query, {"org_name": organization_search(organization_name)})
         
         if result and result.records:
             people = []
@@ -648,44 +496,8 @@ async def search_projects_by_criteria(criteria: Dict[str, Any], neo4j_client) ->
     
     Returns matching projects with details, client, and director information.
     """
-    # Build dynamic query based on criteria
-    where_clauses = []
-    params = {}
-    
-    if criteria.get("type"):
-        where_clauses.append("proj.type CONTAINS $project_type")
-        params["project_type"] = criteria["type"]
-        
-    if criteria.get("year"):
-        where_clauses.append("proj.year = $year")
-        params["year"] = criteria["year"]
-        
-    if criteria.get("status"):
-        where_clauses.append("proj.status CONTAINS $status")
-        params["status"] = criteria["status"]
-        
-    if criteria.get("client"):
-        where_clauses.append("client.name CONTAINS $client_name")
-        params["client_name"] = criteria["client"]
-    
-    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-    
-    query = f"""
-    MATCH (proj:Project)
-    OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-    OPTIONAL MATCH (director:Person)-[:CONTRIBUTED_TO {{role: 'Director'}}]->(proj)
-    WHERE {where_clause}
-    RETURN proj {{
-        .name, .type, .status, .year, .description, .budget
-    }} AS project,
-    client.name AS client,
-    director.name AS director
-    ORDER BY proj.year DESC, proj.name
-    LIMIT 25
-    """
-    
     try:
-        result = await neo4j_client.execute_query(query, params)
+        result = await neo4j_client.execute_read(PROJECTS_BY_CRITERIA, project_criteria_parameters(criteria))
         
         projects = []
         if result and result.records:
@@ -738,15 +550,10 @@ async def find_similar_projects(project_title: str, similarity_threshold: float
     projects above the similarity threshold.
     """
     # First get the target project's embedding
-    target_query = """
-    MATCH (proj:Project)
-    WHERE proj.name CONTAINS $title
-    RETURN proj.concept_embedding AS embedding, proj.name AS exact_title
-    LIMIT 1
-    """
+    target_query = SIMILAR_PROJECT_TARGET
     
     try:
-        target_result = await neo4j_client.execute_query(target_query, {"title": project_title})
+        target_result = await neo4j_client.execute_read(target_query, {"title": project_search(project_title)})
         
         if not target_result or not target_result.records:
             return {
@@ -768,25 +575,9 @@ async def find_similar_projects(project_title: str, similarity_threshold: float
             }
         
         # Find similar projects using vector similarity
-        similarity_query = """
-        MATCH (proj:Project)
-        WHERE proj.concept_embedding IS NOT NULL 
-        AND proj.name <> $exact_title
-        WITH proj, gds.similarity.cosine(proj.concept_embedding, $target_embedding) AS similarity
-        WHERE similarity >= $threshold
-        OPTIONAL MATCH (proj)-[:FOR_CLIENT]->(client:Organization)
-        OPTIONAL MATCH (director:Person)-[:CONTRIBUTED_TO {role: 'Director'}]->(proj)
-        RETURN proj {
-            .name, .type, .year, .description
-        } AS project,
-        client.name AS client,
-        director.name AS director,
-        round(similarity, 3) AS similarity_score
-        ORDER BY similarity DESC
-        LIMIT 10
-        """
+        similarity_query = SIMILAR_PROJECTS_WITH_DIRECTOR
         
-        similarity_result = await neo4j_client.execute_query(
+        similarity_result = await neo4j_client.execute_read(
             similarity_query, 
             {
                 "exact_title": exact_title,
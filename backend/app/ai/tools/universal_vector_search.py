@@ -3,34 +3,195 @@
 Universal Vector Search Layer for Neo4j Tools
 
 This module provides vector search functionality that can be used by any Neo4j tool
-to find relevant data across the entire graph, similar to how Neo4j Graph Builder works.
+to find relevant data across the entire graph, similar to how Neo4j Graph Builder works:
+vector and full-text index searches merged by reciprocal rank fusion.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from .dependencies import get_tool_dependencies
+from .entity_resolver import get_entity_resolver
+from .graph_queries import ENTITIES_BY_ID, FULLTEXT_CANDIDATES, VECTOR_CANDIDATES, keyword_search
 
 logger = logging.getLogger(__name__)
 
+# Result group of each searched label
+LABEL_GROUPS = {
+    "Person": "people",
+    "Project": "projects",
+    "CreativeConcept": "projects",
+    "Organization": "organizations",
+    "Document": "documents"
+}
+
+# Indexes searched for each label (database/schema_manager.py, database/create_indexes.py)
+VECTOR_INDEXES = {
+    "person_bio_vector": "Person",
+    "project_concept_vector": "Project",
+    "creative_concept_vector": "CreativeConcept",
+    "document_content_vector": "Document"
+}
+FULLTEXT_INDEXES = {
+    "person_fulltext_index": "Person",
+    "organization_fulltext_index": "Organization",
+    "project_fulltext_index": "Project",
+    "concept_fulltext_index": "CreativeConcept",
+    "document_fulltext_index": "Document"
+}
+
+# Reciprocal rank fusion constant: damps the weight of the top few ranks
+RRF_K = 60
+
+# A ranked candidate list: (element id, result) from best to worst
+RankedList = List[Tuple[str, Dict[str, Any]]]
+
+
+def reciprocal_rank_fusion(ranked_lists: List[RankedList], k: int = RRF_K) -> List[Dict[str, Any]]:
+    """
+    Merge ranked lists by reciprocal rank fusion
+    
+    Each list adds 1 / (k + rank) to the score of the entities in it, so an
+    entity found by several searches outranks one found by a single search,
+    whatever scale each search scores on. Scores are normalized so an entity
+    ranked first in every list scores 1.0.
+    
+    Returns:
+        One result per entity, best first, with its fused score and the
+        rank it had in each list that found it
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for ranked in ranked_lists:
+        for rank, (element_id, result) in enumerate(ranked, start=1):
+            entry = fused.get(element_id)
+            if entry is None:
+                entry = fused[element_id] = {**result, "element_id": element_id, "score": 0.0, "ranks": {}}
+            entry["score"] += 1.0 / (k + rank)
+            entry["ranks"][result["source"]] = rank
+    
+    best_possible = len(ranked_lists) / (k + 1) or 1.0
+    results = sorted(fused.values(), key=lambda entry: -entry["score"])
+    for entry in results:
+        entry["score"] = round(entry["score"] / best_possible, 4)
+        del entry["source"]
+    return results
+
+
+def _candidate(label: str, record: Dict[str, Any], source: str) -> Dict[str, Any]:
+    return {
+        "type": label,
+        "entity": record["entity"],
+        "labels": record["labels"],
+        "relationships": [],
+        "source": source
+    }
+
+
+async def _ranked_candidates(neo4j_client, query: str, parameters: Dict[str, Any], label: str, source: str) -> RankedList:
+    """Candidates from one index, best first; none if the index is unavailable"""
+    result = await neo4j_client.execute_read(query, parameters)
+    if not result or not result.success:
+        logger.warning(f"🔍 {source} search failed: {getattr(result, 'error', None) or 'no result'}")
+        return []
+    return [(record["element_id"], _candidate(label, record, source)) for record in result.records]
+
+
+async def _embed_query(query_text: str, llm_router) -> Optional[List[float]]:
+    """The query embedding, or None if no embedding model is available"""
+    if llm_router is None:
+        try:
+            llm_router = get_tool_dependencies().llm_router
+        except RuntimeError:
+            return None
+    if llm_router is None:
+        return None
+    
+    try:
+        return await llm_router.get_embedding(query_text)
+    except Exception as e:
+        logger.warning(f"🔍 Query embedding failed, searching full-text indexes only: {e}")
+        return None
+
+
+async def _vector_candidates(
+    query_text: str,
+    neo4j_client,
+    llm_router,
+    top_k: int,
+    similarity_threshold: float
+) -> List[RankedList]:
+    """Embed the query once and search every vector index with it"""
+    vector = await _embed_query(query_text, llm_router)
+    if not vector:
+        return []
+    
+    return list(await asyncio.gather(*[
+        _ranked_candidates(neo4j_client, VECTOR_CANDIDATES, {
+            "index_name": index_name,
+            "top_k": top_k,
+            "vector": vector,
+            "threshold": similarity_threshold
+        }, label, f"vector:{index_name}")
+        for index_name, label in VECTOR_INDEXES.items()
+    ]))
+
+
+async def _resolved_candidates(query_text: str, neo4j_client) -> RankedList:
+    """The entities the query names, as the entity resolver ranks them"""
+    resolver = get_entity_resolver()
+    if not resolver.ready:
+        return []
+    
+    matches = resolver.resolve(query_text, entity_types=LABEL_GROUPS)
+    logger.info(f"🔍 Resolved entities: {[(m.entity_type, m.name, m.score) for m in matches]}")
+    if not matches:
+        return []
+    
+    result = await neo4j_client.execute_read(ENTITIES_BY_ID, {
+        "element_ids": [match.element_id for match in matches]
+    })
+    rows = {row["element_id"]: row for row in (result.records if result else [])}
+    
+    ranked = []
+    for match in sorted(matches, key=lambda m: -m.score):
+        row = rows.get(match.element_id)
+        if row is None:  # deleted since the last refresh
+            continue
+        candidate = _candidate(match.entity_type, row, "resolver")
+        candidate["matched_text"] = match.matched_text
+        ranked.append((match.element_id, candidate))
+    return ranked
+
+
 async def universal_vector_search(
     query_text: str, 
     neo4j_client, 
     max_results: int = 10,
-    similarity_threshold: float = 0.7
+    similarity_threshold: float = 0.7,
+    max_per_type: Optional[int] = None,
+    llm_router=None
 ) -> Dict[str, Any]:
     """
     Universal vector search that finds relevant data across the entire Neo4j graph.
     
-    This mimics the Neo4j Graph Builder approach by searching across:
-    - People (bio embeddings)
-    - Projects (description embeddings) 
-    - Documents (content embeddings)
-    - Organizations (description embeddings)
+    Hybrid retrieval: the query is embedded once and the vector indexes
+    (person bios, project and creative concepts, document content) are
+    searched in parallel with the full-text indexes (people, organizations,
+    projects, concepts, documents) and the entities the query names. The
+    ranked lists are merged by reciprocal rank fusion, so entities several
+    searches agree on come first.
+    
+    Without an embedding model only the full-text searches run.
     
     Args:
         query_text: The search query text
         neo4j_client: Neo4j client instance
         max_results: Maximum number of results to return
-        similarity_threshold: Minimum similarity score to include
+        similarity_threshold: Minimum vector similarity score to include
+        max_per_type: Maximum results per group (default: half of max_results),
+            so one entity type cannot crowd out the others
+        llm_router: Embedding provider (default: the tool dependencies' router)
         
     Returns:
         Dict containing found people, projects, organizations, and documents
@@ -38,53 +199,49 @@ async def universal_vector_search(
     
     logger.info(f"🔍 UNIVERSAL VECTOR SEARCH: '{query_text}'")
     
+    if max_per_type is None:
+        max_per_type = max(1, (max_results + 1) // 2)
+    
     try:
-        # Split query into individual words for better matching
-        query_words = [word.strip().lower() for word in query_text.split() if len(word.strip()) > 2]
-        
-        # Universal search across all entity types with improved multi-word logic
-        # Search for any word in the query, including all entities with __Entity__ label
-        universal_search_query = """
-        // Search across all entities with __Entity__ label - broader than specific types
-        OPTIONAL MATCH (entity:__Entity__)
-        WHERE entity.id IS NOT NULL 
-        AND ANY(word IN $query_words WHERE toLower(entity.id) CONTAINS word)
-        WITH collect(DISTINCT {
-            type: 'Entity',
-            entity: entity {.id, .role, .bio, .company, .name, .description, .type},
-            score: 1.0,
-            labels: labels(entity),
-            relationships: []
-        }) AS all_results
+        try:
+            search = keyword_search(query_text)
+        except ValueError:
+            search = None
         
-        // Categorize results by labels
-        WITH all_results,
-        [result IN all_results WHERE 'Person' IN result.labels] AS people_results,
-        [result IN all_results WHERE 'Project' IN result.labels OR 'CreativeConcept' IN result.labels] AS project_results,
-        [result IN all_results WHERE 'Organization' IN result.labels] AS org_results,
-        [result IN all_results WHERE 'Document' IN result.labels OR 'Chunk' IN result.labels] AS doc_results
+        fulltext_searches = [
+            _ranked_candidates(neo4j_client, FULLTEXT_CANDIDATES, {
+                "index_name": index_name,
+                "search": search,
+                "limit": max_results
+            }, label, f"fulltext:{index_name}")
+            for index_name, label in FULLTEXT_INDEXES.items()
+        ] if search else []
         
-        RETURN people_results, project_results, org_results, doc_results,
-               size(all_results) AS total_results
-        """
+        resolved, vector_lists, *fulltext_lists = await asyncio.gather(
+            _resolved_candidates(query_text, neo4j_client),
+            _vector_candidates(query_text, neo4j_client, llm_router, max_results, similarity_threshold),
+            *fulltext_searches
+        )
+        ranked_lists = [ranked for ranked in [resolved, *vector_lists, *fulltext_lists] if ranked]
         
-        logger.info(f"🔍 Query words: {query_words}")
+        # Fuse, then fill each group up to its cap in fused order
+        groups: Dict[str, List[Dict[str, Any]]] = {group: [] for group in dict.fromkeys(LABEL_GROUPS.values())}
+        total_results = 0
+        for result in reciprocal_rank_fusion(ranked_lists):
+            if total_results >= max_results:
+                break
+            group = groups[LABEL_GROUPS[result["type"]]]
+            if len(group) < max_per_type:
+                group.append(result)
+                total_results += 1
         
-        # Execute the universal search with query words
-        result = await neo4j_client.execute_query(universal_search_query, {
-            "query_words": query_words
-        })
-        
-        if result and result.records:
-            record = result.records[0]
-            
-            people_results = record.get("people_results", [])
-            project_results = record.get("project_results", [])
-            org_results = record.get("org_results", [])
-            doc_results = record.get("doc_results", [])
-            total_results = record.get("total_results", 0)
+        if total_results:
+            people_results = groups["people"]
+            project_results = groups["projects"]
+            org_results = groups["organizations"]
+            doc_results = groups["documents"]
             
-            logger.info(f"🎯 UNIVERSAL SEARCH RESULTS: {total_results} total")
+            logger.info(f"🎯 UNIVERSAL SEARCH RESULTS: {total_results} total from {len(ranked_lists)} ranked lists")
             logger.info(f"  👤 People: {len(people_results)}")
             logger.info(f"  🎬 Projects: {len(project_results)}")
             logger.info(f"  🏢 Organizations: {len(org_results)}")
@@ -9,6 +9,8 @@ import logging
 from typing import Dict, Any
 from .factory import create_organization_tool
 from .universal_vector_search import universal_vector_search
+from .entity_resolver import get_entity_resolver
+from .graph_queries import TREATMENT_WRITERS_FOR_ENTITIES, TREATMENT_WRITERS_FOR_TERM
 
 logger = logging.getLogger(__name__)
 
@@ -79,34 +81,21 @@ async def broad_vector_search(search_query: str, neo4j_client) -> Dict[str, Any]
                 search_term = ' '.join(query_words)
                 logger.info(f"🔍 RELATIONSHIP SEARCH for: '{search_term}'")
                 
-                # Query for treatment writers through relationships
-                writer_query = """
-                MATCH (writer:Person)-[r:AUTHORED_BY|WROTE_TREATMENT_FOR|DIRECTED|CREATED]-(item)
-                WHERE (
-                    toLower(item.id) CONTAINS toLower($search_term) OR
-                    toLower(item.name) CONTAINS toLower($search_term) OR
-                    toLower(item.client) CONTAINS toLower($search_term) OR
-                    ANY(word IN $query_words WHERE toLower(item.id) CONTAINS word)
-                )
-                AND (
-                    toLower(writer.role) CONTAINS 'writer' OR
-                    toLower(writer.role) CONTAINS 'director' OR  
-                    toLower(writer.role) CONTAINS 'author'
-                )
-                RETURN writer.id AS writer_id, writer.name AS writer_name, writer.role AS writer_role,
-                       writer.bio AS writer_bio,
-                       item.id AS item_id, item.name AS item_name, item.type AS item_type,
-                       type(r) AS relationship_type,
-                       item.description AS item_description
-                ORDER BY writer.id
-                LIMIT 10
-                """
+                # Query for treatment writers through relationships: by the ids of the
+                # entities the query names once the resolver is loaded, by words before
+                resolver = get_entity_resolver()
+                if resolver.ready:
+                    element_ids = [match.element_id for match in resolver.resolve(search_term)]
+                    logger.info(f"🔍 RESOLVED {len(element_ids)} entities in '{search_term}'")
+                    writer_query = TREATMENT_WRITERS_FOR_ENTITIES
+                    writer_params = {"element_ids": element_ids}
+                else:
+                    element_ids = None
+                    writer_query = TREATMENT_WRITERS_FOR_TERM
+                    writer_params = {"search_term": search_term, "query_words": query_words}
                 
                 try:
-                    result = await neo4j_client.execute_query(writer_query, {
-                        "search_term": search_term,
-                        "query_words": query_words
-                    })
+                    result = await neo4j_client.execute_read(writer_query, writer_params) if element_ids != [] else None
                     
                     if result and result.records:
                         logger.info(f"🎯 FOUND {len(result.records)} treatment writer relationships")
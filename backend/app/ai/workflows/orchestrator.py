@@ -7,7 +7,8 @@ Routes queries to appropriate agents and coordinates complex workflows.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Type
+from contextlib import aclosing
+from typing import Dict, Any, List, Optional, Type, AsyncGenerator
 from datetime import datetime
 from enum import Enum
 
@@ -24,6 +25,13 @@ from ..agents.sales_agent import SalesIntelligenceAgent
 from ..agents.talent_agent import TalentAcquisitionAgent
 from ..agents.analytics_agent import LeadershipAnalyticsAgent
 from ..tools.graph_tools import GraphQueryTools
+from ..tools.cache import ToolCache
+from ..tools.local_cache import start_invalidation_listener, stop_invalidation_listener
+from ..tools.entity_resolver import (
+    get_entity_resolver,
+    start_entity_resolver_refresh,
+    stop_entity_resolver_refresh
+)
 from tools.folk_ingestion.folk_client import FolkClient
 from ...core.exceptions import AIProcessingError
 
@@ -182,16 +190,19 @@ class AgentOrchestrator:
         return {
             "sales": {
                 "keywords": ["lead", "sales", "market", "pricing", "revenue", "client", "prospect", "opportunity"],
+                "entity_types": ["Organization", "Deal"],
                 "agent": AgentType.SALES,
                 "confidence_threshold": 0.7
             },
             "talent": {
                 "keywords": ["talent", "hire", "crew", "skills", "team", "staff", "casting", "union"],
+                "entity_types": ["Person"],
                 "agent": AgentType.TALENT,
                 "confidence_threshold": 0.7
             },
             "analytics": {
                 "keywords": ["analytics", "performance", "metrics", "report", "analysis", "trend", "forecast", "kpi"],
+                "entity_types": ["Project"],
                 "agent": AgentType.ANALYTICS,
                 "confidence_threshold": 0.7
             }
@@ -209,6 +220,12 @@ class AgentOrchestrator:
             await self.redis_client.ping()
             logger.info("Redis connection initialized")
             
+            # Keep in-process tool caches coherent with other workers
+            start_invalidation_listener(self.redis_client)
+            
+            # Load entity names for query classification and search tools
+            start_entity_resolver_refresh(self.neo4j_client)
+            
             # Initialize vector indexes if needed
             # This would typically be done during deployment
             
@@ -272,6 +289,88 @@ class AgentOrchestrator:
             logger.error(f"Query routing failed: {e}")
             raise AIProcessingError(f"Query routing failed: {e}")
 
+    async def stream_query(
+        self,
+        query: str,
+        user_context: Dict[str, Any],
+        preferred_agent: Optional[AgentType] = None,
+        conversation_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Route query to appropriate agent(s) and stream the response
+        
+        Single-agent responses are streamed token by token from the agent's
+        graph. Multi-agent responses need every agent's answer before
+        synthesis, so they are emitted as one content chunk.
+        
+        Args:
+            query: User query
+            user_context: User context and permissions
+            preferred_agent: Optional preferred agent type
+            conversation_id: Optional conversation ID for continuity
+            
+        Yields:
+            Agent stream chunks; the final "metadata" chunk carries routing metadata
+        """
+        
+        try:
+            # Determine routing strategy
+            if preferred_agent:
+                target_agent = preferred_agent
+                strategy = RoutingStrategy.SINGLE_AGENT
+            else:
+                target_agent, strategy = await self._classify_query(query, user_context)
+        except Exception as e:
+            logger.error(f"Query routing failed: {e}")
+            raise AIProcessingError(f"Query routing failed: {e}")
+        
+        if strategy == RoutingStrategy.MULTI_AGENT:
+            response = await self._multi_agent_response(query, user_context, conversation_id)
+            yield {
+                "type": "content",
+                "content": response["content"],
+                "conversation_id": response["conversation_id"]
+            }
+            yield {
+                "type": "metadata",
+                "content": response["content"],
+                "agent_type": response["agent_type"],
+                "metadata": response.get("metadata", {}),
+                "conversation_id": response["conversation_id"],
+                "routing": response["routing"],
+                "timestamp": response["timestamp"]
+            }
+            return
+        
+        if strategy != RoutingStrategy.SINGLE_AGENT:
+            # Default to sales agent for unknown queries
+            target_agent = AgentType.SALES
+        
+        agent = self.agents.get(target_agent)
+        if not agent:
+            raise AIProcessingError(f"Agent {target_agent} not available")
+        
+        routing = {
+            "strategy": RoutingStrategy.SINGLE_AGENT,
+            "primary_agent": target_agent.value,
+            "agents_used": [target_agent.value]
+        }
+        
+        try:
+            async with aclosing(agent.stream_chat(
+                message=query,
+                user_context=user_context,
+                conversation_id=conversation_id
+            )) as stream:
+                async for chunk in stream:
+                    if chunk["type"] == "metadata":
+                        chunk = {**chunk, "routing": routing}
+                    yield chunk
+                
+        except Exception as e:
+            logger.error(f"Streaming agent response failed for {target_agent}: {e}")
+            raise AIProcessingError(f"Agent {target_agent} processing failed: {e}")
+
     async def _classify_query(
         self,
         query: str,
@@ -282,12 +381,16 @@ class AgentOrchestrator:
         query_lower = query.lower()
         scores = {}
         
+        # Kinds of entities the query names count like a domain keyword
+        named_types = {match.entity_type for match in get_entity_resolver().resolve(query, min_score=0.8)}
+        
         # Score query against each domain
         for domain, rules in self.routing_rules.items():
             score = 0
             for keyword in rules["keywords"]:
                 if keyword in query_lower:
                     score += 1
+            score += len(named_types.intersection(rules.get("entity_types", [])))
             
             # Normalize score
             if len(rules["keywords"]) > 0:
@@ -314,7 +417,8 @@ class AgentOrchestrator:
             strategy = RoutingStrategy.SINGLE_AGENT
             target_agent = AgentType.SALES
         
-        logger.debug(f"Query classified: domain={best_domain}, score={best_score}, strategy={strategy}")
+        logger.debug(f"Query classified: domain={best_domain}, score={best_score}, strategy={strategy}, "
+                     f"named entity types={sorted(named_types)}")
         
         return target_agent, strategy
 
@@ -570,6 +674,11 @@ class AgentOrchestrator:
         else:
             tools_status["redis_connection"] = "disabled"
         
+        # In-process (L1) and Redis (L2) tool cache hit rates
+        if self.graph_tools:
+            tools_status["cache_stats"]["graph_tools"] = self.graph_tools.get_cache_stats()
+        tools_status["cache_stats"]["tool_cache"] = ToolCache.get_stats()
+        
         # Test Folk API connection
         if self.folk_client:
             tools_status["folk_api_connection"] = "enabled"
@@ -612,6 +721,10 @@ class AgentOrchestrator:
         if self.graph_tools:
             logger.info("Cleaning up graph tools connections...")
             # Graph tools share the same connections, so we clean them up here
+        
+        # Stop refreshing entity names and leave the cache listener
+        await stop_entity_resolver_refresh(self.neo4j_client)
+        await stop_invalidation_listener(self.redis_client)
             
         # Cleanup Folk client if available
         if self.folk_client:
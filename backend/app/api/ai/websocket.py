@@ -4,9 +4,9 @@ AI WebSocket Endpoints
 Real-time WebSocket communication for AI agent interactions.
 """
 
-import asyncio
 import json
 import logging
+from contextlib import aclosing
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -320,8 +320,9 @@ async def handle_chat_message(
             "timestamp": datetime.utcnow().isoformat()
         }, connection_id)
         
-        # Route to AI agent
-        response = await orchestrator.route_query(
+        # Route to AI agent, forwarding tokens and tool progress as they arrive
+        response = await stream_agent_response(
+            connection_id=connection_id,
             query=message,
             user_context=user_context,
             preferred_agent=preferred_agent,
@@ -348,6 +349,63 @@ async def handle_chat_message(
             "timestamp": datetime.utcnow().isoformat()
         }, connection_id)
 
+async def stream_agent_response(
+    connection_id: str,
+    query: str,
+    user_context: Dict[str, Any],
+    preferred_agent: Optional[AgentType] = None,
+    conversation_id: Optional[str] = None,
+    chunk_type: str = "ai_response_chunk"
+) -> Dict[str, Any]:
+    """
+    Stream an orchestrator response to a connection
+    
+    Content tokens are sent as ``chunk_type`` messages and tool events as
+    ``tool_progress`` messages while the agent graph runs. A chunk with
+    ``replace`` set carries the complete response and replaces the content
+    sent before it.
+    
+    Returns:
+        The final metadata chunk with the complete response and routing info
+    """
+    
+    response = None
+    
+    # Closing the stream (cancelled task) closes the agent's graph run too
+    async with aclosing(orchestrator.stream_query(
+        query=query,
+        user_context=user_context,
+        preferred_agent=preferred_agent,
+        conversation_id=conversation_id
+    )) as stream:
+        async for chunk in stream:
+            if chunk["type"] == "content":
+                await manager.send_personal_message({
+                    "type": chunk_type,
+                    "content": chunk["content"],
+                    "replace": chunk.get("replace", False),
+                    "conversation_id": chunk.get("conversation_id"),
+                    "timestamp": datetime.utcnow().isoformat()
+                }, connection_id)
+            
+            elif chunk["type"] in ("tool_start", "tool_end"):
+                await manager.send_personal_message({
+                    "type": "tool_progress",
+                    "event": chunk["type"],
+                    "tools": chunk.get("tools", []),
+                    "success": chunk.get("success"),
+                    "conversation_id": chunk.get("conversation_id"),
+                    "timestamp": datetime.utcnow().isoformat()
+                }, connection_id)
+            
+            elif chunk["type"] == "metadata":
+                response = chunk
+    
+    if response is None:
+        raise AIProcessingError("Stream ended without a response")
+    
+    return response
+
 async def handle_ping_message(connection_id: str):
     """Handle ping message for connection health check"""
     
@@ -444,9 +502,6 @@ async def handle_streaming_message(
 ):
     """Handle streaming AI response"""
     
-    # This is a simplified implementation
-    # In production, this would use the streaming capabilities of the LLM router
-    
     message = data.get("message", "")
     if not message.strip():
         return
@@ -468,7 +523,6 @@ async def handle_streaming_message(
             }, connection_id)
             return
         
-        # Get regular response (in production, this would be streaming)
         user_context = {
             "user_id": user_data.get("id", user_id),
             "name": user_data.get("name", "Unknown User"),
@@ -477,23 +531,15 @@ async def handle_streaming_message(
             "department": user_data.get("department", "general"),
             "access_level": "authenticated"
         }
-        response = await orchestrator.route_query(message, user_context)
-        
-        # Simulate streaming by sending chunks
-        content = response["content"]
-        chunk_size = 50
         
-        for i in range(0, len(content), chunk_size):
-            chunk = content[i:i + chunk_size]
-            
-            await manager.send_personal_message({
-                "type": "stream_chunk",
-                "content": chunk,
-                "timestamp": datetime.utcnow().isoformat()
-            }, connection_id)
-            
-            # Small delay for streaming effect
-            await asyncio.sleep(0.1)
+        # Forward tokens as the agent produces them
+        response = await stream_agent_response(
+            connection_id=connection_id,
+            query=message,
+            user_context=user_context,
+            conversation_id=data.get("conversation_id"),
+            chunk_type="stream_chunk"
+        )
         
         # Send stream end
         await manager.send_personal_message({
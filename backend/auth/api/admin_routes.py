@@ -554,6 +554,53 @@ async def admin_health_check(
         }
 
 
+@router.get("/database/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    query_name: Optional[str] = Query(None, description="Only entries of this registered query"),
+    current_user: AuthUser = Depends(require_admin_access),
+    _ = Depends(log_api_access)
+):
+    """
+    Get the Neo4j slow query log
+    
+    Returns slow queries grouped by query shape and the latest entries, with
+    the PROFILE operator tree (db hits, rows) of sampled reads.
+    """
+    
+    try:
+        # Import here to avoid circular imports
+        from database.connection_manager import get_connection_manager
+        from database.monitoring import get_database_monitor
+        
+        monitor = await get_database_monitor(await get_connection_manager())
+        return monitor.get_slow_queries(limit=limit, query_name=query_name)
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Slow query log retrieval failed: {str(e)}"
+        )
+
+
+@router.delete("/database/slow-queries")
+async def clear_slow_queries(
+    current_user: AuthUser = Depends(require_admin_access),
+    _ = Depends(log_api_access)
+):
+    """Clear the Neo4j slow query log"""
+    
+    from database.slow_query_log import get_slow_query_log
+    
+    get_slow_query_log().clear()
+    
+    return {
+        "cleared": True,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "cleared_by": current_user.email
+    }
+
+
 @router.post("/maintenance-mode")
 async def toggle_maintenance_mode(
     enabled: bool,
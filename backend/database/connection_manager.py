@@ -125,6 +125,10 @@ class ConnectionManager:
         
         logger.info("Ensuring database schema is complete...")
         
+        # Graph tool lookups go only through the full-text indexes, so create
+        # missing ones and recreate those whose properties changed
+        fulltext_result = await self.schema_manager.ensure_fulltext_indexes()
+        
         # First validate current schema
         validation_result = await self.schema_manager.validate_schema()
         
@@ -133,6 +137,7 @@ class ConnectionManager:
             return {
                 "schema_complete": True,
                 "creation_required": False,
+                "fulltext_result": fulltext_result,
                 "validation_result": validation_result
             }
         
@@ -147,6 +152,7 @@ class ConnectionManager:
             "schema_complete": final_validation.valid,
             "creation_required": True,
             "creation_result": creation_result,
+            "fulltext_result": fulltext_result,
             "validation_result": final_validation
         }
     
@@ -31,6 +31,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from database.connection_manager import ConnectionManager
 from database.neo4j_client import Neo4jClient, ConnectionConfig
+from database.schema_manager import SchemaManager
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
@@ -225,28 +226,6 @@ class IndexManager:
             
             # Group membership relationships (for segmentation)
             "CREATE INDEX group_membership_index IF NOT EXISTS FOR ()-[r:BELONGS_TO]-() ON (r.addedDate)",
-            
-            # ================================================================================
-            # FULL-TEXT SEARCH INDEXES
-            # ================================================================================
-            
-            # Person full-text search (for name variations and fuzzy matching)
-            "CREATE FULLTEXT INDEX person_fulltext_index IF NOT EXISTS FOR (p:Person) ON EACH [p.name, p.bio, p.title]",
-            
-            # Organization full-text search
-            "CREATE FULLTEXT INDEX organization_fulltext_index IF NOT EXISTS FOR (o:Organization) ON EACH [o.name, o.description]",
-            
-            # Project full-text search  
-            "CREATE FULLTEXT INDEX project_fulltext_index IF NOT EXISTS FOR (p:Project) ON EACH [p.title, p.description, p.synopsis]",
-            
-            # Document full-text search (for content analysis)
-            "CREATE FULLTEXT INDEX document_fulltext_index IF NOT EXISTS FOR (d:Document) ON EACH [d.title, d.content, d.summary]",
-            
-            # Deal full-text search
-            "CREATE FULLTEXT INDEX deal_fulltext_index IF NOT EXISTS FOR (d:Deal) ON EACH [d.name, d.description]",
-            
-            # Creative concept full-text search
-            "CREATE FULLTEXT INDEX concept_fulltext_index IF NOT EXISTS FOR (c:CreativeConcept) ON EACH [c.name, c.description]",
         ]
         
         return indexes
@@ -270,6 +249,14 @@ class IndexManager:
             
             self.logger.info(f"Dropped {dropped_count} existing indexes")
             
+        # Full-text indexes are migrated in place: missing ones are created and
+        # ones whose properties changed are dropped and recreated
+        fulltext_results = await SchemaManager(self.neo4j_client).ensure_fulltext_indexes()
+        self.logger.info(
+            f"Full-text indexes: {fulltext_results['created']} created, "
+            f"{fulltext_results['recreated']} recreated, {fulltext_results['unchanged']} unchanged"
+        )
+        
         # Create new indexes
         index_definitions = await self.get_performance_indexes()
         self.logger.info(f"Creating {len(index_definitions)} indexes...")
@@ -283,6 +270,9 @@ class IndexManager:
             else:
                 failed_count += 1
         
+        created_count += fulltext_results["created"] + fulltext_results["recreated"]
+        failed_count += fulltext_results["failed"]
+        
         self.logger.info(f"Index creation complete: {created_count} created, {failed_count} failed")
         return created_count, failed_count
     
@@ -296,7 +286,9 @@ class IndexManager:
             ("Person name lookup", "MATCH (p:Person {name: 'John Smith'}) RETURN p LIMIT 1"),
             
             # Organization search
-            ("Organization search", "MATCH (o:Organization) WHERE o.name CONTAINS 'Media' RETURN o LIMIT 5"),
+            ("Organization search",
+             "CALL db.index.fulltext.queryNodes('organization_fulltext_index', 'name:media*') YIELD node, score "
+             "RETURN node.name ORDER BY score DESC LIMIT 5"),
             
             # Project by title and year
             ("Project lookup", "MATCH (p:Project {title: 'Sample Project', year: 2024}) RETURN p LIMIT 1"),
@@ -0,0 +1,294 @@
+"""
+Neo4j Driver Registry
+
+One async Neo4j driver, and so one connection pool, per server, user and
+encryption setting for the whole process. The database Neo4jClient, the AI layer's
+graph client, the tool dependencies, the orchestrators and the memory
+services all borrow their driver here instead of opening their own, so a
+worker holds at most NEO4J_MAX_CONNECTION_POOL_SIZE connections however many
+clients it creates.
+
+Drivers are reference counted: the last client to release one closes it.
+Connection acquisition is timed, and pool metrics report connections in use,
+idle connections and how long sessions waited for a connection. Both read the
+driver's internal pool, so they are only enabled for driver versions whose
+pool layout is known.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import neo4j
+from neo4j import AsyncDriver, AsyncGraphDatabase
+
+logger = logging.getLogger(__name__)
+
+# Acquisition waits kept for percentiles
+WAIT_SAMPLES = 1024
+
+# Driver major versions whose private pool (driver._pool.acquire/.connections) is instrumented
+INSTRUMENTED_DRIVER_VERSIONS = (5,)
+
+# URI schemes that configure encryption themselves (the driver rejects an encrypted flag)
+SECURE_SCHEMES = ("neo4j+s", "neo4j+ssc", "bolt+s", "bolt+ssc")
+
+
+def resolve_encryption(uri: str, encrypted: Optional[bool] = None) -> bool:
+    """
+    Whether connections to a URI are encrypted
+
+    Secure URI schemes always are; otherwise an omitted flag falls back to
+    NEO4J_ENCRYPTED, the same default the database client uses.
+    """
+    if uri.split("://", 1)[0].lower() in SECURE_SCHEMES:
+        return True
+    if encrypted is None:
+        return os.getenv("NEO4J_ENCRYPTED", "true").lower() == "true"
+    return encrypted
+
+
+def pool_instrumentation_supported() -> bool:
+    """Whether the installed driver's private pool layout is one we know"""
+    try:
+        return int(neo4j.__version__.split(".", 1)[0]) in INSTRUMENTED_DRIVER_VERSIONS
+    except (AttributeError, ValueError):
+        return False
+
+
+@dataclass
+class PoolSettings:
+    """Connection pool settings shared by every client of a driver"""
+    max_connection_pool_size: int = 100
+    connection_acquisition_timeout: float = 60.0  # seconds a session waits for a free connection
+    connection_timeout: float = 30.0  # seconds to open a new connection
+    max_connection_lifetime: int = 3600
+
+    @classmethod
+    def from_environment(cls) -> "PoolSettings":
+        return cls(
+            max_connection_pool_size=int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "100")),
+            connection_acquisition_timeout=float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")),
+            connection_timeout=float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "30")),
+            max_connection_lifetime=int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+        )
+
+
+@dataclass
+class AcquisitionMetrics:
+    """Timing of connection acquisitions from one pool"""
+    acquisitions: int = 0
+    failures: int = 0  # includes acquisition timeouts
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    _recent: Deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+    def record(self, wait: float, failed: bool = False) -> None:
+        if failed:
+            self.failures += 1
+        else:
+            self.acquisitions += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        self._recent.append(wait)
+
+    def percentile(self, q: float) -> float:
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        attempts = self.acquisitions + self.failures
+        return {
+            "acquisitions": self.acquisitions,
+            "failures": self.failures,
+            "wait_ms": {
+                "mean": round(self.wait_seconds_total / attempts * 1000, 3) if attempts else 0.0,
+                "p50": round(self.percentile(50) * 1000, 3),
+                "p95": round(self.percentile(95) * 1000, 3),
+                "max": round(self.wait_seconds_max * 1000, 3)
+            }
+        }
+
+
+@dataclass
+class _RegisteredDriver:
+    driver: AsyncDriver
+    uri: str
+    settings: PoolSettings
+    references: int = 0
+    metrics: AcquisitionMetrics = field(default_factory=AcquisitionMetrics)
+    created_at: float = field(default_factory=time.time)
+
+
+class DriverRegistry:
+    """Process-wide, reference-counted Neo4j drivers with pool metrics"""
+
+    def __init__(self, settings: Optional[PoolSettings] = None):
+        self.settings = settings or PoolSettings.from_environment()
+        self._drivers: Dict[Tuple[str, str, bool], _RegisteredDriver] = {}
+
+    def configure(self, **settings) -> None:
+        """Tune pool settings for drivers created from now on"""
+        for name, value in settings.items():
+            if not hasattr(self.settings, name):
+                raise ValueError(f"Unknown Neo4j pool setting: {name}")
+            setattr(self.settings, name, value)
+
+    def acquire(
+        self,
+        uri: str,
+        auth: Tuple[str, str],
+        encrypted: Optional[bool] = None,
+        resolver=None,
+        **pool_settings
+    ) -> AsyncDriver:
+        """
+        Shared driver for a server and user, created on first use
+
+        Drivers are keyed by URI, user and resolved encryption, never by
+        password, so clients that spell the same connection differently
+        (an explicit flag, a secure URI scheme or nothing) share one pool.
+
+        Args:
+            encrypted: Driver encryption flag (ignored for neo4j+s:// and bolt+s:// URIs)
+            pool_settings: PoolSettings overrides, applied only when the driver is created
+        """
+        encrypted = resolve_encryption(uri, encrypted)
+        key = (uri, auth[0], encrypted)
+        entry = self._drivers.get(key)
+
+        if entry is None:
+            settings = PoolSettings(**{**asdict(self.settings), **pool_settings})
+            driver_config = asdict(settings)
+            if uri.split("://", 1)[0].lower() not in SECURE_SCHEMES:
+                driver_config["encrypted"] = encrypted
+            if resolver is not None:
+                driver_config["resolver"] = resolver
+
+            entry = _RegisteredDriver(
+                driver=AsyncGraphDatabase.driver(uri, auth=auth, **driver_config),
+                uri=uri,
+                settings=settings
+            )
+            self._instrument(entry)
+            self._drivers[key] = entry
+            logger.info(f"Created shared Neo4j driver for {uri} "
+                        f"(pool size {settings.max_connection_pool_size})")
+        elif pool_settings and any(getattr(entry.settings, k) != v for k, v in pool_settings.items()):
+            logger.debug(f"Reusing the shared Neo4j driver for {uri}; its pool settings take precedence")
+
+        entry.references += 1
+        return entry.driver
+
+    async def release(self, driver: Optional[AsyncDriver]) -> None:
+        """Give a driver back; the last release closes it"""
+        for key, entry in list(self._drivers.items()):
+            if entry.driver is driver:
+                entry.references -= 1
+                if entry.references <= 0:
+                    del self._drivers[key]
+                    await driver.close()
+                    logger.info(f"Closed shared Neo4j driver for {entry.uri}")
+                return
+
+        # Not created here (e.g. injected by a test): close it as before
+        if driver is not None:
+            await driver.close()
+
+    async def close_all(self) -> None:
+        """Close every driver, whoever still holds it (process shutdown)"""
+        entries = list(self._drivers.values())
+        self._drivers.clear()
+        for entry in entries:
+            try:
+                await entry.driver.close()
+            except Exception as e:
+                logger.error(f"Error closing Neo4j driver for {entry.uri}: {e}")
+
+    def get_pool_metrics(self, driver: Optional[AsyncDriver] = None) -> Dict[str, Any]:
+        """
+        Pool metrics of one driver, or of every driver with totals
+
+        Connections in use and idle are read from the driver's pool; they are
+        None if the installed driver version does not expose it.
+        """
+        if driver is not None:
+            for entry in self._drivers.values():
+                if entry.driver is driver:
+                    return self._entry_metrics(entry)
+            return {}
+
+        pools = [self._entry_metrics(entry) for entry in self._drivers.values()]
+        return {
+            "drivers": len(pools),
+            "max_connections": sum(pool["max_pool_size"] for pool in pools),
+            "in_use": sum(pool["in_use"] or 0 for pool in pools),
+            "idle": sum(pool["idle"] or 0 for pool in pools),
+            "pools": pools
+        }
+
+    @staticmethod
+    def _instrument(entry: _RegisteredDriver) -> None:
+        """Time every connection acquisition of the driver's pool"""
+        if not pool_instrumentation_supported():
+            logger.debug(f"Neo4j driver {getattr(neo4j, '__version__', '?')} not instrumented; "
+                         f"acquisition times will not be recorded")
+            return
+
+        pool = getattr(entry.driver, "_pool", None)
+        acquire = getattr(pool, "acquire", None)
+        if acquire is None:
+            logger.debug("Neo4j driver pool not accessible; acquisition times will not be recorded")
+            return
+
+        async def timed_acquire(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                connection = await acquire(*args, **kwargs)
+            except Exception:
+                entry.metrics.record(time.perf_counter() - started, failed=True)
+                raise
+            entry.metrics.record(time.perf_counter() - started)
+            return connection
+
+        pool.acquire = timed_acquire
+
+    @staticmethod
+    def _entry_metrics(entry: _RegisteredDriver) -> Dict[str, Any]:
+        in_use = idle = None
+        pool_connections = None
+        if pool_instrumentation_supported():
+            pool_connections = getattr(getattr(entry.driver, "_pool", None), "connections", None)
+        if isinstance(pool_connections, dict):
+            connections = [c for address in list(pool_connections.values()) for c in list(address)]
+            in_use = sum(1 for c in connections if getattr(c, "in_use", False))
+            idle = len(connections) - in_use
+
+        return {
+            "uri": entry.uri,
+            "clients": entry.references,
+            "max_pool_size": entry.settings.max_connection_pool_size,
+            "acquisition_timeout": entry.settings.connection_acquisition_timeout,
+            "in_use": in_use,
+            "idle": idle,
+            **entry.metrics.to_dict()
+        }
+
+
+# Process-wide registry
+_driver_registry: Optional[DriverRegistry] = None
+
+
+def get_driver_registry() -> DriverRegistry:
+    """Get the process-wide driver registry"""
+    global _driver_registry
+
+    if _driver_registry is None:
+        _driver_registry = DriverRegistry()
+
+    return _driver_registry
@@ -19,6 +19,7 @@ from enum import Enum
 from .neo4j_client import Neo4jClient
 from .schema_manager import SchemaManager
 from .connection_manager import ConnectionManager
+from .slow_query_log import get_slow_query_log
 
 
 class AlertSeverity(Enum):
@@ -210,6 +211,47 @@ class DatabaseMetricsCollector:
                         timestamp=timestamp,
                         labels={"database": connection_status["database"]}
                     ))
+                
+                # Shared connection pool (every client in the process uses it)
+                pool = connection_status.get("pool") or {}
+                if pool:
+                    pool_labels = {"database": connection_status["database"], "uri": pool["uri"]}
+                    metrics.extend([
+                        Metric(
+                            name="neo4j_pool_in_use",
+                            type=MetricType.GAUGE,
+                            value=pool["in_use"] or 0,
+                            unit="connections",
+                            timestamp=timestamp,
+                            labels=pool_labels,
+                            metadata={"max_pool_size": pool["max_pool_size"], "clients": pool["clients"]}
+                        ),
+                        Metric(
+                            name="neo4j_pool_idle",
+                            type=MetricType.GAUGE,
+                            value=pool["idle"] or 0,
+                            unit="connections",
+                            timestamp=timestamp,
+                            labels=pool_labels
+                        ),
+                        Metric(
+                            name="neo4j_pool_acquisition_wait_p95",
+                            type=MetricType.GAUGE,
+                            value=pool["wait_ms"]["p95"],
+                            unit="milliseconds",
+                            timestamp=timestamp,
+                            labels=pool_labels,
+                            metadata={"max_ms": pool["wait_ms"]["max"], "mean_ms": pool["wait_ms"]["mean"]}
+                        ),
+                        Metric(
+                            name="neo4j_pool_acquisition_failures",
+                            type=MetricType.COUNTER,
+                            value=pool["failures"],
+                            unit="count",
+                            timestamp=timestamp,
+                            labels=pool_labels
+                        )
+                    ])
             
         except Exception as e:
             self.logger.error(f"Failed to collect connection metrics: {e}")
@@ -408,6 +450,7 @@ class AlertManager:
         # Alert thresholds
         self.thresholds = {
             "neo4j_avg_query_time": {"warning": 2.0, "critical": 5.0},
+            "neo4j_pool_acquisition_wait_p95": {"warning": 1000},  # ms: pool too small for the workers
             "neo4j_connection_state": {"critical": 0},
             "neo4j_health_score": {"warning": 0.7, "critical": 0.3},
             "neo4j_schema_valid": {"critical": 0},
@@ -517,6 +560,9 @@ class AlertManager:
             return "Neo4j database connection is down"
         elif metric.name == "neo4j_avg_query_time":
             return f"Neo4j average query time ({metric.value:.2f}s) exceeds threshold ({threshold}s)"
+        elif metric.name == "neo4j_pool_acquisition_wait_p95":
+            return (f"Neo4j sessions wait {metric.value:.0f}ms (p95) for a pooled connection; "
+                    f"raise NEO4J_MAX_CONNECTION_POOL_SIZE or reduce workers")
         elif metric.name == "neo4j_health_score":
             return f"Neo4j health score ({metric.value:.2f}) below threshold ({threshold})"
         elif metric.name == "neo4j_schema_valid" and metric.value == 0:
@@ -642,6 +688,29 @@ class DatabaseMonitor:
             "alert_count": len(active_alerts),
             "critical_alerts": len([a for a in active_alerts if a.severity == AlertSeverity.CRITICAL]),
             "warning_alerts": len([a for a in active_alerts if a.severity == AlertSeverity.WARNING]),
+            "slow_queries": get_slow_query_log().get_status(),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def get_slow_queries(self, limit: int = 50, query_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the slow query log
+        
+        Args:
+            limit: Maximum entries to return, newest first
+            query_name: Only entries of this registered query
+            
+        Returns:
+            Dict with log settings and counters, slow queries grouped by
+            query shape (slowest total time first) and the latest entries
+        """
+        
+        slow_query_log = get_slow_query_log()
+        
+        return {
+            "status": slow_query_log.get_status(),
+            "by_query": slow_query_log.get_summary(),
+            "entries": slow_query_log.get_entries(limit, query_name),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
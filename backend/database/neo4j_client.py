@@ -9,12 +9,12 @@ import os
 import time
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
 
-from neo4j import GraphDatabase, AsyncGraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, GraphDatabase, Query, unit_of_work
 from neo4j.exceptions import (
     ServiceUnavailable,
     AuthError,
@@ -23,8 +23,31 @@ from neo4j.exceptions import (
     DatabaseError
 )
 
+from .driver_registry import get_driver_registry
+from .slow_query_log import get_slow_query_log
+
 logger = logging.getLogger(__name__)
 
+# Update counters reported in QueryResult.summary["counters"]
+SUMMARY_COUNTERS = (
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+    "indexes_added",
+    "indexes_removed",
+    "constraints_added",
+    "constraints_removed",
+)
+
+
+def summary_counters(counters) -> Dict[str, int]:
+    """Build the summary counters dict from a driver SummaryCounters"""
+    return {name: getattr(counters, name, 0) for name in SUMMARY_COUNTERS}
+
 
 class ConnectionState(Enum):
     """Neo4j connection states"""
@@ -45,8 +68,12 @@ class ConnectionConfig:
     max_connection_lifetime: int = 3600  # 1 hour
     max_connection_pool_size: int = 100
     connection_timeout: int = 30  # 30 seconds
+    connection_acquisition_timeout: int = 60  # wait for a free pooled connection
+    max_transaction_retry_time: float = 30.0  # execute_read/execute_write retry transient errors this long
     resolver: Optional[callable] = None
     encrypted: bool = True
+    stream_fetch_size: int = 500  # records pulled per round trip when streaming
+    stream_max_records: int = 1000000  # default cap on a streamed result, 0 for none
 
 
 @dataclass 
@@ -61,6 +88,131 @@ class QueryResult:
     error: Optional[str] = None
 
 
+class QueryStream:
+    """
+    Records of one query, yielded as the driver receives them
+    
+    The driver pulls `fetch_size` records per round trip and requests the
+    next batch only once the consumer has taken the previous one, so memory
+    stays constant and a slow consumer slows the query instead of growing a
+    buffer. Leaving the `async with` block early, or reaching `max_records`,
+    discards the rest of the result on the server.
+    
+    Usage:
+        async with neo4j_client.stream_query("MATCH (d:Document) RETURN d.content AS content") as stream:
+            async for record in stream:
+                ...
+        
+        stream.records_streamed, stream.truncated, stream.summary
+    """
+    
+    def __init__(
+        self,
+        client: "Neo4jClient",
+        query: str,
+        parameters: Dict[str, Any],
+        max_records: int,
+        fetch_size: int,
+        timeout: Optional[int] = None
+    ):
+        self.client = client
+        self.query = query
+        self.parameters = parameters
+        self.max_records = max_records
+        self.fetch_size = fetch_size
+        self.timeout = timeout
+        
+        self.records_streamed = 0
+        self.truncated = False
+        self.summary: Dict[str, Any] = {}
+        self.execution_time = 0.0
+        self.error: Optional[str] = None
+        
+        self._session = None
+        self._result = None
+        self._iterator: Optional[AsyncIterator[Dict[str, Any]]] = None
+        self._start_time: Optional[float] = None
+        self._finished = False
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        if self._iterator is None:
+            self._iterator = self._records()
+        return self._iterator
+    
+    async def close(self):
+        """Stop streaming: discard unread records and release the session"""
+        if self._iterator is not None:
+            await self._iterator.aclose()
+        await self._finish()
+    
+    async def _records(self) -> AsyncIterator[Dict[str, Any]]:
+        client = self.client
+        
+        if not await client._ensure_connected():
+            raise DatabaseError("Failed to establish Neo4j connection")
+        
+        self._start_time = time.time()
+        
+        try:
+            self._session = client.driver.session(database=client.config.database, fetch_size=self.fetch_size)
+            self._result = await self._session.run(Query(self.query, timeout=self.timeout), self.parameters)
+            
+            async for record in self._result:
+                if self.max_records and self.records_streamed >= self.max_records:
+                    self.truncated = True
+                    logger.warning(f"Streamed query stopped at {self.max_records} records: {self.query[:100]}...")
+                    break
+                
+                self.records_streamed += 1
+                yield record.data()
+                
+        except Exception as e:
+            client._performance_metrics["errors"] += 1
+            self.error = f"Neo4j stream failed: {str(e)}"
+            logger.error(self.error)
+            raise
+            
+        finally:
+            await self._finish()
+    
+    async def _finish(self):
+        if self._finished or self._start_time is None:
+            return
+        self._finished = True
+        
+        try:
+            if self._result is not None and self.error is None:
+                # Discards whatever the consumer did not read
+                summary = await self._result.consume()
+                self.summary = {
+                    "query_type": summary.query_type,
+                    "counters": summary_counters(summary.counters),
+                    "result_available_after": summary.result_available_after,
+                    "result_consumed_after": summary.result_consumed_after
+                }
+        except Exception as e:
+            logger.warning(f"Failed to discard the rest of a streamed result: {e}")
+            
+        finally:
+            if self._session is not None:
+                await self._session.close()
+            
+            self.execution_time = time.time() - self._start_time
+            metrics = self.client._performance_metrics
+            metrics["queries_executed"] += 1
+            metrics["total_execution_time"] += self.execution_time
+            metrics["records_streamed"] += self.records_streamed
+            
+            logger.debug(f"Streamed {self.records_streamed} records in {self.execution_time:.3f}s: "
+                         f"{self.query[:100]}...")
+
+
 class Neo4jClient:
     """
     Production-ready Neo4j client for OneVice
@@ -68,6 +220,7 @@ class Neo4jClient:
     Features:
     - Async connection management with automatic retry
     - Transaction support with rollback capabilities
+    - Managed read/write transactions routed by access mode, with retries
     - Connection health monitoring and automatic reconnection
     - Comprehensive error handling and logging
     - Query performance monitoring
@@ -86,7 +239,11 @@ class Neo4jClient:
             "queries_executed": 0,
             "total_execution_time": 0,
             "errors": 0,
-            "reconnections": 0
+            "reconnections": 0,
+            "records_streamed": 0,
+            "read_transactions": 0,
+            "write_transactions": 0,
+            "transaction_retries": 0
         }
         
         logger.info(f"Neo4j client initialized for database: {self.config.database}")
@@ -102,7 +259,11 @@ class Neo4jClient:
             max_connection_lifetime=int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600")),
             max_connection_pool_size=int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "100")),
             connection_timeout=int(os.getenv("NEO4J_CONNECTION_TIMEOUT", "30")),
-            encrypted=os.getenv("NEO4J_ENCRYPTED", "true").lower() == "true"
+            connection_acquisition_timeout=int(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60")),
+            max_transaction_retry_time=float(os.getenv("NEO4J_MAX_RETRY_TIME", "30")),
+            encrypted=os.getenv("NEO4J_ENCRYPTED", "true").lower() == "true",
+            stream_fetch_size=int(os.getenv("NEO4J_STREAM_FETCH_SIZE", "500")),
+            stream_max_records=int(os.getenv("NEO4J_STREAM_MAX_RECORDS", "1000000"))
         )
     
     async def connect(self) -> bool:
@@ -123,24 +284,19 @@ class Neo4jClient:
         try:
             logger.info(f"Connecting to Neo4j at {self.config.uri}")
             
-            # Create async driver with optimized configuration
+            # Borrow the process-wide driver, so every client shares one pool
             # Note: For neo4j+s:// and bolt+s:// schemes, encryption is handled by URI
-            driver_config = {
-                "max_connection_lifetime": self.config.max_connection_lifetime,
-                "max_connection_pool_size": self.config.max_connection_pool_size,
-                "connection_timeout": self.config.connection_timeout,
-                "resolver": self.config.resolver
-            }
-            
-            # Only set encrypted parameter for non-secure URI schemes
-            if not (self.config.uri.startswith("neo4j+s://") or self.config.uri.startswith("bolt+s://")):
-                driver_config["encrypted"] = self.config.encrypted
-            
-            self.driver = AsyncGraphDatabase.driver(
-                self.config.uri,
-                auth=(self.config.username, self.config.password),
-                **driver_config
-            )
+            if self.driver is None:
+                self.driver = get_driver_registry().acquire(
+                    self.config.uri,
+                    (self.config.username, self.config.password),
+                    encrypted=self.config.encrypted,
+                    resolver=self.config.resolver,
+                    max_connection_lifetime=self.config.max_connection_lifetime,
+                    max_connection_pool_size=self.config.max_connection_pool_size,
+                    connection_timeout=self.config.connection_timeout,
+                    connection_acquisition_timeout=self.config.connection_acquisition_timeout
+                )
             
             # Verify connection with simple query
             await self._verify_connectivity()
@@ -171,7 +327,7 @@ class Neo4jClient:
         
         if self.driver:
             try:
-                await self.driver.close()
+                await get_driver_registry().release(self.driver)
                 logger.info("Neo4j connection closed successfully")
             except Exception as e:
                 logger.error(f"Error closing Neo4j connection: {e}")
@@ -179,6 +335,10 @@ class Neo4jClient:
                 self.driver = None
                 self.state = ConnectionState.DISCONNECTED
     
+    async def close(self):
+        """Alias of disconnect, matching the AI graph client"""
+        await self.disconnect()
+    
     async def _verify_connectivity(self) -> bool:
         """Verify Neo4j database connectivity"""
         
@@ -239,12 +399,16 @@ class Neo4jClient:
                 # Update performance metrics
                 self._performance_metrics["queries_executed"] += 1
                 self._performance_metrics["total_execution_time"] += execution_time
+                get_slow_query_log().observe(
+                    self.driver, self.config.database, query, parameters, execution_time,
+                    records=len(record_list)
+                )
                 
                 query_result = QueryResult(
                     records=record_list,
                     summary={
                         "query_type": summary.query_type,
-                        "counters": summary.counters._raw_data if hasattr(summary.counters, '_raw_data') else {},
+                        "counters": summary_counters(summary.counters),
                         "result_available_after": summary.result_available_after,
                         "result_consumed_after": summary.result_consumed_after
                     },
@@ -291,6 +455,177 @@ class Neo4jClient:
                 error=error_msg
             )
     
+    async def execute_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None
+    ) -> QueryResult:
+        """
+        Execute a read-only query in a managed read transaction
+        
+        In a cluster (neo4j:// URIs) the driver routes read transactions to
+        followers and read replicas. Transient failures (leader switches,
+        deadlocks, unavailable members) are retried with backoff for up to
+        `max_transaction_retry_time` seconds. The query must not write: a
+        cluster refuses writes in read transactions.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters dictionary
+            timeout: Transaction timeout in seconds
+            
+        Returns:
+            QueryResult: Query execution result with metadata
+        """
+        
+        return await self._execute_managed(READ_ACCESS, query, parameters, timeout)
+    
+    async def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None
+    ) -> QueryResult:
+        """
+        Execute a query in a managed write transaction on the cluster leader
+        
+        Retried like execute_read, so the query must be safe to run again
+        (MERGE rather than CREATE for anything that may be retried).
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters dictionary
+            timeout: Transaction timeout in seconds
+            
+        Returns:
+            QueryResult: Query execution result with metadata
+        """
+        
+        return await self._execute_managed(WRITE_ACCESS, query, parameters, timeout)
+    
+    async def _execute_managed(
+        self,
+        access_mode: str,
+        query: str,
+        parameters: Optional[Dict[str, Any]],
+        timeout: Optional[int]
+    ) -> QueryResult:
+        """Run one query as a driver-managed transaction function"""
+        
+        if not await self._ensure_connected():
+            raise DatabaseError("Failed to establish Neo4j connection")
+        
+        parameters = parameters or {}
+        start_time = time.time()
+        attempts = 0
+        
+        @unit_of_work(timeout=timeout)
+        async def work(tx):
+            nonlocal attempts
+            attempts += 1
+            
+            result = await tx.run(query, parameters)
+            record_list = [record.data() async for record in result]
+            summary = await result.consume()
+            return record_list, summary
+        
+        try:
+            async with self.driver.session(
+                database=self.config.database,
+                default_access_mode=access_mode,
+                max_transaction_retry_time=self.config.max_transaction_retry_time
+            ) as session:
+                if access_mode == READ_ACCESS:
+                    record_list, summary = await session.execute_read(work)
+                else:
+                    record_list, summary = await session.execute_write(work)
+            
+            execution_time = time.time() - start_time
+            
+            self._performance_metrics["queries_executed"] += 1
+            self._performance_metrics["total_execution_time"] += execution_time
+            self._performance_metrics[f"{access_mode.lower()}_transactions"] += 1
+            self._performance_metrics["transaction_retries"] += attempts - 1
+            get_slow_query_log().observe(
+                self.driver, self.config.database, query, parameters, execution_time,
+                access_mode=access_mode, records=len(record_list)
+            )
+            
+            logger.debug(f"{access_mode} transaction executed in {execution_time:.3f}s "
+                         f"({attempts} attempt(s)): {query[:100]}...")
+            
+            return QueryResult(
+                records=record_list,
+                summary={
+                    "query_type": summary.query_type,
+                    "counters": summary_counters(summary.counters),
+                    "result_available_after": summary.result_available_after,
+                    "result_consumed_after": summary.result_consumed_after,
+                    "server": summary.server.address if summary.server else None,
+                    "notifications": [
+                        {"code": n.get("code"), "title": n.get("title")} for n in summary.notifications or []
+                    ],
+                    "attempts": attempts
+                },
+                execution_time=execution_time,
+                query=query,
+                parameters=parameters,
+                success=True
+            )
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self._performance_metrics["errors"] += 1
+            self._performance_metrics["transaction_retries"] += max(attempts - 1, 0)
+            
+            error_msg = f"Neo4j {access_mode.lower()} transaction failed after {attempts} attempt(s): {str(e)}"
+            logger.error(error_msg)
+            
+            return QueryResult(
+                records=[],
+                summary={},
+                execution_time=execution_time,
+                query=query,
+                parameters=parameters,
+                success=False,
+                error=error_msg
+            )
+    
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        max_records: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+        timeout: Optional[int] = None
+    ) -> QueryStream:
+        """
+        Stream a query's records instead of materializing them
+        
+        For exports, re-indexing and analytics over large result sets; see
+        QueryStream. Unlike execute_query, failures are raised.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters dictionary
+            max_records: Stop after this many records (defaults to the configured cap, 0 for none)
+            fetch_size: Records pulled per round trip (defaults to the configured fetch size)
+            timeout: Query timeout in seconds
+            
+        Returns:
+            QueryStream: Async iterator of record dicts
+        """
+        
+        return QueryStream(
+            self,
+            query,
+            parameters or {},
+            max_records=self.config.stream_max_records if max_records is None else max_records,
+            fetch_size=fetch_size or self.config.stream_fetch_size,
+            timeout=timeout
+        )
+    
     @asynccontextmanager
     async def transaction(self, timeout: Optional[int] = None):
         """
@@ -366,7 +701,7 @@ class Neo4jClient:
                         records=record_list,
                         summary={
                             "query_type": summary.query_type,
-                            "counters": summary.counters._raw_data if hasattr(summary.counters, '_raw_data') else {}
+                            "counters": summary_counters(summary.counters)
                         },
                         execution_time=time.time() - start_time,
                         query=query,
@@ -425,6 +760,7 @@ class Neo4jClient:
             "connection_attempts": self._connection_attempts,
             "last_health_check": self._last_health_check,
             "performance_metrics": self._performance_metrics.copy(),
+            "pool": get_driver_registry().get_pool_metrics(self.driver) if self.driver else {},
             "connected": self.state == ConnectionState.CONNECTED
         }
     
@@ -436,7 +772,8 @@ class Neo4jClient:
             "timestamp": time.time(),
             "connection_state": self.state.value,
             "database": self.config.database,
-            "performance": self._performance_metrics.copy()
+            "performance": self._performance_metrics.copy(),
+            "pool": get_driver_registry().get_pool_metrics(self.driver) if self.driver else {}
         }
         
         try:
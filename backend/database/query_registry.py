@@ -0,0 +1,173 @@
+"""
+Cypher Query Registry
+
+Named, parameterized Cypher queries shared by the agent tools and services.
+Every registered query has a fixed shape: values travel as parameters and
+optional filters are written as `$param IS NULL OR ...` instead of being
+appended to the text, so Neo4j plans each query once and serves every later
+execution from its plan cache. Queries whose shape must vary (a variable
+length pattern bound, a label) are registered once per variant.
+
+At startup warm_up() runs EXPLAIN on every registered query. That plans and
+caches them before the first user request, and reports queries the schema
+rejects (missing indexes, syntax errors) and schema warnings (unknown labels,
+relationship types or properties) in the logs instead of at request time.
+
+Usage:
+    PERSON_DETAILS = register_query(
+        "tools.person_details",
+        "MATCH (p:Person) WHERE p.name CONTAINS $name RETURN p",
+        parameters={"name": ""}
+    )
+    result = await neo4j_client.execute_read(PERSON_DETAILS, {"name": name})
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from neo4j import READ_ACCESS, WRITE_ACCESS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RegisteredQuery:
+    """A named Cypher query and the sample parameters it is warmed up with"""
+    name: str
+    cypher: str
+    access_mode: str = READ_ACCESS
+    # Plans are cached per parameter types, so samples must have the real types
+    parameters: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+
+class QueryRegistry:
+    """Process-wide catalogue of fixed-shape Cypher queries"""
+
+    def __init__(self):
+        self._queries: Dict[str, RegisteredQuery] = {}
+        self._by_cypher: Dict[str, RegisteredQuery] = {}
+        self.last_warm_up: Optional[Dict[str, Any]] = None
+
+    def register(
+        self,
+        name: str,
+        cypher: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        access_mode: str = READ_ACCESS
+    ) -> str:
+        """
+        Register a query and return its Cypher text
+
+        Registering the same name twice is allowed only with the same text
+        (modules may be imported more than once).
+        """
+        if access_mode not in (READ_ACCESS, WRITE_ACCESS):
+            raise ValueError(f"Unknown access mode for query {name}: {access_mode}")
+
+        query = RegisteredQuery(name, cypher, access_mode, dict(parameters or {}))
+        existing = self._queries.get(name)
+        if existing is not None and existing.cypher != cypher:
+            raise ValueError(f"Query {name} is already registered with different Cypher")
+
+        self._queries[name] = query
+        self._by_cypher[cypher] = query
+        return cypher
+
+    def get(self, name: str) -> RegisteredQuery:
+        try:
+            return self._queries[name]
+        except KeyError:
+            raise KeyError(f"No registered query named {name}") from None
+
+    def cypher(self, name: str) -> str:
+        return self.get(name).cypher
+
+    def find(self, cypher: str) -> Optional[RegisteredQuery]:
+        """The registered query with this exact text, if any"""
+        return self._by_cypher.get(cypher)
+
+    def names(self) -> List[str]:
+        return sorted(self._queries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._queries
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    async def warm_up(self, neo4j_client, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        EXPLAIN registered queries to plan and cache them
+
+        Read queries are explained in read transactions and write queries in
+        write transactions, so in a cluster each is planned on the kind of
+        member that will run it. Failures are reported, not raised.
+
+        Args:
+            neo4j_client: database.neo4j_client.Neo4jClient
+            names: Queries to warm up (defaults to all)
+
+        Returns:
+            Dict with counts, failed queries and schema warnings
+        """
+        selected = [self.get(name) for name in names] if names is not None else list(self._queries.values())
+        started = time.perf_counter()
+        report: Dict[str, Any] = {"queries": len(selected), "warmed": 0, "failed": {}, "warnings": {}}
+
+        for query in selected:
+            execute = neo4j_client.execute_write if query.access_mode == WRITE_ACCESS else neo4j_client.execute_read
+            result = await execute(f"EXPLAIN {query.cypher}", query.parameters)
+
+            if not result.success:
+                report["failed"][query.name] = result.error
+                logger.error(f"Query {query.name} failed to plan: {result.error}")
+                continue
+
+            report["warmed"] += 1
+            warnings = [
+                notification.get("title") or notification.get("code")
+                for notification in result.summary.get("notifications") or []
+            ]
+            if warnings:
+                report["warnings"][query.name] = warnings
+                logger.warning(f"Query {query.name} planned with warnings: {warnings}")
+
+        report["duration_seconds"] = round(time.perf_counter() - started, 3)
+        self.last_warm_up = report
+
+        logger.info(f"Warmed up {report['warmed']}/{report['queries']} Cypher queries in "
+                    f"{report['duration_seconds']}s ({len(report['failed'])} failed, "
+                    f"{len(report['warnings'])} with warnings)")
+        return report
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "registered": len(self._queries),
+            "last_warm_up": self.last_warm_up
+        }
+
+
+# Process-wide registry
+_query_registry: Optional[QueryRegistry] = None
+
+
+def get_query_registry() -> QueryRegistry:
+    """Get the process-wide query registry"""
+    global _query_registry
+
+    if _query_registry is None:
+        _query_registry = QueryRegistry()
+
+    return _query_registry
+
+
+def register_query(
+    name: str,
+    cypher: str,
+    parameters: Optional[Dict[str, Any]] = None,
+    access_mode: str = READ_ACCESS
+) -> str:
+    """Register a query with the process-wide registry and return its Cypher text"""
+    return get_query_registry().register(name, cypher, parameters, access_mode)
@@ -57,6 +57,15 @@ class VectorIndexDefinition:
     description: str = ""
 
 
+@dataclass
+class FulltextIndexDefinition:
+    """Full-text index definition for entity lookups"""
+    name: str
+    node_label: str
+    properties: List[str]
+    description: str = ""
+
+
 @dataclass 
 class SchemaValidationResult:
     """Schema validation result"""
@@ -285,6 +294,46 @@ class SchemaManager:
             )
         ]
         
+        # Full-text indexes the graph tools resolve entity names through
+        self.fulltext_indexes = [
+            FulltextIndexDefinition(
+                name="person_fulltext_index",
+                node_label="Person",
+                properties=["name", "fullName", "id", "bio", "title", "role"],
+                description="Person lookup by name, fullName or id (graph builder nodes only carry id)"
+            ),
+            FulltextIndexDefinition(
+                name="organization_fulltext_index",
+                node_label="Organization",
+                properties=["name", "id", "description"],
+                description="Organization lookup by name or id"
+            ),
+            FulltextIndexDefinition(
+                name="project_fulltext_index",
+                node_label="Project",
+                properties=["name", "title", "id", "description", "synopsis"],
+                description="Project lookup by name, title or id"
+            ),
+            FulltextIndexDefinition(
+                name="document_fulltext_index",
+                node_label="Document",
+                properties=["title", "content", "summary"],
+                description="Document content search"
+            ),
+            FulltextIndexDefinition(
+                name="deal_fulltext_index",
+                node_label="Deal",
+                properties=["name", "description"],
+                description="Deal lookup by name"
+            ),
+            FulltextIndexDefinition(
+                name="concept_fulltext_index",
+                node_label="CreativeConcept",
+                properties=["name", "description"],
+                description="Creative concept lookup by name"
+            )
+        ]
+        
         # Entertainment industry schema relationships
         self.relationship_definitions = {
             "WORKS_FOR": {
@@ -637,6 +686,88 @@ class SchemaManager:
         
         return results
     
+    async def ensure_fulltext_indexes(self) -> Dict[str, Any]:
+        """
+        Create missing full-text indexes and migrate changed ones
+        
+        CREATE FULLTEXT INDEX ... IF NOT EXISTS keeps an existing index even
+        when its label or properties differ from the definition. The indexes
+        in SHOW FULLTEXT INDEXES are compared with self.fulltext_indexes and
+        only those whose definition changed are dropped and recreated.
+        
+        Returns:
+            Dict with created, recreated, unchanged and failed counts
+        """
+        
+        results = {"created": 0, "recreated": 0, "unchanged": 0, "failed": 0, "errors": []}
+        
+        current = await self.client.execute_query(
+            "SHOW FULLTEXT INDEXES YIELD name, labelsOrTypes, properties"
+        )
+        
+        if not current.success:
+            error_msg = f"Failed to fetch full-text indexes: {current.error}"
+            results["failed"] = len(self.fulltext_indexes)
+            results["errors"].append(error_msg)
+            logger.error(error_msg)
+            return results
+        
+        existing = {record.get("name", ""): record for record in current.records}
+        
+        for index in self.fulltext_indexes:
+            record = existing.get(index.name)
+            
+            if record is not None and (
+                list(record.get("labelsOrTypes") or []) == [index.node_label] and
+                set(record.get("properties") or []) == set(index.properties)
+            ):
+                results["unchanged"] += 1
+                continue
+            
+            try:
+                if record is not None:
+                    logger.info(
+                        f"Full-text index {index.name} changed "
+                        f"({record.get('labelsOrTypes')} {record.get('properties')} -> "
+                        f"[{index.node_label}] {index.properties}), recreating"
+                    )
+                    
+                    dropped = await self.client.execute_query(f"DROP INDEX {index.name} IF EXISTS")
+                    
+                    if not dropped.success:
+                        results["failed"] += 1
+                        error_msg = f"Failed to drop full-text index {index.name}: {dropped.error}"
+                        results["errors"].append(error_msg)
+                        logger.error(error_msg)
+                        continue
+                
+                properties_str = ", ".join([f"n.{prop}" for prop in index.properties])
+                
+                cypher = f"""
+                CREATE FULLTEXT INDEX {index.name} IF NOT EXISTS
+                FOR (n:{index.node_label})
+                ON EACH [{properties_str}]
+                """
+                
+                result = await self.client.execute_query(cypher)
+                
+                if result.success:
+                    results["recreated" if record is not None else "created"] += 1
+                    logger.debug(f"Created full-text index: {index.name}")
+                else:
+                    results["failed"] += 1
+                    error_msg = f"Failed to create full-text index {index.name}: {result.error}"
+                    results["errors"].append(error_msg)
+                    logger.error(error_msg)
+                    
+            except Exception as e:
+                results["failed"] += 1
+                error_msg = f"Exception creating full-text index {index.name}: {str(e)}"
+                results["errors"].append(error_msg)
+                logger.error(error_msg)
+        
+        return results
+    
     async def validate_schema(self) -> SchemaValidationResult:
         """
         Validate current database schema against expected schema
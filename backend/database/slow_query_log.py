@@ -0,0 +1,310 @@
+"""
+Neo4j Slow Query Log
+
+Queries slower than NEO4J_SLOW_QUERY_MS are recorded in a bounded, process-wide
+ring buffer, named after the registered query they ran (see query_registry) so
+an entry points at the tool or service that issued it. Parameter values are
+never stored: an entry keeps the parameter names and types and a hash of the
+values, which is enough to group repeats and to tell plan-cache shapes apart.
+
+A sample of slow read queries (NEO4J_SLOW_QUERY_PROFILE_RATE, at most once per
+query shape every NEO4J_SLOW_QUERY_PROFILE_INTERVAL seconds) is re-run with
+PROFILE in the background, in a read session, and the operator tree with its
+db hits and rows is attached to the entry. Writes are never re-run.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from neo4j import READ_ACCESS, Query
+
+from .query_registry import get_query_registry
+
+logger = logging.getLogger(__name__)
+
+# Characters of query text kept per entry
+MAX_QUERY_TEXT = 2000
+
+
+@dataclass
+class SlowQuerySettings:
+    """Slow query thresholds and PROFILE sampling"""
+    threshold_ms: float = 1000.0
+    capacity: int = 200  # entries kept in the ring buffer
+    profile_sample_rate: float = 0.1  # share of slow reads re-run with PROFILE, 0 to disable
+    profile_interval: float = 300.0  # seconds between profiles of the same query shape
+    profile_timeout: float = 30.0
+
+    @classmethod
+    def from_environment(cls) -> "SlowQuerySettings":
+        return cls(
+            threshold_ms=float(os.getenv("NEO4J_SLOW_QUERY_MS", "1000")),
+            capacity=int(os.getenv("NEO4J_SLOW_QUERY_LOG_SIZE", "200")),
+            profile_sample_rate=float(os.getenv("NEO4J_SLOW_QUERY_PROFILE_RATE", "0.1")),
+            profile_interval=float(os.getenv("NEO4J_SLOW_QUERY_PROFILE_INTERVAL", "300")),
+            profile_timeout=float(os.getenv("NEO4J_SLOW_QUERY_PROFILE_TIMEOUT", "30"))
+        )
+
+
+@dataclass
+class SlowQueryEntry:
+    """One slow query execution"""
+    timestamp: str
+    query_name: Optional[str]  # registered name, None for ad-hoc Cypher
+    query: str
+    access_mode: Optional[str]  # None for auto-commit queries
+    duration_ms: float
+    records: int
+    fingerprint: str  # query text and parameter types
+    parameter_fingerprint: str  # parameter values
+    parameter_types: Dict[str, str] = field(default_factory=dict)
+    profile_status: str = "not_sampled"  # pending, captured, failed or skipped_write
+    profile: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _value_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, (list, tuple)):
+        element_types = sorted({_value_type(item) for item in value})
+        return f"list[{'|'.join(element_types)}]" if element_types else "list"
+    if isinstance(value, dict):
+        return "map"
+    return type(value).__name__
+
+
+def fingerprint_parameters(parameters: Optional[Dict[str, Any]]) -> Tuple[Dict[str, str], str]:
+    """
+    Parameter names with their types, and a short hash of the values
+
+    Neo4j caches plans per query text and parameter types, so the types
+    identify the plan a call used; the hash groups calls with equal values.
+    """
+    parameters = parameters or {}
+    types = {name: _value_type(value) for name, value in sorted(parameters.items())}
+    values = json.dumps(parameters, sort_keys=True, default=str)
+    return types, hashlib.sha1(values.encode()).hexdigest()[:12]
+
+
+def fingerprint_query(query: str, parameter_types: Dict[str, str]) -> str:
+    """Short hash of the whitespace-normalized query text and its parameter types"""
+    shape = " ".join(query.split()) + json.dumps(parameter_types, sort_keys=True)
+    return hashlib.sha1(shape.encode()).hexdigest()[:12]
+
+
+def summarize_profile(profile: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Operator tree of a PROFILE summary with db hits and rows per operator"""
+    if not profile:
+        return None
+
+    args = profile.get("args") or {}
+    children = [summarize_profile(child) for child in profile.get("children") or []]
+    return {
+        "operator": profile.get("operatorType"),
+        "details": args.get("Details"),
+        "db_hits": profile.get("dbHits", 0),
+        "rows": profile.get("rows", 0),
+        "estimated_rows": args.get("EstimatedRows"),
+        "children": children
+    }
+
+
+def total_db_hits(operator: Optional[Dict[str, Any]]) -> int:
+    if not operator:
+        return 0
+    return operator["db_hits"] + sum(total_db_hits(child) for child in operator["children"])
+
+
+class SlowQueryLog:
+    """Bounded log of slow Neo4j queries with sampled PROFILE capture"""
+
+    def __init__(self, settings: Optional[SlowQuerySettings] = None):
+        self.settings = settings or SlowQuerySettings.from_environment()
+        self._entries: Deque[SlowQueryEntry] = deque(maxlen=self.settings.capacity)
+        self._last_profiled: Dict[str, float] = {}
+        self._profile_tasks: Set[asyncio.Task] = set()
+        self._counters = {"slow_queries": 0, "profiles_captured": 0, "profiles_failed": 0}
+
+    def configure(self, **settings) -> None:
+        """Change thresholds or sampling at runtime; a new capacity keeps the newest entries"""
+        for name, value in settings.items():
+            if not hasattr(self.settings, name):
+                raise ValueError(f"Unknown slow query setting: {name}")
+            setattr(self.settings, name, value)
+
+        if self._entries.maxlen != self.settings.capacity:
+            self._entries = deque(self._entries, maxlen=self.settings.capacity)
+
+    def observe(
+        self,
+        driver,
+        database: Optional[str],
+        query: str,
+        parameters: Optional[Dict[str, Any]],
+        duration: float,
+        access_mode: Optional[str] = None,
+        records: int = 0
+    ) -> Optional[SlowQueryEntry]:
+        """
+        Record a query execution if it was slow
+
+        Args:
+            driver: Driver the query ran on, used for the PROFILE re-run
+            duration: Execution time in seconds
+            access_mode: READ_ACCESS or WRITE_ACCESS for managed transactions,
+                None for auto-commit queries (profiled only if registered as reads)
+
+        Returns:
+            The logged entry, or None if the query was not slow
+        """
+        duration_ms = duration * 1000
+        if duration_ms < self.settings.threshold_ms:
+            return None
+
+        registered = get_query_registry().find(query)
+        parameter_types, parameter_fingerprint = fingerprint_parameters(parameters)
+        entry = SlowQueryEntry(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            query_name=registered.name if registered else None,
+            query=query.strip()[:MAX_QUERY_TEXT],
+            access_mode=access_mode,
+            duration_ms=round(duration_ms, 3),
+            records=records,
+            fingerprint=fingerprint_query(query, parameter_types),
+            parameter_fingerprint=parameter_fingerprint,
+            parameter_types=parameter_types
+        )
+        self._entries.append(entry)
+        self._counters["slow_queries"] += 1
+
+        logger.warning(f"Slow Neo4j query {entry.query_name or entry.fingerprint}: "
+                       f"{entry.duration_ms:.0f}ms, {records} records")
+
+        is_read = (access_mode or (registered.access_mode if registered else None)) == READ_ACCESS
+        if not is_read:
+            entry.profile_status = "skipped_write"
+        elif driver is not None and self._should_profile(entry):
+            self._schedule_profile(driver, database, entry, query, parameters or {})
+
+        return entry
+
+    def _should_profile(self, entry: SlowQueryEntry) -> bool:
+        if self.settings.profile_sample_rate <= 0 or random.random() >= self.settings.profile_sample_rate:
+            return False
+        if re.match(r"\s*(EXPLAIN|PROFILE)\b", entry.query, re.IGNORECASE):
+            return False
+
+        now = time.monotonic()
+        last = self._last_profiled.get(entry.fingerprint)
+        if last is not None and now - last < self.settings.profile_interval:
+            return False
+
+        self._last_profiled[entry.fingerprint] = now
+        return True
+
+    def _schedule_profile(self, driver, database, entry, query, parameters) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self._profile(driver, database, entry, query, parameters)
+            )
+        except RuntimeError:
+            return  # no event loop: nothing to run the profile on
+
+        entry.profile_status = "pending"
+        self._profile_tasks.add(task)
+        task.add_done_callback(self._profile_tasks.discard)
+
+    async def _profile(self, driver, database, entry, query, parameters) -> None:
+        """Re-run a slow read with PROFILE and attach its operator tree"""
+        try:
+            async with driver.session(database=database, default_access_mode=READ_ACCESS) as session:
+                result = await session.run(
+                    Query(f"PROFILE {query}", timeout=self.settings.profile_timeout), parameters
+                )
+                summary = await result.consume()
+
+            entry.profile = summarize_profile(summary.profile)
+            if entry.profile:
+                entry.profile["total_db_hits"] = total_db_hits(entry.profile)
+            entry.profile_status = "captured"
+            self._counters["profiles_captured"] += 1
+
+        except Exception as e:
+            entry.profile_status = f"failed: {e}"
+            self._counters["profiles_failed"] += 1
+            logger.debug(f"PROFILE of slow query {entry.query_name or entry.fingerprint} failed: {e}")
+
+    async def wait_for_profiles(self) -> None:
+        """Wait for PROFILE re-runs in flight (tests and shutdown)"""
+        if self._profile_tasks:
+            await asyncio.gather(*list(self._profile_tasks), return_exceptions=True)
+
+    def get_entries(self, limit: Optional[int] = None, query_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Logged entries, newest first"""
+        entries = [e for e in reversed(self._entries) if query_name is None or e.query_name == query_name]
+        return [entry.to_dict() for entry in entries[:limit]]
+
+    def get_summary(self) -> List[Dict[str, Any]]:
+        """Entries in the buffer grouped by query shape, slowest total time first"""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for entry in self._entries:
+            group = groups.setdefault(entry.fingerprint, {
+                "fingerprint": entry.fingerprint,
+                "query_name": entry.query_name,
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "max_db_hits": None,
+                "last_seen": entry.timestamp
+            })
+            group["count"] += 1
+            group["total_ms"] += entry.duration_ms
+            group["max_ms"] = max(group["max_ms"], entry.duration_ms)
+            group["last_seen"] = entry.timestamp
+            if entry.profile:
+                group["max_db_hits"] = max(group["max_db_hits"] or 0, entry.profile["total_db_hits"])
+
+        summary = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)
+        for group in summary:
+            group["mean_ms"] = round(group["total_ms"] / group["count"], 3)
+            group["total_ms"] = round(group["total_ms"], 3)
+        return summary
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "settings": asdict(self.settings),
+            "entries": len(self._entries),
+            "profiles_in_flight": len(self._profile_tasks),
+            **self._counters
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._last_profiled.clear()
+
+
+# Process-wide log
+_slow_query_log: Optional[SlowQueryLog] = None
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Get the process-wide slow query log"""
+    global _slow_query_log
+
+    if _slow_query_log is None:
+        _slow_query_log = SlowQueryLog()
+
+    return _slow_query_log
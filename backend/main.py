@@ -15,7 +15,7 @@ import os
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Awaitable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -58,6 +58,8 @@ from app.api.talent import router as talent_router
 
 # Import database components
 from database import get_connection_manager, initialize_database
+from database.driver_registry import get_driver_registry
+from database.query_registry import get_query_registry
 
 # Configure logging
 logging.basicConfig(
@@ -199,6 +201,13 @@ async def initialize_database_connections():
         
         logger.info("Database connections and schema initialized successfully")
         
+        # Plan every registered Cypher query before the first request needs it
+        if os.getenv("NEO4J_QUERY_WARMUP", "true").lower() == "true":
+            try:
+                await get_query_registry().warm_up(db_result["connection_manager"].neo4j)
+            except Exception as e:
+                logger.warning(f"Cypher query warm-up failed: {e}")
+        
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         raise
@@ -227,6 +236,9 @@ async def cleanup_services():
         if connection_manager:
             await connection_manager.close()
         
+        # Close the shared Neo4j drivers any remaining client still holds
+        await get_driver_registry().close_all()
+        
         logger.info("Services cleanup completed")
         
     except Exception as e:
@@ -557,12 +569,21 @@ async def websocket_endpoint(websocket: WebSocket):
                         })
                         continue
                     
+                    # Forward agent tokens and tool progress while the response is generated
+                    async def send_stream_chunk(chunk: Dict[str, Any]) -> None:
+                        await safe_websocket_send(websocket, {
+                            "type": "chat_stream_chunk",
+                            "data": chunk,
+                            "timestamp": datetime.now(timezone.utc).isoformat()
+                        })
+                    
                     # Process user message with dict format
                     response = await handle_chat_message_dict(
                         user_dict=user,
                         content=content,
                         conversation_id=conversation_id,
-                        metadata=metadata
+                        metadata=metadata,
+                        stream_callback=send_stream_chunk
                     )
                     
                     # Send response back to client (with connection state validation)
@@ -753,7 +774,13 @@ async def generate_ai_response(content: str, user: AuthUser, conversation_id: st
         return f"Thank you for your message, {user.name}. I understand you're interested in: '{content}'. Based on our database of successful projects and industry insights, I can provide detailed analysis and recommendations. Could you provide more context about your specific goals or requirements?"
 
 
-async def handle_chat_message_dict(user_dict: Dict[str, Any], content: str, conversation_id: Optional[str] = None, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+async def handle_chat_message_dict(
+    user_dict: Dict[str, Any],
+    content: str,
+    conversation_id: Optional[str] = None,
+    metadata: Dict[str, Any] = None,
+    stream_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+) -> Dict[str, Any]:
     """
     Handle chat message processing with user dict format (for WebSocket authentication)
     
@@ -762,6 +789,7 @@ async def handle_chat_message_dict(user_dict: Dict[str, Any], content: str, conv
         content: Message content
         conversation_id: Optional conversation ID
         metadata: Optional message metadata
+        stream_callback: Optional coroutine receiving content and tool progress chunks as they are generated
         
     Returns:
         Dict containing response data for WebSocket client
@@ -812,7 +840,9 @@ async def handle_chat_message_dict(user_dict: Dict[str, Any], content: str, conv
         conversation.updated_at = datetime.now(timezone.utc)
         
         # Generate AI response using Agent Orchestrator or LLM router
-        ai_response_result = await generate_ai_response_with_metadata(content, user_dict, conversation_id)
+        ai_response_result = await generate_ai_response_with_metadata(
+            content, user_dict, conversation_id, stream_callback=stream_callback
+        )
         ai_response_content = ai_response_result["content"]
         
         # Add AI response to conversation
@@ -943,10 +973,18 @@ async def apply_security_filtering(query: str, user_context: Dict[str, Any]) ->
         }
 
 
-async def generate_ai_response_with_metadata(content: str, user_dict: Dict[str, Any], conversation_id: str) -> Dict[str, Any]:
+async def generate_ai_response_with_metadata(
+    content: str,
+    user_dict: Dict[str, Any],
+    conversation_id: str,
+    stream_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+) -> Dict[str, Any]:
     """
     Generate AI response with metadata using Agent Orchestrator with LangGraph multi-agent workflows
     
+    When stream_callback is given, the orchestrator response is streamed and
+    every content/tool progress chunk is passed to the callback as it arrives.
+    
     Returns:
         Dict with 'content' (response text) and 'agent_info' (routing metadata)
     """
@@ -994,11 +1032,23 @@ async def generate_ai_response_with_metadata(content: str, user_dict: Dict[str,
             logger.info(f"Routing query through Agent Orchestrator (Supervisor Pattern) for user {user_name}")
             
             # Route filtered query through LangGraph multi-agent supervisor system
-            agent_response = await agent_orchestrator.route_query(
-                query=filtered_content,
-                user_context=user_context,
-                conversation_id=conversation_id
-            )
+            if stream_callback:
+                agent_response = None
+                async for chunk in agent_orchestrator.stream_query(
+                    query=filtered_content,
+                    user_context=user_context,
+                    conversation_id=conversation_id
+                ):
+                    if chunk["type"] == "metadata":
+                        agent_response = chunk
+                    else:
+                        await stream_callback(chunk)
+            else:
+                agent_response = await agent_orchestrator.route_query(
+                    query=filtered_content,
+                    user_context=user_context,
+                    conversation_id=conversation_id
+                )
             
             # Handle orchestrator response format
             if agent_response:
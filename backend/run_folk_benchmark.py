@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Folk.app Ingestion Benchmark - Run Script
+
+Runs the Folk ingestion against a local fake Folk API and reports records/sec,
+peak RSS and the Neo4j statements issued. Writes go to an in-memory sink by
+default, so no Folk API key or database is needed.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import os
+import logging
+
+# Add current directory to path
+sys.path.append(os.path.dirname(__file__))
+
+from tools.folk_ingestion.benchmark import BenchmarkResult, BenchmarkScenario, benchmark_config, run_benchmark
+
+
+def setup_logging(level: str = "WARNING"):
+    """Setup logging configuration"""
+
+    logging.basicConfig(
+        level=getattr(logging, level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    # Reduce noise from external libraries
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+
+def print_report(result: BenchmarkResult):
+    """Print a benchmark result"""
+
+    report = result.to_dict()
+    api = report["api"]
+    performance = report["performance"]
+
+    print("\n" + "=" * 40)
+    print("📊 BENCHMARK COMPLETED")
+    print("=" * 40)
+    print(f"⏱️  Duration: {report['duration_seconds']:.2f}s")
+    print(f"⚡ Throughput: {report['records_per_second']} records/s ({report['records']} records written)")
+    print(f"🧠 Peak RSS: {report['memory']['peak_rss_mb']} MB "
+          f"(before the run: {report['memory']['rss_before_mb']} MB)")
+    print(f"🗄️  Neo4j: {report['neo4j']['statements']} statements in {report['neo4j']['transactions']} "
+          f"transactions ({report['neo4j']['statements_per_record']} per record)")
+    print(f"🌐 Fake Folk API: {api['requests']} requests, {api['pages_served']} pages, "
+          f"{api['rate_limited']} rate limited")
+    print(f"❌ Errors: {report['errors']}")
+
+    if performance["records"]:
+        print(f"\n🔍 Busiest stage: {performance['bottleneck']}")
+        for label, key in (("Fetch/page", "fetch_page_ms"), ("Transform/record", "transform_record_ms"),
+                           ("Write/batch", "write_batch_ms")):
+            timing = performance[key]
+            print(f"   • {label}: p50 {timing['p50']}ms, p95 {timing['p95']}ms, "
+                  f"p99 {timing['p99']}ms, max {timing['max']}ms")
+
+
+def main():
+    """Main entry point"""
+
+    parser = argparse.ArgumentParser(
+        description="Folk.app ingestion throughput benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                      # 1000 people, 200 companies, 5 groups, 500 deals
+  %(prog)s --people 50000 --companies 10000     # Larger workspace
+  %(prog)s --latency-ms 80 --rate-limit-every 50 --retry-after 1
+                                                # Realistic API latency and 429s
+  %(prog)s --write-latency-ms 2                 # Slower simulated database
+  %(prog)s --json results.json                  # Save the report for comparison
+        """
+    )
+
+    parser.add_argument("--people", type=int, default=1000, help="People in the fake workspace (default: 1000)")
+    parser.add_argument("--companies", type=int, default=200, help="Companies (default: 200)")
+    parser.add_argument("--groups", type=int, default=5, help="Groups (default: 5)")
+    parser.add_argument("--custom-objects", type=int, default=500,
+                        help="Custom objects, spread over every group and entity type (default: 500)")
+    parser.add_argument("--entity-types", default="Deals",
+                        help="Comma-separated custom object types (default: Deals)")
+    parser.add_argument("--api-keys", type=int, default=1, help="API keys sharing the workspace (default: 1)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake API latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency per request")
+    parser.add_argument("--rate-limit-every", type=int, default=0,
+                        help="Answer every Nth request with 429 (default: never)")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After sent with 429s, in seconds")
+    parser.add_argument("--write-latency-ms", type=float, default=0.0,
+                        help="Simulated time per Neo4j statement (in-memory sink only)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Records per write transaction (default: 50)")
+    parser.add_argument("--rate-limit", type=int, default=600000,
+                        help="Client rate limit in requests/minute (default: effectively unlimited)")
+    parser.add_argument("--sync-mode", choices=["full", "incremental"], default="full", help="Sync mode to run")
+    parser.add_argument("--no-checkpoints", action="store_true", help="Disable per-batch checkpoint writes")
+    parser.add_argument("--neo4j", action="store_true",
+                        help="Write to the configured Neo4j database (creates benchmark nodes!)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="WARNING",
+        help="Set logging level (default: WARNING)"
+    )
+
+    args = parser.parse_args()
+    setup_logging(args.log_level)
+
+    scenario = BenchmarkScenario(
+        people=args.people,
+        companies=args.companies,
+        groups=args.groups,
+        custom_objects=args.custom_objects,
+        entity_types=tuple(t.strip() for t in args.entity_types.split(",") if t.strip()),
+        api_keys=args.api_keys,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_every=args.rate_limit_every,
+        retry_after_seconds=args.retry_after,
+        write_latency_ms=args.write_latency_ms
+    )
+
+    overrides = {
+        "batch_size": args.batch_size,
+        "rate_limit": args.rate_limit,
+        "sync_mode": args.sync_mode,
+        "enable_checkpoints": not args.no_checkpoints
+    }
+    if args.neo4j:
+        # Only the database settings are needed: the Folk API is faked
+        missing = [var for var in ("NEO4J_URI", "NEO4J_USERNAME", "NEO4J_PASSWORD") if not os.getenv(var)]
+        if missing:
+            print(f"❌ --neo4j needs these variables: {missing}")
+            return False
+        overrides.update(
+            neo4j_uri=os.getenv("NEO4J_URI"),
+            neo4j_username=os.getenv("NEO4J_USERNAME"),
+            neo4j_password=os.getenv("NEO4J_PASSWORD"),
+            neo4j_database=os.getenv("NEO4J_DATABASE", "neo4j")
+        )
+
+    print("🏁 Folk ingestion benchmark")
+    print(f"   - Workspace: {scenario.people} people, {scenario.companies} companies, {scenario.groups} groups, "
+          f"{scenario.custom_objects} custom objects ({', '.join(scenario.entity_types)})")
+    print(f"   - API keys: {scenario.api_keys}, latency {scenario.latency_ms}ms "
+          f"(+{scenario.jitter_ms}ms jitter), 429 every {scenario.rate_limit_every or 'never'}")
+    print(f"   - Neo4j: {'configured database' if args.neo4j else 'in-memory sink'}")
+
+    result = asyncio.run(run_benchmark(scenario, benchmark_config(scenario, **overrides), use_database=args.neo4j))
+    print_report(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result.to_dict(), f, indent=2)
+        print(f"\n💾 Report saved to {args.json}")
+
+    return result.to_dict()["errors"] == 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(0 if main() else 1)
+    except KeyboardInterrupt:
+        print("\n⏹️  Benchmark interrupted")
+        sys.exit(130)  # Standard exit code for SIGINT
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Folk.app Near-Real-Time Sync Worker - Run Script
+
+Starts the long-running sync worker: a small FastAPI server receiving Folk
+webhooks at /webhooks/folk and applying the changes to Neo4j within seconds,
+with incremental polling as a fallback.
+"""
+
+import argparse
+import sys
+import os
+import logging
+
+import uvicorn
+
+# Add current directory to path
+sys.path.append(os.path.dirname(__file__))
+
+from tools.folk_ingestion.config import validate_environment, get_sample_env_file, get_config
+from tools.folk_ingestion.webhook_server import create_app
+
+
+def setup_logging(level: str = "INFO"):
+    """Setup logging configuration"""
+
+    logging.basicConfig(
+        level=getattr(logging, level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    # Reduce noise from external libraries
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("asyncio").setLevel(logging.WARNING)
+
+
+def main():
+    """Main entry point"""
+
+    parser = argparse.ArgumentParser(
+        description="Folk.app near-real-time sync worker",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                        # Listen on 0.0.0.0:8010
+  %(prog)s --port 9000            # Custom port
+  %(prog)s --log-level DEBUG      # Verbose logging
+
+Point the Folk webhook at http://<host>:<port>/webhooks/folk
+        """
+    )
+
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to listen on (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8010, help="Port to listen on (default: 8010)")
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Set logging level (default: INFO)"
+    )
+
+    args = parser.parse_args()
+
+    validation = validate_environment()
+    if not validation["valid"]:
+        print("❌ Environment validation failed!")
+        print(f"Missing required variables: {validation['missing_required']}")
+        print("\n📝 Add these variables to your .env file:")
+        print(get_sample_env_file())
+        return False
+
+    setup_logging(args.log_level)
+    config = get_config()
+
+    if not config.webhook_secret:
+        print("❌ FOLK_WEBHOOK_SECRET is not set!")
+        print("   Unsigned webhooks could delete graph records; set the signing secret configured in Folk.")
+        return False
+
+    print("🔄 Starting Folk sync worker")
+    print(f"   - API keys: {len(config.api_keys)}")
+    print(f"   - Webhook: http://{args.host}:{args.port}/webhooks/folk (signed)")
+    print(f"   - Coalesce window: {config.sync_coalesce_seconds}s")
+    print(f"   - Fallback poll: {config.sync_poll_interval_seconds or 'disabled'}"
+          f"{'s' if config.sync_poll_interval_seconds else ''}")
+
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level=args.log_level.lower())
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(0 if main() else 1)
+    except KeyboardInterrupt:
+        print("\n⏹️  Sync worker stopped")
+        sys.exit(130)  # Standard exit code for SIGINT
@@ -0,0 +1,251 @@
+"""
+Tests for streaming agent responses (BaseAgent.stream_chat and
+AgentOrchestrator.stream_query).
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langsmith import tracing_context
+
+from app.ai.agents.base_agent import BaseAgent
+from app.ai.config import AIConfig, AgentType
+from app.ai.llm.prompt_templates import PromptType
+from app.ai.llm.router import clean_response_content
+from app.ai.workflows.orchestrator import AgentOrchestrator, RoutingStrategy
+from app.core.exceptions import AIProcessingError
+
+RAW_RESPONSE = "1. Summary: two leads  \n\n\n\n- Boost Mobile\n- Netflix\n\nThat's all."
+
+
+class StreamingTestAgent(BaseAgent):
+    """Minimal concrete agent"""
+
+    async def _analyze_query(self, query, user_context):
+        return {}
+
+    def _get_prompt_type(self):
+        return PromptType.SALES_INTELLIGENCE
+
+
+@pytest.fixture(autouse=True)
+def no_tracing():
+    with tracing_context(enabled=False):
+        yield
+
+
+@pytest.fixture
+def redis_client():
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.setex = AsyncMock()
+    return client
+
+
+def make_agent(redis_client, llm_router=None):
+    return StreamingTestAgent(AgentType.SALES, AIConfig(), llm_router or MagicMock(), redis_client=redis_client)
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def content_of(chunks):
+    return "".join(chunk["content"] for chunk in chunks if chunk["type"] == "content")
+
+
+def token(content, node, **kwargs):
+    return "messages", (AIMessageChunk(content=content, **kwargs), {"langgraph_node": node})
+
+
+def graph_state(*messages):
+    return "values", {
+        "messages": list(messages),
+        "conversation_id": "c1",
+        "memory": {},
+        "last_updated": "2026-01-01T00:00:00+00:00"
+    }
+
+
+TOOL_CALL = {"name": "get_person_details", "args": {"name": "Jane"}, "id": "call_1"}
+
+
+class TestStreamChat:
+    """Test tokens, the final message and failures of a streamed graph run"""
+
+    @pytest.mark.asyncio
+    async def test_model_tokens_add_up_to_the_final_message(self, redis_client):
+        agent = make_agent(redis_client)
+        agent._llm_with_tools = GenericFakeChatModel(messages=iter([AIMessage(content=RAW_RESPONSE)]))
+
+        chunks = await collect(agent.stream_chat("who are our leads?", {"user_id": "u1"}))
+
+        assert [chunk["type"] for chunk in chunks][-1] == "metadata"
+        assert sum(chunk["type"] == "content" for chunk in chunks) > 1
+        assert content_of(chunks) == chunks[-1]["content"] == clean_response_content(RAW_RESPONSE)
+        assert chunks[-1]["content"].startswith("**Summary:** two leads\n\n• Boost Mobile")
+
+    @pytest.mark.asyncio
+    async def test_router_fallback_tokens_are_cleaned_in_order(self, redis_client):
+        tokens = ["1. Sum", "mary: two leads  ", "\n\n\n", "\n- Boost", " Mobile\n", "- Netflix"]
+
+        async def stream():
+            for token in tokens:
+                yield {"type": "content", "content": token}
+            yield {"type": "metadata", "provider": "together", "model": "test-model", "response_time": 0.1}
+
+        router = MagicMock()
+        router.route_query = AsyncMock(return_value=stream())
+        agent = make_agent(redis_client, router)
+
+        chunks = await collect(agent.stream_chat("who are our leads?", {"user_id": "u1", "role": "SALESPERSON"}))
+
+        assert router.route_query.call_args.kwargs["stream"] is True
+        assert [chunk["content"] for chunk in chunks if chunk["type"] == "content"] == [
+            "**Summary:** two leads", "\n\n• Boost", " Mobile", "\n• Netflix"
+        ]
+        assert chunks[-1]["content"] == clean_response_content("".join(tokens))
+        assert chunks[-1]["metadata"]["model"] == "test-model"
+
+    @pytest.mark.asyncio
+    async def test_preamble_before_a_tool_call_is_not_streamed(self, redis_client):
+        agent = make_agent(redis_client)
+        preamble = AIMessage(content="Let me look that up.", tool_calls=[TOOL_CALL])
+
+        async def run(*args, **kwargs):
+            yield token("Let me look that up.", "llm_with_tools")
+            yield token("", "llm_with_tools", tool_call_chunks=[
+                {"name": "get_person_details", "args": "{}", "id": "call_1", "index": 0}
+            ])
+            yield graph_state(preamble)
+            yield "custom", {"type": "tool_start", "tools": ["get_person_details"]}
+            yield token("Jane is a producer.", "generate_response")
+            yield graph_state(preamble, AIMessage(content="Jane is a producer."))
+
+        agent.app = MagicMock()
+        agent.app.astream = run
+
+        chunks = await collect(agent.stream_chat("who is Jane?", {"user_id": "u1"}))
+
+        assert [chunk["type"] for chunk in chunks] == ["tool_start", "content", "metadata"]
+        assert content_of(chunks) == chunks[-1]["content"] == "Jane is a producer."
+
+    @pytest.mark.asyncio
+    async def test_direct_answer_is_streamed_once_the_node_finishes(self, redis_client):
+        agent = make_agent(redis_client)
+
+        async def run(*args, **kwargs):
+            yield token("Jane is ", "llm_with_tools")
+            yield token("a producer.", "llm_with_tools")
+            yield graph_state(AIMessage(content="Jane is a producer."))
+
+        agent.app = MagicMock()
+        agent.app.astream = run
+
+        chunks = await collect(agent.stream_chat("who is Jane?", {"user_id": "u1"}))
+
+        assert [chunk["content"] for chunk in chunks if chunk["type"] == "content"] == ["Jane is", " a producer."]
+        assert not any(chunk.get("replace") for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_failed_synthesis_replaces_the_streamed_text(self, redis_client):
+        agent = make_agent(redis_client)
+
+        async def run(*args, **kwargs):
+            yield token("Jane is a", "generate_response")
+            yield graph_state(AIMessage(content="", tool_calls=[TOOL_CALL]), {"role": "assistant", "content": "Summary"})
+
+        agent.app = MagicMock()
+        agent.app.astream = run
+
+        chunks = await collect(agent.stream_chat("who is Jane?", {"user_id": "u1"}))
+
+        contents = [chunk for chunk in chunks if chunk["type"] == "content"]
+        assert [chunk["content"] for chunk in contents] == ["Jane is a", "Summary"]
+        assert contents[-1]["replace"] is True
+        assert chunks[-1]["content"] == "Summary"
+
+    @pytest.mark.asyncio
+    async def test_graph_failure_is_raised_after_the_sent_tokens(self, redis_client):
+        agent = make_agent(redis_client)
+
+        async def failing_run(*args, **kwargs):
+            yield "custom", {"type": "content", "content": "Partial answer "}
+            raise RuntimeError("model connection reset")
+
+        agent.app = MagicMock()
+        agent.app.astream = failing_run
+
+        stream = agent.stream_chat("who are our leads?", {"user_id": "u1"})
+        assert (await stream.__anext__())["content"] == "Partial answer"
+        with pytest.raises(AIProcessingError, match="model connection reset"):
+            await stream.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_stops_the_graph_run(self, redis_client):
+        agent = make_agent(redis_client)
+        closed = []
+
+        async def endless_run(*args, **kwargs):
+            try:
+                while True:
+                    yield "custom", {"type": "content", "content": "token "}
+            finally:
+                closed.append(True)
+
+        agent.app = MagicMock()
+        agent.app.astream = endless_run
+
+        stream = agent.stream_chat("who are our leads?", {"user_id": "u1"})
+        assert (await stream.__anext__())["content"] == "token"
+        await stream.aclose()
+
+        assert closed == [True]
+
+
+class TestStreamQuery:
+    """Test orchestrator routing of streamed responses"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        orchestrator = AgentOrchestrator.__new__(AgentOrchestrator)
+        orchestrator.agents = {}
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_agent_chunks_are_forwarded_with_routing(self, orchestrator):
+        async def stream_chat(message, user_context, conversation_id=None):
+            yield {"type": "tool_start", "tools": ["get_organization_profile"]}
+            yield {"type": "content", "content": "Boost"}
+            yield {"type": "content", "content": " Mobile"}
+            yield {"type": "metadata", "content": "Boost Mobile", "conversation_id": "c1"}
+
+        agent = MagicMock()
+        agent.stream_chat = stream_chat
+        orchestrator.agents[AgentType.TALENT] = agent
+
+        chunks = await collect(orchestrator.stream_query("who?", {}, preferred_agent=AgentType.TALENT))
+
+        assert [chunk["type"] for chunk in chunks] == ["tool_start", "content", "content", "metadata"]
+        assert content_of(chunks) == chunks[-1]["content"]
+        assert chunks[-1]["routing"] == {
+            "strategy": RoutingStrategy.SINGLE_AGENT,
+            "primary_agent": "talent",
+            "agents_used": ["talent"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_agent_failure_is_a_processing_error(self, orchestrator):
+        async def stream_chat(message, user_context, conversation_id=None):
+            yield {"type": "content", "content": "Boost"}
+            raise AIProcessingError("graph failed")
+
+        agent = MagicMock()
+        agent.stream_chat = stream_chat
+        orchestrator.agents[AgentType.SALES] = agent
+
+        stream = orchestrator.stream_query("who?", {}, preferred_agent=AgentType.SALES)
+        assert (await stream.__anext__())["content"] == "Boost"
+        with pytest.raises(AIProcessingError, match="graph failed"):
+            await stream.__anext__()
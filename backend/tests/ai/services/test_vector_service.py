@@ -0,0 +1,146 @@
+"""
+Tests for vector search service embedding generation and caching.
+"""
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.ai.services.vector_service import VectorSearchService, VectorType
+
+
+class FakePipeline:
+    """Minimal Redis pipeline recording SETEX calls."""
+    
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+    
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+    
+    async def execute(self):
+        for key, value in self.commands:
+            self.store[key] = value
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+    
+    def __init__(self):
+        self.store = {}
+        self.mget_calls = 0
+        self.pipelines = []
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+    
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+    
+    def pipeline(self, transaction=True):
+        pipe = FakePipeline(self.store)
+        self.pipelines.append(pipe)
+        return pipe
+
+
+class TestBatchEmbeddings:
+    """Test batched embedding generation."""
+    
+    @pytest.fixture
+    def redis_client(self):
+        return FakeRedis()
+    
+    @pytest.fixture
+    def llm_router(self):
+        router = MagicMock()
+        router.get_embeddings = AsyncMock(
+            side_effect=lambda texts: [[float(len(text)), 0.0, 1.0] for text in texts]
+        )
+        return router
+    
+    @pytest.fixture
+    def vector_service(self, llm_router, redis_client):
+        config = MagicMock()
+        config.embedding_dimension = 3
+        config.redis_key_prefix = "test:"
+        return VectorSearchService(config, llm_router, MagicMock(), redis_client)
+    
+    @pytest.mark.asyncio
+    async def test_batch_sends_single_request_for_misses(self, vector_service, llm_router, redis_client):
+        """Test that a batch embeds all unique misses in one request."""
+        results = await vector_service.batch_generate_embeddings(
+            ["alpha", "be", "alpha"], VectorType.PERSON_BIO
+        )
+        
+        assert results == [[5.0, 0.0, 1.0], [2.0, 0.0, 1.0], [5.0, 0.0, 1.0]]
+        llm_router.get_embeddings.assert_awaited_once_with(["alpha", "be"])
+        assert redis_client.mget_calls == 1
+        assert len(redis_client.pipelines) == 1
+        assert len(redis_client.store) == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_only_embeds_cache_misses(self, vector_service, llm_router):
+        """Test that cached texts are served from the MGET lookup."""
+        await vector_service.batch_generate_embeddings(["alpha"], VectorType.QUERY)
+        results = await vector_service.batch_generate_embeddings(["alpha", "gamma!"], VectorType.QUERY)
+        
+        assert results[1] == [6.0, 0.0, 1.0]
+        assert llm_router.get_embeddings.await_args_list[-1].args == (["gamma!"],)
+        assert vector_service.embedding_stats["cache_hits"] == 1
+        assert vector_service.embedding_stats["total_generated"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_returns_none(self, vector_service, llm_router):
+        """Test that empty texts and failed requests yield None."""
+        llm_router.get_embeddings.side_effect = Exception("API Error")
+        
+        results = await vector_service.batch_generate_embeddings(["alpha", ""], VectorType.QUERY)
+        
+        assert results == [None, None]
+
+
+class TestVectorCacheEncoding:
+    """Test the binary vector cache format."""
+    
+    @pytest.fixture
+    def vector_service(self):
+        config = MagicMock()
+        config.embedding_dimension = 4
+        config.redis_key_prefix = "test:"
+        return VectorSearchService(config, MagicMock(), MagicMock(), FakeRedis())
+    
+    def test_binary_round_trip(self, vector_service):
+        """Test that vectors survive encoding as float32 bytes."""
+        embedding = [0.5, -1.25, 3.0, 0.0]
+        
+        encoded = vector_service._encode_cached_vector(embedding)
+        
+        assert isinstance(encoded, bytes)
+        assert len(encoded) == 9 + 4 * len(embedding)
+        assert vector_service._decode_cached_vector(encoded) == embedding
+    
+    def test_binary_decode_returns_float32_values(self, vector_service):
+        """Test that binary entries decode to a list at float32 precision."""
+        encoded = vector_service._encode_cached_vector([0.1, 2.0, 3.0, 4.0])
+        
+        decoded = vector_service._decode_cached_vector(encoded)
+        
+        assert isinstance(decoded, list)
+        assert decoded[0] == float(np.float32(0.1)) != 0.1
+    
+    def test_legacy_json_entries_still_decode(self, vector_service):
+        """Test that JSON cache entries from the previous format are readable."""
+        legacy = b'{"embedding": [0.5, 1.5], "vector_type": "query"}'
+        
+        assert vector_service._decode_cached_vector(legacy) == [0.5, 1.5]
+    
+    def test_truncated_entry_rejected(self, vector_service):
+        """Test that a corrupted binary entry raises instead of misreading."""
+        encoded = vector_service._encode_cached_vector([1.0, 2.0, 3.0, 4.0])
+        
+        with pytest.raises(Exception):
+            vector_service._decode_cached_vector(encoded[:-2])
@@ -5,8 +5,9 @@ import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import asyncio
 
-from app.ai.llm.router import LLMRouter, QueryComplexity
-from app.ai.config import LLMProvider
+from app.ai.llm.router import LLMRouter, QueryComplexity, ResponseContentCleaner, clean_response_content
+from app.ai.config import AIConfig, LLMProvider
+from app.core.exceptions import AIProcessingError
 
 
 class TestLLMRouter:
@@ -215,4 +216,81 @@ class TestQueryComplexity:
         """Test complexity enumeration values."""
         assert QueryComplexity.SIMPLE == "simple"
         assert QueryComplexity.MODERATE == "moderate"
-        assert QueryComplexity.COMPLEX == "complex"
\ No newline at end of file
+        assert QueryComplexity.COMPLEX == "complex"
+
+
+class TestEmbeddings:
+    """Test embedding requests and their dimension checks."""
+    
+    @pytest.fixture
+    def embedding_router(self):
+        """Create a router with a mocked OpenAI embeddings client."""
+        router = LLMRouter(AIConfig(openai_api_key="sk-test", embedding_dimension=1536))
+        router.embedding_client = MagicMock()
+        router.embedding_client.embeddings.create = AsyncMock()
+        return router
+    
+    @staticmethod
+    def embeddings_response(*vectors):
+        items = [MagicMock(index=index, embedding=vector) for index, vector in enumerate(vectors)]
+        return MagicMock(data=list(reversed(items)))
+    
+    @pytest.mark.asyncio
+    async def test_batch_uses_openai_embedding_model(self, embedding_router):
+        """Test one request per batch, results in input order."""
+        create = embedding_router.embedding_client.embeddings.create
+        create.return_value = self.embeddings_response([0.1] * 1536, [0.2] * 1536)
+        
+        embeddings = await embedding_router.get_embeddings(["alpha", "beta"])
+        
+        create.assert_awaited_once_with(model="text-embedding-3-small", input=["alpha", "beta"])
+        assert [vector[0] for vector in embeddings] == [0.1, 0.2]
+    
+    @pytest.mark.asyncio
+    async def test_wrong_dimension_is_rejected(self, embedding_router):
+        """Test that vectors the indexes cannot hold are an error."""
+        embedding_router.embedding_client.embeddings.create.return_value = self.embeddings_response([0.1] * 768)
+        
+        with pytest.raises(AIProcessingError, match="dimension mismatch"):
+            await embedding_router.get_embedding("alpha")
+        
+        stats = embedding_router.get_provider_stats()["openai"]
+        assert (stats["requests"], stats["failures"]) == (1, 1)
+    
+    def test_config_rejects_model_dimension_mismatch(self):
+        """Test the startup check of the embedding model against the indexes."""
+        with pytest.raises(ValueError, match="3072-dimensional"):
+            AIConfig(openai_embedding_model="text-embedding-3-large", embedding_dimension=1536)
+        
+        assert AIConfig(openai_embedding_model="text-embedding-3-large", embedding_dimension=3072)
+
+
+class TestResponseContentCleaner:
+    """Test response formatting, whole and streamed."""
+    
+    RESPONSE = "\n 1. Summary: two leads  \n\n\n\n- Boost Mobile\n  * Netflix \t\n\n2.No header: x\nDone.  \n\n"
+    
+    def test_clean_response_content(self):
+        """Test headers, bullets, spacing and idempotence."""
+        cleaned = clean_response_content(self.RESPONSE)
+        
+        assert cleaned == "**Summary:** two leads\n\n• Boost Mobile\n  • Netflix \t\n\n2.No header: x\nDone."
+        assert clean_response_content(cleaned) == cleaned
+    
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13])
+    def test_streamed_tokens_match_whole_response(self, size):
+        """Test that cleaned tokens add up to the cleaned response."""
+        cleaner = ResponseContentCleaner()
+        tokens = [self.RESPONSE[i:i + size] for i in range(0, len(self.RESPONSE), size)]
+        
+        streamed = "".join(cleaner.feed(token) for token in tokens) + cleaner.flush()
+        
+        assert streamed == clean_response_content(self.RESPONSE)
+    
+    def test_line_start_is_held_until_known(self):
+        """Test that a possible header or bullet waits for the next token."""
+        cleaner = ResponseContentCleaner()
+        
+        assert cleaner.feed("Intro\n- ") == "Intro"
+        assert cleaner.feed("item  ") == "\n• item"
+        assert cleaner.flush() == ""
@@ -305,7 +305,7 @@ class MockFolkClient:
 def mock_neo4j_client():
     """Mock Neo4j client for testing"""
     client = AsyncMock()
-    client.execute_query = AsyncMock()
+    client.execute_read = AsyncMock()
     return client
 
 
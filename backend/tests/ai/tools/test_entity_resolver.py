@@ -0,0 +1,150 @@
+"""
+Tests for the in-memory entity name resolver and the search tools using it.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.ai.tools import entity_resolver as resolver_module
+from app.ai.tools import universal_vector_search as search_module
+from app.ai.tools.entity_resolver import (
+    EntityResolver,
+    start_entity_resolver_refresh,
+    stop_entity_resolver_refresh
+)
+from app.ai.tools.graph_queries import ENTITIES_BY_ID, ENTITY_NAMES
+from database.neo4j_client import QueryResult
+
+ENTITIES = [
+    ("Organization", "org-boost", ["Boost Mobile"]),
+    ("Project", "proj-boost", ["Boost Mobile Treatment"]),
+    ("Organization", "org-netflix", ["Netflix", "NFLX"]),
+    ("Organization", "org-mcd", ["McDonald's"]),
+    ("Person", "person-courtney", ["Courtney Phillips", "courtney_phillips"]),
+    ("Person", "person-other-courtney", ["Courtney Phillips"]),
+    ("Project", "proj-the", ["The"]),
+    ("Deal", "deal-nike", [None, "Nike Q4 Campaign"])
+]
+
+
+def query_result(records, success=True):
+    return QueryResult(records=records, summary={}, execution_time=0.0, query="", parameters={},
+                       success=success, error=None if success else "unavailable")
+
+
+@pytest.fixture
+def resolver():
+    resolver = EntityResolver(refresh_seconds=60)
+    resolver.load(ENTITIES)
+    return resolver
+
+
+def resolved(resolver, text, **kwargs):
+    return [(m.element_id, m.score) for m in resolver.resolve(text, **kwargs)]
+
+
+class TestEntityResolver:
+    """Test name matching against the in-memory index"""
+
+    def test_names_are_found_in_order_and_longest_name_wins(self, resolver):
+        assert resolved(resolver, "Who wrote the Boost Mobile treatment for Netflix?") == [
+            ("proj-boost", 1.0), ("org-netflix", 1.0)
+        ]
+        assert resolved(resolver, "boost mobile") == [("org-boost", 1.0)]
+
+    def test_aliases_and_shared_names(self, resolver):
+        matches = resolver.resolve("projects with nflx and Courtney Phillips")
+
+        assert [m.element_id for m in matches] == ["org-netflix", "person-courtney", "person-other-courtney"]
+        assert matches[1].name == "Courtney Phillips" and matches[1].matched_text == "courtney phillips"
+
+    def test_misspelled_and_possessive_words(self, resolver):
+        matches = resolver.resolve("netflx and McDonalds or Nike Q4 campaign's budget")
+
+        assert [(m.element_id, m.fuzzy) for m in matches] == [
+            ("org-netflix", True), ("org-mcd", True), ("deal-nike", False)
+        ]
+        assert matches[0].score == 0.8
+        assert resolved(resolver, "netflx", min_score=0.9) == []
+
+    def test_common_words_and_type_filter(self, resolver):
+        assert resolved(resolver, "the") == []
+        assert resolved(resolver, "Boost Mobile and Netflix", entity_types=["Project"]) == []
+        assert resolver.get_status()["entities"] == len(ENTITIES)
+
+    @pytest.mark.asyncio
+    async def test_refresh_loads_every_label_or_keeps_the_index(self, resolver):
+        rows = {
+            ENTITY_NAMES["Person"]: [{"element_id": "p1", "names": ["Jane Doe"]}],
+            ENTITY_NAMES["Organization"]: [{"element_id": "o1", "names": ["Acme Films", "Acme"]}]
+        }
+        client = MagicMock()
+        client.execute_read = AsyncMock(side_effect=lambda query: query_result(rows.get(query, [])))
+
+        assert await resolver.refresh(client) is True
+        assert client.execute_read.await_count == len(ENTITY_NAMES)
+        assert resolved(resolver, "acme and jane doe") == [("o1", 1.0), ("p1", 1.0)]
+
+        client.execute_read = AsyncMock(return_value=query_result([], success=False))
+        assert await resolver.refresh(client) is False
+        assert resolved(resolver, "acme") == [("o1", 1.0)]
+        assert resolver.get_status()["last_error"] == "Person: unavailable"
+
+
+class TestRefreshTask:
+    """Test the shared refresh task of the orchestrator and the tool dependencies"""
+
+    @pytest.mark.asyncio
+    async def test_task_runs_until_every_owner_stopped_it(self):
+        resolver = MagicMock(refresh=AsyncMock(return_value=True), refresh_seconds=0.01)
+        orchestrator_client, tools_client = MagicMock(), MagicMock()
+
+        with patch.object(resolver_module, "_entity_resolver", resolver):
+            task = start_entity_resolver_refresh(orchestrator_client)
+            assert start_entity_resolver_refresh(tools_client) is task
+
+            # The orchestrator cleans up first: the tools keep their resolver
+            await stop_entity_resolver_refresh(orchestrator_client)
+            resolver.refresh.reset_mock()
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            assert {call.args[0] for call in resolver.refresh.await_args_list} == {tools_client}
+
+            await stop_entity_resolver_refresh(tools_client)
+            assert task.cancelled()
+
+        assert resolver_module._refresh_task is None
+        assert resolver_module._refresh_clients == []
+
+
+class TestUniversalSearch:
+    """Test that universal search looks resolved entities up by id"""
+
+    @pytest.mark.asyncio
+    async def test_resolved_entities_are_fetched_by_id(self, resolver):
+        client = MagicMock()
+        client.execute_read = AsyncMock(side_effect=lambda query, parameters: query_result([
+            {"element_id": "org-netflix", "entity": {"id": "Netflix"}, "labels": ["Organization"]},
+            {"element_id": "person-courtney", "entity": {"id": "Courtney Phillips"}, "labels": ["Person"]}
+        ] if query == ENTITIES_BY_ID else []))
+
+        with patch.object(search_module, "get_entity_resolver", return_value=resolver):
+            result = await search_module.universal_vector_search("courtney phillips netflix", client)
+
+        lookups = [call.args[1] for call in client.execute_read.call_args_list if call.args[0] == ENTITIES_BY_ID]
+        assert lookups == [{"element_ids": ["person-courtney", "person-other-courtney", "org-netflix"]}]
+        assert result["found"] is True and result["total_results"] == 2
+        assert result["people"][0]["entity"] == {"id": "Courtney Phillips"}
+        assert result["organizations"][0]["matched_text"] == "netflix"
+
+    @pytest.mark.asyncio
+    async def test_nothing_named_means_no_lookup(self, resolver):
+        client = MagicMock()
+        client.execute_read = AsyncMock(return_value=query_result([]))
+
+        with patch.object(search_module, "get_entity_resolver", return_value=resolver):
+            result = await search_module.universal_vector_search("what happened last week", client)
+
+        assert ENTITIES_BY_ID not in [call.args[0] for call in client.execute_read.call_args_list]
+        assert result["found"] is False
@@ -0,0 +1,72 @@
+"""
+Tests for the graph tool query catalogue and its full-text entity lookups.
+"""
+
+import re
+import pytest
+
+from app.ai.tools.graph_queries import (
+    ORGANIZATION_NAME_FIELDS,
+    fulltext_search,
+    keyword_search,
+    organization_search,
+    person_search
+)
+from database.query_registry import get_query_registry
+
+
+class TestFulltextSearch:
+    """Test the Lucene queries built for entity names"""
+
+    def test_phrase_and_prefix_clauses_per_field(self):
+        search = organization_search("Boost Mobile")
+
+        clauses = '"boost mobile"^4 OR (boost* AND mobile*)^2'
+        assert search == f"name:({clauses}) OR id:({clauses})"
+        assert ORGANIZATION_NAME_FIELDS == ("name", "id")
+
+    def test_names_are_never_matched_fuzzily(self):
+        # Only the best match is kept, so "Jon Smyth" must not resolve to "John Smith"
+        search = fulltext_search("Jon Smyth", ["name"])
+
+        assert search == 'name:("jon smyth"^4 OR (jon* AND smyth*)^2)'
+        assert "~" not in search
+
+    def test_lucene_syntax_is_dropped(self):
+        search = person_search('Nike" OR name:* AND -(x)^9 \\ O\'Brien')
+
+        terms = re.findall(r'"([^"]*)"\^4', search)
+        assert set(terms) == {"nike or name and x 9 o'brien"}
+        assert "name:*" not in search and "\\" not in search and "-(" not in search
+
+    def test_empty_names_are_rejected(self):
+        with pytest.raises(ValueError):
+            fulltext_search("  ?! ", ["name"])
+
+    def test_keyword_search_matches_any_word(self):
+        assert keyword_search("Who wrote the Boost Mobile treatment?") == (
+            '"wrote boost mobile treatment"^4 OR wrote~1 OR boost~1 OR mobile~1 OR treatment~1'
+        )
+        assert keyword_search("TV ads") == '"tv ads"^4 OR tv OR ads'
+
+        with pytest.raises(ValueError):
+            keyword_search("who was the")
+
+
+class TestLookupQueries:
+    """Test that tool lookups seek the full-text indexes"""
+
+    def test_entity_names_are_never_scanned_with_contains(self):
+        import app.ai.tools.graph_queries  # noqa: F401
+
+        registry = get_query_registry()
+        scans = re.compile(r"\.(name|fullName|id)\)? CONTAINS (toLower\()?\$")
+
+        for name in registry.names():
+            if name.startswith("tools.") and name not in ("tools.treatment_writers_for_term",
+                                                          "tools.projects_by_criteria"):
+                assert not scans.search(registry.get(name).cypher), name
+
+        person = registry.get("tools.person_details").cypher
+        assert "db.index.fulltext.queryNodes('person_fulltext_index', $name)" in person
+        assert "ORDER BY score DESC" in person
@@ -48,7 +48,7 @@ class TestGraphQueryTools:
         """Test successful person details retrieval"""
         
         # Setup mock response
-        mock_neo4j_client.execute_query.return_value = create_person_query_result("john_smith")
+        mock_neo4j_client.execute_read.return_value = create_person_query_result("john_smith")
         
         # Execute test
         result = await graph_tools.get_person_details("John Smith")
@@ -61,8 +61,8 @@ class TestGraphQueryTools:
         assert "projects" in result
         
         # Verify query was called
-        mock_neo4j_client.execute_query.assert_called_once()
-        call_args = mock_neo4j_client.execute_query.call_args[0][0]
+        mock_neo4j_client.execute_read.assert_called_once()
+        call_args = mock_neo4j_client.execute_read.call_args[0][0]
         assert "MATCH (p:Person" in call_args
         assert "John Smith" in call_args
     
@@ -71,7 +71,7 @@ class TestGraphQueryTools:
         """Test person not found scenario"""
         
         # Setup mock response
-        mock_neo4j_client.execute_query.return_value = create_empty_query_result()
+        mock_neo4j_client.execute_read.return_value = create_empty_query_result()
         
         # Execute test
         result = await graph_tools.get_person_details("Nonexistent Person")
@@ -103,7 +103,7 @@ class TestGraphQueryTools:
         assert result["name"] == "John Smith"
         
         # Verify Neo4j was not called
-        mock_neo4j_client.execute_query.assert_not_called()
+        mock_neo4j_client.execute_read.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_find_people_at_organization(self, graph_tools, mock_neo4j_client):
@@ -111,7 +111,7 @@ class TestGraphQueryTools:
         
         # Setup mock response
         org_result = create_organization_query_result("nike")
-        mock_neo4j_client.execute_query.return_value = org_result
+        mock_neo4j_client.execute_read.return_value = org_result
         
         # Execute test
         result = await graph_tools.find_people_at_organization("Nike")
@@ -132,7 +132,7 @@ class TestGraphQueryTools:
         """Test successful project details retrieval"""
         
         # Setup mock response
-        mock_neo4j_client.execute_query.return_value = create_project_query_result("nike_campaign_2024")
+        mock_neo4j_client.execute_read.return_value = create_project_query_result("nike_campaign_2024")
         
         # Execute test
         result = await graph_tools.get_project_details("Nike Air Max Campaign 2024")
@@ -159,7 +159,7 @@ class TestGraphQueryTools:
             "total_vendor_cost": 40000,
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(vendor_data)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(vendor_data)
         
         # Execute test
         result = await graph_tools.get_project_vendors("Nike Air Max Campaign 2024")
@@ -191,7 +191,7 @@ class TestGraphQueryTools:
             ],
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(concept_projects)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(concept_projects)
         
         # Execute test
         result = await graph_tools.find_projects_by_concept("Cinematic Style")
@@ -215,7 +215,7 @@ class TestGraphQueryTools:
             "related_concepts": ["Documentary Approach", "High-end Production"],
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(concept_projects)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(concept_projects)
         
         # Execute test
         result = await graph_tools.find_projects_by_concept("Cinematic Style", include_related=True)
@@ -242,7 +242,7 @@ class TestGraphQueryTools:
             "sourced_date": "2024-01-15",
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(deal_data)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(deal_data)
         
         # Execute test
         result = await graph_tools.get_deal_sourcer("Nike Q4 Campaign Deal")
@@ -265,7 +265,7 @@ class TestGraphQueryTools:
             "status": "won",  # Cached status
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(deal_data)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(deal_data)
         
         # Execute test
         result = await graph_tools.get_deal_details_with_live_status("Nike Q4 Campaign Deal")
@@ -300,7 +300,7 @@ class TestGraphQueryTools:
             ],
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(contributor_data)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(contributor_data)
         
         # Execute test
         result = await graph_tools.find_contributors_on_client_projects("Director", "Nike")
@@ -334,7 +334,7 @@ class TestGraphQueryTools:
             "search_query": "creative brief nike",
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(document_results)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(document_results)
         
         # Execute test
         result = await graph_tools.search_documents_full_text("creative brief nike")
@@ -363,7 +363,7 @@ class TestGraphQueryTools:
             "document_count": 1,
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(project_docs)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(project_docs)
         
         # Execute test
         result = await graph_tools.find_documents_for_project("Nike Air Max Campaign 2024")
@@ -390,7 +390,7 @@ class TestGraphQueryTools:
             },
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(doc_profile)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(doc_profile)
         
         # Execute test
         result = await graph_tools.get_document_profile_details("test_doc_001")
@@ -412,7 +412,7 @@ class TestGraphQueryTools:
         """Test handling Neo4j connection errors"""
         
         # Setup mock to raise exception
-        mock_neo4j_client.execute_query.side_effect = Exception("Connection failed")
+        mock_neo4j_client.execute_read.side_effect = Exception("Connection failed")
         
         # Execute test
         result = await graph_tools.get_person_details("John Smith")
@@ -430,7 +430,7 @@ class TestGraphQueryTools:
         mock_redis_client.get = AsyncMock(side_effect=Exception("Redis connection failed"))
         
         # Setup Neo4j success response
-        mock_neo4j_client.execute_query.return_value = create_person_query_result("john_smith")
+        mock_neo4j_client.execute_read.return_value = create_person_query_result("john_smith")
         
         # Execute test
         result = await graph_tools.get_person_details("John Smith")
@@ -440,7 +440,7 @@ class TestGraphQueryTools:
         assert result["name"] == "John Smith"
         
         # Verify Neo4j was called despite Redis error
-        mock_neo4j_client.execute_query.assert_called_once()
+        mock_neo4j_client.execute_read.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_folk_api_error_graceful_fallback(self, graph_tools, mock_neo4j_client, mock_folk_client):
@@ -453,7 +453,7 @@ class TestGraphQueryTools:
             "status": "won",
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(deal_data)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(deal_data)
         
         # Setup Folk API to fail
         mock_folk_client.get_deal_status = AsyncMock(side_effect=Exception("Folk API error"))
@@ -483,7 +483,7 @@ class TestGraphQueryTools:
             await asyncio.sleep(0.01)  # 10ms delay
             return create_person_query_result("john_smith")
         
-        mock_neo4j_client.execute_query.side_effect = slow_query
+        mock_neo4j_client.execute_read.side_effect = slow_query
         
         # Execute test with timing
         start_time = time.time()
@@ -510,7 +510,7 @@ class TestGraphQueryTools:
             await asyncio.sleep(0.02)  # 20ms delay
             return create_person_query_result("john_smith")
         
-        mock_neo4j_client.execute_query.side_effect = slow_neo4j_query
+        mock_neo4j_client.execute_read.side_effect = slow_neo4j_query
         
         # First query (uncached) - should be slower
         start_time = time.time()
@@ -528,7 +528,7 @@ class TestGraphQueryTools:
         assert second_query_time < first_query_time  # Cached should be faster
         
         # Verify Neo4j was called only once
-        assert mock_neo4j_client.execute_query.call_count == 1
+        assert mock_neo4j_client.execute_read.call_count == 1
     
     
     # ================================================================================
@@ -546,7 +546,7 @@ class TestGraphQueryTools:
             "title": "Director of Photography",
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(person_data)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(person_data)
         
         # Execute test
         result = await graph_tools.get_person_details("John Smith")
@@ -557,7 +557,7 @@ class TestGraphQueryTools:
         assert result["folkId"] == "folk_person_123"
         
         # Verify Neo4j was queried
-        mock_neo4j_client.execute_query.assert_called_once()
+        mock_neo4j_client.execute_read.assert_called_once()
     
     @pytest.mark.asyncio 
     async def test_complex_multi_hop_query(self, graph_tools, mock_neo4j_client):
@@ -576,7 +576,7 @@ class TestGraphQueryTools:
             ],
             "found": True
         }]
-        mock_neo4j_client.execute_query.return_value = MockNeo4jResult(complex_result)
+        mock_neo4j_client.execute_read.return_value = MockNeo4jResult(complex_result)
         
         # Execute complex query through contributor search
         result = await graph_tools.find_contributors_on_client_projects("Director", "Nike")
@@ -586,7 +586,7 @@ class TestGraphQueryTools:
         assert "contributors" in result
         
         # Verify appropriate Cypher query was generated
-        call_args = mock_neo4j_client.execute_query.call_args[0][0]
+        call_args = mock_neo4j_client.execute_read.call_args[0][0]
         assert "MATCH" in call_args
         assert "-[:" in call_args  # Should contain relationship patterns
 
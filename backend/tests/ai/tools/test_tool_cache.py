@@ -0,0 +1,551 @@
+"""
+Tests for the two-tier tool cache (in-process L1 + Redis L2).
+"""
+
+import json
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.ai.tools import local_cache
+from app.ai.tools.local_cache import LocalCache, apply_invalidation
+from app.ai.tools.cache import CachedEntry, SingleFlight, ToolCache, cached_tool, coalesced_tool
+
+
+class FakePipeline:
+    """Redis pipeline stand-in that replays queued commands on FakeRedis"""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    def __getattr__(self, command):
+        def queue(*args):
+            self.commands.append((command, args))
+        return queue
+    
+    async def execute(self):
+        self.redis.pipelines += 1
+        results = []
+        for command, args in self.commands:
+            results.append(await getattr(self.redis, command)(*args))
+        return results
+
+
+class FakeRedis:
+    """In-memory async Redis stand-in"""
+    
+    def __init__(self):
+        self.store = {}
+        self.sets = {}
+        self.zsets = {}
+        self.ttls = {}
+        self.get_calls = 0
+        self.pipelines = 0
+        self.published = []
+    
+    async def get(self, key):
+        self.get_calls += 1
+        return self.store.get(key)
+    
+    async def ttl(self, key):
+        return self.ttls.get(key, -2)
+    
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+    
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+    
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+    
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+    
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+    
+    async def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        expired = [member for member, score in zset.items() if float(low) <= score <= float(high)]
+        for member in expired:
+            del zset[member]
+        return len(expired)
+    
+    async def zrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        return [member for member, score in sorted(zset.items(), key=lambda item: item[1])
+                if float(low) <= score <= float(high)]
+    
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            found = [self.store.pop(key, None), self.sets.pop(key, None), self.zsets.pop(key, None)]
+            if any(value is not None for value in found):
+                removed += 1
+        return removed
+    
+    async def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+    
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture(autouse=True)
+def l1_enabled():
+    """L1 caches only while an invalidation listener is subscribed; act as if one is"""
+    local_cache.resume_local_caches()
+    yield
+    local_cache.suspend_local_caches()
+
+
+@pytest.fixture
+def redis():
+    """Patch the tool cache onto a fresh FakeRedis with an empty L1"""
+    fake = FakeRedis()
+    
+    @asynccontextmanager
+    async def fake_context():
+        yield fake
+    
+    ToolCache._local_cache.clear()
+    with patch("app.ai.tools.cache.get_redis_context", fake_context):
+        yield fake
+    ToolCache._local_cache.clear()
+
+
+class TestLocalCache:
+    """Test the bounded in-process LRU cache"""
+    
+    def test_hit_and_miss_stats(self):
+        cache = LocalCache("test")
+        cache.set("a", {"value": 1}, ttl=60)
+        
+        assert cache.get("a") == {"value": 1}
+        assert cache.get("b") is None
+        
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+    
+    def test_entries_expire(self):
+        cache = LocalCache("test")
+        
+        with patch("app.ai.tools.local_cache.time.monotonic", return_value=1000.0):
+            cache.set("a", {"value": 1}, ttl=10)
+        with patch("app.ai.tools.local_cache.time.monotonic", return_value=1011.0):
+            assert cache.get("a") is None
+        
+        assert cache.get_stats()["expirations"] == 1
+        assert cache.get_stats()["entries"] == 0
+    
+    def test_lru_eviction_by_count(self):
+        cache = LocalCache("test", max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_memory_cap(self):
+        cache = LocalCache("test", max_bytes=100)
+        cache.set("a", "x", ttl=60, size=60)
+        cache.set("b", "y", ttl=60, size=60)
+        
+        assert cache.get("a") is None
+        assert cache.get_stats()["bytes"] == 60
+        assert cache.set("huge", "z", ttl=60, size=500) is False
+    
+    def test_pattern_invalidation_across_caches(self):
+        first = LocalCache("first")
+        second = LocalCache("second")
+        first.set("tool:get_person:1", 1, ttl=60)
+        second.set("tool:get_person:2", 2, ttl=60)
+        second.set("tool:get_project:3", 3, ttl=60)
+        
+        removed = apply_invalidation(pattern="tool:get_person:*")
+        
+        assert removed == 2
+        assert second.get("tool:get_project:3") == 3
+
+
+class FakePubSub:
+    """Redis pub/sub stand-in that delivers messages, then fails or waits"""
+    
+    def __init__(self, messages, error=None):
+        self.messages = messages
+        self.error = error
+        self.closed = False
+    
+    async def subscribe(self, channel):
+        pass
+    
+    async def listen(self):
+        for data in self.messages:
+            yield {"type": "message", "data": data}
+        if self.error:
+            raise self.error
+        await asyncio.Event().wait()
+    
+    async def unsubscribe(self, channel):
+        pass
+    
+    async def close(self):
+        self.closed = True
+
+
+def pubsub_client(*pubsubs):
+    redis_client = MagicMock()
+    redis_client.pubsub = MagicMock(side_effect=list(pubsubs))
+    return redis_client
+
+
+async def wait_until(condition):
+    for _ in range(50):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class TestInvalidationListener:
+    """Test that pub/sub listeners survive Redis errors and keep L1 honest"""
+    
+    @pytest.mark.asyncio
+    async def test_listener_resubscribes_and_suspends_l1_while_disconnected(self):
+        cache = LocalCache("listener")
+        cache.set("before", 1, ttl=60)
+        pubsubs = [FakePubSub(["a"], ConnectionError("connection reset")), FakePubSub(["b"])]
+        redis_client = pubsub_client(*pubsubs)
+        handled, events = [], []
+        
+        async def handle(data):
+            handled.append(data)
+        
+        def on_disconnect():
+            local_cache.suspend_local_caches()
+            events.append(("disconnect", cache.get("before"), cache.set("during", 2, ttl=60)))
+        
+        def on_connect():
+            local_cache.resume_local_caches()
+            events.append("connect")
+        
+        task = asyncio.create_task(local_cache.listen_with_reconnect(
+            lambda: redis_client, "channel", handle, on_connect, on_disconnect, min_backoff=0
+        ))
+        await wait_until(lambda: len(handled) == 2)
+        assert cache.set("connected", 3, ttl=60) is True
+        
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        assert handled == ["a", "b"]
+        # Cancelling the listener counts as a disconnect too
+        assert events == ["connect", ("disconnect", None, False), "connect", ("disconnect", None, False)]
+        assert pubsubs[0].closed
+    
+    @pytest.mark.asyncio
+    async def test_l1_caches_only_while_the_shared_listener_runs(self):
+        local_cache.suspend_local_caches()
+        cache = LocalCache("shared")
+        assert cache.set("a", 1, ttl=60) is False
+        
+        listener = local_cache.SharedListener(
+            "channel",
+            AsyncMock(),
+            on_connect=local_cache.resume_local_caches,
+            on_disconnect=local_cache.suspend_local_caches
+        )
+        orchestrator_redis = pubsub_client()
+        # Subscribes through the newest owner's client
+        tools_redis = pubsub_client(FakePubSub([]))
+        
+        task = listener.start(orchestrator_redis)
+        assert listener.start(tools_redis) is task
+        await wait_until(lambda: cache.set("a", 1, ttl=60))
+        
+        # One owner leaving keeps the listener (and L1) for the other
+        await listener.stop(tools_redis)
+        assert not task.done()
+        assert cache.get("a") == 1
+        
+        await listener.stop(orchestrator_redis)
+        assert task.done()
+        assert cache.get("a") is None
+        assert cache.set("b", 2, ttl=60) is False
+
+
+class TestToolCacheTiers:
+    """Test ToolCache L1/L2 interaction"""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_stays_in_process(self, redis):
+        await ToolCache.set("get_organization_profile", {"name": "Nike"}, organization_name="Nike")
+        ToolCache._local_cache.clear()
+        
+        first = await ToolCache.get("get_organization_profile", organization_name="Nike")
+        second = await ToolCache.get("get_organization_profile", organization_name="Nike")
+        
+        assert first == second == {"name": "Nike"}
+        assert redis.get_calls == 1
+    
+    @pytest.mark.asyncio
+    async def test_l1_uses_category_ttl(self, redis):
+        await ToolCache.set("get_deal_status", {"stage": "won"}, deal_id="1")
+        
+        key = ToolCache.generate_cache_key("get_deal_status", deal_id="1")
+        ttl = ToolCache.DEFAULT_TTLS["deal"]
+        assert redis.ttls[key] == ttl + ToolCache.get_stale_ttl(ttl)
+        assert ToolCache._local_cache.get(key).value == {"stage": "won"}
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_l1_and_publishes(self, redis):
+        await ToolCache.set("get_person_details", {"name": "Jane"}, name="Jane")
+        
+        await ToolCache.invalidate("get_person_details", name="Jane")
+        
+        assert await ToolCache.get("get_person_details", name="Jane") is None
+        channel, message = redis.published[-1]
+        assert channel == local_cache.INVALIDATION_CHANNEL
+        assert message["origin"] == local_cache.PROCESS_ID
+
+
+class TestSingleFlight:
+    """Test coalescing of identical concurrent tool calls"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_execution(self, redis):
+        calls = []
+        release = asyncio.Event()
+        
+        @cached_tool()
+        async def get_person_details(name: str):
+            calls.append(name)
+            await release.wait()
+            return {"name": name}
+        
+        pending = [asyncio.create_task(get_person_details(name="Jane")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+        
+        assert calls == ["Jane"]
+        assert all(result == {"name": "Jane"} for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_different_arguments_are_not_coalesced(self, redis):
+        calls = []
+        
+        @coalesced_tool("get_person_details")
+        async def get_person_details(name: str):
+            calls.append(name)
+            await asyncio.sleep(0)
+            return {"name": name}
+        
+        await asyncio.gather(get_person_details(name="Jane"), get_person_details(name="John"))
+        
+        assert sorted(calls) == ["Jane", "John"]
+    
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_every_caller(self):
+        flights = SingleFlight()
+        
+        async def failing():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+        
+        results = await asyncio.gather(
+            flights.do("key", failing), flights.do("key", failing), return_exceptions=True
+        )
+        
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flights.stats == {"executions": 1, "coalesced": 1}
+        assert flights.in_flight() == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+        
+        async def slow():
+            await release.wait()
+            return "done"
+        
+        first = asyncio.create_task(flights.do("key", slow))
+        second = asyncio.create_task(flights.do("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        
+        assert await second == "done"
+
+
+class TestStaleWhileRevalidate:
+    """Test stale serving and early refresh"""
+    
+    @staticmethod
+    def expire(tool_name, **kwargs):
+        """Age an L1 entry past its fresh TTL"""
+        key = ToolCache.generate_cache_key(tool_name, **kwargs)
+        ToolCache._local_cache.get(key).fresh_until = 0
+    
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self, redis):
+        versions = iter(["v1", "v2"])
+        
+        @cached_tool(ttl=60)
+        async def get_organization_profile(organization_name: str):
+            return {"name": organization_name, "version": next(versions)}
+        
+        assert (await get_organization_profile(organization_name="Nike"))["version"] == "v1"
+        self.expire("get_organization_profile", organization_name="Nike")
+        
+        stale = await get_organization_profile(organization_name="Nike")
+        await asyncio.gather(*ToolCache._refresh_tasks)
+        refreshed = await get_organization_profile(organization_name="Nike")
+        
+        assert stale["version"] == "v1"
+        assert refreshed["version"] == "v2"
+    
+    @pytest.mark.asyncio
+    async def test_plain_get_ignores_stale_entries(self, redis):
+        await ToolCache.set("get_person_details", {"name": "Jane"}, name="Jane")
+        self.expire("get_person_details", name="Jane")
+        
+        assert await ToolCache.get("get_person_details", name="Jane") is None
+        assert (await ToolCache.get_entry("get_person_details", name="Jane")).value == {"name": "Jane"}
+    
+    def test_early_refresh_probability(self):
+        entry = CachedEntry(value={}, fresh_until=1000.0, compute_time=2.0)
+        
+        with patch("app.ai.tools.cache.time.time", return_value=990.0):
+            # -2 * log(1 - 0.999) ~= 13.8s ahead of now, past expiry
+            with patch("app.ai.tools.cache.random.random", return_value=0.999):
+                assert entry.should_refresh()
+            # -2 * log(1 - 0.5) ~= 1.4s ahead of now, before expiry
+            with patch("app.ai.tools.cache.random.random", return_value=0.5):
+                assert not entry.should_refresh()
+    
+    def test_legacy_entries_decode_as_fresh(self):
+        entry = CachedEntry.from_json(json.dumps({"name": "Nike"}), remaining_ttl=120)
+        
+        assert entry.value == {"name": "Nike"}
+        assert not entry.is_stale
+
+
+class TestTagInvalidation:
+    """Test tag-set based invalidation"""
+    
+    def test_tags_from_params_and_result(self):
+        tags = ToolCache.extract_tags(
+            "get_person_details",
+            {"name": "Jane Doe"},
+            {"person": {"name": "Jane Doe", "folkId": "per_1"}, "organization": "Nike"}
+        )
+        
+        assert tags[0] == "tool:get_person_details"
+        assert {"person:jane doe", "folk:per_1", "organization:nike"} <= set(tags)
+    
+    @pytest.mark.asyncio
+    async def test_entity_invalidation_deletes_only_tagged_keys(self, redis):
+        await ToolCache.set("get_organization_profile", {"organization": {"name": "Nike"}}, org_name="Nike")
+        await ToolCache.set("get_person_details", {"person": {"name": "Jane"}, "organization": "Nike"}, name="Jane")
+        await ToolCache.set("get_person_details", {"person": {"name": "John"}, "organization": "Adidas"}, name="John")
+        
+        count = await ToolCache.invalidate_entity("organization", "Nike")
+        
+        assert count == 2
+        assert await ToolCache.get("get_organization_profile", org_name="Nike") is None
+        assert await ToolCache.get("get_person_details", name="Jane") is None
+        assert await ToolCache.get("get_person_details", name="John") is not None
+        assert "tooltag:organization:nike" not in redis.zsets
+    
+    @pytest.mark.asyncio
+    async def test_invalidations_are_batched(self, redis):
+        for i in range(5):
+            await ToolCache.set("get_person_details", {"person": {"name": f"P{i}"}}, name=f"P{i}", tags=["group:crew"])
+        
+        pipelines_before = redis.pipelines
+        with patch.object(ToolCache, "INVALIDATION_BATCH_SIZE", 2):
+            assert await ToolCache.invalidate_tags(["group:crew"]) == 5
+        
+        # One pipeline to read the tag set, one for all the batched deletes
+        assert redis.pipelines - pipelines_before == 2
+    
+    @pytest.mark.asyncio
+    async def test_pattern_invalidation_uses_tool_tags(self, redis):
+        await ToolCache.set("get_person_details", {"person": {"name": "Jane"}}, name="Jane")
+        await ToolCache.set("get_organization_profile", {"organization": {"name": "Nike"}}, org_name="Nike")
+        
+        assert await ToolCache.invalidate_pattern("tool:get_person_*") == 1
+        assert await ToolCache.get("get_organization_profile", org_name="Nike") is not None
+        
+        assert await ToolCache.invalidate_pattern("tool:*") == 1
+        assert "tooltag:tool:get_organization_profile" not in redis.zsets
+
+
+    @pytest.mark.asyncio
+    async def test_expired_members_are_pruned_on_write(self, redis):
+        with patch("app.ai.tools.cache.time.time", return_value=1000.0):
+            await ToolCache.set("get_person_details", {"person": {"name": "Jane"}}, ttl=10, name="Jane",
+                                tags=["group:crew"])
+        with patch("app.ai.tools.cache.time.time", return_value=2000.0):
+            await ToolCache.set("get_person_details", {"person": {"name": "John"}}, ttl=10, name="John",
+                                tags=["group:crew"])
+            
+            # Jane's entry expired at 1015; only John is left in the tag set
+            assert list(redis.zsets["tooltag:group:crew"]) == [
+                ToolCache.generate_cache_key("get_person_details", name="John")
+            ]
+            assert await ToolCache.invalidate_tags(["group:crew"]) == 1
+
+
+class TestFolkChangeInvalidation:
+    """Test cache eviction for entities modified by Folk ingestion"""
+    
+    @pytest.mark.asyncio
+    async def test_changed_entities_evict_dependent_entries(self, redis):
+        from app.ai.tools.folk_changes import apply_folk_changes
+        from tools.folk_ingestion.change_events import FolkChange
+        
+        await ToolCache.set(
+            "get_organization_profile",
+            {"organization": {"name": "Nike", "folkId": "org_1"}},
+            org_name="Nike"
+        )
+        await ToolCache.set("get_person_details", {"person": {"name": "Jane", "folkId": "per_1"}}, name="Jane")
+        await ToolCache.set("get_person_details", {"person": {"name": "John", "folkId": "per_2"}}, name="John")
+        
+        # A deal linked to Nike changed; Jane was renamed. The ingestion
+        # process passes its own client instead of the tool dependencies'
+        with patch("app.ai.tools.cache.get_redis_context", side_effect=RuntimeError("no API redis")):
+            count = await apply_folk_changes([
+                FolkChange("deal", "deal_1", "Big Deal", ["org_1"]),
+                FolkChange("person", "per_1", "Jane Smith")
+            ], redis_client=redis)
+        
+        assert count == 2
+        assert "tooltag:folk:org_1" not in redis.zsets
+        
+        # Workers only receive the keys to drop from their L1
+        channel, message = redis.published[-1]
+        assert channel == local_cache.INVALIDATION_CHANNEL
+        assert sorted(message["keys"]) == sorted([
+            ToolCache.generate_cache_key("get_organization_profile", org_name="Nike"),
+            ToolCache.generate_cache_key("get_person_details", name="Jane")
+        ])
+        assert await ToolCache.get("get_organization_profile", org_name="Nike") is None
+        assert await ToolCache.get("get_person_details", name="Jane") is None
+        assert await ToolCache.get("get_person_details", name="John") is not None
@@ -0,0 +1,131 @@
+"""
+Tests for hybrid retrieval in universal_vector_search.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.ai.tools import universal_vector_search as search_module
+from app.ai.tools.entity_resolver import EntityResolver
+from app.ai.tools.graph_queries import FULLTEXT_CANDIDATES, VECTOR_CANDIDATES
+from app.ai.tools.universal_vector_search import (
+    FULLTEXT_INDEXES,
+    RRF_K,
+    VECTOR_INDEXES,
+    reciprocal_rank_fusion,
+    universal_vector_search
+)
+from database.neo4j_client import QueryResult
+
+
+def query_result(records, success=True):
+    return QueryResult(records=records, summary={}, execution_time=0.0, query="", parameters={},
+                       success=success, error=None if success else "unavailable")
+
+
+def row(element_id, label):
+    return {"element_id": element_id, "entity": {"id": element_id}, "labels": [label]}
+
+
+def ranked(source, *element_ids):
+    return [(element_id, {"type": "Person", "entity": {"id": element_id}, "source": source})
+            for element_id in element_ids]
+
+
+def index_client(rows_by_index, failing=()):
+    """A client answering candidate queries from rows per index name"""
+    client = MagicMock()
+    client.execute_read = AsyncMock(side_effect=lambda query, parameters: query_result(
+        rows_by_index.get(parameters["index_name"], []),
+        success=parameters["index_name"] not in failing
+    ))
+    return client
+
+
+@pytest.fixture(autouse=True)
+def unloaded_resolver():
+    with patch.object(search_module, "get_entity_resolver", return_value=EntityResolver(refresh_seconds=60)):
+        yield
+
+
+class TestReciprocalRankFusion:
+    """Test merging ranked lists"""
+
+    def test_agreement_outranks_a_single_top_rank(self):
+        fused = reciprocal_rank_fusion([ranked("a", "x", "y"), ranked("b", "y", "z")])
+
+        assert [entry["element_id"] for entry in fused] == ["y", "x", "z"]
+        assert fused[0]["ranks"] == {"a": 2, "b": 1}
+        assert "source" not in fused[0]
+
+    def test_scores_are_normalized(self):
+        fused = reciprocal_rank_fusion([ranked("a", "x", "y"), ranked("b", "x")])
+
+        assert fused[0]["score"] == 1.0
+        assert fused[1]["score"] == round((1 / (RRF_K + 2)) / (2 / (RRF_K + 1)), 4)
+
+
+class TestHybridSearch:
+    """Test the searches run and how their results are combined"""
+
+    @pytest.mark.asyncio
+    async def test_query_is_embedded_once_and_every_index_searched(self):
+        router = MagicMock()
+        router.get_embedding = AsyncMock(return_value=[0.1, 0.2])
+        client = index_client({
+            "person_bio_vector": [row("p1", "Person"), row("p2", "Person")],
+            "person_fulltext_index": [row("p2", "Person"), row("p3", "Person")],
+            "organization_fulltext_index": [row("o1", "Organization")]
+        })
+
+        result = await universal_vector_search("boost mobile treatment writer", client,
+                                               similarity_threshold=0.6, llm_router=router)
+
+        router.get_embedding.assert_awaited_once_with("boost mobile treatment writer")
+        calls = [call.args for call in client.execute_read.call_args_list]
+        vector_calls = [parameters for query, parameters in calls if query == VECTOR_CANDIDATES]
+        fulltext_calls = [parameters for query, parameters in calls if query == FULLTEXT_CANDIDATES]
+        assert sorted(p["index_name"] for p in vector_calls) == sorted(VECTOR_INDEXES)
+        assert sorted(p["index_name"] for p in fulltext_calls) == sorted(FULLTEXT_INDEXES)
+        assert all(p["vector"] == [0.1, 0.2] and p["threshold"] == 0.6 for p in vector_calls)
+
+        assert [person["element_id"] for person in result["people"]] == ["p2", "p1", "p3"]
+        assert result["organizations"][0]["entity"] == {"id": "o1"}
+        assert result["total_results"] == 4
+
+    @pytest.mark.asyncio
+    async def test_results_are_capped_per_type_and_in_total(self):
+        client = index_client({
+            "person_fulltext_index": [row(f"p{i}", "Person") for i in range(8)],
+            "project_fulltext_index": [row(f"j{i}", "Project") for i in range(8)],
+            "concept_fulltext_index": [row("c1", "CreativeConcept")]
+        })
+
+        result = await universal_vector_search("commercial director", client, max_results=6, llm_router=None)
+
+        assert len(result["people"]) == 3 and len(result["projects"]) == 3
+        assert result["total_results"] == 6
+
+        result = await universal_vector_search("commercial director", client, max_results=6, max_per_type=2)
+        assert [len(result[group]) for group in ("people", "projects", "organizations")] == [2, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_failed_embedding_and_indexes_are_skipped(self):
+        router = MagicMock()
+        router.get_embedding = AsyncMock(side_effect=RuntimeError("no embedding model"))
+        client = index_client({"person_fulltext_index": [row("p1", "Person")]},
+                              failing=("document_fulltext_index",))
+
+        result = await universal_vector_search("netflix", client, llm_router=router)
+
+        assert all(call.args[0] == FULLTEXT_CANDIDATES for call in client.execute_read.call_args_list)
+        assert result["found"] is True and result["people"][0]["ranks"] == {"fulltext:person_fulltext_index": 1}
+
+    @pytest.mark.asyncio
+    async def test_common_words_only_run_no_full_text_search(self):
+        client = index_client({})
+
+        result = await universal_vector_search("who was the", client, llm_router=None)
+
+        client.execute_read.assert_not_awaited()
+        assert result["found"] is False
@@ -0,0 +1,105 @@
+"""
+Tests for forwarding streamed agent responses over the AI WebSocket.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.api.ai import websocket
+from app.core.exceptions import AIProcessingError
+
+
+@pytest.fixture
+def manager():
+    manager = MagicMock()
+    manager.send_personal_message = AsyncMock()
+    with patch.object(websocket, "manager", manager):
+        yield manager
+
+
+def orchestrator_streaming(stream_query):
+    orchestrator = MagicMock()
+    orchestrator.stream_query = stream_query
+    return patch.object(websocket, "orchestrator", orchestrator)
+
+
+def sent(manager):
+    return [call.args[0] for call in manager.send_personal_message.call_args_list]
+
+
+class TestStreamAgentResponse:
+    """Test stream_agent_response message order, result and failures"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_sent_in_order_and_the_final_chunk_returned(self, manager):
+        async def stream_query(**kwargs):
+            yield {"type": "tool_start", "tools": ["get_person_details"], "conversation_id": "c1"}
+            yield {"type": "tool_end", "tools": ["get_person_details"], "success": True, "conversation_id": "c1"}
+            yield {"type": "content", "content": "Courtney", "conversation_id": "c1"}
+            yield {"type": "content", "content": " Phillips", "conversation_id": "c1"}
+            yield {"type": "metadata", "content": "Courtney Phillips", "conversation_id": "c1", "routing": {}}
+
+        with orchestrator_streaming(stream_query):
+            response = await websocket.stream_agent_response("conn-1", "who?", {}, chunk_type="stream_chunk")
+
+        messages = sent(manager)
+        assert [(m["type"], m.get("event") or m.get("content")) for m in messages] == [
+            ("tool_progress", "tool_start"),
+            ("tool_progress", "tool_end"),
+            ("stream_chunk", "Courtney"),
+            ("stream_chunk", " Phillips")
+        ]
+        assert all(call.args[1] == "conn-1" for call in manager.send_personal_message.call_args_list)
+        assert "".join(m["content"] for m in messages if m["type"] == "stream_chunk") == response["content"]
+
+    @pytest.mark.asyncio
+    async def test_replacing_chunk_is_forwarded_with_its_flag(self, manager):
+        async def stream_query(**kwargs):
+            yield {"type": "content", "content": "Jane is a", "conversation_id": "c1"}
+            yield {"type": "content", "content": "Summary", "replace": True, "conversation_id": "c1"}
+            yield {"type": "metadata", "content": "Summary", "conversation_id": "c1", "routing": {}}
+
+        with orchestrator_streaming(stream_query):
+            await websocket.stream_agent_response("conn-1", "who?", {})
+
+        assert [(m["content"], m["replace"]) for m in sent(manager)] == [("Jane is a", False), ("Summary", True)]
+
+    @pytest.mark.asyncio
+    async def test_stream_without_a_final_chunk_is_an_error(self, manager):
+        async def stream_query(**kwargs):
+            yield {"type": "content", "content": "Partial", "conversation_id": "c1"}
+
+        with orchestrator_streaming(stream_query), pytest.raises(AIProcessingError):
+            await websocket.stream_agent_response("conn-1", "who?", {})
+
+        assert [m["content"] for m in sent(manager)] == ["Partial"]
+
+    @pytest.mark.asyncio
+    async def test_cancelling_closes_the_agent_stream(self, manager):
+        closed = asyncio.Event()
+        sending = asyncio.Event()
+
+        async def stalled_send(message, connection_id):
+            sending.set()
+            await asyncio.Event().wait()  # slow client
+
+        manager.send_personal_message.side_effect = stalled_send
+
+        async def stream_query(**kwargs):
+            try:
+                yield {"type": "content", "content": "Partial", "conversation_id": "c1"}
+                yield {"type": "content", "content": "never sent", "conversation_id": "c1"}
+            finally:
+                closed.set()
+
+        with orchestrator_streaming(stream_query):
+            task = asyncio.create_task(websocket.stream_agent_response("conn-1", "who?", {}))
+            await asyncio.wait_for(sending.wait(), timeout=1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        # Closed as the task unwinds, not whenever the generator is collected
+        assert closed.is_set()
+        assert [m["content"] for m in sent(manager)] == ["Partial"]
@@ -0,0 +1 @@
+# Database module tests
\ No newline at end of file
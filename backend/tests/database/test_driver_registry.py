@@ -0,0 +1,148 @@
+"""
+Tests for the process-wide Neo4j driver registry and its pool metrics.
+"""
+
+import asyncio
+import pytest
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from database.driver_registry import DriverRegistry, PoolSettings
+
+
+def fake_driver(connections=None, acquire_delay=0.0):
+    driver = MagicMock()
+    driver.close = AsyncMock()
+
+    async def acquire(*args, **kwargs):
+        await asyncio.sleep(acquire_delay)
+        return SimpleNamespace(in_use=True)
+
+    driver._pool = SimpleNamespace(acquire=acquire, connections=connections or {})
+    return driver
+
+
+@pytest.fixture
+def registry():
+    return DriverRegistry(PoolSettings(max_connection_pool_size=20, connection_acquisition_timeout=5.0))
+
+
+class TestDriverSharing:
+    """Test that clients share one reference-counted driver"""
+
+    @pytest.mark.asyncio
+    async def test_same_server_and_credentials_share_a_driver(self, registry):
+        with patch("database.driver_registry.AsyncGraphDatabase.driver",
+                   side_effect=lambda *a, **kw: fake_driver()) as create:
+            first = registry.acquire("neo4j://db:7687", ("neo4j", "secret"))
+            second = registry.acquire("neo4j://db:7687", ("neo4j", "secret"), max_connection_pool_size=5)
+            other = registry.acquire("neo4j://db:7687", ("reader", "secret"))
+
+        assert first is second
+        assert other is not first
+        assert create.call_count == 2
+        assert create.call_args_list[0].kwargs["max_connection_pool_size"] == 20
+        assert create.call_args_list[0].kwargs["connection_acquisition_timeout"] == 5.0
+
+        await registry.release(first)
+        first.close.assert_not_awaited()
+
+        await registry.release(second)
+        first.close.assert_awaited_once()
+        assert registry.get_pool_metrics()["drivers"] == 1
+
+        await registry.close_all()
+        other.close.assert_awaited_once()
+        assert registry.get_pool_metrics()["drivers"] == 0
+
+    @pytest.mark.parametrize("uri, first, second", [
+        ("neo4j+s://db:7687", True, None),  # database client vs. AI graph client
+        ("neo4j://db:7687", True, None),  # NEO4J_ENCRYPTED defaults to true
+        ("bolt://db:7687", False, False)
+    ])
+    def test_encryption_spellings_and_passwords_share_a_driver(self, registry, monkeypatch, uri, first, second):
+        monkeypatch.delenv("NEO4J_ENCRYPTED", raising=False)
+        with patch("database.driver_registry.AsyncGraphDatabase.driver",
+                   side_effect=lambda *a, **kw: fake_driver()) as create:
+            driver = registry.acquire(uri, ("neo4j", "secret"), encrypted=first)
+            shared = registry.acquire(uri, ("neo4j", "rotated"), encrypted=second)
+
+        assert shared is driver
+        assert create.call_count == 1
+        if "+s" in uri:
+            assert "encrypted" not in create.call_args.kwargs
+        else:
+            assert create.call_args.kwargs["encrypted"] is first
+
+    def test_encrypted_and_plain_connections_do_not_share(self, registry):
+        with patch("database.driver_registry.AsyncGraphDatabase.driver",
+                   side_effect=lambda *a, **kw: fake_driver()):
+            encrypted = registry.acquire("neo4j://db:7687", ("neo4j", "secret"), encrypted=True)
+            plain = registry.acquire("neo4j://db:7687", ("neo4j", "secret"), encrypted=False)
+
+        assert plain is not encrypted
+
+    @pytest.mark.asyncio
+    async def test_unknown_driver_is_closed_on_release(self, registry):
+        driver = fake_driver()
+
+        await registry.release(driver)
+
+        driver.close.assert_awaited_once()
+
+    def test_configure_rejects_unknown_settings(self, registry):
+        registry.configure(max_connection_pool_size=50)
+        assert registry.settings.max_connection_pool_size == 50
+
+        with pytest.raises(ValueError):
+            registry.configure(pool_size=50)
+
+
+class TestPoolMetrics:
+    """Test connection and acquisition metrics"""
+
+    @pytest.mark.asyncio
+    async def test_reports_connections_and_acquisition_waits(self, registry):
+        connections = {"db:7687": deque([SimpleNamespace(in_use=True), SimpleNamespace(in_use=False),
+                                          SimpleNamespace(in_use=False)])}
+        with patch("database.driver_registry.AsyncGraphDatabase.driver",
+                   return_value=fake_driver(connections, acquire_delay=0.01)):
+            driver = registry.acquire("neo4j://db:7687", ("neo4j", "secret"))
+
+        for _ in range(3):
+            await driver._pool.acquire()
+
+        metrics = registry.get_pool_metrics(driver)
+        assert (metrics["in_use"], metrics["idle"], metrics["clients"]) == (1, 2, 1)
+        assert metrics["max_pool_size"] == 20
+        assert metrics["acquisitions"] == 3
+        assert metrics["wait_ms"]["p95"] >= 10
+
+        totals = registry.get_pool_metrics()
+        assert (totals["drivers"], totals["in_use"], totals["idle"], totals["max_connections"]) == (1, 1, 2, 20)
+
+    @pytest.mark.asyncio
+    async def test_failed_acquisitions_are_counted(self, registry):
+        driver = fake_driver()
+        driver._pool.acquire = AsyncMock(side_effect=TimeoutError("pool exhausted"))
+        with patch("database.driver_registry.AsyncGraphDatabase.driver", return_value=driver):
+            registry.acquire("neo4j://db:7687", ("neo4j", "secret"))
+
+        with pytest.raises(TimeoutError):
+            await driver._pool.acquire()
+
+        metrics = registry.get_pool_metrics(driver)
+        assert (metrics["acquisitions"], metrics["failures"]) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_unknown_driver_versions_are_not_instrumented(self, registry):
+        driver = fake_driver({"db:7687": deque([SimpleNamespace(in_use=True)])})
+        acquire = driver._pool.acquire
+        with patch("database.driver_registry.neo4j.__version__", "6.0.0"), \
+             patch("database.driver_registry.AsyncGraphDatabase.driver", return_value=driver):
+            registry.acquire("neo4j://db:7687", ("neo4j", "secret"))
+            metrics = registry.get_pool_metrics(driver)
+
+        assert driver._pool.acquire is acquire
+        assert (metrics["in_use"], metrics["idle"], metrics["acquisitions"]) == (None, None, 0)
@@ -0,0 +1,218 @@
+"""
+Tests for the production Neo4j client.
+"""
+
+import itertools
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from neo4j import SummaryCounters
+from neo4j.exceptions import ClientError, TransientError
+
+from database.neo4j_client import ConnectionConfig, ConnectionState, Neo4jClient
+
+
+class FakeResult:
+    """Driver result over a (possibly endless) row source, counting pulled records"""
+
+    def __init__(self, rows, statistics=None):
+        self.rows = rows
+        self.statistics = statistics or {}
+        self.pulled = 0
+        self.consumed = False
+
+    def __aiter__(self):
+        return self._records()
+
+    async def _records(self):
+        for row in self.rows:
+            self.pulled += 1
+            record = MagicMock()
+            record.data.return_value = row
+            yield record
+
+    async def consume(self):
+        self.consumed = True
+        summary = MagicMock(query_type="r", result_available_after=1, result_consumed_after=2)
+        summary.counters = SummaryCounters(self.statistics)
+        return summary
+
+
+class FakeSession:
+    def __init__(self, result):
+        self.result = result
+        self.closed = False
+        self.query = None
+
+    async def run(self, query, parameters=None):
+        self.query = query
+        return self.result
+
+    async def close(self):
+        self.closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def execute_read(self, work):
+        return await self._retry("READ", work)
+
+    async def execute_write(self, work):
+        return await self._retry("WRITE", work)
+
+    async def _retry(self, access_mode, work, attempts=3):
+        # Stand-in for the driver's retry loop: the session is the transaction
+        self.access_mode = access_mode
+        for attempt in range(attempts):
+            try:
+                return await work(self)
+            except TransientError:
+                if attempt == attempts - 1:
+                    raise
+
+
+def make_client(rows, **config):
+    client = Neo4jClient(ConnectionConfig(uri="neo4j://localhost:7687", username="neo4j", password="test", **config))
+    session = FakeSession(FakeResult(rows))
+    client.driver = MagicMock()
+    client.driver.session.return_value = session
+    client.state = ConnectionState.CONNECTED
+    client._last_health_check = time.time()
+    return client, session
+
+
+def endless_rows():
+    return ({"n": i} for i in itertools.count())
+
+
+class TestStreamQuery:
+    """Test streaming query results"""
+
+    @pytest.mark.asyncio
+    async def test_records_are_streamed_and_summarized(self):
+        client, session = make_client([{"n": 1}, {"n": 2}, {"n": 3}], stream_fetch_size=2)
+
+        async with client.stream_query("MATCH (n) RETURN n", {"x": 1}, timeout=5) as stream:
+            records = [record async for record in stream]
+
+        assert records == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert stream.records_streamed == 3 and not stream.truncated
+        assert stream.summary["query_type"] == "r"
+        assert session.query.timeout == 5
+        client.driver.session.assert_called_once_with(database="neo4j", fetch_size=2)
+        assert session.closed
+        assert client.get_connection_status()["performance_metrics"]["records_streamed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_early_exit_stops_pulling_and_discards_the_rest(self):
+        client, session = make_client(endless_rows())
+
+        async with client.stream_query("MATCH (n) RETURN n") as stream:
+            async for record in stream:
+                if record["n"] == 9:
+                    break
+
+        assert session.result.pulled == 10
+        assert session.result.consumed and session.closed
+        assert stream.records_streamed == 10
+
+    @pytest.mark.asyncio
+    async def test_result_is_capped(self):
+        client, session = make_client(endless_rows(), stream_max_records=100)
+
+        records = [record async for record in client.stream_query("MATCH (n) RETURN n", max_records=25)]
+
+        assert len(records) == 25
+        assert session.closed
+
+        capped_by_default = client.stream_query("MATCH (n) RETURN n")
+        assert capped_by_default.max_records == 100
+
+    @pytest.mark.asyncio
+    async def test_failures_are_raised(self):
+        client, session = make_client([])
+        session.run = MagicMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            async with client.stream_query("MATCH (n) RETURN n") as stream:
+                async for _ in stream:
+                    pass
+
+        assert "boom" in stream.error
+        assert session.closed
+        assert client.get_connection_status()["performance_metrics"]["errors"] == 1
+
+
+class TestManagedTransactions:
+    """Test execute_read/execute_write"""
+
+    @pytest.mark.asyncio
+    async def test_reads_use_a_read_transaction(self):
+        client, session = make_client([{"n": 1}, {"n": 2}], max_transaction_retry_time=5.0)
+
+        result = await client.execute_read("MATCH (n) RETURN n", {"x": 1})
+
+        assert result.success
+        assert result.records == [{"n": 1}, {"n": 2}]
+        assert session.access_mode == "READ" and session.closed
+        client.driver.session.assert_called_once_with(
+            database="neo4j", default_access_mode="READ", max_transaction_retry_time=5.0
+        )
+        metrics = client.get_connection_status()["performance_metrics"]
+        assert (metrics["read_transactions"], metrics["write_transactions"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_write_counters_come_from_the_driver_summary(self):
+        client, session = make_client([{"upserted": 2}])
+        session.result.statistics = {"nodes-created": 1, "relationships-created": 3, "properties-set": 7}
+
+        result = await client.execute_write("UNWIND $rows AS row MERGE (n:Node {id: row.id}) RETURN count(n)")
+
+        counters = result.summary["counters"]
+        assert (counters["nodes_created"], counters["relationships_created"], counters["properties_set"]) == (1, 3, 7)
+        assert counters["nodes_deleted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        client, session = make_client([{"n": 1}])
+        run = session.run
+        failures = [TransientError("leader switch")]
+
+        async def flaky_run(query, parameters=None):
+            if failures:
+                raise failures.pop()
+            return await run(query, parameters)
+
+        session.run = flaky_run
+
+        result = await client.execute_write("MERGE (n:Node {id: 1}) RETURN n")
+
+        assert result.success and result.summary["attempts"] == 2
+        assert session.access_mode == "WRITE"
+        assert client.get_connection_status()["performance_metrics"]["transaction_retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_return_a_failed_result(self):
+        client, session = make_client([])
+        session.run = MagicMock(side_effect=ClientError("syntax error"))
+
+        result = await client.execute_read("MATCH (n RETURN n")
+
+        assert not result.success
+        assert "syntax error" in result.error
+        assert client.get_connection_status()["performance_metrics"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_executions_are_reported_to_the_slow_query_log(self):
+        client, session = make_client([{"n": 1}])
+
+        with patch("database.neo4j_client.get_slow_query_log") as slow_query_log:
+            await client.execute_read("MATCH (n) RETURN n", {"x": 1})
+
+        driver, database, query, parameters, duration = slow_query_log.return_value.observe.call_args.args
+        assert (driver, database, query, parameters) == (client.driver, "neo4j", "MATCH (n) RETURN n", {"x": 1})
+        assert slow_query_log.return_value.observe.call_args.kwargs == {"access_mode": "READ", "records": 1}
@@ -0,0 +1,119 @@
+"""
+Tests for the Cypher query registry and its startup warm-up.
+"""
+
+import re
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from database.neo4j_client import QueryResult
+from database.query_registry import QueryRegistry, get_query_registry
+
+
+def query_result(success=True, notifications=None, error=None):
+    return QueryResult(
+        records=[],
+        summary={"notifications": notifications or []},
+        execution_time=0.0,
+        query="",
+        parameters={},
+        success=success,
+        error=error
+    )
+
+
+@pytest.fixture
+def registry():
+    return QueryRegistry()
+
+
+class TestRegistration:
+    """Test naming and registration rules"""
+
+    def test_register_returns_the_cypher(self, registry):
+        cypher = registry.register("people.by_name", "MATCH (p:Person {name: $name}) RETURN p", {"name": ""})
+
+        assert cypher == "MATCH (p:Person {name: $name}) RETURN p"
+        assert "people.by_name" in registry
+        assert registry.get("people.by_name").parameters == {"name": ""}
+        assert registry.get("people.by_name").access_mode == "READ"
+
+    def test_same_name_needs_the_same_cypher(self, registry):
+        registry.register("people.all", "MATCH (p:Person) RETURN p")
+        registry.register("people.all", "MATCH (p:Person) RETURN p")
+        assert len(registry) == 1
+
+        with pytest.raises(ValueError):
+            registry.register("people.all", "MATCH (p:Person) RETURN p.name")
+
+    def test_unknown_access_mode_and_name_are_rejected(self, registry):
+        with pytest.raises(ValueError):
+            registry.register("people.all", "MATCH (p:Person) RETURN p", access_mode="ADMIN")
+
+        with pytest.raises(KeyError):
+            registry.get("people.missing")
+
+
+class TestWarmUp:
+    """Test EXPLAIN warm-up and its report"""
+
+    @pytest.mark.asyncio
+    async def test_explains_each_query_in_its_transaction_kind(self, registry):
+        registry.register("people.by_name", "MATCH (p:Person {name: $name}) RETURN p", {"name": ""})
+        registry.register("people.rename", "MATCH (p:Person {name: $name}) SET p.name = $new_name",
+                          {"name": "", "new_name": ""}, access_mode="WRITE")
+        client = MagicMock()
+        client.execute_read = AsyncMock(return_value=query_result())
+        client.execute_write = AsyncMock(return_value=query_result())
+
+        report = await registry.warm_up(client)
+
+        client.execute_read.assert_awaited_once_with(
+            "EXPLAIN MATCH (p:Person {name: $name}) RETURN p", {"name": ""}
+        )
+        client.execute_write.assert_awaited_once_with(
+            "EXPLAIN MATCH (p:Person {name: $name}) SET p.name = $new_name", {"name": "", "new_name": ""}
+        )
+        assert (report["queries"], report["warmed"], report["failed"]) == (2, 2, {})
+        assert registry.get_status()["last_warm_up"] is report
+
+    @pytest.mark.asyncio
+    async def test_reports_failures_and_schema_warnings(self, registry):
+        registry.register("broken", "MATCH (p:Person RETURN p")
+        registry.register("unknown_label", "MATCH (p:Persn) RETURN p")
+        registry.register("fine", "MATCH (p:Person) RETURN p")
+        results = {
+            "EXPLAIN MATCH (p:Person RETURN p": query_result(success=False, error="Invalid input"),
+            "EXPLAIN MATCH (p:Persn) RETURN p": query_result(notifications=[
+                {"code": "Neo.ClientNotification.Statement.UnknownLabelWarning",
+                 "title": "The provided label is not in the database."}
+            ]),
+            "EXPLAIN MATCH (p:Person) RETURN p": query_result()
+        }
+        client = MagicMock()
+        client.execute_read = AsyncMock(side_effect=lambda query, parameters: results[query])
+
+        report = await registry.warm_up(client)
+
+        assert report["warmed"] == 2
+        assert report["failed"] == {"broken": "Invalid input"}
+        assert report["warnings"] == {"unknown_label": ["The provided label is not in the database."]}
+
+
+class TestRegisteredQueries:
+    """Test the queries the tools and services register"""
+
+    def test_sample_parameters_cover_every_parameter(self):
+        import app.ai.graph.connection  # noqa: F401
+        import app.ai.graph.queries  # noqa: F401
+        import app.ai.services.vector_service  # noqa: F401
+        import app.ai.tools.graph_queries  # noqa: F401
+
+        registry = get_query_registry()
+        assert len(registry) > 50
+
+        for name in registry.names():
+            query = registry.get(name)
+            used = set(re.findall(r"\$(\w+)", query.cypher))
+            assert used <= set(query.parameters), f"{name} has no sample for {used - set(query.parameters)}"
+            assert "NodeLabel." not in query.cypher and "RelationshipType." not in query.cypher, name
@@ -0,0 +1,105 @@
+"""
+Tests for the full-text index migration in SchemaManager.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from database.neo4j_client import QueryResult
+from database.schema_manager import SchemaManager
+
+
+def query_result(records=None, success=True, error=None):
+    return QueryResult(
+        records=records or [],
+        summary={},
+        execution_time=0.0,
+        query="",
+        parameters={},
+        success=success,
+        error=error
+    )
+
+
+def index_record(index):
+    return {"name": index.name, "labelsOrTypes": [index.node_label], "properties": list(index.properties)}
+
+
+def current_records():
+    return [index_record(index) for index in SchemaManager(MagicMock()).fulltext_indexes]
+
+
+def schema_manager(records):
+    client = MagicMock()
+    client.execute_query = AsyncMock(side_effect=lambda query, *args, **kwargs: (
+        query_result(records) if query.startswith("SHOW FULLTEXT INDEXES") else query_result()
+    ))
+    return SchemaManager(client), client
+
+
+def executed(client):
+    return [" ".join(call.args[0].split()) for call in client.execute_query.call_args_list[1:]]
+
+
+class TestEnsureFulltextIndexes:
+    """Test that only missing or changed full-text indexes are touched"""
+
+    @pytest.mark.asyncio
+    async def test_matching_indexes_are_left_alone(self):
+        records = current_records()
+        # Property order does not change a full-text index
+        records[0]["properties"] = list(reversed(records[0]["properties"]))
+        manager, client = schema_manager(records)
+
+        results = await manager.ensure_fulltext_indexes()
+
+        assert results["unchanged"] == len(manager.fulltext_indexes)
+        assert results["created"] == results["recreated"] == results["failed"] == 0
+        assert executed(client) == []
+
+    @pytest.mark.asyncio
+    async def test_changed_index_is_dropped_and_recreated(self):
+        records = current_records()
+        project = next(r for r in records if r["name"] == "project_fulltext_index")
+        project["properties"] = ["title", "description", "synopsis"]
+        manager, client = schema_manager(records)
+
+        results = await manager.ensure_fulltext_indexes()
+
+        assert results["recreated"] == 1
+        assert results["unchanged"] == len(manager.fulltext_indexes) - 1
+        statements = executed(client)
+        assert statements[0] == "DROP INDEX project_fulltext_index IF EXISTS"
+        assert statements[1].startswith("CREATE FULLTEXT INDEX project_fulltext_index IF NOT EXISTS FOR (n:Project)")
+        assert "n.name" in statements[1] and "n.id" in statements[1]
+        assert len(statements) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_indexes_are_created_without_drop(self):
+        manager, client = schema_manager([])
+
+        results = await manager.ensure_fulltext_indexes()
+
+        assert results["created"] == len(manager.fulltext_indexes)
+        assert not any(statement.startswith("DROP") for statement in executed(client))
+
+    @pytest.mark.asyncio
+    async def test_failed_drop_skips_create(self):
+        records = current_records()
+        records[0]["labelsOrTypes"] = ["Contact"]
+
+        def execute(query, *args, **kwargs):
+            if query.startswith("SHOW FULLTEXT INDEXES"):
+                return query_result(records)
+            if query.startswith("DROP"):
+                return query_result(success=False, error="permission denied")
+            return query_result()
+
+        manager, client = schema_manager(records)
+        client.execute_query = AsyncMock(side_effect=execute)
+
+        results = await manager.ensure_fulltext_indexes()
+
+        assert results["failed"] == 1
+        assert "permission denied" in results["errors"][0]
+        assert not any(statement.startswith("CREATE") for statement in executed(client))
@@ -0,0 +1,140 @@
+"""
+Tests for the Neo4j slow query log and its sampled PROFILE capture.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from database.query_registry import register_query
+from database.slow_query_log import SlowQueryLog, SlowQuerySettings, fingerprint_parameters
+
+PROFILE = {
+    "operatorType": "ProduceResults@neo4j",
+    "dbHits": 0,
+    "rows": 3,
+    "args": {"Details": "p"},
+    "children": [{
+        "operatorType": "NodeByLabelScan@neo4j",
+        "dbHits": 1200,
+        "rows": 3,
+        "args": {"Details": "p:Person", "EstimatedRows": 1000.0},
+        "children": []
+    }]
+}
+
+SLOW_READ = register_query(
+    "tests.slow_people", "MATCH (p:Person) WHERE p.name CONTAINS $name RETURN p", parameters={"name": ""}
+)
+
+
+def fake_driver(profile=PROFILE):
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    result = MagicMock()
+    result.consume = AsyncMock(return_value=SimpleNamespace(profile=profile))
+    session.run = AsyncMock(return_value=result)
+
+    driver = MagicMock()
+    driver.session.return_value = session
+    return driver, session
+
+
+def make_log(**settings):
+    return SlowQueryLog(SlowQuerySettings(**{"threshold_ms": 100, "profile_sample_rate": 1.0, **settings}))
+
+
+class TestFingerprints:
+    """Test parameter fingerprinting"""
+
+    def test_values_are_hashed_and_types_kept(self):
+        types, value_hash = fingerprint_parameters({"name": "Jane", "ids": [1, 2], "year": None})
+        same_types, other_hash = fingerprint_parameters({"name": "John", "ids": [3], "year": None})
+
+        assert types == same_types == {"ids": "list[int]", "name": "str", "year": "null"}
+        assert value_hash != other_hash
+        assert "Jane" not in value_hash
+
+
+class TestSlowQueryLog:
+    """Test logging, the ring buffer and PROFILE sampling"""
+
+    def test_fast_queries_are_not_logged(self):
+        log = make_log()
+
+        assert log.observe(None, "neo4j", SLOW_READ, {"name": "a"}, 0.05, access_mode="READ") is None
+        assert log.get_entries() == []
+
+    def test_ring_buffer_keeps_the_newest_entries(self):
+        log = make_log(capacity=3, profile_sample_rate=0)
+
+        for i in range(5):
+            log.observe(None, "neo4j", f"MATCH (n) RETURN n LIMIT {i}", None, 0.2 + i, access_mode="READ")
+
+        entries = log.get_entries()
+        assert [e["query"] for e in entries] == [f"MATCH (n) RETURN n LIMIT {i}" for i in (4, 3, 2)]
+        assert log.get_status()["slow_queries"] == 5
+
+        log.configure(capacity=2)
+        assert len(log.get_entries()) == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_reads_are_profiled_and_named(self):
+        log = make_log()
+        driver, session = fake_driver()
+
+        entry = log.observe(driver, "neo4j", SLOW_READ, {"name": "Jane"}, 0.5, access_mode="READ", records=3)
+        await log.wait_for_profiles()
+
+        assert entry.query_name == "tests.slow_people"
+        assert entry.parameter_types == {"name": "str"}
+        assert entry.profile_status == "captured"
+        assert entry.profile["total_db_hits"] == 1200
+        assert entry.profile["children"][0]["operator"] == "NodeByLabelScan@neo4j"
+        profiled = session.run.call_args.args
+        assert profiled[0].text == f"PROFILE {SLOW_READ}" and profiled[1] == {"name": "Jane"}
+        driver.session.assert_called_once_with(database="neo4j", default_access_mode="READ")
+
+        summary = log.get_summary()
+        assert summary[0]["query_name"] == "tests.slow_people"
+        assert (summary[0]["count"], summary[0]["max_db_hits"]) == (1, 1200)
+
+    @pytest.mark.asyncio
+    async def test_writes_are_never_profiled(self):
+        log = make_log()
+        driver, session = fake_driver()
+
+        write = log.observe(driver, "neo4j", "MERGE (p:Person {id: $id})", {"id": "1"}, 0.5, access_mode="WRITE")
+        unknown = log.observe(driver, "neo4j", "MATCH (p) DETACH DELETE p", None, 0.5)
+        await log.wait_for_profiles()
+
+        assert write.profile_status == unknown.profile_status == "skipped_write"
+        session.run.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_each_query_shape_is_profiled_once_per_interval(self):
+        log = make_log(profile_interval=300)
+        driver, session = fake_driver()
+
+        first = log.observe(driver, "neo4j", SLOW_READ, {"name": "a"}, 0.5)
+        second = log.observe(driver, "neo4j", SLOW_READ, {"name": "b"}, 0.5)
+        other_shape = log.observe(driver, "neo4j", SLOW_READ, {"name": None}, 0.5)
+        await log.wait_for_profiles()
+
+        assert (first.profile_status, second.profile_status, other_shape.profile_status) == (
+            "captured", "not_sampled", "captured"
+        )
+        assert session.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_profile_failures_are_recorded(self):
+        log = make_log()
+        driver, session = fake_driver()
+        session.run = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        entry = log.observe(driver, "neo4j", SLOW_READ, {"name": "a"}, 0.5, access_mode="READ")
+        await log.wait_for_profiles()
+
+        assert entry.profile_status == "failed: timeout"
+        assert log.get_status()["profiles_failed"] == 1
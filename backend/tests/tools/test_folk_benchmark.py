@@ -0,0 +1,118 @@
+"""
+Tests for the Folk ingestion benchmark harness and its fake Folk API.
+"""
+
+import pytest
+
+from tools.folk_ingestion.benchmark import (
+    BenchmarkScenario,
+    CountingNeo4jClient,
+    FakeFolkAPI,
+    run_benchmark
+)
+from tools.folk_ingestion.folk_client import FolkClient, FolkRateLimitError
+
+
+def make_client(fake_api, max_retries=3):
+    return FolkClient(
+        api_key="benchmark-test",
+        base_url=fake_api.base_url,
+        rate_limit=600000,
+        max_retries=max_retries,
+        transport=fake_api.transport()
+    )
+
+
+class TestFakeFolkAPI:
+    """Test the fake API's data generation, pagination and 429s"""
+
+    @pytest.mark.asyncio
+    async def test_listings_are_paginated_with_cursors(self):
+        fake_api = FakeFolkAPI(BenchmarkScenario(people=250, companies=0, groups=0, custom_objects=0))
+
+        async with make_client(fake_api) as client:
+            pages = [page async for page in client.iter_people_pages(100)]
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert [page.cursor for page in pages] == [None, "100", "200"]
+        assert len({record["id"] for page in pages for record in page}) == 250
+
+    @pytest.mark.asyncio
+    async def test_custom_objects_are_spread_over_listings_and_discoverable(self):
+        scenario = BenchmarkScenario(people=10, groups=2, custom_objects=9, entity_types=("Deals", "Projects"))
+        fake_api = FakeFolkAPI(scenario)
+
+        async with make_client(fake_api) as client:
+            people = await client.get_all_people_paginated()
+            listings = {
+                listing: await client.get_all_custom_objects_paginated(*listing)
+                for listing in scenario.listings
+            }
+
+        assert sum(len(objects) for objects in listings.values()) == 9
+        assert {
+            (group_id, entity_type) for group_id, entity_types in
+            client.discover_entity_types_from_data(people, []).items() for entity_type in entity_types
+        } == set(scenario.listings)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_requests_succeed_on_retry(self):
+        fake_api = FakeFolkAPI(BenchmarkScenario(people=300, rate_limit_every=2))
+
+        async with make_client(fake_api) as client:
+            people = await client.get_all_people_paginated()
+
+        assert len(people) == 300
+        assert fake_api.stats["rate_limited"] > 0
+        assert client.get_stats()["rate_limited_count"] == fake_api.stats["rate_limited"]
+
+    @pytest.mark.asyncio
+    async def test_retries_are_exhausted_when_every_request_is_limited(self):
+        fake_api = FakeFolkAPI(BenchmarkScenario(rate_limit_every=1))
+        fake_api._throttled = set()  # never serve the retry
+
+        async with make_client(fake_api, max_retries=1) as client:
+            with pytest.raises(FolkRateLimitError):
+                await client.get_user_profile()
+
+
+class TestBenchmark:
+    """Test a full benchmark run"""
+
+    @pytest.mark.asyncio
+    async def test_run_reports_throughput_memory_and_statements(self):
+        scenario = BenchmarkScenario(
+            people=120, companies=30, groups=2, custom_objects=40, rate_limit_every=7
+        )
+
+        result = await run_benchmark(scenario)
+        report = result.to_dict()
+
+        assert result.stats.people_processed == 120
+        assert result.stats.companies_processed == 30
+        assert result.stats.custom_objects_processed == 40
+        assert result.records == scenario.total_records
+        assert report["errors"] == 0
+        assert report["records_per_second"] > 0
+        assert report["memory"]["peak_rss_mb"] >= report["memory"]["rss_before_mb"]
+        assert report["api"]["rate_limited"] > 0
+        assert result.stats.api_rate_limited == report["api"]["rate_limited"]
+
+        # Acknowledged writes are counted like driver summaries
+        assert result.stats.nodes_created == scenario.total_records
+        assert result.stats.relationships_created > 0
+
+        # Bulk statements per written batch, never a statement per record
+        assert result.neo4j_transactions > 0
+        assert 0 < result.neo4j_statements < result.records
+
+    @pytest.mark.asyncio
+    async def test_counting_client_wraps_a_real_client(self):
+        inner = CountingNeo4jClient()
+        client = CountingNeo4jClient(inner)
+
+        await client.execute_query("RETURN 1")
+        await client.execute_queries_in_transaction([{"query": "RETURN 1"}, {"query": "RETURN 2"}])
+
+        assert (client.statements, client.transactions, client.queries) == (3, 1, 1)
+        assert inner.statements == 3
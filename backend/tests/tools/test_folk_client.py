@@ -0,0 +1,178 @@
+"""
+Tests for Folk API client rate limiting and pagination.
+"""
+
+import time
+import pytest
+import httpx
+
+from tools.folk_ingestion.folk_client import FolkClient, FolkRateLimitError
+from tools.folk_ingestion.rate_limiter import (
+    AsyncTokenBucket,
+    get_shared_limiter,
+    parse_reset,
+    parse_retry_after
+)
+
+
+def make_client(handler, rate_limit: int = 6000, max_retries: int = 3) -> FolkClient:
+    client = FolkClient(
+        api_key="test",
+        base_url="https://folk.test/v1",
+        rate_limit=rate_limit,
+        max_retries=max_retries,
+        limiter=AsyncTokenBucket(rate_limit)
+    )
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def page(items, next_cursor=None):
+    pagination = {"nextLink": f"https://folk.test/v1/people?limit=2&cursor={next_cursor}"} if next_cursor else {}
+    return {"data": {"items": items, "pagination": pagination}}
+
+
+class TestHeaderParsing:
+    """Test Retry-After and X-RateLimit-Reset parsing"""
+
+    def test_retry_after_seconds(self):
+        assert parse_retry_after("12") == 12.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_retry_after_http_date(self):
+        now = 1_700_000_000
+        header = "Tue, 14 Nov 2023 22:13:40 GMT"  # now + 20s
+        assert parse_retry_after(header, now=now) == pytest.approx(20.0)
+
+    def test_reset_epoch_and_delta(self):
+        assert parse_reset("30") == 30.0
+        assert parse_reset(str(1_700_000_045), now=1_700_000_000) == pytest.approx(45.0)
+
+
+class TestAsyncTokenBucket:
+    """Test token bucket pacing and adaptation"""
+
+    @pytest.mark.asyncio
+    async def test_paces_beyond_burst(self):
+        limiter = AsyncTokenBucket(rate_per_minute=600, burst=1)  # 10 requests/second
+
+        started = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.28
+        assert limiter.stats["throttled"] == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_pauses_and_backs_off(self):
+        limiter = AsyncTokenBucket(rate_per_minute=600, burst=5)
+
+        limiter.on_rate_limited(0.2)
+        assert limiter.rate == pytest.approx(limiter.max_rate / 2)
+
+        started = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - started >= 0.19
+
+        for _ in range(20):
+            limiter.on_response({})
+        assert limiter.rate == limiter.max_rate
+
+    @pytest.mark.asyncio
+    async def test_exhausted_remaining_header_pauses_until_reset(self):
+        limiter = AsyncTokenBucket(rate_per_minute=6000, burst=10)
+
+        limiter.on_response({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0.2"})
+
+        started = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - started >= 0.19
+
+    def test_shared_limiter_per_api_key(self):
+        assert get_shared_limiter("key-a", 100) is get_shared_limiter("key-a", 100)
+        assert get_shared_limiter("key-a", 100) is not get_shared_limiter("key-b", 100)
+
+
+class TestFolkClientRateLimiting:
+    """Test that 429 responses are retried once the limiter's pause elapses"""
+
+    @pytest.mark.asyncio
+    async def test_429_waits_only_for_retry_after(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0.2"})
+            return httpx.Response(200, json={"data": {"id": "usr_1", "email": "a@b.c", "fullName": "A"}})
+
+        async with make_client(handler) as client:
+            started = time.monotonic()
+            user = await client.get_user_profile()
+            elapsed = time.monotonic() - started
+
+        assert user.id == "usr_1"
+        assert len(calls) == 2
+        # Retry-After only: no additional exponential backoff (which starts at 4s)
+        assert 0.19 <= elapsed < 2
+        assert client.get_stats()["rate_limited_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        async with make_client(handler, max_retries=2) as client:
+            with pytest.raises(FolkRateLimitError):
+                await client.get_user_profile()
+
+        assert len(calls) == 2
+
+
+class TestPagination:
+    """Test cursor pagination"""
+
+    @pytest.mark.asyncio
+    async def test_follows_next_link_cursors(self):
+        pages = {
+            None: page([{"id": "per_1"}, {"id": "per_2"}], "c2"),
+            "c2": page([{"id": "per_3"}], None)
+        }
+        cursors = []
+
+        def handler(request):
+            cursor = request.url.params.get("cursor")
+            cursors.append(cursor)
+            return httpx.Response(200, json=pages[cursor])
+
+        async with make_client(handler) as client:
+            people = await client.get_all_people_paginated(page_size=2)
+
+        assert [person["id"] for person in people] == ["per_1", "per_2", "per_3"]
+        assert cursors == [None, "c2"]
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_streams_custom_objects(self):
+        def handler(request):
+            assert request.url.path == "/v1/groups/grp_1/Deals"
+            cursor = request.url.params.get("cursor")
+            return httpx.Response(200, json=page([{"id": f"deal_{cursor or 1}"}], None if cursor else "2"))
+
+        async with make_client(handler) as client:
+            pages = [batch async for batch in client.iter_custom_object_pages("grp_1", "Deals")]
+
+        assert pages == [[{"id": "deal_1"}], [{"id": "deal_2"}]]
+
+    def test_collect_entity_types_accumulates_across_pages(self):
+        group_types = {}
+        reference = [{"entityType": "object", "id": "obj_1"}]
+
+        FolkClient.collect_entity_types([{"customFieldValues": {"grp_1": {"Deals": reference}}}], group_types)
+        FolkClient.collect_entity_types([{"customFieldValues": {"grp_1": {"Projects": reference}}}], group_types)
+
+        assert group_types == {"grp_1": {"Deals", "Projects"}}
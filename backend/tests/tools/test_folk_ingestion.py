@@ -0,0 +1,619 @@
+"""
+Tests for Folk ingestion change tracking and the streaming pipeline.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from neo4j import SummaryCounters
+
+from database.neo4j_client import QueryResult, summary_counters
+from tools.folk_ingestion.config import FolkConfig
+from tools.folk_ingestion.change_events import content_hash
+from tools.folk_ingestion.checkpoints import ListingCheckpoint, ListingProgress
+from tools.folk_ingestion.folk_client import FolkAPIError, FolkClient, FolkPage, FolkUser
+from tools.folk_ingestion.folk_ingestion import FolkIngestionService, IngestionStats
+from tools.folk_ingestion.folk_models import FolkCompany, FolkCustomObject
+from tools.folk_ingestion.pipeline import Distribution, PipelineMetrics, run_pipeline
+from tools.folk_ingestion.sync_state import TOMBSTONE_INDEXES, ListingDelta, SyncStateStore
+
+
+def make_result(records=None, statistics=None, success: bool = True) -> QueryResult:
+    """QueryResult whose counters are built from driver statistics as Neo4jClient does"""
+    return QueryResult(
+        records=records or [],
+        summary={"counters": summary_counters(SummaryCounters(statistics or {}))},
+        execution_time=0.0,
+        query="",
+        parameters={},
+        success=success
+    )
+
+
+@pytest.fixture
+def service():
+    config = FolkConfig(api_keys=["test"], publish_change_events=False)
+    service = FolkIngestionService(config)
+    service.neo4j_client = MagicMock()
+    return service
+
+
+class TestBulkUpserts:
+    """Test that each batch is written with one UNWIND statement per node/relationship type"""
+    
+    @pytest.mark.asyncio
+    async def test_people_batch_uses_two_statements(self, service):
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(return_value=[
+            make_result([{"upserted": 3, "changed_ids": []}]), make_result()
+        ])
+        
+        await service._process_people_batch(
+            [{"id": f"per_{i}", "fullName": f"Person {i}"} for i in range(3)], "owner"
+        )
+        
+        statements = service.neo4j_client.execute_queries_in_transaction.call_args[0][0]
+        assert len(statements) == 2
+        assert statements[0]["query"].strip().startswith("UNWIND $rows")
+        assert [row["folk_id"] for row in statements[0]["parameters"]["rows"]] == ["per_0", "per_1", "per_2"]
+        assert "OWNS_CONTACT" in statements[1]["query"]
+    
+    @pytest.mark.asyncio
+    async def test_custom_objects_link_every_contact_and_company(self, service):
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(return_value=[
+            make_result([{"upserted": 1, "changed_ids": ["deal_1"]}]), make_result(), make_result(), make_result()
+        ])
+        
+        await service._process_custom_objects_batch([{
+            "id": "deal_1",
+            "name": "Big Deal",
+            "people": [{"id": "per_1"}, {"id": "per_2"}],
+            "companies": [{"id": "org_1"}]
+        }], "Deals", "owner")
+        
+        statements = service.neo4j_client.execute_queries_in_transaction.call_args[0][0]
+        assert "MERGE (n:Deal" in statements[0]["query"]
+        assert len(statements[1]["parameters"]["pairs"]) == 2
+        assert statements[2]["parameters"]["pairs"] == [{"source": "deal_1", "target": "org_1"}]
+        assert service.change_set.changes()[0].related_folk_ids == ["per_1", "per_2", "org_1"]
+
+
+class TestChangeTracking:
+    """Test that only modified entities produce change events"""
+    
+    def test_content_hash_ignores_generated_ids(self, service):
+        record = {"id": "per_1", "fullName": "Jane Doe"}
+        
+        first = service._prepare_people_batch([record], "owner")
+        service.processed_folk_ids.clear()
+        second = service._prepare_people_batch([record], "owner")
+        
+        rows = [batch.statements[0]["parameters"]["rows"][0] for batch in (first, second)]
+        assert rows[0]["properties"]["personId"] != rows[1]["properties"]["personId"]
+        assert rows[0]["content_hash"] == rows[1]["content_hash"]
+    
+    @pytest.mark.parametrize("record", [
+        FolkCompany.from_folk_api({"id": "com_1", "name": "Nike"}),
+        FolkCustomObject.from_folk_api({"id": "obj_1", "name": "Big Deal"}, "Deals")
+    ], ids=["company", "custom_object"])
+    def test_same_record_hashes_the_same_twice(self, record):
+        first, second = record.to_neo4j_node("owner"), record.to_neo4j_node("owner")
+        
+        assert first != second  # fresh organizationId / objectId per call
+        assert content_hash(first) == content_hash(second)
+    
+    def test_content_hash_ignores_data_owner(self):
+        company = FolkCompany.from_folk_api({"id": "com_1", "name": "Nike"})
+        
+        # Keys sharing a record must not flip its hash between runs
+        assert content_hash(company.to_neo4j_node("owner_a")) == content_hash(company.to_neo4j_node("owner_b"))
+    
+    def test_content_hash_ignores_sync_timestamp(self):
+        first = content_hash({"name": "Jane", "lastSyncedAt": "2024-01-01"})
+        second = content_hash({"name": "Jane", "lastSyncedAt": "2024-06-01"})
+        
+        assert first == second
+        assert first != content_hash({"name": "Janet", "lastSyncedAt": "2024-01-01"})
+    
+    @pytest.mark.asyncio
+    async def test_only_changed_people_are_recorded(self, service):
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(return_value=[
+            make_result([{"upserted": 2, "changed_ids": ["per_1"]}], {"nodes-created": 1}),
+            make_result(statistics={"relationships-created": 2})
+        ])
+        
+        await service._process_people_batch(
+            [{"id": "per_1", "fullName": "Jane Doe"}, {"id": "per_2", "fullName": "John Roe"}],
+            "owner"
+        )
+        
+        assert service.change_set.folk_ids() == ["per_1"]
+        assert service.change_set.changes()[0].entity_type == "person"
+        assert service.stats.people_processed == 2
+        assert (service.stats.nodes_created, service.stats.nodes_updated) == (1, 1)
+        assert service.stats.relationships_created == 2
+    
+    @pytest.mark.asyncio
+    async def test_changes_are_emitted_to_listeners(self, service):
+        received = []
+        
+        async def listener(change_set):
+            received.append(change_set.folk_ids())
+        
+        service.add_change_listener(listener)
+        service.change_set.record("deal", "deal_1", "Big Deal", ["org_1", "per_1"])
+        
+        await service._emit_changes()
+        
+        assert received == [["deal_1"]]
+        assert service.stats.entities_changed == 1
+    
+    @pytest.mark.asyncio
+    async def test_ingestion_invalidates_redis_itself(self, service):
+        service.config.publish_change_events = True
+        service.config.redis_url = "redis://localhost:6379"
+        service.change_set.record("organization", "org_1", "Nike")
+        service.change_set.record("organization", "org_1", related_folk_ids=["per_1"])
+        
+        client = MagicMock()
+        client.close = AsyncMock()
+        apply = AsyncMock(return_value=3)
+        
+        with patch("redis.asyncio.from_url", return_value=client), \
+                patch("app.ai.tools.folk_changes.apply_folk_changes", apply):
+            await service._emit_changes()
+        
+        changes = apply.call_args.args[0]
+        assert [(c.folk_id, c.name, c.related_folk_ids) for c in changes] == [("org_1", "Nike", ["per_1"])]
+        assert apply.call_args.kwargs["redis_client"] is client
+        assert service.stats.cache_entries_invalidated == 3
+        client.close.assert_awaited_once()
+
+
+async def pages_of(*pages):
+    for page in pages:
+        yield page
+
+
+async def failing_after(*pages):
+    for page in pages:
+        yield page
+    raise FolkAPIError("Failed to get people: API error 500")
+
+
+class TestStreamingPipeline:
+    """Test the bounded fetch -> transform -> write pipeline"""
+    
+    @pytest.mark.asyncio
+    async def test_batches_are_rechunked_and_written_in_order(self):
+        written = []
+        
+        stats = await run_pipeline(
+            pages_of([1, 2, 3], [4, 5], [6]),
+            lambda batch: [n * 10 for n in batch],
+            lambda payload: asyncio.sleep(0, written.append(payload)),
+            batch_size=4
+        )
+        
+        assert written == [[10, 20, 30, 40], [50, 60]]
+        assert (stats.pages, stats.records, stats.batches_written) == (3, 6, 2)
+    
+    @pytest.mark.asyncio
+    async def test_stage_timings_and_queue_depths_are_recorded(self):
+        metrics = PipelineMetrics()
+        
+        async def pages():
+            for i in range(3):
+                await asyncio.sleep(0.01)
+                yield [i, i]
+        
+        async def write(payload):
+            await asyncio.sleep(0.02)
+        
+        await run_pipeline(pages(), lambda batch: batch, write, batch_size=2, metrics=metrics)
+        
+        assert metrics.records == 6
+        assert metrics.fetch_page_seconds.count == 3
+        assert metrics.transform_record_seconds.count == 6
+        assert metrics.write_batch_seconds.count == 3
+        assert metrics.write_batch_seconds.percentile(50) >= 0.019
+        assert metrics.bottleneck() == "write"
+        
+        report = metrics.to_dict(duration_seconds=2.0)
+        assert report["records_per_second"] == 3.0
+        assert report["write_batch_ms"]["p95"] >= 19
+        assert report["queue_depth"]["transform"]["count"] == 3
+    
+    def test_distribution_percentiles_and_merge(self):
+        first, second = Distribution(), Distribution(max_samples=50)
+        for value in range(1, 101):
+            (first if value <= 50 else second).add(value)
+        
+        first.merge(second)
+        
+        assert (first.count, first.max, first.mean) == (100, 100, 50.5)
+        assert first.percentile(50) == 50
+        assert first.percentile(99) == 99
+    
+    @pytest.mark.asyncio
+    async def test_writes_start_before_fetching_completes(self):
+        events = []
+        
+        async def pages():
+            for i in range(3):
+                events.append(f"fetch {i}")
+                yield [i]
+                await asyncio.sleep(0.01)
+        
+        async def write(payload):
+            events.append(f"write {payload[0]}")
+        
+        await run_pipeline(pages(), lambda batch: batch, write, batch_size=1)
+        
+        assert events.index("write 0") < events.index("fetch 2")
+    
+    @pytest.mark.asyncio
+    async def test_slow_writer_bounds_buffered_batches(self):
+        fetched = []
+        
+        async def pages():
+            for i in range(20):
+                fetched.append(i)
+                yield [i]
+        
+        async def slow_write(payload):
+            await asyncio.sleep(0.01)
+        
+        stats = await run_pipeline(pages(), lambda batch: batch, slow_write, batch_size=1, queue_size=2)
+        
+        assert len(fetched) == 20
+        assert stats.max_transform_queue <= 2
+        assert stats.max_write_queue <= 2
+    
+    @pytest.mark.asyncio
+    async def test_fetch_error_raised_after_fetched_batches_are_written(self):
+        written = []
+        
+        with pytest.raises(FolkAPIError):
+            await run_pipeline(
+                failing_after([1], [2]),
+                lambda batch: batch,
+                lambda payload: asyncio.sleep(0, written.append(payload)),
+                batch_size=1
+            )
+        
+        assert written == [[1], [2]]
+    
+    @pytest.mark.asyncio
+    async def test_write_error_cancels_fetch(self):
+        async def endless():
+            while True:
+                yield [1]
+        
+        async def broken_write(payload):
+            raise RuntimeError("neo4j down")
+        
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(
+                run_pipeline(endless(), lambda batch: batch, broken_write, batch_size=1), timeout=2
+            )
+
+    
+    @pytest.mark.asyncio
+    async def test_api_key_streams_people_companies_and_discovered_objects(self, service, monkeypatch):
+        deal_ref = [{"entityType": "object", "id": "deal_1"}]
+        client = MagicMock()
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=None)
+        client.get_user_profile = AsyncMock(return_value=FolkUser(id="owner", email="o@x.io", name="Owner"))
+        client.get_all_groups_paginated = AsyncMock(return_value=[{"id": "grp_1", "name": "Sales"}])
+        client.iter_people_pages = lambda page_size, cursor=None: pages_of(
+            [{"id": "per_1", "fullName": "Jane", "customFieldValues": {"grp_1": {"Deals": deal_ref}}}]
+        )
+        client.iter_companies_pages = lambda page_size, cursor=None: pages_of([{"id": "org_1", "name": "Nike"}])
+        client.iter_custom_object_pages = MagicMock(return_value=pages_of([{"id": "deal_1", "name": "Big Deal"}]))
+        client.collect_entity_types = FolkClient.collect_entity_types
+        client.get_stats = MagicMock(return_value={"requests_made": 4, "errors_count": 0})
+        monkeypatch.setattr("tools.folk_ingestion.folk_ingestion.FolkClient", lambda **kwargs: client)
+        
+        service.neo4j_client.execute_query = AsyncMock(return_value=make_result())
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(
+            side_effect=lambda statements: [make_result([{"upserted": 1, "changed_ids": []}])] +
+                                           [make_result() for _ in statements[1:]]
+        )
+        
+        await service._process_api_key("test")
+        
+        client.iter_custom_object_pages.assert_called_once_with("grp_1", "Deals", page_size=100, cursor=None)
+        assert (service.stats.people_fetched, service.stats.companies_fetched) == (1, 1)
+        assert service.stats.custom_objects_processed == 1
+        assert service.stats.entity_types_discovered == 1
+
+class TestIngestRecords:
+    """Test writing individually fetched records (sync worker path)"""
+    
+    @pytest.mark.asyncio
+    async def test_records_are_written_and_deletions_tombstoned(self, service):
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(
+            side_effect=lambda statements: [make_result([{"upserted": 1, "changed_ids": ["per_1"]}])] +
+                                           [make_result() for _ in statements[1:]]
+        )
+        service.sync_store = MagicMock(tombstone=AsyncMock(return_value=[{"folk_id": "com_9", "name": "Gone"}]))
+        
+        stats = await service.ingest_records(
+            "owner", people=[{"id": "per_1", "fullName": "Jane Doe"}], deleted={"Organization": ["com_9"]}
+        )
+        
+        assert (stats.sync_mode, stats.people_processed, stats.records_tombstoned) == ("realtime", 1, 1)
+        service.sync_store.tombstone.assert_awaited_once_with("Organization", ["com_9"], None, None)
+        assert set(service.change_set.folk_ids()) == {"per_1", "com_9"}
+
+
+class TestIncrementalSync:
+    """Test delta selection and tombstones"""
+    
+    PEOPLE = [{"id": "per_1", "fullName": "Jane Doe"}, {"id": "per_2", "fullName": "John Roe"}]
+    
+    @pytest.fixture
+    def store(self, service):
+        service.incremental = True
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(
+            side_effect=lambda statements: [make_result([{"upserted": 1, "changed_ids": []}])] +
+                                           [make_result() for _ in statements[1:]]
+        )
+        store = MagicMock()
+        store.load_known = AsyncMock()
+        store.tombstone = AsyncMock(side_effect=lambda label, ids, *owner: [{"folk_id": i, "name": None} for i in ids])
+        service.sync_store = store
+        return store
+    
+    def person_hash(self, service, record):
+        prepared = service._prepare_people_batch([record], "owner")
+        service.processed_folk_ids.clear()
+        return prepared.statements[0]["parameters"]["rows"][0]["content_hash"]
+    
+    def written_ids(self, service):
+        return [
+            row["folk_id"]
+            for call in service.neo4j_client.execute_queries_in_transaction.call_args_list
+            for row in call[0][0][0]["parameters"]["rows"]
+        ]
+    
+    async def sync_people(self, service, pages):
+        await service._sync_listing(
+            pages, "owner", "people", "Person", "OWNS_CONTACT",
+            lambda batch, delta: service._prepare_people_batch(batch, "owner", delta)
+        )
+    
+    @pytest.mark.asyncio
+    async def test_only_changed_records_are_written(self, service, store):
+        store.load_known.return_value = {
+            "per_1": (self.person_hash(service, self.PEOPLE[0]), False),
+            "per_2": ("stale", False),
+            "per_3": ("gone", False)
+        }
+        
+        await self.sync_people(service, pages_of(self.PEOPLE[:1], self.PEOPLE[1:]))
+        
+        assert self.written_ids(service) == ["per_2"]
+        store.tombstone.assert_awaited_once_with("Person", ["per_3"], "OWNS_CONTACT", "owner")
+        assert service.stats.records_tombstoned == 1
+        assert service.stats.delta_records_skipped == 1
+        assert "per_3" in service.change_set.folk_ids()
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_listing_writes_nothing(self, service, store):
+        store.load_known.return_value = {
+            record["id"]: (self.person_hash(service, record), False) for record in self.PEOPLE
+        }
+        
+        await self.sync_people(service, pages_of(self.PEOPLE))
+        
+        service.neo4j_client.execute_queries_in_transaction.assert_not_awaited()
+        store.tombstone.assert_not_awaited()
+        assert service.stats.delta_records_skipped == 2
+        assert service.stats.delta_entity_types_skipped == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_listing_never_tombstones(self, service, store):
+        store.load_known.return_value = {"per_3": ("gone", False)}
+        
+        with pytest.raises(FolkAPIError):
+            await self.sync_people(service, failing_after(self.PEOPLE))
+        
+        assert self.written_ids(service) == ["per_1", "per_2"]
+        store.tombstone.assert_not_awaited()
+    
+    def test_tombstoned_and_invalid_records(self):
+        delta = ListingDelta({"per_1": ("abc", True), "per_2": ("def", False), "per_3": ("ghi", False)})
+        
+        assert not delta.is_unchanged("per_1", "abc")
+        assert delta.is_unchanged("per_2", "def")
+        delta.mark_invalid("per_3")
+        
+        assert delta.vanished() == []
+        assert delta.changed == 1
+
+
+class TestSyncStateStore:
+    """Test tombstone and purge statements"""
+    
+    @pytest.fixture
+    def store(self):
+        client = MagicMock()
+        client.execute_query = AsyncMock(return_value=make_result([{"purged": 2, "folk_id": "per_1"}]))
+        return SyncStateStore(client)
+    
+    @pytest.mark.asyncio
+    async def test_vanished_record_tombstones_only_the_owner_link(self, store):
+        await store.tombstone("Person", ["per_1"], "OWNS_CONTACT", "owner_1")
+        
+        query, parameters = store.neo4j_client.execute_query.call_args[0]
+        assert "-[r:OWNS_CONTACT]->(n:Person {folkId: folk_id})" in query
+        assert "SET r.folkDeleted = true" in query
+        # The node itself only once no other owner still links to it
+        assert "NOT EXISTS" in query and "n:FolkTombstone" in query
+        assert parameters == {"folk_ids": ["per_1"], "data_owner_id": "owner_1"}
+        
+        with pytest.raises(ValueError):
+            await store.tombstone("Person", ["per_1"], "WORKS_FOR", "owner_1")
+    
+    @pytest.mark.asyncio
+    async def test_purge_seeks_tombstones_by_label_and_relationship_type(self, store):
+        assert await store.purge_tombstones(30) == 6
+        await store.purge_tombstones(30)
+        
+        queries = [call.args[0] for call in store.neo4j_client.execute_query.call_args_list]
+        assert queries.count(TOMBSTONE_INDEXES[0]) == 1
+        purges = [query for query in queries if "DELETE" in query]
+        assert len(purges) == 6
+        assert all("MATCH (n:FolkTombstone)" in query or "[r:OWNS_CONTACT]" in query or "[r:SOURCED]" in query
+                   for query in purges)
+
+
+class TestParallelApiKeys:
+    """Test concurrent per-key ingestion"""
+    
+    @pytest.mark.asyncio
+    async def test_keys_run_concurrently_with_isolated_stats(self, service, monkeypatch):
+        service.config.api_keys = ["key-a", "key-b", "key-c"]
+        service.config.max_parallel_keys = 3
+        
+        async def process(api_key):
+            await asyncio.sleep(0.1)
+            service.stats.people_processed += {"key-a": 1, "key-b": 2, "key-c": 4}[api_key]
+            service.stats.data_owner = api_key
+            if api_key == "key-c":
+                raise FolkAPIError("unauthorized")
+        
+        monkeypatch.setattr(service, "_process_api_key", process)
+        
+        started = asyncio.get_running_loop().time()
+        stats = await service.run_full_ingestion()
+        elapsed = asyncio.get_running_loop().time() - started
+        
+        assert elapsed < 0.25
+        assert stats.people_processed == 7
+        assert stats.api_keys_processed == 2
+        assert stats.key_stats["key_2"].people_processed == 2
+        assert stats.key_stats["key_3"].processing_errors == ["Failed to process API key 3: unauthorized"]
+        assert stats.to_dict()["keys"]["key_1"]["data_owner"] == "key-a"
+    
+    @pytest.mark.asyncio
+    async def test_parallelism_is_bounded(self, service, monkeypatch):
+        service.config.api_keys = ["key-a", "key-b", "key-c"]
+        service.config.max_parallel_keys = 1
+        running = []
+        peak = []
+        
+        async def process(api_key):
+            running.append(api_key)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(api_key)
+        
+        monkeypatch.setattr(service, "_process_api_key", process)
+        
+        await service.run_full_ingestion()
+        
+        assert max(peak) == 1
+    
+    @pytest.mark.asyncio
+    async def test_shared_folk_id_is_written_once_and_released_on_failure(self, service):
+        people = [{"id": "per_1", "fullName": "Jane Doe"}]
+        
+        first = service._prepare_people_batch(people, "owner_a")
+        assert service._prepare_people_batch(people, "owner_b") is None
+        
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(side_effect=RuntimeError("deadlock"))
+        await service._write_batch(first)
+        
+        assert service._prepare_people_batch(people, "owner_b") is not None
+
+
+class TestCheckpoints:
+    """Test resuming an interrupted run from per-listing checkpoints"""
+    
+    PAGE_1 = FolkPage([{"id": "per_1", "fullName": "Jane Doe"}, {"id": "per_2", "fullName": "John Roe"}], None, "c2")
+    PAGE_2 = FolkPage([{"id": "per_3", "fullName": "Ann Poe"}], "c2", None)
+    
+    async def sync_people(self, service, pages, progress):
+        await service._sync_listing(
+            pages, "owner", "people", "Person", "OWNS_CONTACT",
+            lambda batch, delta: service._prepare_people_batch(batch, "owner", delta),
+            progress=progress
+        )
+    
+    def test_progress_resumes_at_first_unfinished_page(self):
+        progress = ListingProgress("owner", "people")
+        progress.add_page(self.PAGE_1)
+        progress.add_page(self.PAGE_2)
+        progress.mark_done(["per_1"], committed=True)
+        
+        checkpoint = progress.checkpoint(["per_2"])
+        assert (checkpoint.cursor, checkpoint.done_ids, checkpoint.batch_number) == ("c2", [], 2)
+        
+        checkpoint = progress.checkpoint()
+        assert (checkpoint.cursor, checkpoint.done_ids, checkpoint.records_done) == (None, ["per_1"], 1)
+        
+        resumed = ListingProgress("owner", "people", checkpoint)
+        assert [r["id"] for r in resumed.add_page(self.PAGE_1)] == ["per_2"]
+        assert resumed.refetched == 1
+    
+    @pytest.mark.asyncio
+    async def test_restart_resumes_after_last_committed_batch(self, service):
+        service.config.batch_size = 1
+        service.checkpoint_store = MagicMock(save=AsyncMock(return_value=True))
+        committed = []
+        
+        def transaction(statements):
+            if statements[0]["parameters"]["rows"][0]["folk_id"] == "per_3":
+                raise RuntimeError("connection lost")
+            committed.append(statements[-1]["parameters"])
+            return [make_result([{"upserted": 1, "changed_ids": []}])] + [make_result() for _ in statements[1:]]
+        
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(side_effect=transaction)
+        
+        progress = service._listing_progress({}, "owner", "people")
+        await self.sync_people(service, pages_of(self.PAGE_1, self.PAGE_2), progress)
+        
+        last = committed[-1]
+        assert (last["cursor"], last["batch_number"], last["records_done"]) == ("c2", 2, 2)
+        assert service.checkpoint_store.save.call_args[0][0].completed is False
+        
+        # Restart: only the uncommitted page is fetched and written
+        service.stats = IngestionStats()
+        service.processed_folk_ids.clear()
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock(
+            side_effect=lambda statements: [make_result([{"upserted": 1, "changed_ids": []}])] +
+                                           [make_result() for _ in statements[1:]]
+        )
+        checkpoint = ListingCheckpoint(
+            scope="owner", listing="people", cursor=last["cursor"], batch_number=last["batch_number"],
+            records_done=last["records_done"], done_ids=last["done_ids"]
+        )
+        progress = service._listing_progress({"people": checkpoint}, "owner", "people")
+        assert progress.start_cursor == "c2"
+        
+        await self.sync_people(service, pages_of(self.PAGE_2), progress)
+        
+        assert service.stats.people_processed == 1
+        assert service.checkpoint_store.save.call_args[0][0].completed is True
+        assert service.stats.to_dict()["checkpoints"] == {
+            "listings_resumed": 1, "listings_skipped": 0, "records_resumed": 2, "records_redone": 0
+        }
+    
+    @pytest.mark.asyncio
+    async def test_completed_listing_is_skipped(self, service):
+        service.neo4j_client.execute_queries_in_transaction = AsyncMock()
+        checkpoint = ListingCheckpoint(
+            scope="owner", listing="people", records_done=3, completed=True, entity_types={"grp_1": ["Deals"]}
+        )
+        entity_types = {}
+        
+        progress = service._listing_progress({"people": checkpoint}, "owner", "people", entity_types)
+        await self.sync_people(service, pages_of(self.PAGE_1), progress)
+        
+        service.neo4j_client.execute_queries_in_transaction.assert_not_called()
+        assert entity_types == {"grp_1": {"Deals"}}
+        assert (service.stats.checkpoint_listings_skipped, service.stats.checkpoint_records_resumed) == (1, 3)
@@ -0,0 +1,211 @@
+"""
+Tests for the near-real-time Folk sync worker and its webhook endpoint.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tools.folk_ingestion.config import FolkConfig
+from tools.folk_ingestion.folk_client import FolkUser
+from tools.folk_ingestion.folk_ingestion import IngestionStats
+from tools.folk_ingestion.sync_worker import (
+    MAX_ATTEMPTS,
+    FolkChangeNotification,
+    FolkSyncWorker,
+    parse_notifications
+)
+from tools.folk_ingestion.webhook_server import SIGNATURE_HEADER, create_webhook_router
+
+
+@pytest.fixture
+def service():
+    service = MagicMock()
+    service.config = FolkConfig(api_keys=["test"], publish_change_events=False, sync_coalesce_seconds=0.01)
+    service.ingest_records = AsyncMock(return_value=IngestionStats())
+    return service
+
+
+@pytest.fixture
+def worker(service):
+    worker = FolkSyncWorker(service, poll_interval_seconds=0)
+    client = MagicMock()
+    client.get_person = AsyncMock(side_effect=lambda folk_id: {"id": folk_id, "fullName": "Jane Doe"})
+    client.get_company = AsyncMock(return_value=None)
+    client.get_custom_object = AsyncMock(side_effect=lambda group_id, entity_type, folk_id: {"id": folk_id})
+    client.get_user_profile = AsyncMock(return_value=FolkUser(id="owner", email="o@x.io", name="Owner"))
+    client.close = AsyncMock()
+    service.create_folk_client.return_value = client
+    worker._clients = [(client, "owner")]
+    return worker
+
+
+class TestNotificationParsing:
+    """Test webhook payload parsing"""
+
+    def test_parses_single_and_batched_events(self):
+        single = parse_notifications({"type": "person.updated", "data": {"id": "per_1"}})
+        batched = parse_notifications({"events": [
+            {"type": "company.deleted", "data": {"id": "com_1"}},
+            {"type": "object.created", "data": {"id": "obj_1", "groupId": "grp_1", "entityType": "Projects"}},
+            {"type": "workspace.updated", "data": {"id": "ws_1"}}
+        ]})
+
+        assert [(n.kind, n.folk_id, n.deleted) for n in single] == [("person", "per_1", False)]
+        assert [(n.kind, n.deleted, n.label) for n in batched] == [
+            ("company", True, "Organization"),
+            ("object", False, "Project")
+        ]
+
+
+class TestCoalescing:
+    """Test that bursts of changes per entity are applied once"""
+
+    @pytest.mark.asyncio
+    async def test_burst_for_one_entity_is_written_once(self, worker, service):
+        for _ in range(5):
+            worker.submit(FolkChangeNotification("person", "per_1"))
+        worker.submit(FolkChangeNotification("person", "per_2"))
+
+        assert worker.get_stats()["pending"] == 2
+
+        await worker.flush()
+
+        service.ingest_records.assert_awaited_once_with(
+            "owner", [{"id": "per_1", "fullName": "Jane Doe"}, {"id": "per_2", "fullName": "Jane Doe"}], [], {}
+        )
+        assert worker.stats["coalesced"] == 4
+        assert worker.latency.count == 2
+
+    @pytest.mark.asyncio
+    async def test_deletes_and_vanished_records_are_tombstoned(self, worker, service):
+        client, _ = worker._clients[0]
+        client.get_person.side_effect = lambda folk_id: None  # 404 from Folk
+        worker.submit(FolkChangeNotification("person", "per_1"))
+        worker.submit(FolkChangeNotification("person", "per_1", deleted=True))
+        worker.submit(FolkChangeNotification("company", "com_1"))  # 404 from Folk
+
+        await worker.flush()
+
+        service.ingest_records.assert_awaited_once_with(
+            deleted={"Person": ["per_1"], "Organization": ["com_1"]}
+        )
+        assert worker.stats["not_found"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_of_a_readable_record_is_not_tombstoned(self, worker, service):
+        worker.submit(FolkChangeNotification("person", "per_1", deleted=True))
+
+        await worker.flush()
+
+        service.ingest_records.assert_awaited_once_with("owner", [{"id": "per_1", "fullName": "Jane Doe"}], [], {})
+        assert worker.stats["unconfirmed_deletes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_is_confirmed_with_every_api_key(self, worker, service):
+        client, _ = worker._clients[0]
+        client.get_person.side_effect = lambda folk_id: None
+        other = MagicMock()
+        other.get_person = AsyncMock(side_effect=lambda folk_id: {"id": folk_id, "fullName": "Jane Doe"})
+        worker._clients.append((other, "other-owner"))
+        worker.submit(FolkChangeNotification("person", "per_1", deleted=True))
+
+        await worker.flush()
+
+        service.ingest_records.assert_awaited_once_with(
+            "other-owner", [{"id": "per_1", "fullName": "Jane Doe"}], [], {}
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_requeue_deletes(self, worker, service):
+        client, _ = worker._clients[0]
+        client.get_person.side_effect = RuntimeError("Folk API unavailable")
+        worker.submit(FolkChangeNotification("person", "per_1", deleted=True))
+
+        assert await worker.flush() is False
+
+        service.ingest_records.assert_not_awaited()
+        assert worker.get_stats()["pending"] == 1
+
+    @pytest.mark.asyncio
+    async def test_custom_objects_are_fetched_from_their_group(self, worker, service):
+        worker.submit(FolkChangeNotification("object", "deal_1", group_id="grp_1", entity_type="Deals"))
+        worker.submit(FolkChangeNotification("object", "obj_2"))
+
+        await worker.flush()
+
+        service.ingest_records.assert_awaited_once_with("owner", [], [], {"Deals": [{"id": "deal_1"}]})
+        assert worker.stats["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_retried_then_dropped(self, worker, service):
+        service.ingest_records.return_value = IngestionStats(neo4j_errors=1)
+        worker.submit(FolkChangeNotification("person", "per_1"))
+
+        for _ in range(MAX_ATTEMPTS):
+            assert await worker.flush() is False
+
+        assert worker.get_stats()["pending"] == 0
+        assert worker.stats["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_loop_applies_after_coalesce_window(self, worker, service):
+        worker._clients = []  # start() connects one client per API key
+        await worker.start()
+        try:
+            worker.submit(FolkChangeNotification("person", "per_1"))
+            worker.submit(FolkChangeNotification("person", "per_1"))
+            await asyncio.sleep(0.05)
+        finally:
+            await worker.stop()
+
+        assert service.ingest_records.await_count == 1
+        assert worker.get_stats()["api_keys"] == 0  # clients are closed on stop
+
+
+class TestWebhookEndpoint:
+    """Test webhook signature verification and queuing"""
+
+    def make_client(self, worker, secret="s3cret"):
+        app = FastAPI()
+        app.include_router(create_webhook_router(worker, secret))
+        return TestClient(app)
+
+    def test_signed_delivery_is_queued(self, worker):
+        body = json.dumps({"type": "person.updated", "data": {"id": "per_1"}}).encode()
+        signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+
+        response = self.make_client(worker, "s3cret").post(
+            "/webhooks/folk", content=body, headers={SIGNATURE_HEADER: f"sha256={signature}"}
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"accepted": 1}
+        assert worker.get_stats()["pending"] == 1
+
+    def test_invalid_signature_is_rejected(self, worker):
+        response = self.make_client(worker, "s3cret").post(
+            "/webhooks/folk", content=b'{"type": "person.updated", "data": {"id": "per_1"}}',
+            headers={SIGNATURE_HEADER: "bogus"}
+        )
+
+        assert response.status_code == 401
+        assert worker.get_stats()["pending"] == 0
+
+    def test_router_requires_a_secret(self, worker):
+        with pytest.raises(ValueError, match="FOLK_WEBHOOK_SECRET"):
+            create_webhook_router(worker, "")
+
+    def test_unsigned_delivery_is_rejected(self, worker):
+        response = self.make_client(worker).post(
+            "/webhooks/folk", json={"type": "person.deleted", "data": {"id": "per_1"}}
+        )
+
+        assert response.status_code == 401
+        assert worker.get_stats()["pending"] == 0
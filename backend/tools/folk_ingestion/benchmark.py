@@ -0,0 +1,462 @@
+"""
+Folk Ingestion Benchmark
+
+Measures FolkIngestionService throughput without touching the real Folk API.
+A local fake Folk API (served through an httpx mock transport) generates
+configurable volumes of people, companies, groups and custom objects on the
+fly, paginates them with nextLink cursors like Folk does, and can add latency
+and periodic 429 responses. Writes go to a counting Neo4j client, either a
+built-in sink that only acknowledges them or a wrapper around a real database.
+
+A run reports records/sec, peak RSS and the Neo4j statements and
+transactions issued, so pipeline and batching changes can be compared on the
+same workload. Started by run_folk_benchmark.py.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from neo4j import SummaryCounters
+
+from database.neo4j_client import QueryResult, summary_counters
+
+from .checkpoints import CheckpointStore
+from .config import FolkConfig
+from .folk_client import FolkClient
+from .folk_ingestion import FolkIngestionService, IngestionStats
+from .sync_state import SyncStateStore
+
+logger = logging.getLogger(__name__)
+
+FAKE_BASE_URL = "https://folk.benchmark.local/v1"
+
+# Folk caps listing pages at 100 items
+MAX_PAGE_SIZE = 100
+
+_OBJECT_LISTING = re.compile(r"^/groups/(?P<group_id>[^/]+)/(?P<entity_type>[^/]+)$")
+
+
+@dataclass
+class BenchmarkScenario:
+    """Workload served by the fake Folk API"""
+    people: int = 1000
+    companies: int = 200
+    groups: int = 5
+    custom_objects: int = 500  # spread evenly over every group and entity type
+    entity_types: Tuple[str, ...] = ("Deals",)
+    api_keys: int = 1  # every key sees the same workspace, exercising cross-key dedup
+
+    # Fake API behaviour
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit_every: int = 0  # every Nth request answers 429 (0 disables)
+    retry_after_seconds: float = 0.0
+
+    # Built-in Neo4j sink: simulated time per statement
+    write_latency_ms: float = 0.0
+
+    seed: int = 42
+
+    @property
+    def listings(self) -> List[Tuple[str, str]]:
+        """(group ID, entity type) of every custom object listing"""
+        return [(group_id(g), entity_type) for g in range(self.groups) for entity_type in self.entity_types]
+
+    @property
+    def total_records(self) -> int:
+        return self.people + self.companies + self.groups + (self.custom_objects if self.groups else 0)
+
+
+def person_id(index: int) -> str:
+    return f"per_{index:07d}"
+
+
+def company_id(index: int) -> str:
+    return f"com_{index:07d}"
+
+
+def group_id(index: int) -> str:
+    return f"grp_{index:04d}"
+
+
+def object_id(entity_type: str, index: int) -> str:
+    return f"obj_{entity_type.lower()}_{index:07d}"
+
+
+class FakeFolkAPI:
+    """
+    In-process stand-in for the Folk API
+
+    Records are generated from their index on every request instead of being
+    held in memory, so the fake itself does not inflate the measured RSS.
+    """
+
+    def __init__(self, scenario: BenchmarkScenario, base_url: str = FAKE_BASE_URL):
+        self.scenario = scenario
+        self.base_url = base_url.rstrip('/')
+        self._base_path = httpx.URL(self.base_url).path.rstrip('/')
+        self._random = random.Random(scenario.seed)
+
+        # Requests answered with 429, so their retry is served
+        self._throttled: set = set()
+
+        self.stats = {
+            "requests": 0,
+            "pages_served": 0,
+            "records_served": 0,
+            "rate_limited": 0,
+            "not_found": 0
+        }
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one Folk API request"""
+        self.stats["requests"] += 1
+
+        scenario = self.scenario
+        if scenario.latency_ms or scenario.jitter_ms:
+            delay = scenario.latency_ms + self._random.uniform(0, scenario.jitter_ms)
+            await asyncio.sleep(delay / 1000)
+
+        request_key = str(request.url)
+        if request_key in self._throttled:
+            self._throttled.discard(request_key)
+        elif scenario.rate_limit_every and self.stats["requests"] % scenario.rate_limit_every == 0:
+            self._throttled.add(request_key)
+            self.stats["rate_limited"] += 1
+            return httpx.Response(
+                429,
+                headers={"Retry-After": str(scenario.retry_after_seconds)},
+                json={"error": "Too many requests"}
+            )
+
+        path = request.url.path[len(self._base_path):]
+
+        if path == "/users/me":
+            return httpx.Response(200, json={"data": self._user(request)})
+        if path == "/people":
+            return self._page(request, path, self.scenario.people, self._person)
+        if path == "/companies":
+            return self._page(request, path, self.scenario.companies, self._company)
+        if path == "/groups":
+            return self._page(request, path, self.scenario.groups, self._group)
+
+        match = _OBJECT_LISTING.match(path)
+        if match and match["entity_type"] in scenario.entity_types:
+            listing = (match["group_id"], match["entity_type"])
+            if listing in scenario.listings:
+                position = scenario.listings.index(listing)
+                count = len(range(position, scenario.custom_objects, len(scenario.listings)))
+                return self._page(
+                    request, path, count,
+                    lambda i: self._custom_object(match["entity_type"], i * len(scenario.listings) + position)
+                )
+
+        self.stats["not_found"] += 1
+        return httpx.Response(404, json={"error": f"Not found: {path}"})
+
+    def _page(self, request: httpx.Request, path: str, total: int, build) -> httpx.Response:
+        """One listing page, with a nextLink when more items follow"""
+        limit = min(MAX_PAGE_SIZE, int(request.url.params.get("limit", MAX_PAGE_SIZE)))
+        offset = int(request.url.params.get("cursor") or 0)
+        items = [build(i) for i in range(offset, min(offset + limit, total))]
+
+        pagination = {}
+        if offset + limit < total:
+            pagination["nextLink"] = f"{self.base_url}{path}?limit={limit}&cursor={offset + limit}"
+
+        self.stats["pages_served"] += 1
+        self.stats["records_served"] += len(items)
+        return httpx.Response(200, json={"data": {"items": items, "pagination": pagination}})
+
+    def _user(self, request: httpx.Request) -> Dict[str, Any]:
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        user = hashlib.sha256(token.encode()).hexdigest()[:8]
+        return {"id": f"usr_{user}", "email": f"{user}@benchmark.example.com", "fullName": f"Benchmark {user}"}
+
+    def _group(self, index: int) -> Dict[str, Any]:
+        return {"id": group_id(index), "name": f"Group {index}"}
+
+    def _person(self, index: int) -> Dict[str, Any]:
+        scenario = self.scenario
+        person = {
+            "id": person_id(index),
+            "firstName": f"First{index}",
+            "lastName": f"Last{index}",
+            "fullName": f"First{index} Last{index}",
+            "jobTitle": "Producer",
+            "description": f"Benchmark contact {index}",
+            "emails": [f"person{index}@benchmark.example.com"],
+            "phones": [f"+1555{index:07d}"],
+            "urls": [f"https://linkedin.com/in/person{index}"],
+            "companies": [],
+            "groups": [],
+            "customFieldValues": {},
+            "createdAt": "2024-01-01T00:00:00Z"
+        }
+
+        if scenario.companies:
+            company = index % scenario.companies
+            person["companies"] = [{"id": company_id(company), "name": f"Company {company}"}]
+
+        # Reference custom objects so every listing is discovered from the people pages
+        if scenario.groups and scenario.custom_objects:
+            position = index % len(scenario.listings)
+            listing_group, entity_type = scenario.listings[position]
+            person["groups"] = [{"id": listing_group, "name": f"Group {listing_group}"}]
+            person["customFieldValues"] = {
+                listing_group: {entity_type: [{"id": object_id(entity_type, position), "entityType": entity_type}]}
+            }
+
+        return person
+
+    def _company(self, index: int) -> Dict[str, Any]:
+        return {
+            "id": company_id(index),
+            "name": f"Company {index}",
+            "description": f"Benchmark company {index}",
+            "urls": [f"company{index}.benchmark.local"],
+            "groups": [],
+            "customFieldValues": {},
+            "createdAt": "2024-01-01T00:00:00Z"
+        }
+
+    def _custom_object(self, entity_type: str, index: int) -> Dict[str, Any]:
+        scenario = self.scenario
+        custom_object = {
+            "id": object_id(entity_type, index),
+            "name": f"{entity_type.rstrip('s')} {index}",
+            "customFieldValues": {"Stage": "Negotiation", "Budget": str(10000 + index), "Notes": "Benchmark"},
+            "people": [],
+            "companies": [],
+            "createdAt": "2024-01-01T00:00:00Z"
+        }
+
+        if scenario.people:
+            custom_object["people"] = [{"id": person_id(index % scenario.people)}]
+        if scenario.companies:
+            custom_object["companies"] = [{"id": company_id(index % scenario.companies)}]
+
+        return custom_object
+
+
+class CountingNeo4jClient:
+    """
+    Counts the statements and transactions the ingestion issues
+
+    Wraps a real Neo4jClient when given one; otherwise acknowledges every
+    statement itself, reporting bulk upserts as fully written. Acknowledged
+    counters go through the driver's SummaryCounters like real results.
+    """
+
+    def __init__(self, inner=None, write_latency_ms: float = 0.0):
+        self.inner = inner
+        self.write_latency_ms = write_latency_ms
+
+        self.statements = 0
+        self.transactions = 0
+        self.queries = 0  # statements run outside a multi-statement transaction
+
+    def __getattr__(self, name: str):
+        inner = self.__dict__.get("inner")
+        if inner is None:
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+    async def execute_query(
+        self, query: str, parameters: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None
+    ) -> QueryResult:
+        self.statements += 1
+        self.queries += 1
+
+        if self.inner is not None:
+            return await self.inner.execute_query(query, parameters, timeout)
+
+        await self._simulate(1)
+        return self._acknowledge(query, parameters or {})
+
+    async def execute_queries_in_transaction(
+        self, queries: List[Dict[str, Any]], timeout: Optional[int] = None
+    ) -> List[QueryResult]:
+        self.statements += len(queries)
+        self.transactions += 1
+
+        if self.inner is not None:
+            return await self.inner.execute_queries_in_transaction(queries, timeout)
+
+        await self._simulate(len(queries))
+        return [self._acknowledge(q["query"], q.get("parameters") or {}) for q in queries]
+
+    async def disconnect(self):
+        if self.inner is not None:
+            await self.inner.disconnect()
+
+    async def _simulate(self, statements: int) -> None:
+        if self.write_latency_ms:
+            await asyncio.sleep(self.write_latency_ms * statements / 1000)
+
+    @staticmethod
+    def _acknowledge(query: str, parameters: Dict[str, Any]) -> QueryResult:
+        records: List[Dict[str, Any]] = []
+        statistics: Dict[str, int] = {}  # server statistics, as the driver receives them
+
+        if "rows" in parameters and "AS upserted" in query:
+            folk_ids = [row["folk_id"] for row in parameters["rows"]]
+            records = [{"upserted": len(folk_ids), "changed_ids": folk_ids}]
+            statistics["nodes-created"] = len(folk_ids)
+        elif "pairs" in parameters:
+            statistics["relationships-created"] = len(parameters["pairs"])
+        elif "folk_ids" in parameters and "MERGE (owner)" in query:
+            statistics["relationships-created"] = len(parameters["folk_ids"])
+
+        return QueryResult(
+            records=records,
+            summary={"counters": summary_counters(SummaryCounters(statistics))},
+            execution_time=0.0,
+            query=query,
+            parameters=parameters,
+            success=True
+        )
+
+
+class BenchmarkIngestionService(FolkIngestionService):
+    """Ingestion service whose Folk clients talk to a FakeFolkAPI"""
+
+    def __init__(self, config: FolkConfig, fake_api: FakeFolkAPI):
+        super().__init__(config)
+        self.fake_api = fake_api
+
+    def create_folk_client(self, api_key: str) -> FolkClient:
+        return FolkClient(
+            api_key=api_key,
+            base_url=self.fake_api.base_url,
+            rate_limit=self.config.rate_limit,
+            timeout=self.config.timeout,
+            max_retries=self.config.max_retries,
+            max_concurrent_requests=self.config.max_concurrent_requests,
+            transport=self.fake_api.transport()
+        )
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one benchmark run"""
+    scenario: BenchmarkScenario
+    stats: IngestionStats
+    records: int
+    duration_seconds: float
+    rss_before_mb: float
+    peak_rss_mb: float
+    neo4j_statements: int
+    neo4j_transactions: int
+    api: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.duration_seconds if self.duration_seconds else 0.0
+
+    @property
+    def statements_per_record(self) -> float:
+        return self.neo4j_statements / self.records if self.records else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "records": self.records,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "records_per_second": round(self.records_per_second, 1),
+            "memory": {
+                "rss_before_mb": round(self.rss_before_mb, 1),
+                "peak_rss_mb": round(self.peak_rss_mb, 1)
+            },
+            "neo4j": {
+                "statements": self.neo4j_statements,
+                "transactions": self.neo4j_transactions,
+                "statements_per_record": round(self.statements_per_record, 3)
+            },
+            "api": dict(self.api),
+            "errors": len(self.stats.validation_errors) + len(self.stats.processing_errors),
+            "performance": self.stats.to_dict()["performance"]
+        }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, 0 where unavailable"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def benchmark_config(scenario: BenchmarkScenario, **overrides) -> FolkConfig:
+    """Ingestion settings for a benchmark run; the limiter is effectively off unless overridden"""
+    settings = {
+        "api_keys": [f"benchmark-key-{i + 1}" for i in range(scenario.api_keys)],
+        "base_url": FAKE_BASE_URL,
+        "rate_limit": 600000,
+        "publish_change_events": False,
+        "backup_before_ingestion": False
+    }
+    settings.update(overrides)
+    return FolkConfig(**settings)
+
+
+async def run_benchmark(
+    scenario: BenchmarkScenario,
+    config: Optional[FolkConfig] = None,
+    use_database: bool = False
+) -> BenchmarkResult:
+    """
+    Run one full ingestion against a fake Folk API
+
+    Args:
+        config: Ingestion settings (defaults to benchmark_config(scenario))
+        use_database: Write to the configured Neo4j database instead of the built-in sink
+    """
+    config = config or benchmark_config(scenario)
+    fake_api = FakeFolkAPI(scenario)
+    service = BenchmarkIngestionService(config, fake_api)
+
+    if use_database:
+        await service.initialize()
+    neo4j_client = CountingNeo4jClient(service.neo4j_client, write_latency_ms=scenario.write_latency_ms)
+    service.neo4j_client = neo4j_client
+    service.sync_store = SyncStateStore(neo4j_client)
+    service.checkpoint_store = CheckpointStore(neo4j_client)
+
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+
+    try:
+        stats = await service.run_full_ingestion()
+    finally:
+        duration = time.perf_counter() - started
+        await service.cleanup()
+
+    records = stats.people_processed + stats.companies_processed + stats.groups_processed \
+        + stats.custom_objects_processed
+
+    return BenchmarkResult(
+        scenario=scenario,
+        stats=stats,
+        records=records,
+        duration_seconds=duration,
+        rss_before_mb=rss_before,
+        peak_rss_mb=peak_rss_mb(),
+        neo4j_statements=neo4j_client.statements,
+        neo4j_transactions=neo4j_client.transactions,
+        api=dict(fake_api.stats)
+    )
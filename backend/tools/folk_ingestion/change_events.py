@@ -0,0 +1,85 @@
+"""
+Folk Change Events
+
+Tracks which Folk entities an ingestion run actually modified in Neo4j so
+the tool caches can invalidate only the dependent entries instead of
+flushing everything.
+"""
+
+import json
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+
+# Node properties that change on every sync and must not count as a modification
+# (the internal IDs are fresh UUIDs generated by each to_neo4j_node call, and
+# dataOwnerId is whichever API key wrote the node last; ownership is kept in
+# the OWNS_CONTACT / SOURCED relationships)
+VOLATILE_PROPERTIES = {
+    "lastSyncedAt", "folkContentHash", "personId", "organizationId", "objectId", "dataOwnerId"
+}
+
+
+def content_hash(properties: Dict[str, Any]) -> str:
+    """Stable hash of node properties, ignoring sync bookkeeping fields"""
+    stable = {k: v for k, v in properties.items() if k not in VOLATILE_PROPERTIES}
+    encoded = json.dumps(stable, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+@dataclass
+class FolkChange:
+    """A single modified Folk entity"""
+    entity_type: str
+    folk_id: str
+    name: Optional[str] = None
+    related_folk_ids: List[str] = field(default_factory=list)
+
+
+class FolkChangeSet:
+    """Modified entities collected during an ingestion run, keyed by folk ID"""
+
+    def __init__(self):
+        self._changes: Dict[str, FolkChange] = {}
+
+    def record(
+        self,
+        entity_type: str,
+        folk_id: str,
+        name: Optional[str] = None,
+        related_folk_ids: Iterable[str] = ()
+    ) -> None:
+        """Record that an entity was created or modified"""
+        if not folk_id:
+            return
+
+        related = [related_id for related_id in related_folk_ids if related_id]
+        existing = self._changes.get(folk_id)
+
+        if existing:
+            existing.name = existing.name or name
+            existing.related_folk_ids.extend(r for r in related if r not in existing.related_folk_ids)
+        else:
+            self._changes[folk_id] = FolkChange(entity_type, folk_id, name, related)
+
+    def changes(self) -> List[FolkChange]:
+        return list(self._changes.values())
+
+    def folk_ids(self) -> List[str]:
+        return list(self._changes)
+
+    def counts_by_type(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for change in self._changes.values():
+            counts[change.entity_type] = counts.get(change.entity_type, 0) + 1
+        return counts
+
+    def clear(self) -> None:
+        self._changes.clear()
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __bool__(self) -> bool:
+        return bool(self._changes)
+
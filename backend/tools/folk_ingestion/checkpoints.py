@@ -0,0 +1,246 @@
+"""
+Folk Ingestion Checkpoints
+
+Crash-safe progress for long ingestion runs. After every committed batch a
+`FolkIngestionCheckpoint` node records, per API key and listing (people,
+companies, or one group's custom object type), the cursor of the first page
+that is not yet fully written and the folk IDs already written from it. The
+checkpoint is saved in the same transaction as the batch, so it never claims
+work that was rolled back.
+
+A restarted run skips listings that completed, resumes the others from their
+cursor, and drops records that were already written. Checkpoints are cleared
+once an API key finishes, so the next regular run starts from page one.
+"""
+
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ListingCheckpoint:
+    """Persisted progress of one listing under one API key"""
+    scope: str
+    listing: str
+    cursor: Optional[str] = None
+    batch_number: int = 0
+    records_done: int = 0
+    done_ids: List[str] = field(default_factory=list)
+    completed: bool = False
+    entity_types: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@dataclass
+class _PageProgress:
+    """Write progress of one fetched page"""
+    cursor: Optional[str]
+    next_cursor: Optional[str]
+    pending: Set[str]
+    done: List[str]
+
+
+class ListingProgress:
+    """
+    Tracks which fetched pages of a listing are fully written
+
+    Only the pages between the resume cursor and the fetch position are kept,
+    which the pipeline's bounded queues limit to a handful.
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        listing: str,
+        checkpoint: Optional[ListingCheckpoint] = None,
+        entity_types: Optional[Dict[str, Set[str]]] = None
+    ):
+        self.scope = scope
+        self.listing = listing
+        self.entity_types = entity_types
+        self.resumed = checkpoint is not None
+        self.completed = bool(checkpoint and checkpoint.completed)
+        self.start_cursor = checkpoint.cursor if checkpoint else None
+        self.batch_number = checkpoint.batch_number if checkpoint else 0
+        self.records_done = checkpoint.records_done if checkpoint else 0
+
+        # Records the interrupted run already wrote from the resume page
+        self._skip_ids: Set[str] = set(checkpoint.done_ids) if checkpoint else set()
+        self.refetched = 0
+
+        self._cursor = self.start_cursor
+        self._pages: Deque[_PageProgress] = deque()
+
+    async def filter_pages(self, pages: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Register fetched pages, dropping records already written before a restart"""
+        async for page in pages:
+            records = self.add_page(page)
+            if records:
+                yield records
+
+    def add_page(self, page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Register one fetched page; returns the records that still need processing"""
+        records = []
+        done = []
+
+        for record in page:
+            folk_id = record.get("id")
+            if folk_id in self._skip_ids:
+                done.append(folk_id)
+            else:
+                records.append(record)
+
+        self.refetched += len(done)
+        self._pages.append(_PageProgress(
+            cursor=getattr(page, "cursor", None),
+            next_cursor=getattr(page, "next_cursor", None),
+            pending={record["id"] for record in records if record.get("id")},
+            done=done
+        ))
+        self._advance()
+        return records
+
+    def mark_done(self, folk_ids: Iterable[str], committed: bool = False) -> None:
+        """Mark records as written (committed=True) or as needing no write"""
+        folk_ids = set(folk_ids)
+
+        for page in self._pages:
+            finished = page.pending & folk_ids
+            if finished:
+                page.pending -= finished
+                page.done.extend(finished)
+
+        if committed:
+            self.batch_number += 1
+            self.records_done += len(folk_ids)
+
+        self._advance()
+
+    @property
+    def has_pending(self) -> bool:
+        return any(page.pending for page in self._pages)
+
+    def checkpoint(self, committing: Iterable[str] = (), completed: bool = False) -> ListingCheckpoint:
+        """
+        Checkpoint describing the listing once `committing` is written
+
+        Does not change the tracked state; call mark_done after the commit.
+        """
+        committing = set(committing)
+        cursor = self._cursor
+        done_ids: List[str] = []
+
+        for page in self._pages:
+            if page.pending - committing:
+                cursor = page.cursor
+                done_ids = page.done + sorted(page.pending & committing)
+                break
+            cursor = page.next_cursor
+
+        return ListingCheckpoint(
+            scope=self.scope,
+            listing=self.listing,
+            cursor=cursor,
+            batch_number=self.batch_number + (1 if committing else 0),
+            records_done=self.records_done + len(committing),
+            done_ids=done_ids,
+            completed=completed,
+            entity_types={
+                group_id: sorted(types) for group_id, types in (self.entity_types or {}).items()
+            }
+        )
+
+    def _advance(self) -> None:
+        """Drop fully written pages from the front, moving the resume cursor past them"""
+        while self._pages and not self._pages[0].pending:
+            self._cursor = self._pages.popleft().next_cursor
+
+
+class CheckpointStore:
+    """Reads and writes FolkIngestionCheckpoint nodes"""
+
+    def __init__(self, neo4j_client):
+        self.neo4j_client = neo4j_client
+
+    async def load(self, scope: str, max_age_hours: int) -> Dict[str, ListingCheckpoint]:
+        """Checkpoints left by an interrupted run of an API key"""
+        result = await self.neo4j_client.execute_query(
+            """
+            MATCH (c:FolkIngestionCheckpoint {scope: $scope})
+            WHERE c.updatedAt >= datetime() - duration({hours: $max_age_hours})
+            RETURN c.listing AS listing, c.cursor AS cursor, c.batchNumber AS batch_number,
+                   c.recordsDone AS records_done, c.doneIds AS done_ids,
+                   c.completed AS completed, c.entityTypes AS entity_types
+            """,
+            {"scope": scope, "max_age_hours": max_age_hours}
+        )
+
+        if not result.success:
+            logger.warning(f"Failed to load ingestion checkpoints for {scope}: {result.error}")
+            return {}
+
+        return {
+            record["listing"]: ListingCheckpoint(
+                scope=scope,
+                listing=record["listing"],
+                cursor=record.get("cursor"),
+                batch_number=record.get("batch_number") or 0,
+                records_done=record.get("records_done") or 0,
+                done_ids=list(record.get("done_ids") or []),
+                completed=bool(record.get("completed")),
+                entity_types=json.loads(record.get("entity_types") or "{}")
+            )
+            for record in result.records
+        }
+
+    @staticmethod
+    def save_statement(checkpoint: ListingCheckpoint) -> Dict[str, Any]:
+        """Statement saving a checkpoint, for the transaction that writes its batch"""
+        return {
+            "query": """
+            MERGE (c:FolkIngestionCheckpoint {scope: $scope, listing: $listing})
+            SET c.cursor = $cursor,
+                c.batchNumber = $batch_number,
+                c.recordsDone = $records_done,
+                c.doneIds = $done_ids,
+                c.completed = $completed,
+                c.entityTypes = $entity_types,
+                c.updatedAt = datetime()
+            """,
+            "parameters": {
+                "scope": checkpoint.scope,
+                "listing": checkpoint.listing,
+                "cursor": checkpoint.cursor,
+                "batch_number": checkpoint.batch_number,
+                "records_done": checkpoint.records_done,
+                "done_ids": checkpoint.done_ids,
+                "completed": checkpoint.completed,
+                "entity_types": json.dumps(checkpoint.entity_types)
+            }
+        }
+
+    async def save(self, checkpoint: ListingCheckpoint) -> bool:
+        """Save a checkpoint on its own (listing completion)"""
+        statement = self.save_statement(checkpoint)
+        result = await self.neo4j_client.execute_query(statement["query"], statement["parameters"])
+        return result.success
+
+    async def clear(self, scope: str) -> int:
+        """Remove an API key's checkpoints once its run finished"""
+        result = await self.neo4j_client.execute_query(
+            """
+            MATCH (c:FolkIngestionCheckpoint {scope: $scope})
+            DELETE c
+            RETURN count(*) AS cleared
+            """,
+            {"scope": scope}
+        )
+
+        if not result.success or not result.records:
+            return 0
+
+        return result.records[0].get("cleared", 0)
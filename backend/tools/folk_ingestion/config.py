@@ -38,9 +38,28 @@ class FolkConfig:
     dry_run: bool = False
     batch_size: int = 50
     max_concurrent_requests: int = 5
+    pipeline_queue_size: int = 4
+    max_parallel_keys: int = 3
     enable_detailed_logging: bool = False
     backup_before_ingestion: bool = True
     
+    # Sync mode: "full" rewrites everything, "incremental" writes only changes
+    sync_mode: str = "full"
+    tombstone_retention_days: int = 30
+    
+    # Checkpoints: resume an interrupted run instead of starting from page one
+    enable_checkpoints: bool = True
+    checkpoint_max_age_hours: int = 24
+    
+    # Near-real-time sync worker (webhooks, with incremental polling as fallback)
+    webhook_secret: str = ""
+    sync_coalesce_seconds: float = 2.0
+    sync_poll_interval_seconds: int = 900
+    
+    # Change events (cache invalidation for modified entities)
+    publish_change_events: bool = True
+    redis_url: str = ""
+    
     # Logging Configuration
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -89,9 +108,28 @@ class FolkConfig:
             dry_run=os.getenv("FOLK_INGESTION_DRY_RUN", "false").lower() == "true",
             batch_size=int(os.getenv("FOLK_INGESTION_BATCH_SIZE", "50")),
             max_concurrent_requests=int(os.getenv("FOLK_INGESTION_MAX_CONCURRENT", "5")),
+            pipeline_queue_size=int(os.getenv("FOLK_INGESTION_QUEUE_SIZE", "4")),
+            max_parallel_keys=int(os.getenv("FOLK_INGESTION_PARALLEL_KEYS", "3")),
             enable_detailed_logging=os.getenv("FOLK_INGESTION_DETAILED_LOGGING", "false").lower() == "true",
             backup_before_ingestion=os.getenv("FOLK_INGESTION_BACKUP", "true").lower() == "true",
             
+            # Sync mode
+            sync_mode=os.getenv("FOLK_SYNC_MODE", "full").lower(),
+            tombstone_retention_days=int(os.getenv("FOLK_TOMBSTONE_RETENTION_DAYS", "30")),
+            
+            # Checkpoints
+            enable_checkpoints=os.getenv("FOLK_INGESTION_CHECKPOINTS", "true").lower() == "true",
+            checkpoint_max_age_hours=int(os.getenv("FOLK_CHECKPOINT_MAX_AGE_HOURS", "24")),
+            
+            # Sync worker
+            webhook_secret=os.getenv("FOLK_WEBHOOK_SECRET", ""),
+            sync_coalesce_seconds=float(os.getenv("FOLK_SYNC_COALESCE_SECONDS", "2")),
+            sync_poll_interval_seconds=int(os.getenv("FOLK_SYNC_POLL_INTERVAL", "900")),
+            
+            # Change events
+            publish_change_events=os.getenv("FOLK_CHANGE_EVENTS", "true").lower() == "true",
+            redis_url=os.getenv("REDIS_URL", ""),
+            
             # Logging
             log_level=os.getenv("FOLK_LOG_LEVEL", "INFO"),
             log_file=os.getenv("FOLK_LOG_FILE")
@@ -118,6 +156,24 @@ class FolkConfig:
         if self.max_concurrent_requests <= 0:
             raise ValueError("Max concurrent requests must be greater than 0")
         
+        if self.pipeline_queue_size <= 0:
+            raise ValueError("Pipeline queue size must be greater than 0")
+        
+        if self.max_parallel_keys <= 0:
+            raise ValueError("Max parallel keys must be greater than 0")
+        
+        if self.checkpoint_max_age_hours <= 0:
+            raise ValueError("Checkpoint max age must be greater than 0")
+        
+        if self.sync_coalesce_seconds < 0:
+            raise ValueError("Sync coalesce window cannot be negative")
+        
+        if self.sync_poll_interval_seconds < 0:
+            raise ValueError("Sync poll interval cannot be negative")
+        
+        if self.sync_mode not in ["full", "incremental"]:
+            raise ValueError("Sync mode must be 'full' or 'incremental'")
+        
         if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
             raise ValueError("Invalid log level")
     
@@ -169,8 +225,18 @@ class FolkConfig:
                 "dry_run": self.dry_run,
                 "batch_size": self.batch_size,
                 "max_concurrent_requests": self.max_concurrent_requests,
+                "pipeline_queue_size": self.pipeline_queue_size,
+                "max_parallel_keys": self.max_parallel_keys,
                 "detailed_logging": self.enable_detailed_logging,
-                "backup_enabled": self.backup_before_ingestion
+                "backup_enabled": self.backup_before_ingestion,
+                "sync_mode": self.sync_mode,
+                "tombstone_retention_days": self.tombstone_retention_days,
+                "checkpoints": self.enable_checkpoints,
+                "checkpoint_max_age_hours": self.checkpoint_max_age_hours,
+                "webhook_signatures": bool(self.webhook_secret),
+                "sync_coalesce_seconds": self.sync_coalesce_seconds,
+                "sync_poll_interval_seconds": self.sync_poll_interval_seconds,
+                "change_events": self.publish_change_events and bool(self.redis_url)
             },
             "logging": {
                 "level": self.log_level,
@@ -207,8 +273,19 @@ def validate_environment() -> Dict[str, Any]:
         "FOLK_INGESTION_DRY_RUN",
         "FOLK_INGESTION_BATCH_SIZE",
         "FOLK_INGESTION_MAX_CONCURRENT",
+        "FOLK_INGESTION_QUEUE_SIZE",
+        "FOLK_INGESTION_PARALLEL_KEYS",
         "FOLK_INGESTION_DETAILED_LOGGING",
         "FOLK_INGESTION_BACKUP",
+        "FOLK_SYNC_MODE",
+        "FOLK_TOMBSTONE_RETENTION_DAYS",
+        "FOLK_INGESTION_CHECKPOINTS",
+        "FOLK_CHECKPOINT_MAX_AGE_HOURS",
+        "FOLK_WEBHOOK_SECRET",
+        "FOLK_SYNC_COALESCE_SECONDS",
+        "FOLK_SYNC_POLL_INTERVAL",
+        "FOLK_CHANGE_EVENTS",
+        "REDIS_URL",
         "FOLK_LOG_LEVEL",
         "FOLK_LOG_FILE"
     ]
@@ -264,9 +341,28 @@ NEO4J_DATABASE=neo4j
 FOLK_INGESTION_DRY_RUN=false
 FOLK_INGESTION_BATCH_SIZE=50
 FOLK_INGESTION_MAX_CONCURRENT=5
+FOLK_INGESTION_QUEUE_SIZE=4
+FOLK_INGESTION_PARALLEL_KEYS=3
 FOLK_INGESTION_DETAILED_LOGGING=false
 FOLK_INGESTION_BACKUP=true
 
+# Sync Mode (Optional - "incremental" writes only changed records)
+FOLK_SYNC_MODE=full
+FOLK_TOMBSTONE_RETENTION_DAYS=30
+
+# Checkpoints (Optional - resume interrupted runs)
+FOLK_INGESTION_CHECKPOINTS=true
+FOLK_CHECKPOINT_MAX_AGE_HOURS=24
+
+# Sync Worker (Optional - run_folk_sync_worker.py, which requires the secret)
+FOLK_WEBHOOK_SECRET=
+FOLK_SYNC_COALESCE_SECONDS=2
+FOLK_SYNC_POLL_INTERVAL=900
+
+# Change Events (Optional - invalidates API tool caches for modified entities)
+FOLK_CHANGE_EVENTS=true
+REDIS_URL=redis://localhost:6379
+
 # Logging Configuration (Optional)
 FOLK_LOG_LEVEL=INFO
 FOLK_LOG_FILE=folk_ingestion.log
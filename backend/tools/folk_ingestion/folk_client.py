@@ -7,15 +7,35 @@ rate limiting, and authentication support.
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
+from urllib.parse import urlparse, parse_qs
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, wait_exponential, retry_if_exception_type
+
+from .rate_limiter import AsyncTokenBucket, get_shared_limiter, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+# Backoff for transient failures; rate-limit waits are owned by the limiter
+_backoff = wait_exponential(multiplier=1, min=4, max=10)
+
+
+def _retry_wait(retry_state) -> float:
+    """No extra wait after a 429 (the shared limiter already paused), backoff otherwise"""
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exception, FolkRateLimitError):
+        return 0
+    return _backoff(retry_state)
+
+
+def _stop_after_max_retries(retry_state) -> bool:
+    """Stop after the client's configured number of attempts"""
+    client = retry_state.args[0] if retry_state.args else None
+    return retry_state.attempt_number >= getattr(client, "max_retries", 3)
+
 
 class FolkAPIError(Exception):
     """Base exception for Folk API errors"""
@@ -29,7 +49,10 @@ class FolkAuthenticationError(FolkAPIError):
 
 class FolkRateLimitError(FolkAPIError):
     """Rate limit exceeded"""
-    pass
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class FolkAPIUnavailableError(FolkAPIError):
@@ -56,13 +79,23 @@ class APIResponse:
     error: Optional[str] = None
 
 
+class FolkPage(list):
+    """One page of a listing, with the cursor that fetched it and the next one"""
+    
+    def __init__(self, items: List[Dict[str, Any]], cursor: Optional[str] = None, next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+
 class FolkClient:
     """
     Async Folk.app API Client
     
     Features:
     - Authentication with API keys
-    - Rate limiting with exponential backoff
+    - Adaptive token-bucket rate limiting shared per API key
+    - Concurrent fetching of independent listings
     - Comprehensive error handling
     - Retry logic for transient failures
     - Request/response logging
@@ -74,18 +107,35 @@ class FolkClient:
         base_url: str = "https://api.folk.app/v1",
         rate_limit: int = 100,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        max_concurrent_requests: int = 5,
+        limiter: Optional[AsyncTokenBucket] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
     ):
-        """Initialize Folk API client"""
+        """
+        Initialize Folk API client
+        
+        Args:
+            rate_limit: Requests per minute allowed for this API key
+            max_concurrent_requests: Requests in flight at once
+            limiter: Token bucket to share (defaults to the process-wide bucket for the key)
+            transport: HTTP transport override (e.g. a fake Folk API for benchmarks)
+        """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.rate_limit = rate_limit
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrent_requests = max_concurrent_requests
+        
+        # Folk quotas are per key, so clients for the same key share one bucket
+        self.limiter = limiter or get_shared_limiter(api_key, rate_limit)
+        self._concurrency = asyncio.Semaphore(max_concurrent_requests)
         
         # Track API usage
         self._requests_made = 0
         self._errors_count = 0
+        self._rate_limited_count = 0
         
         # HTTP client configuration
         self.client = httpx.AsyncClient(
@@ -95,7 +145,11 @@ class FolkClient:
                 "User-Agent": "OneVice-Folk-Integration/1.0"
             },
             timeout=httpx.Timeout(timeout),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+            limits=httpx.Limits(
+                max_connections=max(10, max_concurrent_requests),
+                max_keepalive_connections=max(5, max_concurrent_requests)
+            ),
+            transport=transport
         )
         
         logger.info(f"Folk API client initialized for {base_url}")
@@ -115,9 +169,10 @@ class FolkClient:
             logger.info("Folk API client closed")
     
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((httpx.RequestError, FolkRateLimitError, FolkAPIUnavailableError))
+        stop=_stop_after_max_retries,
+        wait=_retry_wait,
+        retry=retry_if_exception_type((FolkRateLimitError, FolkAPIUnavailableError)),
+        reraise=True
     )
     async def _make_request(
         self,
@@ -134,20 +189,28 @@ class FolkClient:
         try:
             logger.debug(f"Folk API {method.upper()} {url} (attempt {self._requests_made})")
             
-            response = await self.client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data if data else None
-            )
+            async with self._concurrency:
+                await self.limiter.acquire()
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=data if data else None
+                )
             
-            # Handle rate limiting
+            # Handle rate limiting: pause the shared bucket and let the retry
+            # wait on it, instead of sleeping here and backing off again
             if response.status_code == 429:
                 self._errors_count += 1
-                retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning(f"Rate limit hit, retrying after {retry_after}s")
-                await asyncio.sleep(retry_after)
-                raise FolkRateLimitError(f"Rate limit exceeded, retry after {retry_after}s")
+                self._rate_limited_count += 1
+                retry_after = self.limiter.on_rate_limited(
+                    parse_retry_after(response.headers.get("Retry-After"))
+                )
+                raise FolkRateLimitError(
+                    f"Rate limit exceeded, retry after {retry_after:.0f}s", retry_after=retry_after
+                )
+            
+            self.limiter.on_response(response.headers)
             
             # Handle authentication errors
             if response.status_code == 401:
@@ -198,11 +261,14 @@ class FolkClient:
                 headers=dict(response.headers)
             )
             
+        except FolkAPIError:
+            raise
+        
         except httpx.RequestError as e:
             self._errors_count += 1
             error_msg = f"HTTP request failed: {str(e)}"
             logger.error(error_msg)
-            raise FolkAPIError(error_msg) from e
+            raise FolkAPIUnavailableError(error_msg) from e
         
         except Exception as e:
             self._errors_count += 1
@@ -314,26 +380,27 @@ class FolkClient:
         
         return deals
     
-    async def get_all_people_paginated(self, page_size: int = 100) -> List[Dict[str, Any]]:
-        """Get all people with automatic pagination using nextLink"""
-        
-        all_people = []
-        next_url = None
+    async def iter_pages(
+        self, endpoint: str, page_size: int, description: str, cursor: Optional[str] = None
+    ) -> AsyncIterator[FolkPage]:
+        """
+        Yield a listing page by page, following nextLink cursors
+        
+        Pages of one listing are sequential by nature (each cursor comes from
+        the previous page); pacing is left to the shared rate limiter, so
+        independent listings iterated concurrently interleave at the allowed rate.
+        Passing a `cursor` resumes the listing at that page.
+        """
         
         while True:
-            if next_url:
-                # Extract cursor from nextLink URL
-                from urllib.parse import urlparse, parse_qs
-                parsed = urlparse(next_url)
-                cursor = parse_qs(parsed.query).get('cursor', [None])[0]
-                params = {"limit": page_size, "cursor": cursor} if cursor else {"limit": page_size}
-            else:
-                params = {"limit": page_size}
+            params = {"limit": page_size}
+            if cursor:
+                params["cursor"] = cursor
             
-            response = await self._make_request("GET", "/people", params=params)
+            response = await self._make_request("GET", endpoint, params=params)
             
             if not response.success:
-                raise FolkAPIError(f"Failed to get people: {response.error}")
+                raise FolkAPIError(f"Failed to get {description}: {response.error}")
             
             # Folk API returns data in data.items structure
             batch = response.data.get("data", {}).get("items", [])
@@ -341,147 +408,71 @@ class FolkClient:
             if not batch:
                 break
             
-            all_people.extend(batch)
-            
             # Check for pagination nextLink
             next_url = response.data.get("data", {}).get("pagination", {}).get("nextLink")
-            if not next_url:
+            next_cursor = parse_qs(urlparse(next_url).query).get("cursor", [None])[0] if next_url else None
+            
+            yield FolkPage(batch, cursor=cursor, next_cursor=next_cursor)
+            
+            if not next_cursor:
                 break
             
-            # Rate limiting between requests
-            await asyncio.sleep(0.1)
+            cursor = next_cursor
+    
+    async def _get_all_pages(self, endpoint: str, page_size: int, description: str) -> List[Dict[str, Any]]:
+        """Collect a whole listing into memory"""
+        
+        items = []
+        async for batch in self.iter_pages(endpoint, page_size, description):
+            items.extend(batch)
+        
+        logger.info(f"Retrieved total of {len(items)} {description} via pagination")
+        return items
+    
+    def iter_people_pages(self, page_size: int = 100, cursor: Optional[str] = None) -> AsyncIterator[FolkPage]:
+        """Stream people page by page"""
+        return self.iter_pages("/people", page_size, "people", cursor)
+    
+    def iter_companies_pages(self, page_size: int = 100, cursor: Optional[str] = None) -> AsyncIterator[FolkPage]:
+        """Stream companies page by page"""
+        return self.iter_pages("/companies", page_size, "companies", cursor)
+    
+    def iter_custom_object_pages(
+        self, group_id: str, entity_type: str, page_size: int = 100, cursor: Optional[str] = None
+    ) -> AsyncIterator[FolkPage]:
+        """Stream custom objects of one group and entity type page by page"""
+        return self.iter_pages(
+            f"/groups/{group_id}/{entity_type}", page_size, f"{entity_type} for group {group_id}", cursor
+        )
+    
+    async def get_all_people_paginated(self, page_size: int = 100) -> List[Dict[str, Any]]:
+        """Get all people with automatic pagination using nextLink"""
         
-        logger.info(f"Retrieved total of {len(all_people)} people via pagination")
-        return all_people
+        return await self._get_all_pages("/people", page_size, "people")
     
     async def get_all_companies_paginated(self, page_size: int = 100) -> List[Dict[str, Any]]:
         """Get all companies with automatic pagination using nextLink"""
         
-        all_companies = []
-        next_url = None
-        
-        while True:
-            if next_url:
-                # Extract cursor from nextLink URL
-                from urllib.parse import urlparse, parse_qs
-                parsed = urlparse(next_url)
-                cursor = parse_qs(parsed.query).get('cursor', [None])[0]
-                params = {"limit": page_size, "cursor": cursor} if cursor else {"limit": page_size}
-            else:
-                params = {"limit": page_size}
-            
-            response = await self._make_request("GET", "/companies", params=params)
-            
-            if not response.success:
-                raise FolkAPIError(f"Failed to get companies: {response.error}")
-            
-            # Folk API returns data in data.items structure
-            batch = response.data.get("data", {}).get("items", [])
-            
-            if not batch:
-                break
-            
-            all_companies.extend(batch)
-            
-            # Check for pagination nextLink
-            next_url = response.data.get("data", {}).get("pagination", {}).get("nextLink")
-            if not next_url:
-                break
-            
-            # Rate limiting between requests
-            await asyncio.sleep(0.1)
-        
-        logger.info(f"Retrieved total of {len(all_companies)} companies via pagination")
-        return all_companies
+        return await self._get_all_pages("/companies", page_size, "companies")
     
     async def get_all_groups_paginated(self, page_size: int = 100) -> List[Dict[str, Any]]:
         """Get all groups with automatic pagination using nextLink"""
         
-        all_groups = []
-        next_url = None
-        
-        while True:
-            if next_url:
-                # Extract cursor from nextLink URL
-                from urllib.parse import urlparse, parse_qs
-                parsed = urlparse(next_url)
-                cursor = parse_qs(parsed.query).get('cursor', [None])[0]
-                params = {"limit": page_size, "cursor": cursor} if cursor else {"limit": page_size}
-            else:
-                params = {"limit": page_size}
-            
-            response = await self._make_request("GET", "/groups", params=params)
-            
-            if not response.success:
-                raise FolkAPIError(f"Failed to get groups: {response.error}")
-            
-            # Folk API returns data in data.items structure
-            batch = response.data.get("data", {}).get("items", [])
-            
-            if not batch:
-                break
-            
-            all_groups.extend(batch)
-            
-            # Check for pagination nextLink
-            next_url = response.data.get("data", {}).get("pagination", {}).get("nextLink")
-            if not next_url:
-                break
-            
-            # Rate limiting between requests
-            await asyncio.sleep(0.1)
-        
-        logger.info(f"Retrieved total of {len(all_groups)} groups via pagination")
-        return all_groups
+        return await self._get_all_pages("/groups", page_size, "groups")
     
     async def get_all_deals_for_group_paginated(self, group_id: str, page_size: int = 100) -> List[Dict[str, Any]]:
         """Get all deals for a specific group with automatic pagination using nextLink"""
         
-        all_deals = []
-        next_url = None
-        
-        while True:
-            if next_url:
-                # Extract cursor from nextLink URL
-                from urllib.parse import urlparse, parse_qs
-                parsed = urlparse(next_url)
-                cursor = parse_qs(parsed.query).get('cursor', [None])[0]
-                params = {"limit": page_size, "cursor": cursor} if cursor else {"limit": page_size}
-            else:
-                params = {"limit": page_size}
-            
-            response = await self._make_request("GET", f"/groups/{group_id}/Deals", params=params)
-            
-            if not response.success:
-                raise FolkAPIError(f"Failed to get deals for group {group_id}: {response.error}")
-            
-            # Folk API returns data in data.items structure
-            batch = response.data.get("data", {}).get("items", [])
-            
-            if not batch:
-                break
-            
-            all_deals.extend(batch)
-            
-            # Check for pagination nextLink
-            next_url = response.data.get("data", {}).get("pagination", {}).get("nextLink")
-            if not next_url:
-                break
-            
-            # Rate limiting between requests
-            await asyncio.sleep(0.1)
-        
-        logger.info(f"Retrieved total of {len(all_deals)} deals for group {group_id} via pagination")
-        return all_deals
+        return await self._get_all_pages(
+            f"/groups/{group_id}/Deals", page_size, f"deals for group {group_id}"
+        )
     
-    def discover_entity_types_from_data(self, people_data: List[Dict], companies_data: List[Dict]) -> Dict[str, List[str]]:
-        """Discover entity types by parsing customFieldValues from people and companies"""
-        
-        group_entity_types = {}
+    @staticmethod
+    def collect_entity_types(records: List[Dict], group_entity_types: Dict[str, Set[str]]) -> None:
+        """Add the entity types referenced by records' customFieldValues, in place"""
         
-        # Check companies customFieldValues
-        for company in companies_data:
-            custom_fields = company.get("customFieldValues", {})
+        for record in records:
+            custom_fields = record.get("customFieldValues", {})
             
             for group_id, group_fields in custom_fields.items():
                 if not group_id.startswith("grp_"):
@@ -497,25 +488,14 @@ class FolkClient:
                         for item in field_value:
                             if isinstance(item, dict) and "entityType" in item:
                                 group_entity_types[group_id].add(field_name)
+    
+    def discover_entity_types_from_data(self, people_data: List[Dict], companies_data: List[Dict]) -> Dict[str, List[str]]:
+        """Discover entity types by parsing customFieldValues from people and companies"""
         
-        # Check people customFieldValues  
-        for person in people_data:
-            custom_fields = person.get("customFieldValues", {})
-            
-            for group_id, group_fields in custom_fields.items():
-                if not group_id.startswith("grp_"):
-                    continue
-                    
-                if group_id not in group_entity_types:
-                    group_entity_types[group_id] = set()
-                
-                # Look for array fields that contain entity references
-                for field_name, field_value in group_fields.items():
-                    if isinstance(field_value, list) and field_value:
-                        # Check if items have entity-like structure
-                        for item in field_value:
-                            if isinstance(item, dict) and "entityType" in item:
-                                group_entity_types[group_id].add(field_name)
+        group_entity_types: Dict[str, Set[str]] = {}
+        
+        self.collect_entity_types(companies_data, group_entity_types)
+        self.collect_entity_types(people_data, group_entity_types)
         
         # Convert sets to lists for easier handling
         result = {group_id: list(entity_types) for group_id, entity_types in group_entity_types.items()}
@@ -547,47 +527,43 @@ class FolkClient:
     async def get_all_custom_objects_paginated(self, group_id: str, entity_type: str, page_size: int = 100) -> List[Dict[str, Any]]:
         """Get all custom objects of a specific entity type with automatic pagination"""
         
-        all_objects = []
-        next_url = None
+        return await self._get_all_pages(
+            f"/groups/{group_id}/{entity_type}", page_size, f"{entity_type} for group {group_id}"
+        )
+    
+    async def _get_record(self, endpoint: str, description: str) -> Optional[Dict[str, Any]]:
+        """Get a single record, None if it does not exist (anymore)"""
         
-        while True:
-            if next_url:
-                # Extract cursor from nextLink URL
-                from urllib.parse import urlparse, parse_qs
-                parsed = urlparse(next_url)
-                cursor = parse_qs(parsed.query).get('cursor', [None])[0]
-                params = {"limit": page_size, "cursor": cursor} if cursor else {"limit": page_size}
-            else:
-                params = {"limit": page_size}
-            
-            response = await self._make_request("GET", f"/groups/{group_id}/{entity_type}", params=params)
-            
-            if not response.success:
-                raise FolkAPIError(f"Failed to get {entity_type} for group {group_id}: {response.error}")
-            
-            # Folk API returns data in data.items structure
-            batch = response.data.get("data", {}).get("items", [])
-            
-            if not batch:
-                break
-            
-            all_objects.extend(batch)
-            
-            # Check for pagination nextLink
-            next_url = response.data.get("data", {}).get("pagination", {}).get("nextLink")
-            if not next_url:
-                break
-            
-            # Rate limiting between requests
-            await asyncio.sleep(0.1)
+        response = await self._make_request("GET", endpoint)
+        
+        if response.status_code == 404:
+            return None
+        
+        if not response.success:
+            raise FolkAPIError(f"Failed to get {description}: {response.error}")
         
-        logger.info(f"Retrieved total of {len(all_objects)} {entity_type} for group {group_id} via pagination")
-        return all_objects
+        return response.data.get("data")
+    
+    async def get_person(self, person_id: str) -> Optional[Dict[str, Any]]:
+        """Get one person by Folk ID"""
+        return await self._get_record(f"/people/{person_id}", f"person {person_id}")
+    
+    async def get_company(self, company_id: str) -> Optional[Dict[str, Any]]:
+        """Get one company by Folk ID"""
+        return await self._get_record(f"/companies/{company_id}", f"company {company_id}")
+    
+    async def get_custom_object(self, group_id: str, entity_type: str, object_id: str) -> Optional[Dict[str, Any]]:
+        """Get one custom object (deal, project, ...) of a group by Folk ID"""
+        return await self._get_record(
+            f"/groups/{group_id}/{entity_type}/{object_id}", f"{entity_type} {object_id} for group {group_id}"
+        )
     
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """Get client usage statistics"""
         return {
             "requests_made": self._requests_made,
             "errors_count": self._errors_count,
-            "success_rate": (self._requests_made - self._errors_count) / max(self._requests_made, 1)
+            "rate_limited_count": self._rate_limited_count,
+            "success_rate": (self._requests_made - self._errors_count) / max(self._requests_made, 1),
+            "limiter": self.limiter.get_stats()
         }
\ No newline at end of file
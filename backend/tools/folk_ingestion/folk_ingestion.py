@@ -9,13 +9,18 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Set
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Set, Callable, Awaitable, AsyncIterator
+from dataclasses import dataclass, field, fields
+from contextvars import ContextVar
 from contextlib import asynccontextmanager
 
 from .folk_client import FolkClient, FolkAPIError, FolkUser
 from .folk_models import FolkPerson, FolkCompany, FolkGroup, FolkCustomObject
 from .config import FolkConfig
+from .change_events import FolkChangeSet, content_hash
+from .sync_state import ListingDelta, SyncStateStore
+from .pipeline import PipelineMetrics, PipelineStats, run_pipeline
+from .checkpoints import CheckpointStore, ListingCheckpoint, ListingProgress
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -23,6 +28,9 @@ from database.neo4j_client import Neo4jClient, ConnectionConfig
 
 logger = logging.getLogger(__name__)
 
+# Stats of the API key processed by the current task (unset outside key workers)
+_key_stats: ContextVar[Optional["IngestionStats"]] = ContextVar("folk_key_stats", default=None)
+
 
 @dataclass
 class IngestionStats:
@@ -35,6 +43,7 @@ class IngestionStats:
     api_keys_processed: int = 0
     api_requests_made: int = 0
     api_errors: int = 0
+    api_rate_limited: int = 0
     
     # Data stats
     people_fetched: int = 0
@@ -47,6 +56,23 @@ class IngestionStats:
     custom_objects_processed: int = 0
     entity_types_discovered: int = 0
     
+    # Change tracking
+    entities_changed: int = 0
+    cache_entries_invalidated: int = 0
+    
+    # Incremental sync stats
+    sync_mode: str = "full"
+    delta_records_skipped: int = 0
+    delta_entity_types_skipped: int = 0
+    records_tombstoned: int = 0
+    tombstones_purged: int = 0
+    
+    # Resume stats: work taken over from an interrupted run vs fetched again
+    checkpoint_listings_resumed: int = 0
+    checkpoint_listings_skipped: int = 0
+    checkpoint_records_resumed: int = 0
+    checkpoint_records_redone: int = 0
+    
     # Neo4j stats
     nodes_created: int = 0
     nodes_updated: int = 0
@@ -54,15 +80,53 @@ class IngestionStats:
     transactions_executed: int = 0
     neo4j_errors: int = 0
     
+    # Stage timings, throughput and queue depths of the streaming pipeline
+    pipeline: PipelineMetrics = field(default_factory=PipelineMetrics)
+    
     # Errors
     validation_errors: List[str] = field(default_factory=list)
     processing_errors: List[str] = field(default_factory=list)
     
+    # Per-API-key breakdown (run-level stats only)
+    data_owner: Optional[str] = None
+    key_stats: Dict[str, "IngestionStats"] = field(default_factory=dict)
+    
     def finalize(self):
         """Finalize stats when ingestion completes"""
         self.end_time = datetime.utcnow()
         self.duration_seconds = (self.end_time - self.start_time).total_seconds()
     
+    def merge(self, other: "IngestionStats"):
+        """Add another (per-key) stats object's counters and errors to this one"""
+        for stats_field in fields(self):
+            value = getattr(other, stats_field.name)
+            if stats_field.name in ("duration_seconds", "key_stats") or isinstance(value, bool):
+                continue
+            if isinstance(value, (int, float)):
+                setattr(self, stats_field.name, getattr(self, stats_field.name) + value)
+            elif isinstance(value, list):
+                getattr(self, stats_field.name).extend(value)
+            elif isinstance(value, PipelineMetrics):
+                self.pipeline.merge(value)
+    
+    def key_summary(self) -> Dict[str, Any]:
+        """Compact per-API-key report"""
+        return {
+            "data_owner": self.data_owner,
+            "duration_seconds": self.duration_seconds,
+            "requests_made": self.api_requests_made,
+            "rate_limited": self.api_rate_limited,
+            "people_processed": self.people_processed,
+            "companies_processed": self.companies_processed,
+            "groups_processed": self.groups_processed,
+            "custom_objects_processed": self.custom_objects_processed,
+            "records_resumed": self.checkpoint_records_resumed,
+            "records_per_second": self.pipeline.to_dict(self.duration_seconds)["records_per_second"],
+            "bottleneck": self.pipeline.bottleneck(),
+            "neo4j_errors": self.neo4j_errors,
+            "total_errors": len(self.validation_errors) + len(self.processing_errors)
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for reporting"""
         return {
@@ -74,14 +138,31 @@ class IngestionStats:
             "api": {
                 "keys_processed": self.api_keys_processed,
                 "requests_made": self.api_requests_made,
-                "errors": self.api_errors
+                "errors": self.api_errors,
+                "rate_limited": self.api_rate_limited
             },
+            "keys": {label: key_stats.key_summary() for label, key_stats in self.key_stats.items()},
             "data": {
                 "people": {"fetched": self.people_fetched, "processed": self.people_processed},
                 "companies": {"fetched": self.companies_fetched, "processed": self.companies_processed},
                 "groups": {"fetched": self.groups_fetched, "processed": self.groups_processed},
                 "custom_objects": {"fetched": self.custom_objects_fetched, "processed": self.custom_objects_processed},
-                "entity_types_discovered": self.entity_types_discovered
+                "entity_types_discovered": self.entity_types_discovered,
+                "entities_changed": self.entities_changed,
+                "cache_entries_invalidated": self.cache_entries_invalidated
+            },
+            "sync": {
+                "mode": self.sync_mode,
+                "records_skipped": self.delta_records_skipped,
+                "entity_types_skipped": self.delta_entity_types_skipped,
+                "records_tombstoned": self.records_tombstoned,
+                "tombstones_purged": self.tombstones_purged
+            },
+            "checkpoints": {
+                "listings_resumed": self.checkpoint_listings_resumed,
+                "listings_skipped": self.checkpoint_listings_skipped,
+                "records_resumed": self.checkpoint_records_resumed,
+                "records_redone": self.checkpoint_records_redone
             },
             "neo4j": {
                 "nodes_created": self.nodes_created,
@@ -90,6 +171,7 @@ class IngestionStats:
                 "transactions_executed": self.transactions_executed,
                 "errors": self.neo4j_errors
             },
+            "performance": self.pipeline.to_dict(self.duration_seconds),
             "errors": {
                 "validation_errors": self.validation_errors,
                 "processing_errors": self.processing_errors,
@@ -98,6 +180,19 @@ class IngestionStats:
         }
 
 
+@dataclass
+class PreparedBatch:
+    """A transformed batch, ready to be written in one transaction"""
+    description: str
+    stat: str  # IngestionStats counter credited with the upserted nodes
+    statements: List[Dict[str, Any]]
+    changes: Dict[str, Dict[str, Any]]
+    size: int
+    claimed_ids: List[str] = field(default_factory=list)  # processed_folk_ids entries to release on failure
+    progress: Optional[ListingProgress] = None  # listing checkpointed in the batch's transaction
+    source_ids: List[str] = field(default_factory=list)  # folk IDs of every record the batch covers
+
+
 class FolkIngestionService:
     """
     Main service for ingesting Folk.app CRM data into Neo4j
@@ -109,14 +204,45 @@ class FolkIngestionService:
     4. Track data provenance
     """
     
-    def __init__(self, config: FolkConfig):
+    def __init__(
+        self,
+        config: FolkConfig,
+        change_listeners: Optional[List[Callable[[FolkChangeSet], Awaitable[None]]]] = None
+    ):
         self.config = config
         self.neo4j_client: Optional[Neo4jClient] = None
         self.stats = IngestionStats()
+        
+        # Folk IDs upserted this run; shared by all key workers so each node is written once
         self.processed_folk_ids: Set[str] = set()
         
+        # Entities whose Neo4j properties actually changed during the current run
+        self.change_set = FolkChangeSet()
+        self.change_listeners = list(change_listeners or [])
+        
+        # Incremental sync: only write changed records, tombstone vanished ones
+        self.incremental = config.sync_mode == "incremental"
+        self.sync_store: Optional[SyncStateStore] = None
+        
+        # Per-listing progress, so a restarted run resumes instead of starting over
+        self.checkpoint_store: Optional[CheckpointStore] = None
+        
         logger.info(f"Folk ingestion service initialized with {len(config.api_keys)} API keys")
     
+    @property
+    def stats(self) -> IngestionStats:
+        """
+        Stats of the API key processed by the current task, or of the whole run
+        
+        Keys are processed concurrently, each in its own task with its own
+        IngestionStats; they are merged into the run stats when the key finishes.
+        """
+        return _key_stats.get() or self._run_stats
+    
+    @stats.setter
+    def stats(self, value: IngestionStats):
+        self._run_stats = value
+    
     async def __aenter__(self):
         """Async context manager entry"""
         await self.initialize()
@@ -139,6 +265,8 @@ class FolkIngestionService:
             
             self.neo4j_client = Neo4jClient(neo4j_config)
             await self.neo4j_client.connect()
+            self.sync_store = SyncStateStore(self.neo4j_client)
+            self.checkpoint_store = CheckpointStore(self.neo4j_client)
             
             logger.info("Neo4j connection established")
             
@@ -156,30 +284,39 @@ class FolkIngestionService:
         """
         Run complete Folk data ingestion process
         
+        Uses incremental mode when the configured sync mode is "incremental".
+        
         Returns:
             IngestionStats: Comprehensive ingestion statistics
         """
         
-        logger.info("Starting Folk CRM data ingestion")
-        self.stats = IngestionStats()
+        logger.info(f"Starting Folk CRM data ingestion ({'incremental' if self.incremental else 'full'})")
+        self.stats = IngestionStats(sync_mode="incremental" if self.incremental else "full")
+        self.change_set = FolkChangeSet()
+        self.processed_folk_ids.clear()
         
         try:
-            # Process each API key
-            for i, api_key in enumerate(self.config.api_keys):
-                logger.info(f"Processing API key {i+1}/{len(self.config.api_keys)}")
-                
+            # Process API keys concurrently; each key is a separate workspace with its own quota
+            semaphore = asyncio.Semaphore(self.config.max_parallel_keys)
+            key_results = await asyncio.gather(*(
+                self._run_api_key(i, api_key, semaphore) for i, api_key in enumerate(self.config.api_keys)
+            ))
+            
+            for i, key_stats in enumerate(key_results):
+                self.stats.merge(key_stats)
+                self.stats.key_stats[f"key_{i+1}"] = key_stats
+            
+            # Remove records that have been tombstoned past the retention period
+            if self.incremental and not self.config.dry_run and self.config.tombstone_retention_days > 0:
                 try:
-                    await self._process_api_key(api_key)
-                    self.stats.api_keys_processed += 1
-                    
+                    self.stats.tombstones_purged = await self.sync_store.purge_tombstones(
+                        self.config.tombstone_retention_days
+                    )
                 except Exception as e:
-                    error_msg = f"Failed to process API key {i+1}: {str(e)}"
-                    logger.error(error_msg)
-                    self.stats.processing_errors.append(error_msg)
-                    self.stats.api_errors += 1
-                    
-                    # Continue with next API key
-                    continue
+                    logger.error(f"Failed to purge tombstones: {e}")
+            
+            # Let caches drop entries that depend on modified entities
+            await self._emit_changes()
             
             # Finalize stats
             self.stats.finalize()
@@ -198,77 +335,564 @@ class FolkIngestionService:
             logger.error(f"Folk ingestion failed: {e}")
             raise
     
-    async def _process_api_key(self, api_key: str):
-        """Process data for a single API key"""
+    async def _run_api_key(self, index: int, api_key: str, semaphore: asyncio.Semaphore) -> IngestionStats:
+        """Process one API key in isolation, collecting its own stats"""
+        
+        key_stats = IngestionStats(sync_mode=self.stats.sync_mode)
+        
+        async with semaphore:
+            token = _key_stats.set(key_stats)
+            key_stats.start_time = datetime.utcnow()
+            logger.info(f"Processing API key {index+1}/{len(self.config.api_keys)}")
+            
+            try:
+                await self._process_api_key(api_key)
+                key_stats.api_keys_processed += 1
+                
+            except Exception as e:
+                error_msg = f"Failed to process API key {index+1}: {str(e)}"
+                logger.error(error_msg)
+                key_stats.processing_errors.append(error_msg)
+                key_stats.api_errors += 1
+                
+            finally:
+                key_stats.finalize()
+                _key_stats.reset(token)
+        
+        logger.info(f"API key {index+1} finished in {key_stats.duration_seconds:.2f}s")
+        return key_stats
+    
+    def add_change_listener(self, listener: Callable[[FolkChangeSet], Awaitable[None]]):
+        """Register an in-process callback invoked with each run's change set"""
+        self.change_listeners.append(listener)
+    
+    async def run_incremental_ingestion(self) -> IngestionStats:
+        """
+        Run an incremental sync: write only changed records and tombstone deletions
+        
+        Returns:
+            IngestionStats: Comprehensive ingestion statistics
+        """
+        self.incremental = True
+        return await self.run_full_ingestion()
+    
+    async def ingest_records(
+        self,
+        data_owner_id: Optional[str] = None,
+        people: Optional[List[Dict[str, Any]]] = None,
+        companies: Optional[List[Dict[str, Any]]] = None,
+        custom_objects: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        deleted: Optional[Dict[str, List[str]]] = None
+    ) -> IngestionStats:
+        """
+        Write individually fetched records without listing the workspace
+        
+        Used by the near-real-time sync worker: records go through the same
+        transforms and bulk upserts as a full run, deletions are tombstoned and
+        change events are emitted.
+        
+        Args:
+            data_owner_id: Folk user the records belong to (required with records)
+            people: Raw Folk people
+            companies: Raw Folk companies
+            custom_objects: Raw custom objects per entity type ("Deals", ...)
+            deleted: Folk IDs deleted in Folk, per node label
+        
+        Returns:
+            IngestionStats: Statistics for this batch of changes
+        """
+        
+        self.stats = IngestionStats(sync_mode="realtime")
+        self.change_set = FolkChangeSet()
+        self.processed_folk_ids.clear()
+        
+        people = people or []
+        companies = companies or []
+        custom_objects = custom_objects or {}
+        
+        self.stats.people_fetched = len(people)
+        self.stats.companies_fetched = len(companies)
+        self.stats.custom_objects_fetched = sum(len(records) for records in custom_objects.values())
+        
+        def chunks(records: List[Dict[str, Any]]):
+            for start in range(0, len(records), self.config.batch_size):
+                yield records[start:start + self.config.batch_size]
+        
+        prepared_batches = [self._prepare_people_batch(batch, data_owner_id) for batch in chunks(people)]
+        prepared_batches += [self._prepare_companies_batch(batch, data_owner_id) for batch in chunks(companies)]
+        for entity_type, records in custom_objects.items():
+            prepared_batches += [
+                self._prepare_custom_objects_batch(batch, entity_type, data_owner_id) for batch in chunks(records)
+            ]
+        
+        for prepared in prepared_batches:
+            if prepared:
+                await self._write_batch(prepared)
+        
+        if not self.config.dry_run:
+            for label, folk_ids in (deleted or {}).items():
+                await self._tombstone(label, folk_ids)
+        
+        await self._emit_changes()
+        self.stats.finalize()
+        
+        return self.stats
+    
+    async def _emit_changes(self):
+        """Pass modified folk IDs to listeners and invalidate the tool caches"""
+        
+        self.stats.entities_changed = len(self.change_set)
+        
+        if not self.change_set:
+            logger.info("No Folk entities changed, skipping cache invalidation")
+            return
+        
+        logger.info(f"Folk entities changed: {self.change_set.counts_by_type()}")
+        
+        for listener in self.change_listeners:
+            try:
+                await listener(self.change_set)
+            except Exception as e:
+                logger.error(f"Change listener failed: {e}")
+        
+        if not (self.config.publish_change_events and self.config.redis_url):
+            return
+        
+        try:
+            import redis.asyncio as redis
+            
+            from app.ai.tools.folk_changes import apply_folk_changes
+            
+            # Redis entries are deleted here rather than by the API workers,
+            # which only receive the L1 evictions over pub/sub
+            client = redis.from_url(self.config.redis_url)
+            try:
+                self.stats.cache_entries_invalidated += await apply_folk_changes(
+                    self.change_set.changes(), redis_client=client
+                )
+            finally:
+                await client.close()
+                
+        except Exception as e:
+            # Caches fall back to TTL expiry if they can't be invalidated
+            error_msg = f"Failed to invalidate tool caches: {str(e)}"
+            logger.error(error_msg)
+            self.stats.processing_errors.append(error_msg)
+    
+    def _record_changes(self, node_result, changes: Dict[str, Dict[str, Any]]):
+        """Record entities the bulk upsert reported as changed"""
+        
+        if not node_result.success or not node_result.records:
+            return
+        
+        for folk_id in node_result.records[0].get("changed_ids", []):
+            if folk_id in changes:
+                self.change_set.record(**changes[folk_id])
+    
+    @staticmethod
+    def _node_upsert_statement(label: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Single UNWIND statement upserting a batch of nodes by folkId
+        
+        Each row carries folk_id, properties and content_hash; the statement
+        returns the number of rows upserted and the folk IDs whose content changed.
+        """
+        return {
+            "query": f"""
+            UNWIND $rows AS row
+            MERGE (n:{label} {{folkId: row.folk_id}})
+            WITH n, row, coalesce(n.folkContentHash, '') <> row.content_hash
+                         OR coalesce(n.folkDeleted, false) AS changed
+            SET n += row.properties, n.folkContentHash = row.content_hash
+            REMOVE n.folkDeleted, n.folkDeletedAt, n:FolkTombstone
+            RETURN count(n) AS upserted,
+                   collect(CASE WHEN changed THEN n.folkId END) AS changed_ids
+            """,
+            "parameters": {"rows": rows}
+        }
+    
+    @staticmethod
+    def _owner_relationship_statement(
+        label: str, relationship: str, folk_ids: List[str], data_owner_id: str
+    ) -> Dict[str, Any]:
+        """Single UNWIND statement linking the data owner to a batch of nodes (reviving tombstoned links)"""
+        return {
+            "query": f"""
+            MATCH (owner:Person {{folkUserId: $data_owner_id}})
+            UNWIND $folk_ids AS folk_id
+            MATCH (n:{label} {{folkId: folk_id}})
+            MERGE (owner)-[r:{relationship}]->(n)
+            REMOVE r.folkDeleted, r.folkDeletedAt
+            """,
+            "parameters": {"folk_ids": folk_ids, "data_owner_id": data_owner_id}
+        }
+    
+    @staticmethod
+    def _link_statement(
+        source_label: str, relationship: str, target_label: str, pairs: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Single UNWIND statement creating one relationship type for a batch of pairs"""
+        return {
+            "query": f"""
+            UNWIND $pairs AS pair
+            MATCH (source:{source_label} {{folkId: pair.source}})
+            MATCH (target:{target_label} {{folkId: pair.target}})
+            MERGE (source)-[:{relationship}]->(target)
+            """,
+            "parameters": {"pairs": pairs}
+        }
+    
+    async def _execute_bulk_upsert(
+        self, statements: List[Dict[str, Any]], changes: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """
+        Run a node upsert statement and its relationship statements in one transaction
+        
+        Returns:
+            Number of nodes upserted
+        """
+        results = await self.neo4j_client.execute_queries_in_transaction(statements)
+        node_result = results[0]
+        
+        self._record_changes(node_result, changes)
+        
+        upserted = node_result.records[0].get("upserted", 0) if node_result.records else 0
+        created = 0
+        for result in results:
+            counters = result.summary.get("counters", {})
+            created += counters.get("nodes_created", 0) if result is node_result else 0
+            self.stats.relationships_created += counters.get("relationships_created", 0)
+        
+        self.stats.nodes_created += created
+        self.stats.nodes_updated += max(upserted - created, 0)
+        self.stats.transactions_executed += 1
+        self.stats.neo4j_errors += sum(1 for r in results if not r.success)
+        
+        return upserted
+    
+    async def _write_batch(self, prepared: "PreparedBatch"):
+        """Write one prepared batch in a single transaction"""
+        
+        if self.config.dry_run:
+            logger.info(f"[DRY RUN] Would process {prepared.size} {prepared.description}")
+            setattr(self.stats, prepared.stat, getattr(self.stats, prepared.stat) + prepared.size)
+            return
+        
+        statements = prepared.statements
+        if prepared.progress is not None:
+            # Saved in the batch's transaction, so it never claims rolled-back work
+            checkpoint = prepared.progress.checkpoint(prepared.source_ids)
+            statements = statements + [CheckpointStore.save_statement(checkpoint)]
+        
+        try:
+            upserted = await self._execute_bulk_upsert(statements, prepared.changes)
+            setattr(self.stats, prepared.stat, getattr(self.stats, prepared.stat) + upserted)
+            
+            # The transaction is all-or-nothing: rows upserted means the checkpoint committed too
+            if upserted and prepared.progress is not None:
+                prepared.progress.mark_done(prepared.source_ids, committed=True)
+            
+            logger.info(f"Processed {upserted}/{prepared.size} {prepared.description} in batch")
+            
+        except Exception as e:
+            upserted = 0
+            self.stats.neo4j_errors += 1
+            logger.error(f"Failed to execute {prepared.description} batch transaction: {e}")
+        
+        # Let another key's worker write these records if this transaction failed
+        if not upserted and prepared.claimed_ids:
+            self.processed_folk_ids.difference_update(prepared.claimed_ids)
+    
+    async def _stream_listing(
+        self,
+        pages: AsyncIterator[List[Dict[str, Any]]],
+        prepare: Callable[[List[Dict[str, Any]]], Optional["PreparedBatch"]],
+        on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        progress: Optional[ListingProgress] = None
+    ) -> PipelineStats:
+        """
+        Run a paged listing through the fetch -> transform -> write pipeline
+        
+        With `progress`, records an interrupted run already wrote are dropped,
+        every batch checkpoints the listing in its own transaction, and the
+        listing is marked completed once all of its batches are written.
+        """
+        
+        if progress is None:
+            return await run_pipeline(
+                pages,
+                prepare,
+                self._write_batch,
+                batch_size=self.config.batch_size,
+                queue_size=self.config.pipeline_queue_size,
+                on_page=on_page,
+                metrics=self.stats.pipeline
+            )
+        
+        def prepare_tracked(batch: List[Dict[str, Any]]) -> Optional["PreparedBatch"]:
+            prepared = prepare(batch)
+            source_ids = [record["id"] for record in batch if record.get("id")]
+            
+            if prepared is None:
+                # Nothing to write (unchanged, invalid or already written by another key)
+                progress.mark_done(source_ids)
+                return None
+            
+            prepared.progress = progress
+            prepared.source_ids = source_ids
+            return prepared
+        
+        try:
+            pipeline_stats = await run_pipeline(
+                progress.filter_pages(pages),
+                prepare_tracked,
+                self._write_batch,
+                batch_size=self.config.batch_size,
+                queue_size=self.config.pipeline_queue_size,
+                on_page=on_page,
+                metrics=self.stats.pipeline
+            )
+        finally:
+            self.stats.checkpoint_records_redone += progress.refetched
+        
+        # A failed batch keeps the listing open, so a restart retries it
+        try:
+            await self.checkpoint_store.save(progress.checkpoint(completed=not progress.has_pending))
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint completed listing {progress.listing}: {e}")
+        
+        return pipeline_stats
+    
+    async def _load_checkpoints(self, data_owner_id: str) -> Optional[Dict[str, ListingCheckpoint]]:
+        """Checkpoints left by an interrupted run of this key, None when checkpointing is off"""
+        
+        if not self.config.enable_checkpoints or self.config.dry_run or self.checkpoint_store is None:
+            return None
+        
+        try:
+            checkpoints = await self.checkpoint_store.load(data_owner_id, self.config.checkpoint_max_age_hours)
+        except Exception as e:
+            logger.error(f"Failed to load ingestion checkpoints: {e}")
+            return {}
+        
+        if checkpoints:
+            logger.info(f"Resuming interrupted ingestion: {len(checkpoints)} listing checkpoints found")
+        
+        return checkpoints
+    
+    def _listing_progress(
+        self,
+        checkpoints: Optional[Dict[str, ListingCheckpoint]],
+        data_owner_id: str,
+        listing: str,
+        entity_types: Optional[Dict[str, Set[str]]] = None
+    ) -> Optional[ListingProgress]:
+        """Progress tracker for a listing, resuming from its checkpoint if there is one"""
+        
+        if checkpoints is None:
+            return None
+        
+        checkpoint = checkpoints.get(listing)
+        if checkpoint is not None:
+            self.stats.checkpoint_listings_resumed += 1
+            self.stats.checkpoint_records_resumed += checkpoint.records_done
+            if checkpoint.completed:
+                self.stats.checkpoint_listings_skipped += 1
+            
+            # Entity types discovered by the interrupted run's pages
+            if entity_types is not None:
+                for group_id, types in checkpoint.entity_types.items():
+                    entity_types.setdefault(group_id, set()).update(types)
+        
+        return ListingProgress(data_owner_id, listing, checkpoint, entity_types)
+    
+    def _is_unchanged(self, delta: Optional[ListingDelta], folk_id: str, record_hash: str) -> bool:
+        """Incremental mode: True when the record matches what Neo4j already holds"""
+        if delta is not None and delta.is_unchanged(folk_id, record_hash):
+            self.stats.delta_records_skipped += 1
+            return True
+        return False
+    
+    async def _sync_listing(
+        self,
+        pages: AsyncIterator[List[Dict[str, Any]]],
+        data_owner_id: str,
+        entity_key: str,
+        label: str,
+        relationship: str,
+        prepare: Callable[[List[Dict[str, Any]], Optional[ListingDelta]], Optional["PreparedBatch"]],
+        on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        progress: Optional[ListingProgress] = None
+    ):
+        """
+        Stream one entity listing into Neo4j
+        
+        In incremental mode only records whose content hash changed are written
+        and records missing from a completely read listing are tombstoned. A
+        failed write leaves the node's old content hash, so the record is
+        retried by the next run. A listing resumed from a checkpoint was not
+        read completely by this run and is never tombstoned.
+        """
         
-        async with FolkClient(
+        if progress is not None and progress.completed:
+            logger.info(f"Skipping {entity_key}: completed before the restart")
+            return
+        
+        delta = None
+        if self.incremental:
+            delta = ListingDelta(await self.sync_store.load_known(label, relationship, data_owner_id))
+        
+        # Raises if the listing could not be read completely (nothing is tombstoned then)
+        await self._stream_listing(pages, lambda batch: prepare(batch, delta), on_page, progress)
+        
+        if delta is None or (progress is not None and progress.resumed):
+            return
+        
+        vanished = delta.vanished()
+        logger.info(f"Incremental {entity_key}: {delta.changed} changed, "
+                   f"{delta.skipped} unchanged, {len(vanished)} deleted")
+        
+        if not delta.changed and not vanished:
+            self.stats.delta_entity_types_skipped += 1
+        
+        if self.config.dry_run:
+            return
+        
+        await self._tombstone(label, vanished, relationship, data_owner_id)
+    
+    async def _tombstone(
+        self,
+        label: str,
+        folk_ids: List[str],
+        relationship: Optional[str] = None,
+        data_owner_id: Optional[str] = None
+    ) -> int:
+        """
+        Tombstone records deleted in Folk and emit change events for them
+        
+        Given a data owner, only that owner's links are tombstoned; nodes are
+        tombstoned (and reported) once no owner has them any more.
+        """
+        
+        if not folk_ids:
+            return 0
+        
+        try:
+            tombstoned = await self.sync_store.tombstone(label, folk_ids, relationship, data_owner_id)
+        except Exception as e:
+            self.stats.neo4j_errors += 1
+            logger.error(f"Failed to tombstone {len(folk_ids)} {label} nodes: {e}")
+            return 0
+        
+        for record in tombstoned:
+            self.change_set.record(label.lower(), record["folk_id"], record.get("name"))
+        
+        self.stats.records_tombstoned += len(tombstoned)
+        return len(tombstoned)
+    
+    def create_folk_client(self, api_key: str) -> FolkClient:
+        """Folk client for one API key, configured from the ingestion settings"""
+        return FolkClient(
             api_key=api_key,
             base_url=self.config.base_url,
             rate_limit=self.config.rate_limit,
             timeout=self.config.timeout,
-            max_retries=self.config.max_retries
-        ) as folk_client:
+            max_retries=self.config.max_retries,
+            max_concurrent_requests=self.config.max_concurrent_requests
+        )
+    
+    async def _process_api_key(self, api_key: str):
+        """Process data for a single API key"""
+        
+        async with self.create_folk_client(api_key) as folk_client:
             
             # Get user profile to identify data owner
             user_profile = await folk_client.get_user_profile()
             data_owner_id = user_profile.id
             
             logger.info(f"Processing data for user: {user_profile.name} ({user_profile.email})")
+            self.stats.data_owner = user_profile.email or user_profile.name
             
             # Ensure internal user exists in Neo4j
             await self._ensure_internal_user(user_profile)
             
-            # Folk API has max limit of 100 per request
-            page_limit = min(100, self.config.page_size if not self.config.dry_run else 100)
-            
-            # Fetch all data concurrently
-            people_task = asyncio.create_task(folk_client.get_people(limit=page_limit))
-            companies_task = asyncio.create_task(folk_client.get_companies(limit=page_limit))  
-            groups_task = asyncio.create_task(folk_client.get_all_groups_paginated(self.config.page_size))
+            # Resume from checkpoints if a previous run of this key was interrupted
+            checkpoints = await self._load_checkpoints(data_owner_id)
             
-            # Wait for core data
-            people_data, companies_data, groups_data = await asyncio.gather(
-                people_task, companies_task, groups_task, return_exceptions=True
-            )
-            
-            # Handle fetch errors
-            if isinstance(people_data, Exception):
-                logger.error(f"Failed to fetch people: {people_data}")
-                people_data = []
-            
-            if isinstance(companies_data, Exception):
-                logger.error(f"Failed to fetch companies: {companies_data}")
-                companies_data = []
+            # Folk API has max limit of 100 per request
+            page_limit = min(100, self.config.page_size)
             
-            if isinstance(groups_data, Exception):
-                logger.error(f"Failed to fetch groups: {groups_data}")
+            # Groups are few: fetch and write them first
+            try:
+                groups_data = await folk_client.get_all_groups_paginated(page_limit)
+            except Exception as e:
+                logger.error(f"Failed to fetch groups: {e}")
                 groups_data = []
             
-            self.stats.people_fetched += len(people_data) if people_data else 0
-            self.stats.companies_fetched += len(companies_data) if companies_data else 0
-            self.stats.groups_fetched += len(groups_data) if groups_data else 0
+            self.stats.groups_fetched += len(groups_data)
             
-            # Process groups first (needed for relationships)
             if groups_data:
                 await self._process_groups(groups_data, data_owner_id)
             
-            # Process people and companies concurrently
-            await asyncio.gather(
-                self._process_people(people_data, data_owner_id),
-                self._process_companies(companies_data, data_owner_id),
+            # Stream people and companies concurrently, writing from the first page;
+            # custom object entity types are discovered as the pages pass through
+            entity_types_by_group: Dict[str, Set[str]] = {}
+            people_progress = self._listing_progress(checkpoints, data_owner_id, "people", entity_types_by_group)
+            companies_progress = self._listing_progress(
+                checkpoints, data_owner_id, "companies", entity_types_by_group
+            )
+            
+            def on_people_page(page: List[Dict[str, Any]]):
+                self.stats.people_fetched += len(page)
+                folk_client.collect_entity_types(page, entity_types_by_group)
+            
+            def on_companies_page(page: List[Dict[str, Any]]):
+                self.stats.companies_fetched += len(page)
+                folk_client.collect_entity_types(page, entity_types_by_group)
+            
+            results = await asyncio.gather(
+                self._sync_listing(
+                    folk_client.iter_people_pages(page_limit, people_progress and people_progress.start_cursor),
+                    data_owner_id, "people", "Person", "OWNS_CONTACT",
+                    lambda batch, delta: self._prepare_people_batch(batch, data_owner_id, delta),
+                    on_people_page, people_progress
+                ),
+                self._sync_listing(
+                    folk_client.iter_companies_pages(page_limit, companies_progress and companies_progress.start_cursor),
+                    data_owner_id, "companies", "Organization", "OWNS_CONTACT",
+                    lambda batch, delta: self._prepare_companies_batch(batch, data_owner_id, delta),
+                    on_companies_page, companies_progress
+                ),
                 return_exceptions=True
             )
             
-            # Discover entity types and process custom objects for each group
+            # A failed listing must never be treated as "everything deleted"
+            discovery_complete = True
+            for entity_key, result in zip(("people", "companies"), results):
+                if isinstance(result, Exception):
+                    discovery_complete = False
+                    error_msg = f"Failed to sync {entity_key}: {result}"
+                    logger.error(error_msg)
+                    self.stats.processing_errors.append(error_msg)
+            
+            # Stream custom objects for each group
             if groups_data:
                 await self._process_custom_objects_for_groups(
-                    folk_client, groups_data, people_data, companies_data, data_owner_id
+                    folk_client, groups_data, entity_types_by_group, data_owner_id, discovery_complete, checkpoints
                 )
             
+            # The key finished: its next run starts from page one again
+            if checkpoints is not None:
+                try:
+                    await self.checkpoint_store.clear(data_owner_id)
+                except Exception as e:
+                    logger.warning(f"Failed to clear ingestion checkpoints: {e}")
+            
             # Update API request stats
             client_stats = folk_client.get_stats()
             self.stats.api_requests_made += client_stats["requests_made"]
             self.stats.api_errors += client_stats["errors_count"]
+            self.stats.api_rate_limited += client_stats.get("rate_limited_count", 0)
     
     async def _ensure_internal_user(self, user_profile: FolkUser):
         """Ensure internal user exists in Neo4j"""
@@ -313,33 +937,31 @@ class FolkIngestionService:
             self.stats.neo4j_errors += 1
             logger.error(f"Error ensuring internal user: {e}")
     
-    async def _process_people(self, people_data: List[Dict[str, Any]], data_owner_id: str):
-        """Process people data in batches"""
-        
-        if not people_data:
-            return
-        
-        logger.info(f"Processing {len(people_data)} people")
-        
-        # Process in batches
-        for i in range(0, len(people_data), self.config.batch_size):
-            batch = people_data[i:i + self.config.batch_size]
-            await self._process_people_batch(batch, data_owner_id)
-    
     async def _process_people_batch(self, batch: List[Dict[str, Any]], data_owner_id: str):
-        """Process a batch of people"""
+        """Process a batch of people with a single bulk upsert"""
         
-        if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would process {len(batch)} people")
-            self.stats.people_processed += len(batch)
-            return
+        prepared = self._prepare_people_batch(batch, data_owner_id)
+        if prepared:
+            await self._write_batch(prepared)
+    
+    def _prepare_people_batch(
+        self, batch: List[Dict[str, Any]], data_owner_id: str, delta: Optional[ListingDelta] = None
+    ) -> Optional[PreparedBatch]:
+        """Validate and transform a batch of people into one bulk upsert"""
         
-        queries = []
+        rows = []
+        changes = {}
         
         for person_data in batch:
             try:
                 # Validate and transform data
                 folk_person = FolkPerson.from_folk_api(person_data, data_owner_id)
+                person_props = folk_person.to_neo4j_node(data_owner_id)
+                person_hash = content_hash(person_props)
+                
+                # Skip records unchanged since the last incremental sync
+                if self._is_unchanged(delta, folk_person.folk_id, person_hash):
+                    continue
                 
                 # Skip if already processed
                 if folk_person.folk_id in self.processed_folk_ids:
@@ -347,80 +969,65 @@ class FolkIngestionService:
                 
                 self.processed_folk_ids.add(folk_person.folk_id)
                 
-                # Create merge query
-                person_props = folk_person.to_neo4j_node(data_owner_id)
-                
-                query = {
-                    "query": """
-                    MERGE (p:Person {folkId: $folk_id})
-                    SET p += $properties
-                    WITH p
-                    OPTIONAL MATCH (owner:Person {folkUserId: $data_owner_id})
-                    WHERE owner IS NOT NULL
-                    MERGE (owner)-[:OWNS_CONTACT]->(p)
-                    RETURN p.personId as person_id
-                    """,
-                    "parameters": {
-                        "folk_id": folk_person.folk_id,
-                        "properties": person_props,
-                        "data_owner_id": data_owner_id
-                    }
+                rows.append({
+                    "folk_id": folk_person.folk_id,
+                    "properties": person_props,
+                    "content_hash": person_hash
+                })
+                changes[folk_person.folk_id] = {
+                    "entity_type": "person",
+                    "folk_id": folk_person.folk_id,
+                    "name": folk_person.name
                 }
                 
-                queries.append(query)
-                
             except Exception as e:
+                if delta is not None:
+                    delta.mark_invalid(person_data.get("id"))
                 error_msg = f"Failed to process person {person_data.get('id', 'unknown')}: {str(e)}"
                 logger.error(error_msg)
                 self.stats.validation_errors.append(error_msg)
         
-        # Execute batch transaction
-        if queries:
-            try:
-                results = await self.neo4j_client.execute_queries_in_transaction(queries)
-                
-                successful_queries = sum(1 for r in results if r.success)
-                failed_queries = len(results) - successful_queries
-                
-                self.stats.people_processed += successful_queries
-                self.stats.nodes_created += successful_queries
-                self.stats.relationships_created += successful_queries  # OWNS_CONTACT relationships
-                self.stats.transactions_executed += 1
-                self.stats.neo4j_errors += failed_queries
-                
-                logger.info(f"Processed {successful_queries}/{len(queries)} people in batch")
-                
-            except Exception as e:
-                self.stats.neo4j_errors += 1
-                logger.error(f"Failed to execute people batch transaction: {e}")
-    
-    async def _process_companies(self, companies_data: List[Dict[str, Any]], data_owner_id: str):
-        """Process companies data in batches"""
+        if not rows:
+            return None
         
-        if not companies_data:
-            return
-        
-        logger.info(f"Processing {len(companies_data)} companies")
-        
-        # Process in batches
-        for i in range(0, len(companies_data), self.config.batch_size):
-            batch = companies_data[i:i + self.config.batch_size]
-            await self._process_companies_batch(batch, data_owner_id)
+        folk_ids = [row["folk_id"] for row in rows]
+        return PreparedBatch(
+            description="people",
+            stat="people_processed",
+            statements=[
+                self._node_upsert_statement("Person", rows),
+                self._owner_relationship_statement("Person", "OWNS_CONTACT", folk_ids, data_owner_id)
+            ],
+            changes=changes,
+            size=len(rows),
+            claimed_ids=folk_ids
+        )
     
     async def _process_companies_batch(self, batch: List[Dict[str, Any]], data_owner_id: str):
-        """Process a batch of companies"""
+        """Process a batch of companies with a single bulk upsert"""
         
-        if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would process {len(batch)} companies")
-            self.stats.companies_processed += len(batch)
-            return
+        prepared = self._prepare_companies_batch(batch, data_owner_id)
+        if prepared:
+            await self._write_batch(prepared)
+    
+    def _prepare_companies_batch(
+        self, batch: List[Dict[str, Any]], data_owner_id: str, delta: Optional[ListingDelta] = None
+    ) -> Optional[PreparedBatch]:
+        """Validate and transform a batch of companies into one bulk upsert"""
         
-        queries = []
+        rows = []
+        changes = {}
         
         for company_data in batch:
             try:
                 # Validate and transform data
                 folk_company = FolkCompany.from_folk_api(company_data)
+                company_props = folk_company.to_neo4j_node(data_owner_id)
+                company_hash = content_hash(company_props)
+                
+                # Skip records unchanged since the last incremental sync
+                if self._is_unchanged(delta, folk_company.folk_id, company_hash):
+                    continue
                 
                 # Skip if already processed
                 if folk_company.folk_id in self.processed_folk_ids:
@@ -428,52 +1035,39 @@ class FolkIngestionService:
                 
                 self.processed_folk_ids.add(folk_company.folk_id)
                 
-                # Create merge query
-                company_props = folk_company.to_neo4j_node(data_owner_id)
-                
-                query = {
-                    "query": """
-                    MERGE (o:Organization {folkId: $folk_id})
-                    SET o += $properties
-                    WITH o
-                    OPTIONAL MATCH (owner:Person {folkUserId: $data_owner_id})
-                    WHERE owner IS NOT NULL
-                    MERGE (owner)-[:OWNS_CONTACT]->(o)
-                    RETURN o.organizationId as org_id
-                    """,
-                    "parameters": {
-                        "folk_id": folk_company.folk_id,
-                        "properties": company_props,
-                        "data_owner_id": data_owner_id
-                    }
+                rows.append({
+                    "folk_id": folk_company.folk_id,
+                    "properties": company_props,
+                    "content_hash": company_hash
+                })
+                changes[folk_company.folk_id] = {
+                    "entity_type": "organization",
+                    "folk_id": folk_company.folk_id,
+                    "name": folk_company.name
                 }
                 
-                queries.append(query)
-                
             except Exception as e:
+                if delta is not None:
+                    delta.mark_invalid(company_data.get("id"))
                 error_msg = f"Failed to process company {company_data.get('id', 'unknown')}: {str(e)}"
                 logger.error(error_msg)
                 self.stats.validation_errors.append(error_msg)
         
-        # Execute batch transaction
-        if queries:
-            try:
-                results = await self.neo4j_client.execute_queries_in_transaction(queries)
-                
-                successful_queries = sum(1 for r in results if r.success)
-                failed_queries = len(results) - successful_queries
-                
-                self.stats.companies_processed += successful_queries
-                self.stats.nodes_created += successful_queries
-                self.stats.relationships_created += successful_queries  # OWNS_CONTACT relationships
-                self.stats.transactions_executed += 1
-                self.stats.neo4j_errors += failed_queries
-                
-                logger.info(f"Processed {successful_queries}/{len(queries)} companies in batch")
-                
-            except Exception as e:
-                self.stats.neo4j_errors += 1
-                logger.error(f"Failed to execute companies batch transaction: {e}")
+        if not rows:
+            return None
+        
+        folk_ids = [row["folk_id"] for row in rows]
+        return PreparedBatch(
+            description="companies",
+            stat="companies_processed",
+            statements=[
+                self._node_upsert_statement("Organization", rows),
+                self._owner_relationship_statement("Organization", "OWNS_CONTACT", folk_ids, data_owner_id)
+            ],
+            changes=changes,
+            size=len(rows),
+            claimed_ids=folk_ids
+        )
     
     async def _process_groups(self, groups_data: List[Dict[str, Any]], data_owner_id: str):
         """Process groups data"""
@@ -488,49 +1082,41 @@ class FolkIngestionService:
             self.stats.groups_processed += len(groups_data)
             return
         
-        queries = []
+        rows = []
+        changes = {}
         
         for group_data in groups_data:
             try:
                 # Validate and transform data
                 folk_group = FolkGroup.from_folk_api(group_data)
                 
-                # Create merge query
                 group_props = folk_group.to_neo4j_node(data_owner_id)
                 
-                query = {
-                    "query": """
-                    MERGE (g:Group {folkId: $folk_id})
-                    SET g += $properties
-                    RETURN g.name as group_name
-                    """,
-                    "parameters": {
-                        "folk_id": folk_group.folk_id,
-                        "properties": group_props
-                    }
+                rows.append({
+                    "folk_id": folk_group.folk_id,
+                    "properties": group_props,
+                    "content_hash": content_hash(group_props)
+                })
+                changes[folk_group.folk_id] = {
+                    "entity_type": "group",
+                    "folk_id": folk_group.folk_id,
+                    "name": folk_group.name
                 }
                 
-                queries.append(query)
-                
             except Exception as e:
                 error_msg = f"Failed to process group {group_data.get('id', 'unknown')}: {str(e)}"
                 logger.error(error_msg)
                 self.stats.validation_errors.append(error_msg)
         
         # Execute batch transaction
-        if queries:
+        if rows:
             try:
-                results = await self.neo4j_client.execute_queries_in_transaction(queries)
-                
-                successful_queries = sum(1 for r in results if r.success)
-                failed_queries = len(results) - successful_queries
-                
-                self.stats.groups_processed += successful_queries
-                self.stats.nodes_created += successful_queries
-                self.stats.transactions_executed += 1
-                self.stats.neo4j_errors += failed_queries
+                upserted = await self._execute_bulk_upsert(
+                    [self._node_upsert_statement("Group", rows)], changes
+                )
+                self.stats.groups_processed += upserted
                 
-                logger.info(f"Processed {successful_queries}/{len(queries)} groups")
+                logger.info(f"Processed {upserted}/{len(rows)} groups")
                 
             except Exception as e:
                 self.stats.neo4j_errors += 1
@@ -540,160 +1126,225 @@ class FolkIngestionService:
         self, 
         folk_client: FolkClient, 
         groups_data: List[Dict[str, Any]],
-        people_data: List[Dict[str, Any]],
-        companies_data: List[Dict[str, Any]],
-        data_owner_id: str
+        entity_types_by_group: Dict[str, Set[str]],
+        data_owner_id: str,
+        discovery_complete: bool = True,
+        checkpoints: Optional[Dict[str, ListingCheckpoint]] = None
     ):
-        """Process custom objects (deals, projects, etc.) for all groups using dynamic entity discovery"""
+        """
+        Stream custom objects (deals, projects, etc.) for all groups using dynamic entity discovery
         
-        logger.info(f"Discovering entity types and processing custom objects for {len(groups_data)} groups")
+        Listings are streamed concurrently (bounded by max_concurrent_requests);
+        each one writes its batches as soon as they are transformed.
+        """
         
-        # Discover entity types from people and companies data
-        entity_types_by_group = folk_client.discover_entity_types_from_data(people_data, companies_data)
+        logger.info(f"Processing custom objects for {len(groups_data)} groups")
         
         if entity_types_by_group:
             self.stats.entity_types_discovered = sum(len(types) for types in entity_types_by_group.values())
             logger.info(f"Discovered {self.stats.entity_types_discovered} entity types across groups")
         
-        for group_data in groups_data:
-            group_id = group_data.get("id")
+        # Discovered entity types per group, default to ["Deals"] for backward compatibility
+        listings = [
+            (group_data, entity_type)
+            for group_data in groups_data if group_data.get("id")
+            for entity_type in sorted(entity_types_by_group.get(group_data["id"], {"Deals"}))
+        ]
+        
+        # Incremental mode: known hashes per node label, shared by every group's listing
+        known_by_label: Dict[str, Dict[str, Tuple[Optional[str], bool]]] = {}
+        if self.incremental:
+            for node_label in {entity_type.rstrip('s') for _, entity_type in listings}:
+                known_by_label[node_label] = await self.sync_store.load_known(node_label, "SOURCED", data_owner_id)
+        
+        progress_by_listing = [
+            self._listing_progress(checkpoints, data_owner_id, f"{entity_type}:{group_data['id']}")
+            for group_data, entity_type in listings
+        ]
+        
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        
+        async def sync_listing(
+            group_data: Dict[str, Any], entity_type: str, progress: Optional[ListingProgress]
+        ) -> Optional[ListingDelta]:
+            async with semaphore:
+                return await self._sync_custom_object_listing(
+                    folk_client, group_data, entity_type, data_owner_id, known_by_label, progress
+                )
+        
+        results = await asyncio.gather(
+            *(
+                sync_listing(group_data, entity_type, progress)
+                for (group_data, entity_type), progress in zip(listings, progress_by_listing)
+            ),
+            return_exceptions=True
+        )
+        
+        # Folk IDs seen per label, and labels whose listing was incomplete (never tombstoned this run)
+        seen_by_label: Dict[str, Set[str]] = {}
+        incomplete_labels: Set[str] = set()
+        
+        for (group_data, entity_type), progress, result in zip(listings, progress_by_listing, results):
+            node_label = entity_type.rstrip('s')
             group_name = group_data.get("name", "Unknown")
             
-            if not group_id:
-                continue
-            
-            # Get discovered entity types for this group, default to ["Deals"] for backward compatibility
-            entity_types = entity_types_by_group.get(group_id, ["Deals"])
+            # Records written before a restart were not seen by this run
+            if progress is not None and progress.resumed:
+                incomplete_labels.add(node_label)
             
-            logger.info(f"Processing entity types {entity_types} for group '{group_name}'")
-            
-            # Process each entity type for this group
-            for entity_type in entity_types:
-                try:
-                    # Fetch custom objects for this group and entity type using pagination
-                    custom_objects_data = await folk_client.get_all_custom_objects_paginated(
-                        group_id, entity_type, page_size=100
-                    )
-                    
-                    if custom_objects_data:
-                        self.stats.custom_objects_fetched += len(custom_objects_data)
-                        logger.info(f"Processing {len(custom_objects_data)} {entity_type} for group '{group_name}'")
-                        
-                        # Process custom objects in batches
-                        for i in range(0, len(custom_objects_data), self.config.batch_size):
-                            batch = custom_objects_data[i:i + self.config.batch_size]
-                            await self._process_custom_objects_batch(batch, entity_type, data_owner_id)
-                    
-                except Exception as e:
-                    error_msg = f"Failed to process {entity_type} for group {group_name}: {str(e)}"
-                    
-                    # Don't treat 404 as failures - they're expected for groups without that entity type
-                    if "404" in str(e):
-                        logger.debug(f"Group '{group_name}' has no {entity_type} (expected)")
-                    else:
-                        logger.error(error_msg)
-                        self.stats.processing_errors.append(error_msg)
+            if isinstance(result, Exception):
+                # Don't treat 404 as failures - they're expected for groups without that entity type
+                if "404" in str(result):
+                    logger.debug(f"Group '{group_name}' has no {entity_type} (expected)")
+                else:
+                    incomplete_labels.add(node_label)
+                    error_msg = f"Failed to process {entity_type} for group {group_name}: {str(result)}"
+                    logger.error(error_msg)
+                    self.stats.processing_errors.append(error_msg)
+            elif result is not None:
+                seen_by_label.setdefault(node_label, set()).update(result.seen)
+        
+        # Tombstone custom objects that vanished from every group listing; without
+        # complete people/companies listings some group listings may be missing
+        if self.incremental and discovery_complete and not self.config.dry_run:
+            for node_label, known in known_by_label.items():
+                if node_label in incomplete_labels:
+                    continue
+                seen = seen_by_label.get(node_label, set())
+                vanished = [folk_id for folk_id, (_, deleted) in known.items() if not deleted and folk_id not in seen]
+                await self._tombstone(node_label, vanished, "SOURCED", data_owner_id)
+    
+    async def _sync_custom_object_listing(
+        self,
+        folk_client: FolkClient,
+        group_data: Dict[str, Any],
+        entity_type: str,
+        data_owner_id: str,
+        known_by_label: Dict[str, Dict[str, Tuple[Optional[str], bool]]],
+        progress: Optional[ListingProgress] = None
+    ) -> Optional[ListingDelta]:
+        """
+        Stream one group's custom objects of one entity type
+        
+        Returns:
+            The listing's delta in incremental mode, None otherwise
+        """
+        
+        group_id = group_data["id"]
+        group_name = group_data.get("name", "Unknown")
+        node_label = entity_type.rstrip('s')
+        
+        if progress is not None and progress.completed:
+            logger.info(f"Skipping {entity_type} for group '{group_name}': completed before the restart")
+            return None
+        
+        delta = ListingDelta(known_by_label[node_label]) if self.incremental else None
+        
+        def on_page(page: List[Dict[str, Any]]):
+            self.stats.custom_objects_fetched += len(page)
+        
+        pipeline_stats = await self._stream_listing(
+            folk_client.iter_custom_object_pages(
+                group_id, entity_type, page_size=100, cursor=progress and progress.start_cursor
+            ),
+            lambda batch: self._prepare_custom_objects_batch(batch, entity_type, data_owner_id, delta),
+            on_page,
+            progress
+        )
+        
+        if pipeline_stats.records:
+            logger.info(f"Processed {pipeline_stats.records} {entity_type} for group '{group_name}'")
+        
+        return delta
     
     async def _process_custom_objects_batch(
         self, batch: List[Dict[str, Any]], entity_type: str, data_owner_id: str
     ):
-        """Process a batch of custom objects (deals, projects, opportunities, etc.)"""
+        """Process a batch of custom objects (deals, projects, opportunities, etc.) with bulk upserts"""
         
-        if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would process {len(batch)} {entity_type}")
-            self.stats.custom_objects_processed += len(batch)
-            return
+        prepared = self._prepare_custom_objects_batch(batch, entity_type, data_owner_id)
+        if prepared:
+            await self._write_batch(prepared)
+    
+    def _prepare_custom_objects_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        entity_type: str,
+        data_owner_id: str,
+        delta: Optional[ListingDelta] = None
+    ) -> Optional[PreparedBatch]:
+        """Validate and transform a batch of custom objects into one bulk upsert"""
+        
+        # Use dynamic label based on entity type (Deal, Project, Opportunity, etc.)
+        node_label = entity_type.rstrip('s')  # Convert "Deals" -> "Deal", "Projects" -> "Project"
         
-        queries = []
+        rows = []
+        changes = {}
+        contact_pairs = []
+        company_pairs = []
         
         for custom_object_data in batch:
             try:
                 # Validate and transform data using generic custom object model
                 folk_custom_object = FolkCustomObject.from_folk_api(custom_object_data, entity_type)
                 
-                # Create merge query with relationships
                 custom_object_props = folk_custom_object.to_neo4j_node(data_owner_id)
+                custom_object_hash = content_hash(custom_object_props)
                 
-                # Build relationship creation queries
-                relationship_queries = []
-                
-                # Link to contacts
-                for contact_id in folk_custom_object.contact_ids:
-                    if contact_id:
-                        relationship_queries.append("""
-                        OPTIONAL MATCH (contact:Person {folkId: $contact_id})
-                        WHERE contact IS NOT NULL
-                        MERGE (co)-[:WITH_CONTACT]->(contact)
-                        """)
-                
-                # Link to companies
-                for company_id in folk_custom_object.company_ids:
-                    if company_id:
-                        relationship_queries.append("""
-                        OPTIONAL MATCH (org:Organization {folkId: $company_id})
-                        WHERE org IS NOT NULL
-                        MERGE (co)-[:FOR_ORGANIZATION]->(org)
-                        """)
-                
-                # Link to data owner
-                relationship_queries.append("""
-                OPTIONAL MATCH (owner:Person {folkUserId: $data_owner_id})
-                WHERE owner IS NOT NULL
-                MERGE (owner)-[:SOURCED]->(co)
-                """)
+                # Skip records unchanged since the last incremental sync
+                if self._is_unchanged(delta, folk_custom_object.folk_id, custom_object_hash):
+                    continue
                 
-                relationship_cypher = "\n".join(relationship_queries)
+                rows.append({
+                    "folk_id": folk_custom_object.folk_id,
+                    "properties": custom_object_props,
+                    "content_hash": custom_object_hash
+                })
                 
-                # Use dynamic label based on entity type (Deal, Project, Opportunity, etc.)
-                node_label = entity_type.rstrip('s')  # Convert "Deals" -> "Deal", "Projects" -> "Project"
+                # Link to contacts and companies
+                contact_pairs.extend(
+                    {"source": folk_custom_object.folk_id, "target": contact_id}
+                    for contact_id in folk_custom_object.contact_ids if contact_id
+                )
+                company_pairs.extend(
+                    {"source": folk_custom_object.folk_id, "target": company_id}
+                    for company_id in folk_custom_object.company_ids if company_id
+                )
                 
-                query = {
-                    "query": f"""
-                    MERGE (co:{node_label} {{folkId: $folk_id}})
-                    SET co += $properties
-                    WITH co
-                    {relationship_cypher}
-                    RETURN co.name as object_name
-                    """,
-                    "parameters": {
-                        "folk_id": folk_custom_object.folk_id,
-                        "properties": custom_object_props,
-                        "data_owner_id": data_owner_id
-                    }
+                # Profiles of linked contacts and companies embed this object
+                changes[folk_custom_object.folk_id] = {
+                    "entity_type": node_label.lower(),
+                    "folk_id": folk_custom_object.folk_id,
+                    "name": folk_custom_object.name,
+                    "related_folk_ids": folk_custom_object.contact_ids + folk_custom_object.company_ids
                 }
                 
-                # Add contact and company IDs for relationship queries
-                if folk_custom_object.contact_ids:
-                    query["parameters"]["contact_id"] = folk_custom_object.contact_ids[0]
-                if folk_custom_object.company_ids:
-                    query["parameters"]["company_id"] = folk_custom_object.company_ids[0]
-                
-                queries.append(query)
-                
             except Exception as e:
+                if delta is not None:
+                    delta.mark_invalid(custom_object_data.get("id"))
                 error_msg = f"Failed to process {entity_type} {custom_object_data.get('id', 'unknown')}: {str(e)}"
                 logger.error(error_msg)
                 self.stats.validation_errors.append(error_msg)
         
-        # Execute batch transaction
-        if queries:
-            try:
-                results = await self.neo4j_client.execute_queries_in_transaction(queries)
-                
-                successful_queries = sum(1 for r in results if r.success)
-                failed_queries = len(results) - successful_queries
-                
-                self.stats.custom_objects_processed += successful_queries
-                self.stats.nodes_created += successful_queries
-                self.stats.relationships_created += successful_queries * 3  # Approximate relationship count
-                self.stats.transactions_executed += 1
-                self.stats.neo4j_errors += failed_queries
-                
-                logger.info(f"Processed {successful_queries}/{len(queries)} {entity_type} in batch")
-                
-            except Exception as e:
-                self.stats.neo4j_errors += 1
-                logger.error(f"Failed to execute {entity_type} batch transaction: {e}")
+        if not rows:
+            return None
+        
+        # One statement per node and relationship type
+        folk_ids = [row["folk_id"] for row in rows]
+        statements = [self._node_upsert_statement(node_label, rows)]
+        if contact_pairs:
+            statements.append(self._link_statement(node_label, "WITH_CONTACT", "Person", contact_pairs))
+        if company_pairs:
+            statements.append(self._link_statement(node_label, "FOR_ORGANIZATION", "Organization", company_pairs))
+        statements.append(self._owner_relationship_statement(node_label, "SOURCED", folk_ids, data_owner_id))
+        
+        return PreparedBatch(
+            description=entity_type,
+            stat="custom_objects_processed",
+            statements=statements,
+            changes=changes,
+            size=len(rows)
+        )
 
 
 # CLI interface for direct execution
@@ -737,8 +1388,39 @@ async def run_ingestion_cli():
             print(f"📋 Groups: {stats.groups_processed} processed")
             print(f"💼 Custom Objects: {stats.custom_objects_processed} processed ({stats.entity_types_discovered} types)")
             print(f"🔗 Relationships: {stats.relationships_created} created")
+            print(f"🔄 Changed entities: {stats.entities_changed} ({stats.cache_entries_invalidated} cached results invalidated)")
+            if stats.sync_mode == "incremental":
+                print(f"⏭️  Unchanged (skipped): {stats.delta_records_skipped} records")
+                print(f"🪦 Tombstoned: {stats.records_tombstoned} ({stats.tombstones_purged} purged)")
+            if stats.checkpoint_listings_resumed:
+                print(f"⏯️  Resumed: {stats.checkpoint_listings_resumed} listings "
+                      f"({stats.checkpoint_listings_skipped} already complete), "
+                      f"{stats.checkpoint_records_resumed} records resumed, "
+                      f"{stats.checkpoint_records_redone} re-fetched")
             print(f"❌ Errors: {len(stats.validation_errors) + len(stats.processing_errors)}")
             
+            performance = stats.to_dict()["performance"]
+            if performance["records"]:
+                print(f"\n⚡ Throughput: {performance['records_per_second']} records/s "
+                      f"(busiest stage: {performance['bottleneck']})")
+                for label, key in (("Fetch/page", "fetch_page_ms"), ("Transform/record", "transform_record_ms"),
+                                   ("Write/batch", "write_batch_ms")):
+                    timing = performance[key]
+                    print(f"   • {label}: p50 {timing['p50']}ms, p95 {timing['p95']}ms, "
+                          f"p99 {timing['p99']}ms, max {timing['max']}ms")
+                depth = performance["queue_depth"]
+                print(f"   • Queue depth (max): transform {depth['transform']['max']:.0f}, "
+                      f"write {depth['write']['max']:.0f} of {config.pipeline_queue_size}")
+            
+            if len(stats.key_stats) > 1:
+                print("\n🔑 Per API key:")
+                for label, key_stats in stats.key_stats.items():
+                    summary = key_stats.key_summary()
+                    print(f"   • {label} ({summary['data_owner'] or 'unknown'}): "
+                          f"{summary['duration_seconds']:.2f}s, {summary['records_per_second']} records/s, "
+                          f"{summary['requests_made']} requests, "
+                          f"{summary['rate_limited']} rate limited, {summary['total_errors']} errors")
+            
             if stats.processing_errors:
                 print("\n⚠️  Processing Errors:")
                 for error in stats.processing_errors[:5]:  # Show first 5
@@ -0,0 +1,273 @@
+"""
+Folk Ingestion Pipeline
+
+Streams a Folk listing through fetch -> transform -> write stages that run
+concurrently and are connected by bounded queues. The first page is written
+while later pages are still being fetched, and at most a few batches are held
+in memory at any time regardless of CRM size: a slow stage applies
+back-pressure to the stages feeding it.
+
+Each stage is timed (fetch latency per page, transform time per record,
+write time per batch) and queue depths are sampled, so a slow run shows
+whether the Folk API, the model transformation or Neo4j is the bottleneck.
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's output
+_END = object()
+
+
+class Distribution:
+    """
+    Count, total and max of observed values, with percentiles
+
+    Percentiles are computed over a bounded reservoir sample, so memory stays
+    constant however long the run is.
+    """
+
+    def __init__(self, max_samples: int = 1024):
+        self.max_samples = max_samples
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._observations = 0
+        self._samples: List[float] = []
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Record a value observed `weight` times (e.g. a per-record time for a whole batch)"""
+        self.count += weight
+        self.total += value * weight
+        self.max = max(self.max, value)
+        self._observations += 1
+
+        if len(self._samples) < self.max_samples:
+            self._samples.append(value)
+        else:
+            slot = random.randrange(self._observations)
+            if slot < self.max_samples:
+                self._samples[slot] = value
+
+    def merge(self, other: "Distribution") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self._observations += other._observations
+        self._samples.extend(other._samples)
+        if len(self._samples) > self.max_samples:
+            self._samples = random.sample(self._samples, self.max_samples)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile (0-100) of the sampled values"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self, scale: float = 1.0) -> Dict[str, float]:
+        """Count plus mean/p50/p95/p99/max, multiplied by `scale` (1000 for ms)"""
+        return {
+            "count": self.count,
+            "mean": round(self.mean * scale, 3),
+            "p50": round(self.percentile(50) * scale, 3),
+            "p95": round(self.percentile(95) * scale, 3),
+            "p99": round(self.percentile(99) * scale, 3),
+            "max": round(self.max * scale, 3)
+        }
+
+
+@dataclass
+class PipelineMetrics:
+    """Stage timings and queue depths, accumulated over every pipeline run"""
+    records: int = 0
+    fetch_page_seconds: Distribution = field(default_factory=Distribution)
+    transform_record_seconds: Distribution = field(default_factory=Distribution)
+    write_batch_seconds: Distribution = field(default_factory=Distribution)
+    transform_queue_depth: Distribution = field(default_factory=Distribution)
+    write_queue_depth: Distribution = field(default_factory=Distribution)
+
+    def merge(self, other: "PipelineMetrics") -> None:
+        self.records += other.records
+        self.fetch_page_seconds.merge(other.fetch_page_seconds)
+        self.transform_record_seconds.merge(other.transform_record_seconds)
+        self.write_batch_seconds.merge(other.write_batch_seconds)
+        self.transform_queue_depth.merge(other.transform_queue_depth)
+        self.write_queue_depth.merge(other.write_queue_depth)
+
+    def busy_seconds(self) -> Dict[str, float]:
+        """
+        Time spent in each stage
+
+        Stages overlap, so the busiest one bounds the run. Summed over listings,
+        which are themselves streamed concurrently.
+        """
+        return {
+            "fetch": round(self.fetch_page_seconds.total, 3),
+            "transform": round(self.transform_record_seconds.total, 3),
+            "write": round(self.write_batch_seconds.total, 3)
+        }
+
+    def bottleneck(self) -> Optional[str]:
+        busy = self.busy_seconds()
+        return max(busy, key=busy.get) if any(busy.values()) else None
+
+    def to_dict(self, duration_seconds: float) -> Dict[str, Any]:
+        return {
+            "records": self.records,
+            "records_per_second": round(self.records / duration_seconds, 2) if duration_seconds > 0 else 0.0,
+            "fetch_page_ms": self.fetch_page_seconds.summary(1000),
+            "transform_record_ms": self.transform_record_seconds.summary(1000),
+            "write_batch_ms": self.write_batch_seconds.summary(1000),
+            "queue_depth": {
+                "transform": self.transform_queue_depth.summary(),
+                "write": self.write_queue_depth.summary()
+            },
+            "busy_seconds": self.busy_seconds(),
+            "bottleneck": self.bottleneck()
+        }
+
+
+@dataclass
+class PipelineStats:
+    """Counters for one pipeline run"""
+    pages: int = 0
+    records: int = 0
+    batches: int = 0
+    batches_written: int = 0
+    max_transform_queue: int = 0
+    max_write_queue: int = 0
+
+
+async def run_pipeline(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    transform: Callable[[List[Dict[str, Any]]], Any],
+    write: Callable[[Any], Awaitable[None]],
+    batch_size: int,
+    queue_size: int = 4,
+    on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    metrics: Optional[PipelineMetrics] = None
+) -> PipelineStats:
+    """
+    Run fetch, transform and write stages concurrently over a paged listing.
+
+    Args:
+        pages: Async iterator of raw record pages
+        transform: Turns a batch of raw records into a write payload (None skips the batch)
+        write: Writes one payload
+        batch_size: Records per transform/write batch (pages are re-chunked)
+        queue_size: Batches buffered between stages
+        on_page: Called with every fetched page (counting, discovery)
+        metrics: Accumulates stage timings and queue depths (shared across runs)
+
+    Returns:
+        PipelineStats for the run
+
+    Raises:
+        The fetch error, if the listing could not be read completely. Batches
+        fetched before the failure are still transformed and written first.
+    """
+    stats = PipelineStats()
+    metrics = metrics if metrics is not None else PipelineMetrics()
+    transform_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    write_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def fetch_stage() -> Optional[BaseException]:
+        buffer: List[Dict[str, Any]] = []
+        error = None
+
+        iterator = pages.__aiter__()
+
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    page = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                metrics.fetch_page_seconds.add(time.perf_counter() - started)
+
+                stats.pages += 1
+                stats.records += len(page)
+                metrics.records += len(page)
+                if on_page:
+                    on_page(page)
+
+                buffer.extend(page)
+                while len(buffer) >= batch_size:
+                    await transform_queue.put(buffer[:batch_size])
+                    buffer = buffer[batch_size:]
+                    metrics.transform_queue_depth.add(transform_queue.qsize())
+                    stats.max_transform_queue = max(stats.max_transform_queue, transform_queue.qsize())
+        except Exception as e:
+            error = e
+
+        if buffer:
+            await transform_queue.put(buffer)
+        await transform_queue.put(_END)
+        return error
+
+    async def transform_stage() -> None:
+        while True:
+            batch = await transform_queue.get()
+            if batch is _END:
+                break
+
+            started = time.perf_counter()
+            payload = transform(batch)
+            metrics.transform_record_seconds.add((time.perf_counter() - started) / len(batch), len(batch))
+            stats.batches += 1
+
+            if payload is not None:
+                await write_queue.put(payload)
+                metrics.write_queue_depth.add(write_queue.qsize())
+                stats.max_write_queue = max(stats.max_write_queue, write_queue.qsize())
+
+            # Let the other stages run between CPU-bound transforms
+            await asyncio.sleep(0)
+
+        await write_queue.put(_END)
+
+    async def write_stage() -> None:
+        while True:
+            payload = await write_queue.get()
+            if payload is _END:
+                break
+
+            started = time.perf_counter()
+            await write(payload)
+            metrics.write_batch_seconds.add(time.perf_counter() - started)
+            stats.batches_written += 1
+
+    tasks = [
+        asyncio.create_task(fetch_stage()),
+        asyncio.create_task(transform_stage()),
+        asyncio.create_task(write_stage())
+    ]
+
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # A failed transform or write must not leave the other stages blocked on a full queue
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    fetch_error = tasks[0].result()
+    if fetch_error is not None:
+        raise fetch_error
+
+    return stats
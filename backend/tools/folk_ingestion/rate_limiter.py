@@ -0,0 +1,241 @@
+"""
+Folk API Rate Limiter
+
+Async token bucket shared by every request made with the same Folk API key.
+The bucket refills at the configured requests-per-minute quota and adapts to
+what the API reports: a 429 pauses all callers until `Retry-After` and halves
+the refill rate, successful responses additively restore it, and
+`X-RateLimit-Remaining`/`X-RateLimit-Reset` headers cap the available tokens
+so the client never spends more than the server says is left.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative decrease on 429, additive increase (fraction of the quota) on success
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+
+# Never throttle below this fraction of the configured quota
+MIN_RATE_RATIO = 0.1
+
+# Fallback pause when a 429 carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Accepts both delta-seconds and HTTP-date forms; returns None when the
+    header is missing or malformed.
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+def parse_reset(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse an X-RateLimit-Reset header into seconds until the window resets.
+
+    Folk-style APIs send either an epoch timestamp or seconds remaining; values
+    that look like epoch seconds are converted relative to now.
+    """
+    if value is None:
+        return None
+
+    try:
+        reset = float(str(value).strip())
+    except ValueError:
+        return None
+
+    if reset > 1e9:
+        now = time.time() if now is None else now
+        reset -= now
+
+    return max(0.0, reset)
+
+
+class AsyncTokenBucket:
+    """
+    Adaptive token bucket for async callers.
+
+    Tokens are reserved synchronously (the bucket may go negative), so
+    concurrent callers are queued in arrival order without a lock and each
+    sleeps only for its own slot. A server-imposed pause set while callers are
+    waiting is honoured before they proceed.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None, name: str = "folk"):
+        if rate_per_minute <= 0:
+            raise ValueError("Rate limit must be greater than 0")
+
+        self.name = name
+        self.max_rate = rate_per_minute / 60.0
+        self.rate = self.max_rate
+        self.capacity = float(burst if burst is not None else max(1, min(10, int(rate_per_minute // 10))))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+        self.stats = {
+            "acquired": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+            "rate_limited": 0,
+            "pause_seconds": 0.0
+        }
+
+    def _refill(self, now: float) -> None:
+        # _updated may lie in the future while paused; nothing accrues until then
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Wait for a request slot.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        await self._wait_for_pause()
+
+        self._refill(time.monotonic())
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        # A 429 seen by another caller while this one was queued pauses it too
+        await self._wait_for_pause()
+
+        waited = time.monotonic() - started
+        self.stats["acquired"] += 1
+        if waited > 0.001:
+            self.stats["throttled"] += 1
+            self.stats["wait_seconds"] += waited
+        return waited
+
+    async def _wait_for_pause(self) -> None:
+        while True:
+            remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
+    def pause(self, seconds: float) -> None:
+        """Block every caller for at least `seconds`"""
+        if seconds <= 0:
+            return
+
+        now = time.monotonic()
+        until = now + seconds
+        if until > self._paused_until:
+            self.stats["pause_seconds"] += until - max(now, self._paused_until)
+            self._paused_until = until
+
+        # Tokens accrued before the pause must not be spent in a burst afterwards
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._updated = max(self._updated, until)
+
+    def on_rate_limited(self, retry_after: Optional[float]) -> float:
+        """
+        Record a 429 response.
+
+        Returns:
+            Seconds every caller will be paused for
+        """
+        self.stats["rate_limited"] += 1
+        self.rate = max(self.max_rate * MIN_RATE_RATIO, self.rate * BACKOFF_FACTOR)
+
+        delay = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        self.pause(delay)
+
+        logger.warning(
+            f"Folk rate limit hit ({self.name}); pausing {delay:.1f}s, "
+            f"rate now {self.rate * 60:.0f}/min"
+        )
+        return delay
+
+    def on_response(self, headers: Mapping[str, str]) -> None:
+        """Adapt to a successful response and its rate-limit headers"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_STEP)
+
+        remaining = headers.get("x-ratelimit-remaining") or headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        try:
+            remaining = float(remaining)
+        except ValueError:
+            return
+
+        now = time.monotonic()
+        self._refill(now)
+
+        if remaining <= 0:
+            reset = parse_reset(headers.get("x-ratelimit-reset") or headers.get("X-RateLimit-Reset"))
+            if reset:
+                self.pause(reset)
+            else:
+                self._tokens = min(self._tokens, 0.0)
+        else:
+            self._tokens = min(self._tokens, remaining)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Limiter usage statistics"""
+        return {
+            **self.stats,
+            "rate_per_minute": round(self.rate * 60, 2),
+            "max_rate_per_minute": round(self.max_rate * 60, 2),
+            "capacity": self.capacity
+        }
+
+
+# Folk quotas apply per API key, so every client for a key shares one bucket
+_limiters: Dict[str, AsyncTokenBucket] = {}
+
+
+def get_shared_limiter(api_key: str, rate_per_minute: float) -> AsyncTokenBucket:
+    """Process-wide token bucket for an API key"""
+    key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    limiter = _limiters.get(key_id)
+
+    if limiter is None or limiter.max_rate != rate_per_minute / 60.0:
+        limiter = AsyncTokenBucket(rate_per_minute, name=f"key:{key_id[:8]}")
+        _limiters[key_id] = limiter
+
+    return limiter
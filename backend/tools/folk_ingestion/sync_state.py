@@ -0,0 +1,220 @@
+"""
+Folk Incremental Sync State
+
+Tracks what each API key already synced to Neo4j so incremental syncs only
+write records whose content changed, and tombstones records that
+disappeared from Folk instead of deleting them outright.
+
+Folk's list endpoints expose no reliable updated-at field, so the watermark
+is content based and lives on the nodes themselves: every upserted node
+carries `folkContentHash`, and a streamed record is written only when its
+hash differs from the stored one. A failed write leaves the old hash in
+place, so the record is retried by the next run.
+
+Several API keys can own the same node, so a record missing from one key's
+listing only tombstones that key's owner relationship (OWNS_CONTACT or
+SOURCED); the node itself is tombstoned, and labelled FolkTombstone, once no
+live owner relationship is left or Folk confirmed the deletion.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Relationships linking a data owner (internal Person) to the nodes it synced
+OWNER_RELATIONSHIPS = ("OWNS_CONTACT", "SOURCED")
+
+# Label added to tombstoned nodes so purges seek them by label
+TOMBSTONE_LABEL = "FolkTombstone"
+
+# Range indexes on folkDeletedAt backing the tombstone purge
+TOMBSTONE_INDEXES = [
+    f"CREATE INDEX folk_tombstone_deleted_at IF NOT EXISTS FOR (n:{TOMBSTONE_LABEL}) ON (n.folkDeletedAt)"
+] + [
+    f"CREATE INDEX folk_{relationship.lower()}_deleted_at IF NOT EXISTS "
+    f"FOR ()-[r:{relationship}]-() ON (r.folkDeletedAt)"
+    for relationship in OWNER_RELATIONSHIPS
+]
+
+
+class ListingDelta:
+    """
+    Incremental-sync bookkeeping for one streamed listing
+
+    Only folk IDs and hashes are kept, never the records themselves, so
+    listings can be compared against Neo4j page by page.
+    """
+
+    def __init__(self, known: Dict[str, Tuple[Optional[str], bool]]):
+        self.known = known
+        self.hashes: Dict[str, str] = {}
+        self.invalid: Set[str] = set()
+        self.skipped = 0
+
+    def is_unchanged(self, folk_id: str, content_hash: str) -> bool:
+        """Record a listed record; True when Neo4j already holds this exact content"""
+        self.hashes[folk_id] = content_hash
+        if self.known.get(folk_id) == (content_hash, False):
+            self.skipped += 1
+            return True
+        return False
+
+    def mark_invalid(self, folk_id: Optional[str]) -> None:
+        """Record a listed record that failed validation (never tombstoned)"""
+        if folk_id:
+            self.invalid.add(folk_id)
+
+    @property
+    def seen(self) -> Set[str]:
+        return set(self.hashes) | self.invalid
+
+    @property
+    def changed(self) -> int:
+        return len(self.hashes) - self.skipped
+
+    def vanished(self, seen: Optional[Set[str]] = None) -> List[str]:
+        """Known, live folk IDs missing from the listing (or from `seen`)"""
+        seen = self.seen if seen is None else seen
+        return [folk_id for folk_id, (_, deleted) in self.known.items() if not deleted and folk_id not in seen]
+
+
+class SyncStateStore:
+    """Reads stored content hashes and writes node tombstones"""
+
+    def __init__(self, neo4j_client):
+        self.neo4j_client = neo4j_client
+        self._indexes_ensured = False
+
+    async def ensure_indexes(self) -> None:
+        """Create the tombstone indexes once per store"""
+        if self._indexes_ensured:
+            return
+
+        for statement in TOMBSTONE_INDEXES:
+            result = await self.neo4j_client.execute_query(statement)
+            if not result.success:
+                raise RuntimeError(f"Failed to create tombstone index: {result.error}")
+
+        self._indexes_ensured = True
+
+    async def load_known(
+        self, label: str, relationship: str, data_owner_id: str
+    ) -> Dict[str, Tuple[Optional[str], bool]]:
+        """
+        Content hashes of the nodes this API key owns
+
+        Returns:
+            Mapping of folk ID to (content hash, tombstoned for this owner)
+        """
+        result = await self.neo4j_client.execute_query(
+            f"""
+            MATCH (:Person {{folkUserId: $data_owner_id}})-[r:{relationship}]->(n:{label})
+            WHERE n.folkId IS NOT NULL
+            RETURN n.folkId AS folk_id, n.folkContentHash AS content_hash,
+                   coalesce(r.folkDeleted, false) OR coalesce(n.folkDeleted, false) AS deleted
+            """,
+            {"data_owner_id": data_owner_id}
+        )
+
+        if not result.success:
+            raise RuntimeError(f"Failed to load known {label} hashes: {result.error}")
+
+        return {
+            record["folk_id"]: (record.get("content_hash"), record.get("deleted", False))
+            for record in result.records
+        }
+
+    async def tombstone(
+        self,
+        label: str,
+        folk_ids: Iterable[str],
+        relationship: Optional[str] = None,
+        data_owner_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Tombstone records deleted in Folk
+
+        With a data owner, only that owner's relationship to each node is
+        tombstoned, and a node only once none of its owners has it any more.
+        Without one (a deletion confirmed by Folk) the nodes are tombstoned
+        directly.
+
+        Returns:
+            Folk ID and name of each node tombstoned
+        """
+        folk_ids = list(folk_ids)
+        if not folk_ids:
+            return []
+
+        if data_owner_id is not None:
+            if relationship not in OWNER_RELATIONSHIPS:
+                raise ValueError(f"Not an owner relationship: {relationship}")
+
+            query = f"""
+            UNWIND $folk_ids AS folk_id
+            MATCH (:Person {{folkUserId: $data_owner_id}})-[r:{relationship}]->(n:{label} {{folkId: folk_id}})
+            SET r.folkDeleted = true, r.folkDeletedAt = datetime()
+            WITH DISTINCT n
+            WHERE coalesce(n.folkDeleted, false) = false
+              AND NOT EXISTS {{
+                  MATCH (:Person)-[owner:{relationship}]->(n)
+                  WHERE coalesce(owner.folkDeleted, false) = false
+              }}
+            SET n.folkDeleted = true, n.folkDeletedAt = datetime(), n:{TOMBSTONE_LABEL}
+            RETURN n.folkId AS folk_id, n.name AS name
+            """
+        else:
+            query = f"""
+            UNWIND $folk_ids AS folk_id
+            MATCH (n:{label} {{folkId: folk_id}})
+            WHERE coalesce(n.folkDeleted, false) = false
+            SET n.folkDeleted = true, n.folkDeletedAt = datetime(), n:{TOMBSTONE_LABEL}
+            RETURN n.folkId AS folk_id, n.name AS name
+            """
+
+        result = await self.neo4j_client.execute_query(
+            query, {"folk_ids": folk_ids, "data_owner_id": data_owner_id}
+        )
+
+        if not result.success:
+            raise RuntimeError(f"Failed to tombstone {label} nodes: {result.error}")
+
+        return result.records
+
+    async def purge_tombstones(self, retention_days: int) -> int:
+        """
+        Delete nodes and owner relationships tombstoned longer than the retention period
+
+        Each purge seeks one label or relationship type through its
+        folkDeletedAt index instead of scanning every node.
+
+        Returns:
+            Number of nodes and relationships deleted
+        """
+        await self.ensure_indexes()
+
+        statements = [
+            f"""
+            MATCH (n:{TOMBSTONE_LABEL})
+            WHERE n.folkDeletedAt < datetime() - duration({{days: $retention_days}})
+            DETACH DELETE n
+            RETURN count(*) AS purged
+            """
+        ] + [
+            f"""
+            MATCH (:Person)-[r:{relationship}]->()
+            WHERE r.folkDeletedAt < datetime() - duration({{days: $retention_days}})
+            DELETE r
+            RETURN count(*) AS purged
+            """
+            for relationship in OWNER_RELATIONSHIPS
+        ]
+
+        purged = 0
+        for statement in statements:
+            result = await self.neo4j_client.execute_query(statement, {"retention_days": retention_days})
+            if result.success and result.records:
+                purged += result.records[0].get("purged", 0)
+
+        return purged
@@ -0,0 +1,382 @@
+"""
+Folk Near-Real-Time Sync Worker
+
+Applies Folk change notifications to Neo4j within seconds instead of waiting
+for the next batch run. Notifications (delivered to the webhook endpoint in
+webhook_server.py) are coalesced per entity over a short window, so a burst of
+edits to one deal costs a single fetch and write. Changed records are fetched
+by ID and written through the regular ingestion transforms in small batches.
+Records are only tombstoned once no API key can read them anymore, so a
+deletion notification is confirmed with Folk before anything is removed.
+
+Webhooks can be missed (worker restarts, delivery outages), so the worker
+also runs an incremental sync on start and whenever no notification arrived
+for a whole poll interval.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .folk_client import FolkClient
+from .folk_ingestion import FolkIngestionService, IngestionStats
+from .pipeline import Distribution
+
+logger = logging.getLogger(__name__)
+
+# Attempts before a change that keeps failing is left to the polling fallback
+MAX_ATTEMPTS = 3
+
+# Webhook event prefixes ("person.updated") mapped to entity kinds
+EVENT_KINDS = {
+    "person": "person",
+    "people": "person",
+    "contact": "person",
+    "company": "company",
+    "companies": "company",
+    "organization": "company",
+    "object": "object",
+    "custom_object": "object",
+    "deal": "object"
+}
+
+DELETE_ACTIONS = {"deleted", "removed"}
+
+
+@dataclass
+class FolkChangeNotification:
+    """A Folk entity reported as created, updated or deleted"""
+    kind: str  # "person", "company" or "object"
+    folk_id: str
+    deleted: bool = False
+    group_id: Optional[str] = None
+    entity_type: Optional[str] = None  # custom object type, e.g. "Deals"
+    received_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.kind, self.folk_id)
+
+    @property
+    def label(self) -> str:
+        """Neo4j node label of the entity"""
+        if self.kind == "person":
+            return "Person"
+        if self.kind == "company":
+            return "Organization"
+        return (self.entity_type or "Deals").rstrip('s')
+
+    def merge(self, newer: "FolkChangeNotification") -> None:
+        """Coalesce a later notification for the same entity into this one"""
+        self.deleted = newer.deleted
+        self.group_id = newer.group_id or self.group_id
+        self.entity_type = newer.entity_type or self.entity_type
+
+
+def parse_notifications(payload: Any) -> List[FolkChangeNotification]:
+    """
+    Parse a webhook payload: one event, a list of events or {"events": [...]}
+
+    Events look like {"type": "person.updated", "data": {"id": "per_1"}}; custom
+    objects also carry "groupId" and "entityType" in their data. Unknown
+    events are ignored.
+    """
+    if isinstance(payload, dict) and "events" in payload:
+        payload = payload["events"]
+
+    notifications = []
+    for event in payload if isinstance(payload, list) else [payload]:
+        if not isinstance(event, dict):
+            continue
+
+        event_type = str(event.get("type") or event.get("event") or "").lower()
+        prefix, _, action = event_type.partition(".")
+        kind = EVENT_KINDS.get(prefix)
+        data = event.get("data") or {}
+
+        if not kind or not data.get("id"):
+            logger.debug(f"Ignoring Folk webhook event '{event_type}'")
+            continue
+
+        notifications.append(FolkChangeNotification(
+            kind=kind,
+            folk_id=data["id"],
+            deleted=action in DELETE_ACTIONS,
+            group_id=data.get("groupId"),
+            entity_type=data.get("entityType") or ("Deals" if prefix == "deal" else None)
+        ))
+
+    return notifications
+
+
+class FolkSyncWorker:
+    """
+    Long-running worker applying coalesced Folk changes
+
+    Change batches and fallback polls share the ingestion service and are
+    serialized, so their writes and stats never interleave.
+    """
+
+    def __init__(
+        self,
+        service: FolkIngestionService,
+        coalesce_seconds: Optional[float] = None,
+        max_batch: Optional[int] = None,
+        poll_interval_seconds: Optional[int] = None
+    ):
+        config = service.config
+        self.service = service
+        self.coalesce_seconds = config.sync_coalesce_seconds if coalesce_seconds is None else coalesce_seconds
+        self.max_batch = max_batch or config.batch_size
+        self.poll_interval_seconds = (
+            config.sync_poll_interval_seconds if poll_interval_seconds is None else poll_interval_seconds
+        )
+
+        # Pending changes in arrival order, one per entity
+        self._pending: Dict[Tuple[str, str], FolkChangeNotification] = {}
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._tasks: List[asyncio.Task] = []
+        self._clients: List[Tuple[FolkClient, str]] = []  # (client, data owner ID) per API key
+        self._last_notification: Optional[float] = None
+
+        # Seconds from receiving a notification to its change being written
+        self.latency = Distribution()
+        self.stats = {
+            "received": 0,
+            "coalesced": 0,
+            "applied": 0,
+            "tombstoned": 0,
+            "not_found": 0,
+            "unconfirmed_deletes": 0,
+            "skipped": 0,
+            "failed": 0,
+            "dropped": 0,
+            "flushes": 0,
+            "polls": 0
+        }
+
+    async def start(self) -> None:
+        """Connect a Folk client per API key and start the flush and poll loops"""
+        for api_key in self.service.config.api_keys:
+            client = self.service.create_folk_client(api_key)
+            try:
+                profile = await client.get_user_profile()
+            except Exception as e:
+                logger.error(f"Sync worker cannot use a Folk API key: {e}")
+                await client.close()
+                continue
+            self._clients.append((client, profile.id))
+
+        self._tasks = [asyncio.create_task(self._flush_loop())]
+        if self.poll_interval_seconds:
+            self._tasks.append(asyncio.create_task(self._poll_loop()))
+
+        logger.info(f"Folk sync worker started ({len(self._clients)} API keys, "
+                    f"{self.coalesce_seconds}s coalesce window)")
+
+    async def stop(self) -> None:
+        """Stop the loops, apply what is still pending and close the clients"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        while self._pending and await self.flush():
+            pass
+
+        for client, _ in self._clients:
+            await client.close()
+        self._clients = []
+
+        logger.info("Folk sync worker stopped")
+
+    def submit(self, notification: FolkChangeNotification) -> None:
+        """Queue a change; a pending change for the same entity absorbs it"""
+        self.stats["received"] += 1
+        self._last_notification = time.monotonic()
+
+        pending = self._pending.get(notification.key)
+        if pending:
+            pending.merge(notification)
+            self.stats["coalesced"] += 1
+        else:
+            self._pending[notification.key] = notification
+
+        self._wakeup.set()
+
+    async def flush(self) -> bool:
+        """
+        Apply up to max_batch pending changes
+
+        Returns:
+            False if applying them failed (they are queued again)
+        """
+        batch = [self._pending.pop(key) for key in list(self._pending)[:self.max_batch]]
+        if not batch:
+            return True
+
+        async with self._lock:
+            try:
+                await self._apply(batch)
+            except Exception as e:
+                logger.error(f"Failed to apply {len(batch)} Folk changes: {e}")
+                self._requeue(batch)
+                return False
+
+        self.stats["flushes"] += 1
+        now = time.monotonic()
+        for notification in batch:
+            self.latency.add(now - notification.received_at)
+
+        return True
+
+    async def poll(self) -> Optional[IngestionStats]:
+        """Catch up with an incremental sync (fallback for missed webhooks)"""
+        async with self._lock:
+            try:
+                stats = await self.service.run_incremental_ingestion()
+            except Exception as e:
+                logger.error(f"Fallback Folk sync failed: {e}")
+                return None
+
+        self.stats["polls"] += 1
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker counters, pending changes and change latency"""
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "api_keys": len(self._clients),
+            "latency_ms": self.latency.summary(1000),
+            "seconds_since_notification": (
+                round(time.monotonic() - self._last_notification, 1) if self._last_notification else None
+            )
+        }
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+
+            # Let a burst of edits to the same entities collapse into one write
+            await asyncio.sleep(self.coalesce_seconds)
+            self._wakeup.clear()
+
+            while self._pending and await self.flush():
+                pass
+
+            # Failed changes are retried after another window
+            if self._pending:
+                self._wakeup.set()
+
+    async def _poll_loop(self) -> None:
+        # Changes made while the worker was down never produced a webhook it saw
+        await self.poll()
+
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+
+            if self._last_notification and time.monotonic() - self._last_notification < self.poll_interval_seconds:
+                continue  # Webhooks are being delivered
+
+            await self.poll()
+
+    def _requeue(self, batch: List[FolkChangeNotification]) -> None:
+        self.stats["failed"] += len(batch)
+
+        for notification in batch:
+            notification.attempts += 1
+            if notification.attempts >= MAX_ATTEMPTS:
+                self.stats["dropped"] += 1
+                logger.warning(f"Dropping Folk change for {notification.kind} {notification.folk_id} "
+                               f"after {notification.attempts} attempts")
+            else:
+                # A newer notification received meanwhile supersedes this one
+                self._pending.setdefault(notification.key, notification)
+
+    async def _apply(self, batch: List[FolkChangeNotification]) -> None:
+        """
+        Fetch the changed records and write them with the ingestion transforms
+
+        Deletion notifications are fetched like any other change: only a
+        record no API key can read (404 for every key) is tombstoned, so a
+        forged or stale "deleted" event cannot remove a live record.
+        """
+        if not self._clients:
+            raise RuntimeError("No Folk API key available to fetch changed records")
+
+        deleted: Dict[str, List[str]] = {}
+        changes = []
+
+        for notification in batch:
+            if notification.kind == "object" and not (notification.group_id and notification.entity_type):
+                self.stats["skipped"] += 1
+                logger.warning(f"Folk object {notification.folk_id} changed without group/entity type; "
+                               f"left to the next poll")
+            else:
+                changes.append(notification)
+
+        fetched = await asyncio.gather(*(self._fetch(notification) for notification in changes))
+
+        # Records grouped by the data owner whose API key could read them
+        by_owner: Dict[str, Dict[str, Any]] = {}
+        for notification, result in zip(changes, fetched):
+            if result is None:
+                # No API key can see it anymore: deleted in Folk
+                if not notification.deleted:
+                    self.stats["not_found"] += 1
+                deleted.setdefault(notification.label, []).append(notification.folk_id)
+                continue
+
+            if notification.deleted:
+                # Still readable: write the current version instead
+                self.stats["unconfirmed_deletes"] += 1
+                logger.warning(f"Folk reported {notification.kind} {notification.folk_id} deleted "
+                               f"but it still exists; not tombstoned")
+
+            owner, record = result
+            records = by_owner.setdefault(owner, {"people": [], "companies": [], "custom_objects": {}})
+            if notification.kind == "person":
+                records["people"].append(record)
+            elif notification.kind == "company":
+                records["companies"].append(record)
+            else:
+                records["custom_objects"].setdefault(notification.entity_type, []).append(record)
+
+        for owner, records in by_owner.items():
+            self._record(await self.service.ingest_records(
+                owner, records["people"], records["companies"], records["custom_objects"]
+            ))
+
+        if deleted:
+            self._record(await self.service.ingest_records(deleted=deleted))
+
+    async def _fetch(self, notification: FolkChangeNotification) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Current version of a changed record and its data owner, None if no key can read it"""
+
+        for client, owner in self._clients:
+            if notification.kind == "person":
+                record = await client.get_person(notification.folk_id)
+            elif notification.kind == "company":
+                record = await client.get_company(notification.folk_id)
+            else:
+                record = await client.get_custom_object(
+                    notification.group_id, notification.entity_type, notification.folk_id
+                )
+
+            if record is not None:
+                return owner, record
+
+        return None
+
+    def _record(self, stats: IngestionStats) -> None:
+        """Count an applied change batch; raise so failed writes are retried"""
+        self.stats["applied"] += stats.people_processed + stats.companies_processed + stats.custom_objects_processed
+        self.stats["tombstoned"] += stats.records_tombstoned
+
+        if stats.neo4j_errors:
+            raise RuntimeError(f"{stats.neo4j_errors} Neo4j errors while writing Folk changes")
@@ -0,0 +1,101 @@
+"""
+Folk Sync Webhook Server
+
+FastAPI app hosting the near-real-time sync worker: receives Folk webhook
+notifications, verifies their signature and hands them to FolkSyncWorker.
+Started by run_folk_sync_worker.py, separately from the API server, so sync
+work never competes with chat requests.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request, status
+
+from .config import FolkConfig
+from .folk_ingestion import FolkIngestionService
+from .sync_worker import FolkSyncWorker, parse_notifications
+
+logger = logging.getLogger(__name__)
+
+# HMAC-SHA256 of the raw request body, hex encoded (optionally "sha256=" prefixed)
+SIGNATURE_HEADER = "X-Folk-Signature"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a webhook body against its signature header"""
+    if not signature:
+        return False
+
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.strip().removeprefix("sha256="))
+
+
+def create_webhook_router(worker: FolkSyncWorker, secret: str) -> APIRouter:
+    """
+    Webhook receiver and status endpoints for a sync worker
+
+    Raises:
+        ValueError: without a webhook secret; unsigned deliveries are never accepted
+    """
+    if not secret:
+        raise ValueError("FOLK_WEBHOOK_SECRET is required to receive Folk webhooks")
+
+    router = APIRouter(prefix="/webhooks/folk", tags=["Folk Sync"])
+
+    @router.post("", status_code=status.HTTP_202_ACCEPTED)
+    async def receive_folk_webhook(request: Request):
+        """Queue the changes in a Folk webhook delivery"""
+        body = await request.body()
+
+        if not verify_signature(secret, body, request.headers.get(SIGNATURE_HEADER)):
+            logger.warning("Rejected Folk webhook with an invalid signature")
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature")
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON payload")
+
+        notifications = parse_notifications(payload)
+        for notification in notifications:
+            worker.submit(notification)
+
+        return {"accepted": len(notifications)}
+
+    @router.get("/status")
+    async def folk_sync_status():
+        """Sync worker counters, pending changes and latency"""
+        return worker.get_stats()
+
+    return router
+
+
+def create_app(config: FolkConfig) -> FastAPI:
+    """Sync worker app: the worker runs for the lifetime of the server"""
+
+    service = FolkIngestionService(config)
+    worker = FolkSyncWorker(service)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await service.initialize()
+        await worker.start()
+        try:
+            yield
+        finally:
+            await worker.stop()
+            await service.cleanup()
+
+    app = FastAPI(title="OneVice Folk Sync Worker", version="1.0.0", lifespan=lifespan)
+    app.include_router(create_webhook_router(worker, config.webhook_secret))
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "pending_changes": worker.get_stats()["pending"]}
+
+    return app